@@ -1,33 +1,107 @@
+import time
+_STARTUP_T0 = time.perf_counter()  # 시작 시간 보고용 (모듈 import 시작 시각)
+
 import sys
 import json
-import pandas as pd
-from openpyxl import load_workbook
+import os
+import threading
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QFileDialog, QMessageBox, 
-    QPushButton, QHBoxLayout, QVBoxLayout, QGridLayout, QLabel, QTreeWidgetItem, QSpinBox,
-    QDialog, QScrollArea, QTextBrowser
+    QPushButton, QHBoxLayout, QVBoxLayout, QTreeWidgetItem, QSpinBox,
+    QDialog, QScrollArea, QTextBrowser, QProgressBar, QInputDialog, QLabel
 )
-from PySide6.QtCore import Qt, QFile, QIODevice
-from PySide6.QtUiTools import QUiLoader
+from PySide6.QtCore import Qt, QFile, QIODevice, QEvent, QTimer
 
 # Custom UInt32 SpinBox 임포트
 from uint32_spinbox import UInt32SpinBox
 
-# FT2232H 멀티 프로토콜 통신을 위한 import (pyftdi 라이브러리 필요)
-try:
-    from pyftdi.spi import SpiController
-    from pyftdi.i2c import I2cController
-    from pyftdi.serialext import serial_for_url
-    PYFTDI_AVAILABLE = True
-except ImportError:
-    PYFTDI_AVAILABLE = False
-    print("⚠️ pyftdi 라이브러리가 설치되지 않았습니다. 통신 기능이 제한됩니다.")
-    print("설치: pip install pyftdi")
+# 32비트 레지스터 편집 위젯 (단일 paintEvent)
+from bit_register_widget import BitRegisterWidget
+
+# 현재 레지스터 값 모델 (틱당 한 번 병합된 갱신)
+from register_value_model import RegisterValueModel
+
+# Excel 레지스터 맵 파서 / 필드 비트 연산 (Qt 비의존) 및 백그라운드 로더
+import register_fields
+from register_excel_parser import load_excel
+from excel_load_worker import ExcelLoadWorker
+
+# 레지스터 통신 프레임 형식 및 하드웨어 없는 시뮬레이션 디바이스
+from register_protocol import I2C_DEFAULT_ADDRESS
+from register_transfer import write_frame, read_frame, transfer_batch, transfer_source, TransportError
+from sim_device import (
+    SimulatedRegisterDevice, SimulatedSpiPort, SimulatedI2cPort, SimulatedSerialPort, SimClock,
+)
+from sim_faults import FaultInjectingPort, FaultProfile
+
+# 레지스터 맵 이름 조회 및 시퀀스 엔진 (배치 전송)
+from register_map import RegisterMap
+from register_sequence import SequenceEngine, SequenceError, load_sequence, format_report
+from register_device import RegisterDevice
+from register_profile import RegisterProfile, ProfileError, apply_profile
+from register_poll import PollCondition, PollConditionError, PollUntil, poll_statistics
+from poll_worker import PollWorker
+from register_latency import LatencyRecorder
+from register_trace import TraceRecorder, traced
+from register_profiler import SamplingProfiler, HEARTBEAT_INTERVAL_S
+from register_usb_meter import UsbEfficiencyMeter
+
+# 시작 시간 측정 (import / UI 구성 / 맵 로드 / 첫 화면)
+from startup_timing import StartupTimer
+
+# 서브시스템별 로거 (REGISTER_LOG_LEVEL 환경 변수로 레벨 조정)
+from register_logging import get_logger, configure_logging, DEBUG
+
+parser_log = get_logger("parser")
+transport_log = get_logger("transport")
+ui_log = get_logger("ui")
+
+# 컴파일된 UI 모듈 (pyside6-uic register_controller.ui -o register_controller_ui.py)
+UI_FILE_NAME = "register_controller.ui"
+UI_MODULE_FILE_NAME = "register_controller_ui.py"
+
+# 짧은 응답/응답 없음일 때 추가로 다시 읽는 횟수
+READ_RETRIES = 1
+
+# 프로파일러 시작 후 실제 샘플링 속도를 로그에 남기기까지 기다리는 시간
+PROFILER_RATE_CHECK_MS = 1000
+
+
+def load_pyftdi():
+    """FT2232H 멀티 프로토콜 통신용 pyftdi 를 처음 연결할 때 임포트합니다 (시작 시간 단축).
+    
+    반환값: (SpiController, I2cController, serial_for_url) 또는 설치되지 않은 경우 None
+    """
+    try:
+        from pyftdi.spi import SpiController
+        from pyftdi.i2c import I2cController
+        from pyftdi.serialext import serial_for_url
+    except ImportError:
+        transport_log.warning("⚠️ pyftdi 라이브러리가 설치되지 않았습니다. 통신 기능이 제한됩니다. (설치: pip install pyftdi)")
+        return None
+    return SpiController, I2cController, serial_for_url
+
+
+def compiled_ui_is_current(base_dir):
+    """컴파일된 UI 모듈이 .ui 파일보다 오래되지 않았으면 True"""
+    ui_path = os.path.join(base_dir, UI_FILE_NAME)
+    module_path = os.path.join(base_dir, UI_MODULE_FILE_NAME)
+    try:
+        return os.path.getmtime(module_path) >= os.path.getmtime(ui_path)
+    except OSError:
+        return False
+
+_STARTUP_IMPORTED = time.perf_counter()
 
 class RegisterTreeViewerController(QMainWindow):
-    def __init__(self, excel_path=None):
+    def __init__(self, excel_path=None, load_in_background=False, startup_timer=None):
         super().__init__()
         
+        # 시작 시간 측정 (main()에서 전달, 스크립트에서 생성 시 None)
+        self.startup_timer = startup_timer
+        if startup_timer:
+            startup_timer.begin("ui_build")
+        
         # 멀티 프로토콜 컨트롤러 초기화
         self.current_protocol = "SPI"  # 기본값: SPI
         self.spi_controller = None
@@ -40,7 +114,23 @@ class RegisterTreeViewerController(QMainWindow):
         
         # 시뮬레이션 관련 변수들
         self.simulation_mode = False
-        self.simulation_registers = {}  # 시뮬레이션용 레지스터 데이터 저장
+        self.sim_device = None  # 시뮬레이션 디바이스 (sim_device.SimulatedRegisterDevice)
+        self.poll_task = None   # 진행 중인 poll-until (register_poll.PollUntil)
+        self.poll_worker = None # poll-until 읽기 스레드 (poll_worker.PollWorker)
+        self.monitor_window = None  # 레지스터 모니터 창 (register_monitor_widget.MonitorWindow)
+        self.journal = None         # 기록 중인 트랜잭션 저널 (register_journal.TransactionJournal)
+        self.latency = None         # 전송 단계별 시간 집계 (register_latency.LatencyRecorder)
+        self.latency_label = None   # 상태 표시줄의 p50/p95/p99 표시
+        self.latency_timer = None
+        self.last_latency = None    # 마지막으로 집계를 멈춘 LatencyRecorder (내보내기용)
+        self.trace = None           # 기록 중인 구간 추적 (register_trace.TraceRecorder)
+        self.usb_meter = None       # USB 전송 효율 (register_usb_meter.UsbEfficiencyMeter)
+        self.usb_meter_bar = None   # 상태 표시줄 효율 게이지 (패킷 채움 %)
+        self.usb_meter_timer = None
+        self.profiler = None        # 샘플링 프로파일러 (register_profiler.SamplingProfiler)
+        self.profiler_timer = None  # 이벤트 루프 heartbeat (멈춤 감지)
+        # 포트 잠금: 백그라운드 모니터 스레드와 GUI 스레드의 전송이 섞이지 않도록 모든 전송을 감쌈
+        self.bus_lock = threading.RLock()
         
         # 현재 선택된 레지스터 정보
         self.current_register = None
@@ -57,65 +147,122 @@ class RegisterTreeViewerController(QMainWindow):
         # 레지스터별 독립 데이터 저장소
         self.register_data_store = {}  # {addr: data} 형태로 각 레지스터의 값을 독립적으로 저장
         
-        # UI 업데이트 동기화 플래그
-        self._updating_ui = False
+        # 현재 레지스터 값 모델 (비트 위젯 / SpinBox / DEC / Tree 의 단일 값 원본)
+        self.value_model = RegisterValueModel(self)
+        self.current_register_item = None  # 현재 레지스터의 트리 아이템 (Tree 갱신 시 검색 생략)
         
-        # 비트 버튼들을 저장할 리스트
-        self.bit_buttons = []
+        # 32비트 레지스터 편집 위젯 (create_bit_register_widget에서 생성)
+        self.bit_widget = None
         
         # 레지스터 데이터
         self.data = None
         
+        # 백그라운드 Excel 로드 작업 (진행 중이 아니면 None)
+        self.excel_worker = None
+        
         # UI 로드
         self.load_ui()
         
         # 시그널 연결
         self.connect_signals()
         
-        # 32개 비트 버튼 생성
-        self.create_bit_buttons()
+        # 32비트 레지스터 편집 위젯 생성
+        self.create_bit_register_widget()
+        
+        # 상태바 Excel 로드 진행률 / 취소 버튼
+        self.create_load_progress_widgets()
         
         # 초기 UI 상태 설정
         self.setup_initial_ui_state()
         
-        # Excel 파일이 지정되면 로드
-        import os
-        if excel_path:
-            self.load_excel_file(excel_path)
+        if startup_timer:
+            startup_timer.end("ui_build")
+            # 첫 화면 그리기 감지 (트리 뷰포트의 첫 Paint 이벤트)
+            self.ui.tree_widget.viewport().installEventFilter(self)
+        
+        # Excel 파일이 지정되면 로드 (없으면 기본 파일, 절대경로로 보정)
+        if not excel_path:
+            excel_path = os.path.join(os.path.dirname(__file__), "Sample.xlsx")
+        if load_in_background:
+            # 창을 먼저 띄우고 백그라운드에서 로드
+            self.start_excel_load(excel_path)
         else:
-            # 기본 파일 로드 (절대경로로 보정)
             try:
-                sample_path = os.path.join(os.path.dirname(__file__), "Sample.xlsx")
-                self.load_excel_file(sample_path)
+                self.load_excel_file(excel_path)
             except Exception as e:
-                print(f"⚠️ 기본 파일 Sample.xlsx 로딩 실패: {e}")
+                ui_log.warning("⚠️ 기본 파일 Sample.xlsx 로딩 실패: %s", e)
             
         # 모든 비트 버튼을 0으로 초기화
         self.reset_all_bits_to_zero()
 
     def load_ui(self):
-        """UI 파일을 로드합니다."""
-        import os
-        ui_path = os.path.join(os.path.dirname(__file__), "register_controller.ui")
+        """UI를 구성합니다.
+        
+        컴파일된 register_controller_ui.py 가 .ui 파일보다 최신이면 바로 사용하고,
+        그렇지 않으면 (.ui 만 수정된 경우) QUiLoader 로 .ui 파일을 읽습니다.
+        """
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        if not (compiled_ui_is_current(base_dir) and self.setup_compiled_ui()):
+            if not self.load_ui_file(os.path.join(base_dir, UI_FILE_NAME)):
+                return
+        # 윈도우 속성 설정
+        self.setWindowTitle("Register Tree Viewer with 32-bit Controller")
+        self.setGeometry(100, 100, 1400, 800)
+        # QSpinBox 32비트 설정
+        self.setup_spinbox()
+
+    def setup_compiled_ui(self):
+        """컴파일된 UI 클래스로 위젯을 생성합니다 (성공 시 True)."""
+        try:
+            from register_controller_ui import Ui_RegisterTreeViewer
+        except ImportError as e:
+            ui_log.warning("⚠️ 컴파일된 UI 모듈을 불러올 수 없어 .ui 파일을 사용합니다: %s", e)
+            return False
+        self.ui = Ui_RegisterTreeViewer()
+        self.ui.setupUi(self)
+        ui_log.debug("✅ 컴파일된 UI 사용: %s", UI_MODULE_FILE_NAME)
+        return True
+
+    def load_ui_file(self, ui_path):
+        """QUiLoader 로 .ui 파일을 읽어 위젯을 생성합니다 (성공 시 True)."""
+        from PySide6.QtUiTools import QUiLoader
         ui_file = QFile(ui_path)
         if not ui_file.open(QIODevice.ReadOnly):
-            print(f"UI 파일을 열 수 없습니다: {ui_path}")
-            return
+            ui_log.error("UI 파일을 열 수 없습니다: %s", ui_path)
+            return False
         loader = QUiLoader()
         self.ui = loader.load(ui_file)
         ui_file.close()
         if not self.ui:
-            print("UI 로드 실패")
-            return
+            ui_log.error("UI 로드 실패")
+            return False
         # UI의 모든 위젯들을 현재 MainWindow에 복사
         self.setCentralWidget(self.ui.centralwidget)
         self.setMenuBar(self.ui.menubar)
         self.setStatusBar(self.ui.statusbar)
-        # 윈도우 속성 설정
-        self.setWindowTitle("Register Tree Viewer with 32-bit Controller")
-        self.setGeometry(100, 100, 1400, 800)
-        # QSpinBox 32비트 설정
-        self.setup_spinbox()
+        ui_log.debug("✅ .ui 파일 로드 (컴파일된 UI가 없거나 오래됨): %s", ui_path)
+        return True
+
+    def eventFilter(self, watched, event):
+        """첫 화면 그리기 시점 기록 (시작 시간 보고용)"""
+        if event.type() == QEvent.Paint and self.startup_timer:
+            watched.removeEventFilter(self)
+            # 이 Paint 이벤트 처리가 끝난 뒤 기록
+            QTimer.singleShot(0, lambda: self.mark_startup_phase("first_paint"))
+        return super().eventFilter(watched, event)
+
+    def mark_startup_phase(self, phase):
+        """시작 단계 완료 기록, 모든 단계가 끝나면 보고"""
+        timer = self.startup_timer
+        if not timer:
+            return
+        timer.end(phase)
+        if timer.is_complete():
+            timer.report()
+            self.startup_timer = None
+            if os.environ.get("REGISTER_STARTUP_EXIT") == "1":
+                # Test_Script/startup_benchmark.py 용: 보고 후 바로 종료
+                QApplication.instance().quit()
 
     def setup_spinbox(self):
         """QSpinBox를 32비트 처리용으로 설정 (간단한 방법)"""
@@ -126,7 +273,7 @@ class RegisterTreeViewerController(QMainWindow):
             spinbox.setDisplayIntegerBase(16)  # 16진수 표시
             spinbox.setPrefix("0x")  # 0x 접두사
             spinbox.setValue(0)  # 초기값
-            print("✅ QSpinBox 설정 완료 (32비트 처리 로직 포함)")
+            ui_log.debug("✅ QSpinBox 설정 완료 (32비트 처리 로직 포함)")
 
     def setup_initial_ui_state(self):
         """초기 UI 상태를 설정합니다."""
@@ -151,81 +298,32 @@ class RegisterTreeViewerController(QMainWindow):
                     btn = getattr(self.ui, btn_name)
                     btn.setEnabled(False)  # 연결되기 전에는 비활성화
                     
-            print("✅ 초기 UI 상태 설정 완료")
+            ui_log.debug("✅ 초기 UI 상태 설정 완료")
             
         except Exception as e:
-            print(f"❌ 초기 UI 상태 설정 오류: {e}")
+            ui_log.error("❌ 초기 UI 상태 설정 오류: %s", e)
 
-    def create_bit_buttons(self):
-        """32개의 비트 버튼을 16x2 배열로 동적으로 생성합니다."""
-        # 기존 버튼들 제거
-        self.bit_buttons.clear()
+    def create_load_progress_widgets(self):
+        """상태바에 Excel 로드 진행률 바와 Cancel 버튼을 추가합니다 (로드 중에만 표시)."""
+        self.load_progress_bar = QProgressBar()
+        self.load_progress_bar.setMaximumWidth(200)
+        self.load_progress_bar.setFormat("%v / %m")
+        self.load_cancel_btn = QPushButton("Cancel")
+        self.load_cancel_btn.clicked.connect(self.cancel_excel_load)
+        
+        self.statusBar().addPermanentWidget(self.load_progress_bar)
+        self.statusBar().addPermanentWidget(self.load_cancel_btn)
+        self.load_progress_bar.hide()
+        self.load_cancel_btn.hide()
+
+    def create_bit_register_widget(self):
+        """32비트 레지스터 편집 위젯을 생성합니다 (단일 커스텀 페인팅 위젯)."""
+        self.bit_widget = BitRegisterWidget()
+        self.bit_widget.bitToggled.connect(self.on_bit_button_clicked)
         
-        # 메인 수직 레이아웃 생성
         main_layout = QVBoxLayout()
-        
-        # 그리드 레이아웃 생성 (2행 x 16열)
-        grid_layout = QGridLayout()
-        grid_layout.setSpacing(2)
-        
-        # 0번 비트부터 31번 비트까지 (배열 인덱스와 비트 번호를 일치시킴)
-        for i in range(32):
-            button = QPushButton(f"{i % 10}")  # 비트 번호의 마지막 자리 표시
-            button.setMinimumSize(30, 30)
-            button.setMaximumSize(30, 30)
-            button.setCheckable(True)
-            button.setToolTip(f"Bit {i}")
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #f0f0f0;
-                    border: 2px solid #ccc;
-                    font-weight: bold;
-                    font-size: 10px;
-                }
-                QPushButton:checked {
-                    background-color: #4CAF50;
-                    color: white;
-                    border: 2px solid #45a049;
-                }
-                QPushButton:hover {
-                    background-color: #e0e0e0;
-                }
-                QPushButton:checked:hover {
-                    background-color: #45a049;
-                }
-            """)
-            
-            # 클릭 이벤트 연결 (배열 인덱스와 비트 번호가 동일)
-            button.clicked.connect(lambda checked, bit_num=i: self.on_bit_button_clicked(bit_num, checked))
-            
-            self.bit_buttons.append(button)
-            
-            # 그리드에 배치: 화면 표시는 MSB부터 LSB 순서 (31→0)
-            # 상위 16비트(31~16)는 0행, 하위 16비트(15~0)는 1행
-            row = 0 if i >= 16 else 1
-            col = (31 - i) % 16  # 31번이 0열, 0번이 15열
-            grid_layout.addWidget(button, row, col)
-        
-        # 비트 번호 라벨 추가
-        bit_labels_layout = QHBoxLayout()
-        for i in range(31, -1, -1):
-            if i >= 16:  # 상위 16비트
-                label = QLabel(f"{i}")
-                label.setAlignment(Qt.AlignCenter)
-                label.setStyleSheet("font-size: 8px; color: #666;")
-                bit_labels_layout.addWidget(label)
-        
-        bit_labels_layout2 = QHBoxLayout()
-        for i in range(15, -1, -1):  # 하위 16비트
-            label = QLabel(f"{i}")
-            label.setAlignment(Qt.AlignCenter)
-            label.setStyleSheet("font-size: 8px; color: #666;")
-            bit_labels_layout2.addWidget(label)
-        
-        # 메인 레이아웃에 추가
-        main_layout.addLayout(bit_labels_layout)
-        main_layout.addLayout(grid_layout)
-        main_layout.addLayout(bit_labels_layout2)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.addWidget(self.bit_widget, 0, Qt.AlignLeft)
         
         # 레이아웃을 bit_buttons_widget에 설정
         self.ui.bit_buttons_widget.setLayout(main_layout)
@@ -240,49 +338,76 @@ class RegisterTreeViewerController(QMainWindow):
         # 메뉴 액션 연결
         self.ui.action_open_excel.triggered.connect(self.open_excel_file)
         self.ui.action_save_json.triggered.connect(self.save_json_file)
+        if hasattr(self.ui, 'action_run_sequence'):
+            self.ui.action_run_sequence.triggered.connect(self.run_sequence_file)
+        if hasattr(self.ui, 'action_save_profile'):
+            self.ui.action_save_profile.triggered.connect(self.save_profile_file)
+        if hasattr(self.ui, 'action_apply_profile'):
+            self.ui.action_apply_profile.triggered.connect(self.apply_profile_file)
+        if hasattr(self.ui, 'action_poll_until'):
+            self.ui.action_poll_until.triggered.connect(self.poll_until_dialog)
+        if hasattr(self.ui, 'action_monitor'):
+            self.ui.action_monitor.triggered.connect(self.monitor_dialog)
+        if hasattr(self.ui, 'action_record_journal'):
+            self.ui.action_record_journal.toggled.connect(self.toggle_journal)
+        if hasattr(self.ui, 'action_replay_journal'):
+            self.ui.action_replay_journal.triggered.connect(self.replay_journal_file)
+        if hasattr(self.ui, 'action_latency_stats'):
+            self.ui.action_latency_stats.toggled.connect(self.toggle_latency)
+        if hasattr(self.ui, 'action_export_latency'):
+            self.ui.action_export_latency.triggered.connect(self.export_latency_file)
+        if hasattr(self.ui, 'action_usb_efficiency'):
+            self.ui.action_usb_efficiency.toggled.connect(self.toggle_usb_meter)
+        if hasattr(self.ui, 'action_record_trace'):
+            self.ui.action_record_trace.toggled.connect(self.toggle_trace)
         self.ui.action_exit.triggered.connect(self.close)
         self.ui.action_expand_all.triggered.connect(self.ui.tree_widget.expandAll)
         self.ui.action_collapse_all.triggered.connect(self.ui.tree_widget.collapseAll)
         self.ui.action_protocol_guide.triggered.connect(self.show_protocol_guide)
         self.ui.action_about.triggered.connect(self.show_about)
+        if hasattr(self.ui, 'action_sampling_profiler'):
+            self.ui.action_sampling_profiler.toggled.connect(self.toggle_profiler)
         
         # FT2232H 연결 버튼들
-        print("🔗 FT2232H 버튼 연결 중...")
+        ui_log.debug("🔗 FT2232H 버튼 연결 중...")
         self.ui.protocol_combo.currentTextChanged.connect(self.on_protocol_changed)
         if hasattr(self.ui, 'setup_combo'):
             self.ui.setup_combo.currentTextChanged.connect(self.on_setup_changed)
         self.ui.connect_btn.clicked.connect(self.connect_ft2232h)
         self.ui.disconnect_btn.clicked.connect(self.disconnect_ft2232h)
         self.ui.simulate_btn.clicked.connect(self.simulate_ft2232h_connection)
-        print("✅ FT2232H 버튼 연결 완료")
+        ui_log.debug("✅ FT2232H 버튼 연결 완료")
         
         # 통신 버튼들 (프로토콜에 따라 동작이 달라짐)
-        print("🔗 통신 버튼 연결 중...")
+        ui_log.debug("🔗 통신 버튼 연결 중...")
         self.ui.write_btn.clicked.connect(self.write_register)
         self.ui.write_all_btn.clicked.connect(self.write_all_registers)
         self.ui.read_btn.clicked.connect(self.read_register)
         self.ui.read_all_btn.clicked.connect(self.read_all_registers)
-        print("✅ 통신 버튼 연결 완료")
+        ui_log.debug("✅ 통신 버튼 연결 완료")
         
         # 새로 추가된 단일 읽기/쓰기 버튼들
-        print("🔗 단일 읽기/쓰기 버튼 연결 중...")
+        ui_log.debug("🔗 단일 읽기/쓰기 버튼 연결 중...")
         if hasattr(self.ui, 'single_write_btn'):
             self.ui.single_write_btn.clicked.connect(self.single_write_register)
         if hasattr(self.ui, 'single_read_btn'):
             self.ui.single_read_btn.clicked.connect(self.single_read_register)
-        print("✅ 단일 읽기/쓰기 버튼 연결 완료")
+        ui_log.debug("✅ 단일 읽기/쓰기 버튼 연결 완료")
         
         # 주소/데이터 입력 필드 이벤트
-        print("🔗 주소/데이터 입력 필드 연결 중...")
+        ui_log.debug("🔗 주소/데이터 입력 필드 연결 중...")
         if hasattr(self.ui, 'addr_edit'):
             self.ui.addr_edit.textChanged.connect(self.on_addr_changed)
         if hasattr(self.ui, 'data_edit'):
             self.ui.data_edit.textChanged.connect(self.on_data_changed)
-        print("✅ 주소/데이터 입력 필드 연결 완료")
+        ui_log.debug("✅ 주소/데이터 입력 필드 연결 완료")
         
         # 16진수 값 변경 이벤트
         self.ui.hex_value_spinbox.valueChanged.connect(self.on_hex_value_changed)
         
+        # 값 모델 -> 모든 뷰 (이벤트 루프 틱당 한 번)
+        self.value_model.valueChanged.connect(self.on_register_value_changed)
+        
         # 로그 지우기 버튼
         self.ui.clear_log_btn.clicked.connect(self.clear_log)
     
@@ -290,7 +415,7 @@ class RegisterTreeViewerController(QMainWindow):
     
     def on_protocol_changed(self, protocol):
         """프로토콜 변경 이벤트 처리"""
-        print(f"📡 프로토콜 변경: {protocol}")
+        ui_log.debug("📡 프로토콜 변경: %s", protocol)
         self.current_protocol = protocol
         
         # 현재 연결이 있으면 해제
@@ -343,7 +468,7 @@ class RegisterTreeViewerController(QMainWindow):
     
     def on_setup_changed(self, setup_text):
         """Setup ComboBox 변경 이벤트 처리"""
-        print(f"⚙️ Setup 변경: {setup_text}")
+        ui_log.debug("⚙️ Setup 변경: %s", setup_text)
         
         # 현재 프로토콜에 따라 설정 적용
         if self.current_protocol == "SPI":
@@ -359,7 +484,7 @@ class RegisterTreeViewerController(QMainWindow):
             else:
                 self.spi_mode = 0  # 기본값
                 
-            print(f"🔧 SPI 모드 설정: {self.spi_mode}")
+            ui_log.debug("🔧 SPI 모드 설정: %s", self.spi_mode)
             self.log_message(f"⚙️ SPI 모드 설정: {setup_text}")
             
         elif self.current_protocol == "I2C":
@@ -373,190 +498,37 @@ class RegisterTreeViewerController(QMainWindow):
             elif "High Speed Mode" in setup_text:
                 self.ui.freq_edit.setText("3400000")  # 3.4MHz
                 
-            print(f"🔧 I2C 설정: {setup_text}")
+            ui_log.debug("🔧 I2C 설정: %s", setup_text)
             self.log_message(f"⚙️ I2C 설정: {setup_text}")
             
         elif self.current_protocol == "UART":
             # UART 설정 저장 (향후 구현에서 사용)
             self.uart_config = setup_text
             
-            print(f"🔧 UART 설정: {setup_text}")
+            ui_log.debug("🔧 UART 설정: %s", setup_text)
             self.log_message(f"⚙️ UART 설정: {setup_text}")
     
     # ========== 공용 유틸리티 함수들 ==========
     
     def parse_bit_range(self, bit_range_str):
         """비트 범위 문자열을 파싱하여 (upper_bit, lower_bit) 튜플 반환"""
-        try:
-            bit_range_str = str(bit_range_str).strip()
-            if ':' in bit_range_str:
-                parts = bit_range_str.split(':')
-                upper_bit = int(parts[0])
-                lower_bit = int(parts[1])
-            else:
-                # 단일 비트인 경우
-                upper_bit = lower_bit = int(bit_range_str)
-            return upper_bit, lower_bit
-        except (ValueError, AttributeError) as e:
-            print(f"⚠️ 비트 범위 파싱 오류 ({bit_range_str}): {e}")
-            return 0, 0
+        return register_fields.parse_bit_range(bit_range_str)
+    
     
     def extract_field_value_from_register(self, register_value, upper_bit, lower_bit):
         """레지스터 값에서 특정 비트 범위의 필드 값을 추출"""
-        if upper_bit >= lower_bit and upper_bit <= 31 and lower_bit >= 0:
-            mask = ((1 << (upper_bit - lower_bit + 1)) - 1) << lower_bit
-            field_value = (register_value & mask) >> lower_bit
-            return field_value
-        return 0
+        return register_fields.extract_field_value_from_register(register_value, upper_bit, lower_bit)
+    
     
     def insert_field_value_to_register(self, register_value, field_value, upper_bit, lower_bit):
         """레지스터 값의 특정 비트 범위에 필드 값을 삽입"""
-        if upper_bit >= lower_bit and upper_bit <= 31 and lower_bit >= 0:
-            # 기존 해당 비트 범위를 0으로 클리어
-            mask = ((1 << (upper_bit - lower_bit + 1)) - 1) << lower_bit
-            register_value &= ~mask
-            
-            # 새로운 필드 값을 해당 위치에 삽입
-            field_mask = (1 << (upper_bit - lower_bit + 1)) - 1
-            shifted_value = (field_value & field_mask) << lower_bit
-            register_value |= shifted_value
-            
-            return register_value & 0xFFFFFFFF  # 32비트 마스크
-        return register_value
+        return register_fields.insert_field_value_to_register(register_value, field_value, upper_bit, lower_bit)
+    
     
     def calculate_register_value_from_fields(self, fields):
         """필드들의 값으로부터 전체 레지스터 값을 계산"""
-        total_value = 0
-        
-        for field in fields:
-            try:
-                # 기본값 파싱
-                default_str = str(field.get('default_value', '0')).strip()
-                if default_str.startswith('0x') or default_str.startswith('0X'):
-                    field_value = int(default_str, 16)
-                else:
-                    field_value = int(default_str)
-                
-                # 비트 범위 파싱
-                bit_range = field.get('bit_range', '0')
-                upper_bit, lower_bit = self.parse_bit_range(bit_range)
-                
-                # 비트 범위가 설정되지 않았으면 기존 방식으로 가져오기
-                if upper_bit == 0 and lower_bit == 0:
-                    upper_bit = field.get('upper_bit', 0)
-                    lower_bit = field.get('lower_bit', 0)
-                
-                # 필드 값이 0이 아닌 경우에만 레지스터에 값 설정
-                if field_value != 0:
-                    total_value = self.insert_field_value_to_register(
-                        total_value, field_value, upper_bit, lower_bit
-                    )
-                    print(f"    🔸 필드 '{field.get('name', 'unknown')}': 값={field_value}, 비트={upper_bit}:{lower_bit}")
-                else:
-                    print(f"    🔸 필드 '{field.get('name', 'unknown')}': 값={field_value} (0이므로 스킵)")
-                                
-            except Exception as e:
-                print(f"    ❌ 필드 처리 오류 '{field.get('name', 'unknown')}': {e}")
-                continue
-        
-        final_value = total_value & 0xFFFFFFFF  # 32비트 마스크
-        return final_value
+        return register_fields.calculate_register_value_from_fields(fields)
     
-    def calculate_register_value_from_tree(self):
-        """현재 Tree 위젯에 표시된 필드 값들로부터 전체 레지스터 값을 계산"""
-        if not self.current_register:
-            return 0
-            
-        total_value = 0
-        print(f"🌳 Tree 기반 레지스터 값 계산 시작 (레지스터: {self.current_register})")
-        
-        try:
-            # Tree에서 현재 레지스터의 모든 필드 항목 찾기
-            root = self.ui.tree_widget.invisibleRootItem()
-            print(f"🔍 Tree 루트에서 {root.childCount()}개 시트 항목 발견")
-            
-            for i in range(root.childCount()):
-                sheet_item = root.child(i)
-                print(f"📋 시트 '{sheet_item.text(0)}'에서 {sheet_item.childCount()}개 레지스터 확인")
-                
-                for j in range(sheet_item.childCount()):
-                    reg_item = sheet_item.child(j)
-                    reg_text = reg_item.text(0)
-                    reg_data = reg_item.data(0, Qt.UserRole)
-                    
-                    print(f"    🔍 레지스터: {reg_text}")
-                    
-                    # UserRole 데이터로 현재 레지스터 확인
-                    if reg_data and reg_data.get('address') == self.current_register:
-                        print(f"🎯 대상 레지스터 발견: {reg_text} (주소: {self.current_register})")
-                        
-                        # 해당 레지스터의 모든 필드 순회
-                        print(f"📋 레지스터에 {reg_item.childCount()}개 필드 발견")
-                        for k in range(reg_item.childCount()):
-                            field_item = reg_item.child(k)
-                            field_text = field_item.text(0)
-                            field_data = field_item.data(0, Qt.UserRole)
-                            
-                            print(f"    🔍 필드 항목: '{field_text}'")
-                            
-                            if field_data and field_data.get('type') == 'field':
-                                field_name = field_data.get('name', '')
-                                bit_range = field_data.get('bit_range', '')
-                                
-                                # 필드 텍스트에서 값 추출 (예: "EN_VCM [15:15] = 1")
-                                try:
-                                    if ' = ' in field_text:
-                                        field_value_text = field_text.split(' = ')[-1].strip()
-                                        
-                                        if field_value_text.startswith('0x') or field_value_text.startswith('0X'):
-                                            field_value = int(field_value_text, 16)
-                                        else:
-                                            field_value = int(field_value_text)
-                                        
-                                        print(f"    🔢 필드 '{field_name}': Tree값={field_value}, 비트범위={bit_range}")
-                                        
-                                        # 비트 범위 파싱
-                                        upper_bit, lower_bit = self.parse_bit_range(bit_range)
-                                        
-                                        # 모든 필드 값을 포함 (0이어도 처리)
-                                        total_value = self.insert_field_value_to_register(
-                                            total_value, field_value, upper_bit, lower_bit
-                                        )
-                                        print(f"    ✅ 필드 '{field_name}': 값={field_value}, 비트={upper_bit}:{lower_bit}, 누적값=0x{total_value:08X}")
-                                    else:
-                                        print(f"    ⚠️ 필드 텍스트에서 값을 찾을 수 없음: '{field_text}'")
-                                        
-                                except Exception as e:
-                                    print(f"    ❌ 필드 '{field_name}' 값 파싱 오류: {e}")
-                                    continue
-                            else:
-                                print(f"    ⚠️ 필드 데이터가 없거나 타입이 'field'가 아님")
-                        
-                        break
-        
-        except Exception as e:
-            print(f"❌ Tree 기반 레지스터 값 계산 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            return 0
-        
-        # 대상 레지스터를 찾지 못한 경우
-        if total_value == 0:
-            print(f"⚠️ 레지스터 '{self.current_register}'를 Tree에서 찾을 수 없거나 모든 필드 값이 0임")
-            print(f"🔄 대안: 비트 버튼 상태로 직접 계산")
-            
-            # 비트 버튼 상태로 직접 계산
-            for i in range(32):
-                if i < len(self.bit_buttons):
-                    btn = self.bit_buttons[i]
-                    if btn.isChecked():
-                        total_value |= (1 << i)
-            
-            print(f"🔢 비트 버튼 기반 계산 결과: 0x{total_value:08X} ({total_value})")
-        
-        final_value = total_value & 0xFFFFFFFF  # 32비트 마스크
-        print(f"🔢 Tree 기반 최종 레지스터 값: 0x{final_value:08X} ({final_value})")
-        return final_value
     
     def get_field_data(self, field_name):
         """현재 레지스터에서 특정 필드의 데이터를 찾아 반환"""
@@ -573,198 +545,79 @@ class RegisterTreeViewerController(QMainWindow):
                                 return field
             return None
         except Exception as e:
-            print(f"❌ 필드 데이터 검색 오류: {e}")
+            ui_log.error("❌ 필드 데이터 검색 오류: %s", e)
             return None
     
     def reset_all_bits_to_zero(self):
-        """모든 비트 버튼을 0으로 초기화합니다."""
+        """모든 비트를 0으로 초기화합니다."""
+        ui_log.debug("🔄 모든 비트를 0으로 초기화 중...")
+        # 값 모델만 바꾸면 비트 위젯 / SpinBox / DEC / Tree 는 다음 틱에 한 번에 갱신됨
+        self.value_model.setValue(0)
+    
+    def on_register_value_changed(self, value):
+        """값 모델의 병합된 변경 알림 - 모든 뷰와 저장소를 한 번에 동기화"""
         try:
-            print("🔄 모든 비트 버튼을 0으로 초기화 중...")
-            
-            if not self.bit_buttons or len(self.bit_buttons) != 32:
-                print(f"❌ 비트 버튼 배열 문제: {len(self.bit_buttons) if self.bit_buttons else 0}")
-                return
-            
-            # 모든 비트 버튼을 0으로 설정
-            for i, button in enumerate(self.bit_buttons):
-                button.blockSignals(True)
-                button.setChecked(False)
-                button.setText("0")
-                button.blockSignals(False)
-            
-            # SpinBox 값을 0으로 설정
-            if hasattr(self.ui, 'hex_value_spinbox'):
-                self.ui.hex_value_spinbox.blockSignals(True)
-                self.ui.hex_value_spinbox.setValue(0)
-                self.ui.hex_value_spinbox.blockSignals(False)
+            ui_log.debug("🔢 레지스터 값 동기화: %s (0x%08X)", value, value)
             
-            # DEC 표시를 0으로 업데이트
-            self.update_dec_display(0)
+            self.bit_widget.setValue(value)
+            self.update_hex_display(value)
+            self.update_dec_display(value)
+            self.update_tree_display_values(value)
             
-            # Tree 표시 값 업데이트
+            # 현재 레지스터의 데이터 저장
             if self.current_register:
-                self.update_tree_display_values(0)
-            
-            print("✅ 모든 비트 버튼이 0으로 초기화됨")
+                self.register_data_store[self.current_register] = value
+                self.reg_data = value  # 전역 상태도 동기화
+                ui_log.debug("💾 레지스터 데이터 저장: %s = 0x%08X", self.current_register, value)
             
         except Exception as e:
-            print(f"❌ 비트 버튼 초기화 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            ui_log.exception("❌ 레지스터 값 동기화 중 오류: %s", e)
     
     # ========== 메인 기능 함수들 ==========
 
     def on_bit_button_clicked(self, bit_index, checked):
-        """비트 버튼 클릭 이벤트 처리 - 완전 안전 버전 (spinbox 제거)"""
+        """비트 위젯 클릭 이벤트 처리 (필드 범위 밖 비트는 위젯에서 클릭되지 않음)"""
+        ui_log.debug("🔧 비트 %s 클릭: %s", bit_index, 'ON' if checked else 'OFF')
+        
+        if not (0 <= bit_index <= 31):
+            ui_log.error("❌ 잘못된 비트 인덱스: %s", bit_index)
+            return
+        
+        self.value_model.setBit(bit_index, checked)
+    
+    
+    def update_hex_display(self, value):
+        """HEX SpinBox 업데이트 (필드 선택 시 필드 값, 아니면 전체 값 / unsigned to signed 변환)
+        
+        값 모델이 뷰를 동기화하는 중에만 호출되므로, 범위 변경으로 인한 중간 valueChanged 는
+        on_hex_value_changed 에서 무시됩니다.
+        """
         try:
-            print(f"🔧 비트 {bit_index} 클릭: {'ON' if checked else 'OFF'}")
-            
-            # 입력 검증
-            if not (0 <= bit_index <= 31):
-                print(f"❌ 잘못된 비트 인덱스: {bit_index}")
-                return
-                
-            if not self.bit_buttons or len(self.bit_buttons) != 32:
-                print(f"❌ 비트 버튼 배열 오류: {len(self.bit_buttons) if self.bit_buttons else 0}")
+            if not hasattr(self, 'ui') or not hasattr(self.ui, 'hex_value_spinbox'):
                 return
+            hex_widget = self.ui.hex_value_spinbox
             
-            # 버튼 텍스트 업데이트 (직접 인덱스 사용)
-            if 0 <= bit_index < len(self.bit_buttons):
-                button = self.bit_buttons[bit_index]
-                button.setText("1" if checked else "0")
-            
-            # 현재 선택된 필드가 있는 경우 필드 범위 내에서만 계산
             if self.current_field_data:
-                bit_range = self.current_field_data.get('bit_range', '')
-                upper_bit, lower_bit = self.parse_bit_range(bit_range)
-                
-                print(f"🎯 필드 선택됨: {self.current_field} [{bit_range}]")
-                
-                # 클릭된 비트가 필드 범위 내에 있는지 확인
-                if lower_bit <= bit_index <= upper_bit:
-                    # 필드 범위 내의 비트들만으로 필드 값 계산
-                    field_value = 0
-                    for bit_pos in range(lower_bit, upper_bit + 1):
-                        btn_idx = bit_pos
-                        if 0 <= btn_idx < len(self.bit_buttons):
-                            btn = self.bit_buttons[btn_idx]
-                            if btn.isChecked():
-                                # 필드 내에서의 비트 위치 (lower_bit가 0번 위치)
-                                field_bit_pos = bit_pos - lower_bit
-                                field_value |= (1 << field_bit_pos)
-                    
-                    print(f"🔢 필드 값 계산: {field_value} (비트 범위: {upper_bit}:{lower_bit})")
-                    
-                    # 현재 전체 레지스터 값 가져오기
-                    current_reg_value = 0
-                    try:
-                        spinbox_value = self.ui.hex_value_spinbox.value()
-                        if spinbox_value < 0:
-                            current_reg_value = spinbox_value + 4294967296
-                        else:
-                            current_reg_value = spinbox_value
-                    except:
-                        current_reg_value = 0
-                    
-                    # 필드 값을 전체 레지스터 값에 삽입
-                    # 하지만 실제로는 전체 비트 버튼 상태를 확인하여 최종 값 계산
-                    final_value = 0
-                    for i in range(32):
-                        if i < len(self.bit_buttons):
-                            btn = self.bit_buttons[i]
-                            if btn.isChecked():
-                                final_value |= (1 << i)
-                    
-                    print(f"🔍 전체 비트 버튼 상태 기반 계산: 0x{final_value:08X} ({final_value})")
-                else:
-                    print(f"⚠️ 클릭된 비트 {bit_index}가 필드 범위 [{upper_bit}:{lower_bit}] 밖에 있음")
-                    return
+                upper_bit, lower_bit = self.parse_bit_range(self.current_field_data.get('bit_range', ''))
+                self.set_spinbox_range_for_field(upper_bit, lower_bit)
+                display_value = self.extract_field_value_from_register(value, upper_bit, lower_bit)
             else:
-                # 필드가 선택되지 않은 경우 전체 32비트 값 계산
-                calculated_value = 0
-                for i in range(32):
-                    if i < len(self.bit_buttons):
-                        btn = self.bit_buttons[i]
-                        if btn.isChecked():
-                            bit_position = i  # 직접 인덱스 사용
-                            if 0 <= bit_position <= 31:
-                                calculated_value |= (1 << bit_position)
-                
-                final_value = calculated_value & 0xFFFFFFFF
-            
-            print(f"🔢 계산된 값: {final_value} (0x{final_value:08X})")
+                self.reset_spinbox_range()
+                display_value = value
             
-            # SpinBox 업데이트 
-            if hasattr(self, 'ui') and hasattr(self.ui, 'hex_value_spinbox'):
-                # unsigned int를 signed int로 변환
-                if final_value > 2147483647:
-                    signed_value = final_value - 4294967296
-                else:
-                    signed_value = final_value
-                
-                if self.current_field_data:
-                    # 필드가 선택된 상태에서는 시그널 차단하여 무한 루프 방지
-                    self.ui.hex_value_spinbox.blockSignals(True)
-                    self.ui.hex_value_spinbox.setValue(signed_value)
-                    self.ui.hex_value_spinbox.blockSignals(False)
-                    
-                    # 직접 DEC와 Tree 업데이트 (비트 버튼은 이미 클릭으로 업데이트됨)
-                    self.update_dec_display(final_value)
-                    self.update_tree_display_values(final_value)
-                    
-                    # 현재 레지스터의 데이터 저장
-                    if self.current_register:
-                        self.register_data_store[self.current_register] = final_value
-                        self.reg_data = final_value  # 전역 상태도 동기화
-                        print(f"💾 레지스터 데이터 저장 (필드): {self.current_register} = 0x{final_value:08X}")
-                    
-                    # 디버깅: 실제 필드 값 검증
-                    bit_range = self.current_field_data.get('bit_range', '')
-                    upper_bit, lower_bit = self.parse_bit_range(bit_range)
-                    extracted_field_value = self.extract_field_value_from_register(final_value, upper_bit, lower_bit)
-                    print(f"🔍 디버깅 - 필드: {self.current_field}, 범위: {bit_range}")
-                    print(f"🔍 전체 레지스터 값: 0x{final_value:08X} ({final_value})")
-                    print(f"🔍 추출된 필드 값: {extracted_field_value}")
-                    
-                    print(f"✅ 필드 선택 상태 - 직접 업데이트: {final_value} (0x{final_value:08X})")
-                else:
-                    # 필드가 선택되지 않은 상태에서는 정상 시그널 발생
-                    self.ui.hex_value_spinbox.setValue(signed_value)
-                    
-                    # 현재 레지스터의 데이터 저장
-                    if self.current_register:
-                        self.register_data_store[self.current_register] = final_value
-                        self.reg_data = final_value  # 전역 상태도 동기화
-                        print(f"💾 레지스터 데이터 저장 (전체): {self.current_register} = 0x{final_value:08X}")
-                    
-                    print(f"✅ 비트 버튼 -> SpinBox 업데이트: {final_value} (0x{final_value:08X})")
+            # unsigned int를 signed int로 변환
+            if display_value > 2147483647:
+                signed_value = display_value - 4294967296
             else:
-                # SpinBox가 없으면 직접 DEC 업데이트
-                self.update_dec_display(final_value)
+                signed_value = display_value
             
+            # 같은 값이면 다시 설정하지 않음 (입력 중인 텍스트/커서 유지)
+            if hex_widget.value() != signed_value:
+                hex_widget.setValue(signed_value)
+                ui_log.debug("✅ HEX SpinBox 업데이트: UInt32=%s (0x%08X) -> Signed=%s", display_value, display_value, signed_value)
         except Exception as e:
-            print(f"❌ 비트 버튼 클릭 처리 중 예외: {e}")
-            import traceback
-            traceback.print_exc()
+            ui_log.error("❌ HEX 표시 업데이트 오류: %s", e)
     
-    def update_hex_display(self, value):
-        """HEX 표시 업데이트 (unsigned to signed 변환)"""
-        try:
-            if hasattr(self, 'ui') and hasattr(self.ui, 'hex_value_spinbox'):
-                hex_widget = self.ui.hex_value_spinbox
-                if hex_widget is not None:
-                    # unsigned int를 signed int로 변환
-                    if value > 2147483647:
-                        signed_value = value - 4294967296
-                    else:
-                        signed_value = value
-                        
-                    hex_widget.blockSignals(True)
-                    hex_widget.setValue(signed_value)
-                    hex_widget.blockSignals(False)
-                    print(f"✅ HEX SpinBox 업데이트: UInt32={value} (0x{value:08X}) -> Signed={signed_value}")
-        except Exception as e:
-            print(f"❌ HEX 표시 업데이트 오류: {e}")
     
     def update_dec_display(self, value):
         """DEC 표시 업데이트 (안전한 방법)"""
@@ -774,15 +627,15 @@ class RegisterTreeViewerController(QMainWindow):
                 if dec_widget is not None:
                     dec_text = str(value)
                     dec_widget.setText(dec_text)
-                    print(f"✅ DEC 업데이트: {dec_text}")
+                    ui_log.debug("✅ DEC 업데이트: %s", dec_text)
         except Exception as e:
-            print(f"❌ DEC 표시 업데이트 오류: {e}")
+            ui_log.error("❌ DEC 표시 업데이트 오류: %s", e)
 
     def on_hex_value_changed(self, value):
-        """QSpinBox 값 변경 이벤트 처리 - signed to unsigned 변환"""
+        """QSpinBox 값 변경 이벤트 처리 - signed to unsigned 변환 후 값 모델에 반영"""
         try:
-            # UI 업데이트 중이면 처리하지 않음 (무한 루프 방지)
-            if self._updating_ui:
+            # 값 모델이 SpinBox를 동기화하는 중이면 사용자 입력이 아님
+            if self.value_model.isPublishing():
                 return
                 
             # signed int를 unsigned int로 변환
@@ -791,113 +644,35 @@ class RegisterTreeViewerController(QMainWindow):
             else:
                 uint32_value = value
                 
-            print(f"🔢 SpinBox 값 변경: {value} -> UInt32: {uint32_value} (0x{uint32_value:08X})")
+            ui_log.debug("🔢 SpinBox 값 변경: %s -> UInt32: %s (0x%08X)", value, uint32_value, uint32_value)
             
-            # 필드가 선택된 경우: 필드 범위 내에서만 값 적용
             if self.current_field_data:
+                # 필드가 선택된 경우: SpinBox 값은 필드 값이며 필드 범위에만 적용
                 bit_range = self.current_field_data.get('bit_range', '')
                 upper_bit, lower_bit = self.parse_bit_range(bit_range)
-                
-                # 현재 전체 비트 버튼 상태 확인
-                current_full_value = 0
-                for i in range(32):
-                    if i < len(self.bit_buttons):
-                        btn = self.bit_buttons[i]
-                        if btn.isChecked():
-                            current_full_value |= (1 << i)
-                
-                # 선택된 필드 범위의 기존 값 제거
-                mask = ((1 << (upper_bit - lower_bit + 1)) - 1) << lower_bit
-                current_full_value &= ~mask
-                
-                # 새로운 필드 값을 해당 비트 범위에 삽입
-                field_value = uint32_value & ((1 << (upper_bit - lower_bit + 1)) - 1)
-                final_value = current_full_value | (field_value << lower_bit)
-                
-                print(f"🎯 필드 '{self.current_field}' 범위 [{bit_range}]에만 값 적용")
-                print(f"   기존 전체 값: 0x{current_full_value:08X}")
-                print(f"   새 필드 값: {field_value}")
-                print(f"   최종 값: 0x{final_value:08X}")
-                
-                # 비트 버튼들 업데이트 (최종 값으로)
-                self.update_bit_buttons_from_value(final_value)
-                
-                # DEC 표시 업데이트 (최종 값으로)
-                self.update_dec_display(final_value)
-                
-                # Tree의 표시 값 업데이트 (최종 값으로)
-                self.update_tree_display_values(final_value)
-                
-                # 현재 레지스터의 데이터 저장
-                if self.current_register:
-                    self.register_data_store[self.current_register] = final_value
-                    self.reg_data = final_value  # 전역 상태도 동기화
-                    print(f"💾 레지스터 데이터 저장: {self.current_register} = 0x{final_value:08X}")
+                self.value_model.setField(upper_bit, lower_bit, uint32_value)
+                ui_log.debug("🎯 필드 '%s' 범위 [%s]에만 값 적용", self.current_field, bit_range)
             else:
                 # 필드가 선택되지 않은 경우: 전체 값 적용
-                print(f"📊 전체 레지스터 값 적용: 0x{uint32_value:08X}")
-                
-                # 비트 버튼들 업데이트
-                self.update_bit_buttons_from_value(uint32_value)
-                
-                # DEC 표시 업데이트
-                self.update_dec_display(uint32_value)
-                
-                # Tree의 표시 값 업데이트
-                self.update_tree_display_values(uint32_value)
-                
-                # 현재 레지스터의 데이터 저장
-                if self.current_register:
-                    self.register_data_store[self.current_register] = uint32_value
-                    self.reg_data = uint32_value  # 전역 상태도 동기화
-                    print(f"💾 레지스터 데이터 저장: {self.current_register} = 0x{uint32_value:08X}")
-            
-            print(f"✅ HEX 처리 완료: 0x{value:08X}")
+                self.value_model.setValue(uint32_value)
             
         except Exception as e:
-            print(f"❌ HEX 값 변경 처리 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            ui_log.exception("❌ HEX 값 변경 처리 중 오류: %s", e)
+    
     
     def update_bit_buttons_from_value(self, value):
-        """값에서 비트 버튼들을 안전하게 업데이트 (필드 선택 상태 유지)"""
-        try:
-            if not self.bit_buttons or len(self.bit_buttons) != 32:
-                print(f"❌ 비트 버튼 배열 문제: {len(self.bit_buttons) if self.bit_buttons else 0}")
-                return
-            
-            # 현재 강조된 필드의 비트 범위 저장 (있다면)
-            highlighted_bits = set()
-            if self.current_field_data:
-                bit_range = self.current_field_data.get('bit_range', '')
-                upper_bit, lower_bit = self.parse_bit_range(bit_range)
-                highlighted_bits = set(range(lower_bit, upper_bit + 1))
-                
-            for i in range(32):
-                if i < len(self.bit_buttons):
-                    button = self.bit_buttons[i]
-                    bit_value = (value >> i) & 1  # i번째 비트 값 추출
-                    
-                    button.blockSignals(True)
-                    button.setChecked(bool(bit_value))
-                    button.setText("1" if bit_value else "0")
-                    button.blockSignals(False)
-                    
-                    # 강조된 비트가 아닌 경우에만 기본 스타일 적용
-                    if i not in highlighted_bits:
-                        # 기본 스타일 유지 (강조 표시되지 않은 버튼들)
-                        pass  # 이미 기본 스타일이 적용되어 있음
-                    
-        except Exception as e:
-            print(f"❌ 비트 버튼 업데이트 오류: {e}")
+        """값으로 비트 위젯을 업데이트 (값 모델을 통해 모든 뷰가 함께 갱신됨)"""
+        self.value_model.setValue(value)
 
     def connect_ft2232h(self):
         """FT2232H 멀티 프로토콜 연결"""
-        print(f"🔗 FT2232H {self.current_protocol} 연결 버튼 클릭됨")
+        transport_log.debug("🔗 FT2232H %s 연결 버튼 클릭됨", self.current_protocol)
         
-        if not PYFTDI_AVAILABLE:
+        pyftdi = load_pyftdi()
+        if pyftdi is None:
             QMessageBox.warning(self, "라이브러리 없음", "pyftdi 라이브러리가 필요합니다.\npip install pyftdi")
             return
+        SpiController, I2cController, serial_for_url = pyftdi
             
         try:
             url = self.ui.url_edit.text()
@@ -914,7 +689,7 @@ class RegisterTreeViewerController(QMainWindow):
                 # I2C 컨트롤러 초기화
                 self.i2c_controller = I2cController()
                 self.i2c_controller.configure(url)
-                self.i2c = self.i2c_controller.get_port(0x50)  # 기본 I2C 주소
+                self.i2c = self.i2c_controller.get_port(I2C_DEFAULT_ADDRESS)  # 기본 I2C 주소
                 self.log_message(f"✅ FT2232H I2C 연결 성공: {url} @ {frequency}Hz")
                 
             elif self.current_protocol == "UART":
@@ -937,7 +712,7 @@ class RegisterTreeViewerController(QMainWindow):
             if hasattr(self.ui, 'single_read_btn'):
                 self.ui.single_read_btn.setEnabled(True)
             
-            print(f"✅ {self.current_protocol} 버튼들 활성화됨")
+            transport_log.debug("✅ %s 버튼들 활성화됨", self.current_protocol)
             self.statusBar().showMessage(f"FT2232H {self.current_protocol} 연결됨")
             
         except Exception as e:
@@ -946,32 +721,43 @@ class RegisterTreeViewerController(QMainWindow):
 
     def disconnect_ft2232h(self):
         """FT2232H 멀티 프로토콜 연결 해제"""
-        print(f"🔌 FT2232H {self.current_protocol} 연결 해제 버튼 클릭됨")
+        transport_log.debug("🔌 FT2232H %s 연결 해제 버튼 클릭됨", self.current_protocol)
         
         try:
-            # 실제 연결이 있는 경우 해제
-            if self.spi_controller:
-                self.spi_controller.close()
-                self.spi_controller = None
-                self.spi = None
-                print("🔌 SPI 연결 해제됨")
-                
-            if self.i2c_controller:
-                self.i2c_controller.close()
-                self.i2c_controller = None
-                self.i2c = None
-                print("🔌 I2C 연결 해제됨")
-                
-            if self.uart_serial:
-                self.uart_serial.close()
-                self.uart_serial = None
-                print("🔌 UART 연결 해제됨")
-            
-            # 시뮬레이션 모드 해제
+            # 포트를 닫기 전에 poll-until / 모니터 / USB 효율 측정 정지
+            self._stop_poll_worker()
+            if self.monitor_window is not None:
+                # 모니터 스레드가 읽기 중이라 stop() 이 먼저 돌아와도 읽기는 bus_lock 안에서 하므로
+                # 아래의 잠금 안 닫기가 그 읽기가 끝나기를 기다리고, 이후 스레드는 포트를 다시 쓰지 않음
+                self.monitor_window.close()
+            self.stop_usb_meter()
+            
+            # 실제 연결이 있는 경우 해제 (다른 스레드의 전송이 끝난 뒤 닫도록 포트 잠금 안에서)
+            with self.bus_lock:
+                if self.spi_controller:
+                    self.spi_controller.close()
+                    self.spi_controller = None
+                    self.spi = None
+                    transport_log.debug("🔌 SPI 연결 해제됨")
+                    
+                if self.i2c_controller:
+                    self.i2c_controller.close()
+                    self.i2c_controller = None
+                    self.i2c = None
+                    transport_log.debug("🔌 I2C 연결 해제됨")
+                    
+                if self.uart_serial:
+                    self.uart_serial.close()
+                    self.uart_serial = None
+                    transport_log.debug("🔌 UART 연결 해제됨")
+            
+            # 시뮬레이션 모드 해제 (시뮬레이션 포트는 컨트롤러 객체가 없음)
             if self.simulation_mode:
                 self.simulation_mode = False
-                self.simulation_registers.clear()
-                print("🎭 시뮬레이션 모드 해제됨")
+                self.sim_device = None
+                self.spi = None
+                self.i2c = None
+                transport_log.debug("🎭 시뮬레이션 모드 해제됨")
             
             # UI 상태 변경
             self.ui.connect_btn.setEnabled(True)
@@ -988,7 +774,7 @@ class RegisterTreeViewerController(QMainWindow):
             if hasattr(self.ui, 'single_read_btn'):
                 self.ui.single_read_btn.setEnabled(False)
             
-            print(f"✅ {self.current_protocol} 버튼들 비활성화됨")
+            transport_log.debug("✅ %s 버튼들 비활성화됨", self.current_protocol)
             self.log_message(f"🔌 FT2232H {self.current_protocol} 연결 해제")
             self.statusBar().showMessage("연결 해제됨")
             
@@ -996,13 +782,43 @@ class RegisterTreeViewerController(QMainWindow):
             self.log_message(f"❌ 연결 해제 오류: {str(e)}")
 
     def simulate_ft2232h_connection(self):
-        """FT2232H 시뮬레이션 연결 (하드웨어 없이 테스트 가능)"""
-        print(f"🎭 FT2232H {self.current_protocol} 시뮬레이션 연결 버튼 클릭됨")
+        """FT2232H 시뮬레이션 연결 (하드웨어 없이 테스트 가능)
+        
+        현재 레지스터 맵의 기본값으로 전원 인가된 SimulatedRegisterDevice 를 만들고,
+        프로토콜별 시뮬레이션 포트를 self.spi / self.i2c / self.uart_serial 에 연결합니다.
+        읽기/쓰기는 실제 하드웨어와 같은 프레임 코드 경로를 그대로 통과합니다.
+        """
+        transport_log.debug("🎭 FT2232H %s 시뮬레이션 연결 버튼 클릭됨", self.current_protocol)
         
         try:
-            # 시뮬레이션 모드 활성화
+            try:
+                frequency = int(self.ui.freq_edit.text())
+            except ValueError:
+                frequency = 1000000
+            
+            # 시뮬레이션 모드 활성화 (실제와 비슷한 USB/버스 지연을 실제 시간으로 적용)
+            self.sim_device = SimulatedRegisterDevice.from_register_map(self.data)
+            clock = SimClock(realtime=True)
+            if self.current_protocol == "SPI":
+                port = SimulatedSpiPort(self.sim_device, frequency=frequency, mode=self.spi_mode, clock=clock)
+            elif self.current_protocol == "I2C":
+                port = SimulatedI2cPort(self.sim_device, I2C_DEFAULT_ADDRESS, frequency=frequency, clock=clock)
+            else:
+                port = SimulatedSerialPort(self.sim_device, baudrate=frequency, clock=clock)
+            
+            # REGISTER_SIM_FAULTS=noisy_cable 등: 시뮬레이션 전송 경로에 고장 주입 (sim_faults.PROFILES)
+            fault_profile = os.environ.get("REGISTER_SIM_FAULTS")
+            if fault_profile:
+                port = FaultInjectingPort(port, FaultProfile.named(fault_profile))
+                self.log_message(f"   고장 주입 프로파일: {port.profile}")
+            
+            if self.current_protocol == "SPI":
+                self.spi = port
+            elif self.current_protocol == "I2C":
+                self.i2c = port
+            else:
+                self.uart_serial = port
             self.simulation_mode = True
-            self.simulation_registers.clear()  # 시뮬레이션 레지스터 초기화
             
             # UI 상태 변경 (실제 연결과 동일)
             self.ui.connect_btn.setEnabled(False)
@@ -1019,17 +835,58 @@ class RegisterTreeViewerController(QMainWindow):
             if hasattr(self.ui, 'single_read_btn'):
                 self.ui.single_read_btn.setEnabled(True)
             
-            print(f"✅ {self.current_protocol} 버튼들 활성화됨 (시뮬레이션 모드)")
+            transport_log.debug("✅ %s 버튼들 활성화됨 (시뮬레이션 모드)", self.current_protocol)
             self.log_message(f"🎭 FT2232H {self.current_protocol} 시뮬레이션 연결 성공 (하드웨어 없이 테스트 모드)")
+            self.log_message(f"   시뮬레이션 디바이스: {len(self.sim_device.defaults)}개 레지스터 기본값으로 초기화")
             self.statusBar().showMessage(f"FT2232H {self.current_protocol} 시뮬레이션 연결됨")
             
         except Exception as e:
             QMessageBox.critical(self, "시뮬레이션 오류", f"시뮬레이션 연결 실패:\n{str(e)}")
             self.log_message(f"❌ 시뮬레이션 연결 실패: {str(e)}")
 
+    # ========== 레지스터 프레임 송수신 (SPI / I2C / UART 공용) ==========
+
+    def log_icon(self, icon):
+        """로그 접두어 (시뮬레이션 모드에서는 '🎭 SIMUL')"""
+        return "🎭 SIMUL" if self.simulation_mode else icon
+    
+    def transport_write(self, addr, value):
+        """현재 프로토콜 프레임으로 레지스터 쓰기, 로그용 명령 문자열 반환"""
+        port = self.current_port()
+        with self.bus_lock, transfer_source("gui"):
+            frame = write_frame(port, self.current_protocol, addr, value)
+        if self.current_protocol == "SPI":
+            return "CMD: " + " ".join(f"0x{b:02X}" for b in frame)
+        if self.current_protocol == "I2C":
+            return "DATA: " + " ".join(f"0x{b:02X}" for b in frame)
+        return frame.strip()
+    
+    def transport_read(self, addr):
+        """현재 프로토콜 프레임으로 레지스터 읽기
+        
+        짧은 응답/응답 없음은 0 으로 바꾸지 않고 READ_RETRIES 회 다시 읽은 뒤에도
+        실패하면 TransportError 를 그대로 올립니다.
+        """
+        port = self.current_port()
+        for attempt in range(READ_RETRIES + 1):
+            try:
+                with self.bus_lock, transfer_source("gui"):
+                    return read_frame(port, self.current_protocol, addr, response_wait=0.1)
+            except TransportError as e:
+                if attempt == READ_RETRIES:
+                    raise
+                transport_log.warning("⚠️ 읽기 재시도 %d/%d: %s", attempt + 1, READ_RETRIES, e)
+    
+    def current_port(self):
+        """현재 프로토콜의 포트 (연결이 없으면 예외)"""
+        port = {"SPI": self.spi, "I2C": self.i2c, "UART": self.uart_serial}.get(self.current_protocol)
+        if port is None:
+            raise Exception(f"{self.current_protocol} 연결이 없습니다.")
+        return port
+    
     def write_register(self):
         """현재 선택된 레지스터에 값 쓰기 (프로토콜별 처리)"""
-        print(f"✍️ Write Register 버튼 클릭됨 ({self.current_protocol})")
+        transport_log.debug("✍️ Write Register 버튼 클릭됨 (%s)", self.current_protocol)
         
         # 연결 확인
         is_connected = (self.spi_controller or self.i2c_controller or self.uart_serial or self.simulation_mode)
@@ -1040,104 +897,58 @@ class RegisterTreeViewerController(QMainWindow):
         try:
             addr = int(self.current_register, 16)
             
-            # Tree의 모든 필드 값을 기반으로 전체 레지스터 값 계산
-            value = self.calculate_register_value_from_tree()
+            # 값 모델이 현재 레지스터 값의 원본 (Tree 텍스트를 다시 파싱하지 않음)
+            value = self.value_model.value()
             
-            print(f"📊 Tree 기반 계산된 레지스터 값: 0x{value:08X} ({value})")
+            transport_log.debug("📊 현재 레지스터 값: 0x%08X (%s)", value, value)
             
             if self.current_field and self.current_field_data:
                 # 필드가 선택된 경우: 해당 필드 값 표시
                 bit_range = self.current_field_data.get('bit_range', '')
                 upper_bit, lower_bit = self.parse_bit_range(bit_range)
                 field_value = self.extract_field_value_from_register(value, upper_bit, lower_bit)
-                print(f"🎯 필드 '{self.current_field}' 선택됨:")
-                print(f"   전체 레지스터 값: 0x{value:08X} ({value})")
-                print(f"   필드 범위 [{bit_range}] 값: {field_value}")
+                transport_log.debug("🎯 필드 '%s' 선택됨:", self.current_field)
+                transport_log.debug("   전체 레지스터 값: 0x%08X (%s)", value, value)
+                transport_log.debug("   필드 범위 [%s] 값: %s", bit_range, field_value)
             else:
                 # 레지스터 전체 선택된 경우
-                print(f"📊 전체 레지스터 값: 0x{value:08X} ({value})")
+                transport_log.debug("📊 전체 레지스터 값: 0x%08X (%s)", value, value)
             
-            if self.simulation_mode:
-                # 시뮬레이션 모드: 가상으로 레지스터에 쓰기
-                self.simulation_registers[addr] = value
-                print(f"🎭 시뮬레이션 쓰기: Addr=0x{addr:02X}, Value=0x{value:08X}")
-                
-                if self.current_field:
-                    self.log_message(f"🎭 SIMUL {self.current_protocol} WRITE (필드 '{self.current_field}'): Addr={self.current_register}, Value=0x{value:08X} ({value})")
-                else:
-                    self.log_message(f"🎭 SIMUL {self.current_protocol} WRITE: Addr={self.current_register}, Value=0x{value:08X} ({value})")
-                self.log_message(f"   시뮬레이션 데이터 저장됨")
-                
+            command = self.transport_write(addr, value)
+            
+            prefix = f"{self.log_icon('📝')} {self.current_protocol} WRITE"
+            if self.current_field:
+                self.log_message(f"{prefix} (필드 '{self.current_field}'): Addr={self.current_register}, Value=0x{value:08X} ({value})")
             else:
-                # 실제 통신 모드 - 프로토콜별 처리
-                if self.current_protocol == "SPI" and self.spi:
-                    # SPI 쓰기 명령 (RW=0, 주소 7비트 + 데이터 32비트)
-                    write_cmd = (addr & 0x7F)  # RW=0, 주소 7비트
-                    data_byte3 = (value >> 24) & 0xFF
-                    data_byte2 = (value >> 16) & 0xFF
-                    data_byte1 = (value >> 8) & 0xFF
-                    data_byte0 = value & 0xFF
-                    
-                    # SPI 전송 (32비트 데이터)
-                    response = self.spi.exchange([write_cmd, data_byte3, data_byte2, data_byte1, data_byte0])
-                    
-                    if self.current_field:
-                        self.log_message(f"📝 SPI WRITE (필드 '{self.current_field}'): Addr={self.current_register}, Value=0x{value:08X} ({value})")
-                    else:
-                        self.log_message(f"📝 SPI WRITE: Addr={self.current_register}, Value=0x{value:08X} ({value})")
-                    self.log_message(f"   CMD: 0x{write_cmd:02X} 0x{data_byte3:02X} 0x{data_byte2:02X} 0x{data_byte1:02X} 0x{data_byte0:02X}")
-                    
-                elif self.current_protocol == "I2C" and self.i2c:
-                    # I2C 쓰기 (레지스터 주소 + 4바이트 데이터)
-                    data_bytes = [addr, 
-                                  (value >> 24) & 0xFF, 
-                                  (value >> 16) & 0xFF, 
-                                  (value >> 8) & 0xFF, 
-                                  value & 0xFF]
-                    self.i2c.write(data_bytes)
-                    
-                    if self.current_field:
-                        self.log_message(f"📝 I2C WRITE (필드 '{self.current_field}'): Addr={self.current_register}, Value=0x{value:08X} ({value})")
-                    else:
-                        self.log_message(f"📝 I2C WRITE: Addr={self.current_register}, Value=0x{value:08X} ({value})")
-                    
-                elif self.current_protocol == "UART" and self.uart_serial:
-                    # UART 쓰기 (텍스트 형태로 전송)
-                    cmd_str = f"W,{addr:02X},{value:08X}\n"
-                    self.uart_serial.write(cmd_str.encode())
-                    
-                    if self.current_field:
-                        self.log_message(f"📝 UART WRITE (필드 '{self.current_field}'): {cmd_str.strip()}")
-                    else:
-                        self.log_message(f"📝 UART WRITE: {cmd_str.strip()}")
-                    
-                else:
-                    raise Exception(f"{self.current_protocol} 연결이 없습니다.")
+                self.log_message(f"{prefix}: Addr={self.current_register}, Value=0x{value:08X} ({value})")
+            self.log_message(f"   {command}")
             
         except Exception as e:
             QMessageBox.critical(self, "쓰기 오류", f"레지스터 쓰기 실패:\n{str(e)}")
             self.log_message(f"❌ 쓰기 실패: {str(e)}")
 
+    @traced("ui")
     def write_all_registers(self):
         """모든 레지스터에 현재 값 쓰기"""
-        print("✍️ Write All Registers 버튼 클릭됨")
+        transport_log.debug("✍️ Write All Registers 버튼 클릭됨")
         
-        if (not self.spi and not self.simulation_mode) or not self.data:
-            QMessageBox.warning(self, "경고", "SPI가 연결되지 않았거나 데이터가 없습니다.")
+        is_connected = (self.spi_controller or self.i2c_controller or self.uart_serial or self.simulation_mode)
+        if not is_connected or not self.data:
+            QMessageBox.warning(self, "경고", f"{self.current_protocol} 연결되지 않았거나 데이터가 없습니다.")
             return
             
         try:
             count = 0
             mode_str = "시뮬레이션" if self.simulation_mode else "실제"
-            print(f"🚀 Write All 시작: 모든 레지스터 처리 ({mode_str} 모드)")
-            print(f"🔍 현재 register_data_store 상태: {self.register_data_store}")
+            transport_log.debug("🚀 Write All 시작: 모든 레지스터 처리 (%s 모드)", mode_str)
+            transport_log.debug("🔍 현재 register_data_store 상태: %s", self.register_data_store)
             
             for registers in self.data.values():
                 for register in registers:
                     addr_str = register['address']
                     addr = int(addr_str, 16)
                     
-                    print(f"🔍 디버깅 - register['address']: '{addr_str}', type: {type(addr_str)}")
+                    transport_log.debug("🔍 디버깅 - register['address']: '%s', type: %s", addr_str, type(addr_str))
                     
                     # 레지스터별 저장된 값 가져오기 - 다양한 키 형식 시도
                     value = None
@@ -1145,156 +956,746 @@ class RegisterTreeViewerController(QMainWindow):
                     # 1. 원본 주소 형식으로 시도 (예: '0x00')
                     if addr_str in self.register_data_store:
                         value = self.register_data_store[addr_str]
-                        print(f"🔍 레지스터 {addr_str}: 저장된 값 사용 (원본키) = 0x{value:08X}")
+                        transport_log.debug("🔍 레지스터 %s: 저장된 값 사용 (원본키) = 0x%08X", addr_str, value)
                     # 2. 앞의 '0x' 제거한 형식으로 시도 (예: '00')
                     elif addr_str.replace('0x', '').upper() in self.register_data_store:
                         clean_addr = addr_str.replace('0x', '').upper()
                         value = self.register_data_store[clean_addr]
-                        print(f"🔍 레지스터 {addr_str}: 저장된 값 사용 (정리된키 {clean_addr}) = 0x{value:08X}")
+                        transport_log.debug("🔍 레지스터 %s: 저장된 값 사용 (정리된키 %s) = 0x%08X", addr_str, clean_addr, value)
                     # 3. 2자리 16진수 형식으로 시도 (예: '00')
                     elif f"{addr:02X}" in self.register_data_store:
                         hex_key = f"{addr:02X}"
                         value = self.register_data_store[hex_key]
-                        print(f"🔍 레지스터 {addr_str}: 저장된 값 사용 (16진수키 {hex_key}) = 0x{value:08X}")
+                        transport_log.debug("🔍 레지스터 %s: 저장된 값 사용 (16진수키 %s) = 0x%08X", addr_str, hex_key, value)
                     else:
                         # 저장된 값이 없으면 기본값 사용
                         value = register.get('default_value', 0)
                         if isinstance(value, str):
                             value = int(value)
-                        print(f"🔍 레지스터 {addr_str}: 기본값 사용 = 0x{value:08X}")
+                        transport_log.debug("🔍 레지스터 %s: 기본값 사용 = 0x%08X", addr_str, value)
                     
                     # [addr, data] 형식 로그 출력
-                    print(f"📝 [0x{addr:02X}, 0x{value:08X}]")
-                    
-                    if self.simulation_mode:
-                        # 시뮬레이션 모드: 가상으로 모든 레지스터에 쓰기
-                        self.simulation_registers[addr] = value
-                        print(f"🎭 시뮬레이션 쓰기: Addr=0x{addr:02X}, Value=0x{value:08X}")
-                    else:
-                        # 실제 SPI 통신 모드
-                        # SPI 쓰기 명령
-                        write_cmd = (addr & 0x7F)
-                        data_byte3 = (value >> 24) & 0xFF
-                        data_byte2 = (value >> 16) & 0xFF
-                        data_byte1 = (value >> 8) & 0xFF
-                        data_byte0 = value & 0xFF
-                        
-                        response = self.spi.exchange([write_cmd, data_byte3, data_byte2, data_byte1, data_byte0])
+                    transport_log.debug("📝 [0x%02X, 0x%08X]", addr, value)
                     
+                    self.transport_write(addr, value)
                     count += 1
             
-            mode_prefix = "🎭 SIMUL" if self.simulation_mode else "📝"
-            print(f"✅ Write All 완료: {count}개 레지스터 처리됨 ({mode_str} 모드)")
-            self.log_message(f"{mode_prefix} WRITE ALL: {count}개 레지스터 쓰기 완료")
+            transport_log.info("✅ Write All 완료: %s개 레지스터 처리됨 (%s 모드)", count, mode_str)
+            self.log_message(f"{self.log_icon('📝')} WRITE ALL: {count}개 레지스터 쓰기 완료")
             
         except Exception as e:
             QMessageBox.critical(self, "쓰기 오류", f"전체 쓰기 실패:\n{str(e)}")
             self.log_message(f"❌ 전체 쓰기 실패: {str(e)}")
 
-    def read_register(self):
-        """현재 선택된 레지스터 읽기"""
-        print("📖 Read Register 버튼 클릭됨")
-        
-        if (not self.spi and not self.simulation_mode) or not self.current_register:
-            QMessageBox.warning(self, "경고", "SPI가 연결되지 않았거나 레지스터가 선택되지 않았습니다.")
-            return
-            
+    def read_register(self):
+        """현재 선택된 레지스터 읽기"""
+        transport_log.debug("📖 Read Register 버튼 클릭됨")
+        
+        is_connected = (self.spi_controller or self.i2c_controller or self.uart_serial or self.simulation_mode)
+        if not is_connected or not self.current_register:
+            QMessageBox.warning(self, "경고", f"{self.current_protocol} 연결되지 않았거나 레지스터가 선택되지 않았습니다.")
+            return
+            
+        try:
+            addr = int(self.current_register, 16)
+            value = self.transport_read(addr)
+            self.log_message(f"{self.log_icon('📖')} {self.current_protocol} READ: Addr={self.current_register}, Value=0x{value:08X} ({value})")
+            
+            # UI 업데이트 (값 모델을 통해 모든 뷰가 함께 갱신됨)
+            self.value_model.setValue(value)
+            
+        except Exception as e:
+            QMessageBox.critical(self, "읽기 오류", f"레지스터 읽기 실패:\n{str(e)}")
+            self.log_message(f"❌ 읽기 실패: {str(e)}")
+
+    @traced("ui")
+    def read_all_registers(self):
+        """모든 레지스터 읽기"""
+        transport_log.debug("📖 Read All Registers 버튼 클릭됨")
+        
+        is_connected = (self.spi_controller or self.i2c_controller or self.uart_serial or self.simulation_mode)
+        if not is_connected or not self.data:
+            QMessageBox.warning(self, "경고", f"{self.current_protocol} 연결되지 않았거나 데이터가 없습니다.")
+            return
+            
+        try:
+            count = 0
+            mode_str = "시뮬레이션" if self.simulation_mode else "실제"
+            transport_log.debug("📖 Read All 시작: 모든 레지스터 읽기 (%s 모드)", mode_str)
+            
+            icon = self.log_icon('📖')
+            for registers in self.data.values():
+                for register in registers:
+                    addr = int(register['address'], 16)
+                    value = self.transport_read(addr)
+                    self.log_message(f"{icon} READ: Addr=0x{addr:02X}, Value=0x{value:08X}")
+                    count += 1
+            
+            self.log_message(f"{icon} READ ALL: {count}개 레지스터 읽기 완료")
+            
+        except Exception as e:
+            QMessageBox.critical(self, "읽기 오류", f"전체 읽기 실패:\n{str(e)}")
+            self.log_message(f"❌ 전체 읽기 실패: {str(e)}")
+
+    @traced("ui")
+    def run_sequence_file(self, file_path=None):
+        """시퀀스 파일(CSV/JSON/YAML) 실행, 단계별 시간을 로그에 출력"""
+        transport_log.debug("🧾 Run Sequence 메뉴 선택됨")
+        
+        is_connected = (self.spi_controller or self.i2c_controller or self.uart_serial or self.simulation_mode)
+        if not is_connected or not self.data:
+            QMessageBox.warning(self, "경고", f"{self.current_protocol} 연결되지 않았거나 데이터가 없습니다.")
+            return None
+        
+        if not file_path:
+            file_path, _ = QFileDialog.getOpenFileName(
+                self, "시퀀스 파일 열기", "", "Sequence Files (*.csv *.json *.yaml *.yml);;All Files (*)")
+            if not file_path:
+                return None
+        
+        try:
+            register_map = RegisterMap(self.data)
+            steps = load_sequence(file_path)
+            
+            # register_data_store 의 현재 값을 field 쓰기의 기준(섀도)으로 사용
+            address_keys = {int(register['address'], 16): register['address']
+                            for registers in self.data.values() for register in registers}
+            shadow = {addr: self.register_data_store[key]
+                      for addr, key in address_keys.items() if key in self.register_data_store}
+            
+            engine = SequenceEngine(self.current_port(), self.current_protocol, register_map, shadow=shadow,
+                                    response_wait=0.1 if self.current_protocol == "UART" else 0.0)
+            self.log_message(f"{self.log_icon('🧾')} SEQUENCE: {os.path.basename(file_path)} ({len(steps)}단계)")
+            with self.bus_lock, transfer_source("sequence"):
+                result = engine.run(steps)
+            for line in format_report(result):
+                self.log_message(f"   {line}")
+            
+            # 실행 후 값으로 저장소/현재 레지스터 갱신
+            for addr, value in engine.shadow.items():
+                if addr in address_keys:
+                    self.register_data_store[address_keys[addr]] = value
+            if self.current_register in self.register_data_store:
+                self.value_model.setValue(self.register_data_store[self.current_register])
+            return result
+            
+        except SequenceError as e:
+            QMessageBox.critical(self, "시퀀스 오류", f"시퀀스 파일 오류:\n{str(e)}")
+            self.log_message(f"❌ 시퀀스 오류: {str(e)}")
+        except Exception as e:
+            QMessageBox.critical(self, "시퀀스 오류", f"시퀀스 실행 실패:\n{str(e)}")
+            self.log_message(f"❌ 시퀀스 실행 실패: {str(e)}")
+        return None
+
+    def save_profile_file(self, file_path=None):
+        """register_data_store 의 현재 값을 설정 프로파일(JSON)로 저장"""
+        if not self.register_data_store:
+            QMessageBox.warning(self, "경고", "저장할 레지스터 값이 없습니다.")
+            return None
+        
+        if not file_path:
+            file_path, _ = QFileDialog.getSaveFileName(self, "프로파일 저장", "", "Profile Files (*.json)")
+            if not file_path:
+                return None
+        
+        try:
+            name = os.path.splitext(os.path.basename(file_path))[0]
+            profile = RegisterProfile.from_register_values(self.register_data_store, name)
+            profile.save(file_path)
+            self.log_message(f"{self.log_icon('💾')} PROFILE 저장: {os.path.basename(file_path)} ({len(profile)}개 레지스터)")
+            return profile
+        except Exception as e:
+            QMessageBox.critical(self, "프로파일 오류", f"프로파일 저장 실패:\n{str(e)}")
+            self.log_message(f"❌ 프로파일 저장 실패: {str(e)}")
+        return None
+    
+    def apply_profile_file(self, file_path=None, verify=True):
+        """설정 프로파일을 디바이스에 최소 변경분 배치로 적용"""
+        is_connected = (self.spi_controller or self.i2c_controller or self.uart_serial or self.simulation_mode)
+        if not is_connected or not self.data:
+            QMessageBox.warning(self, "경고", f"{self.current_protocol} 연결되지 않았거나 데이터가 없습니다.")
+            return None
+        
+        if not file_path:
+            file_path, _ = QFileDialog.getOpenFileName(self, "프로파일 열기", "", "Profile Files (*.json);;All Files (*)")
+            if not file_path:
+                return None
+        
+        try:
+            profile = RegisterProfile.load(file_path)
+            device = RegisterDevice(self.current_port(), RegisterMap(self.data), self.current_protocol,
+                                    response_wait=0.1 if self.current_protocol == "UART" else 0.0)
+            # 화면 값은 디바이스와 다를 수 있으므로 현재 상태는 디바이스에서 배치로 읽음
+            with self.bus_lock, transfer_source("profile"):
+                result = apply_profile(device, profile, verify=verify, use_shadow=False)
+            self.log_message(f"{self.log_icon('🎛️')} PROFILE: {os.path.basename(file_path)} "
+                             f"{result.skipped}개 동일, {len(result.delta)}개 변경, "
+                             f"배치 {result.batches}회, {result.elapsed_s * 1000:.2f}ms")
+            for addr, value in result.mismatched.items():
+                self.log_message(f"   ❌ 0x{addr:02X} 검증 실패: 0x{value:08X} (기대 0x{result.delta[addr]:08X})")
+            
+            # 적용 후 값으로 저장소/현재 레지스터 갱신
+            address_keys = {int(register['address'], 16): register['address']
+                            for registers in self.data.values() for register in registers}
+            for addr, value in device.shadow.items():
+                if addr in address_keys:
+                    self.register_data_store[address_keys[addr]] = value
+            if self.current_register in self.register_data_store:
+                self.value_model.setValue(self.register_data_store[self.current_register])
+            return result
+            
+        except ProfileError as e:
+            QMessageBox.critical(self, "프로파일 오류", f"프로파일 파일 오류:\n{str(e)}")
+            self.log_message(f"❌ 프로파일 오류: {str(e)}")
+        except Exception as e:
+            QMessageBox.critical(self, "프로파일 오류", f"프로파일 적용 실패:\n{str(e)}")
+            self.log_message(f"❌ 프로파일 적용 실패: {str(e)}")
+        return None
+
+    def poll_until_dialog(self):
+        """조건식을 입력받아 poll-until 시작"""
+        expression, ok = QInputDialog.getText(self, "Poll Until", "조건식 (예: EN_TX == 1 and RO_DATA_5 & 0x1):")
+        if ok and expression.strip():
+            timeout_ms, ok = QInputDialog.getInt(self, "Poll Until", "시간 제한 (ms):", 1000, 1, 600000)
+            if ok:
+                self.start_poll_until(expression, timeout_ms)
+    
+    def start_poll_until(self, expression, timeout_ms=1000, min_interval_ms=1, max_interval_ms=100):
+        """조건식이 참이 될 때까지 읽기 (GUI 를 막지 않음)
+        
+        한 번의 시도는 조건식 레지스터의 배치 읽기 하나로 PollWorker 스레드에서 포트 잠금을 잡고 실행하며,
+        시도 사이의 대기는 이벤트 루프의 QTimer 로 처리하므로 읽기와 대기 중 모두 화면이 멈추지 않습니다.
+        """
+        is_connected = (self.spi_controller or self.i2c_controller or self.uart_serial or self.simulation_mode)
+        if not is_connected or not self.data:
+            QMessageBox.warning(self, "경고", f"{self.current_protocol} 연결되지 않았거나 데이터가 없습니다.")
+            return None
+        if self.poll_task is not None:
+            QMessageBox.warning(self, "경고", f"이미 대기 중입니다: {self.poll_task.condition.expression}")
+            return None
+        
+        try:
+            condition = PollCondition(expression, RegisterMap(self.data))
+        except PollConditionError as e:
+            QMessageBox.critical(self, "조건식 오류", str(e))
+            self.log_message(f"❌ 조건식 오류: {str(e)}")
+            return None
+        
+        port, protocol = self.current_port(), self.current_protocol
+        response_wait = 0.1 if protocol == "UART" else 0.0
+        
+        def read(addresses):
+            with self.bus_lock, transfer_source("poll"):
+                values = transfer_batch(port, protocol, [("R", addr) for addr in addresses], response_wait)
+            return dict(zip(addresses, values))
+        
+        self.poll_task = PollUntil(condition, read, timeout_ms / 1000.0,
+                                   min_interval_ms / 1000.0, max_interval_ms / 1000.0).start()
+        self.log_message(f"{self.log_icon('⏳')} POLL UNTIL: {condition.expression} (최대 {timeout_ms}ms)")
+        self.statusBar().showMessage(f"대기 중: {condition.expression}")
+        worker = PollWorker(self.poll_task, self)
+        worker.stepped.connect(self.on_poll_stepped)
+        worker.failed.connect(self.on_poll_failed)
+        worker.finished.connect(worker.deleteLater)
+        self.poll_worker = worker
+        worker.start()
+        worker.step()
+        return self.poll_task
+    
+    def _next_poll_step(self):
+        # 타이머가 끝나기 전에 창이 닫혔으면 아무것도 하지 않음
+        if self.poll_worker is not None:
+            self.poll_worker.step()
+    
+    def _stop_poll_worker(self):
+        """진행 중인 poll-until 취소, 실행 중인 읽기가 끝날 때까지 기다림"""
+        worker, self.poll_worker = self.poll_worker, None
+        task, self.poll_task = self.poll_task, None
+        if worker is not None:
+            worker.cancel()
+            worker.wait()
+            self.log_message(f"   ⏹️ poll-until 취소: {task.condition.expression}")
+    
+    def on_poll_failed(self, message):
+        if self.sender() is not self.poll_worker:
+            return
+        self.poll_worker = None
+        self.poll_task = None
+        self.statusBar().showMessage("대기 실패", 3000)
+        self.log_message(f"❌ poll-until 실패: {message}")
+    
+    def on_poll_stepped(self, delay):
+        """작업 스레드의 시도 결과: 다음 시도 예약 또는 완료 처리"""
+        if self.sender() is not self.poll_worker:
+            return
+        if delay is not None:
+            QTimer.singleShot(max(0, int(delay * 1000)), self._next_poll_step)
+            return
+        
+        task, self.poll_task, self.poll_worker = self.poll_task, None, None
+        result = task.result
+        address_keys = {int(register['address'], 16): register['address']
+                        for registers in self.data.values() for register in registers}
+        for addr, value in result.values.items():
+            if addr in address_keys:
+                self.register_data_store[address_keys[addr]] = value
+        if self.current_register in self.register_data_store:
+            self.value_model.setValue(self.register_data_store[self.current_register])
+        
+        status = "✅ 충족" if result.ok else "❌ 시간 초과"
+        self.log_message(f"   {status}: {result.attempts}회 읽기, {result.elapsed_s * 1000:.3f}ms")
+        histogram = poll_statistics.histogram(result.expression)
+        if histogram is not None and histogram.count:
+            summary = histogram.as_dict()
+            self.log_message(f"   ⏱️ 충족 시간 {summary['count']}회: p50 {summary['p50_ms']}ms, "
+                             f"p95 {summary['p95_ms']}ms, p99 {summary['p99_ms']}ms, 최대 {summary['max_ms']}ms")
+        self.statusBar().showMessage(f"{status}: {result.expression}", 3000)
+
+    def monitor_dialog(self):
+        """모니터할 레지스터와 목표 주기를 입력받아 모니터 창 열기"""
+        default = self.current_register or ", ".join(
+            register['address'] for registers in (self.data or {}).values() for register in registers)
+        targets, ok = QInputDialog.getText(self, "Register Monitor", "레지스터 (주소/이름, 쉼표로 구분):", text=default)
+        if ok and targets.strip():
+            rate_hz, ok = QInputDialog.getDouble(self, "Register Monitor", "목표 샘플/초 (0 = 최대 속도):",
+                                                 1000.0, 0.0, 1000000.0, 0)
+            if ok:
+                self.start_monitor([target.strip() for target in targets.split(",") if target.strip()], rate_hz)
+    
+    def start_monitor(self, targets, rate_hz=1000.0):
+        """레지스터 모니터 시작 (샘플링은 백그라운드 스레드, 창은 고정 주기로 갱신)"""
+        is_connected = (self.spi_controller or self.i2c_controller or self.uart_serial or self.simulation_mode)
+        if not is_connected or not self.data:
+            QMessageBox.warning(self, "경고", f"{self.current_protocol} 연결되지 않았거나 데이터가 없습니다.")
+            return None
+        if self.monitor_window is not None:
+            self.monitor_window.close()
+        
+        # NumPy 를 끌어오므로 모니터를 처음 열 때 임포트 (시작 시간 단축)
+        from register_monitor import RegisterMonitor
+        from register_monitor_widget import MonitorWindow
+        
+        try:
+            register_map = RegisterMap(self.data)
+            addresses = [register_map.resolve(target)[0] for target in targets]
+            monitor = RegisterMonitor(self.current_port(), self.current_protocol, addresses, rate_hz,
+                                      response_wait=0.1 if self.current_protocol == "UART" else 0.0,
+                                      lock=self.bus_lock)
+        except Exception as e:
+            QMessageBox.critical(self, "모니터 오류", f"모니터 시작 실패:\n{str(e)}")
+            self.log_message(f"❌ 모니터 시작 실패: {str(e)}")
+            return None
+        
+        names = {addr: register_map.name_of(addr) for addr in monitor.addresses}
+        self.monitor_window = MonitorWindow(monitor, names, register_map, self)
+        self.monitor_window.closed.connect(self.on_monitor_closed)
+        monitor.start()
+        self.monitor_window.show()
+        self.log_message(f"{self.log_icon('📊')} MONITOR: {len(monitor.addresses)}개 레지스터, "
+                         f"목표 {f'{rate_hz:.0f}/s' if rate_hz else '최대 속도'}")
+        return monitor
+    
+    def on_monitor_closed(self):
+        window, self.monitor_window = self.monitor_window, None
+        if window is not None:
+            stats = window.monitor.stats()
+            self.log_message(f"   📊 모니터 종료: {stats['samples']:,}샘플, {stats['rate_hz']:,.0f}샘플/s, "
+                             f"오류 {stats['errors']}")
+
+    # ========== 트랜잭션 저널 ==========
+
+    def toggle_journal(self, recording):
+        if recording:
+            self.start_journal()
+        else:
+            self.stop_journal()
+    
+    def start_journal(self):
+        """이후 모든 버스 트랜잭션(GUI / 시퀀스 / 프로파일 / 대기 / 모니터)을 메모리 저널에 기록"""
+        if self.journal is not None:
+            return self.journal
+        from register_journal import TransactionJournal   # NumPy 는 처음 기록할 때 임포트
+        self.journal = TransactionJournal(register_map=RegisterMap(self.data) if self.data else None).attach()
+        self.log_message("🧾 JOURNAL: 트랜잭션 기록 시작")
+        self.statusBar().showMessage("트랜잭션 기록 중", 3000)
+        return self.journal
+    
+    def stop_journal(self, file_path=None):
+        """기록 중지 후 저널 파일(.rjnl)로 저장 (file_path 가 없으면 저장 위치를 물음)"""
+        journal, self.journal = self.journal, None
+        if hasattr(self.ui, 'action_record_journal') and self.ui.action_record_journal.isChecked():
+            self.ui.action_record_journal.blockSignals(True)
+            self.ui.action_record_journal.setChecked(False)
+            self.ui.action_record_journal.blockSignals(False)
+        if journal is None:
+            return None
+        journal.detach()
+        summary = journal.summary()
+        failed = f", 실패 {summary['failed']}개" if summary['failed'] else ""
+        self.log_message(f"🧾 JOURNAL: 기록 중지 ({summary['records']}개 트랜잭션, 배치 {summary['batches']}회{failed})")
+        if not len(journal):
+            return journal
+        
+        if not file_path:
+            file_path, _ = QFileDialog.getSaveFileName(self, "저널 저장", "", "Transaction Journal (*.rjnl)")
+            if not file_path:
+                self.log_message("   저널을 저장하지 않았습니다")
+                return journal
+        try:
+            journal.save(file_path)
+            self.log_message(f"   💾 {os.path.basename(file_path)} 저장")
+        except OSError as e:
+            QMessageBox.critical(self, "저널 오류", f"저널 저장 실패:\n{str(e)}")
+            self.log_message(f"❌ 저널 저장 실패: {str(e)}")
+        return journal
+    
+    REPLAY_MODES = {
+        "최대 속도 (쓰기만)": ("fast", False),
+        "원래 간격 (쓰기만)": ("original", False),
+        "원래 간격 + 읽기 비교": ("original", True),
+    }
+    
+    def replay_journal_file(self, file_path=None, mode=None):
+        """저널을 현재 연결로 재생 (쓰기를 배치로 묶어 전송, 재생한 값으로 저장소 갱신)"""
+        is_connected = (self.spi_controller or self.i2c_controller or self.uart_serial or self.simulation_mode)
+        if not is_connected:
+            QMessageBox.warning(self, "경고", f"{self.current_protocol} 연결되지 않았습니다.")
+            return None
+        
+        if not file_path:
+            file_path, _ = QFileDialog.getOpenFileName(
+                self, "저널 열기", "", "Transaction Journal (*.rjnl);;All Files (*)")
+            if not file_path:
+                return None
+        if mode is None:
+            mode, ok = QInputDialog.getItem(self, "Replay Journal", "재생 방식:", list(self.REPLAY_MODES), 0, False)
+            if not ok:
+                return None
+        timing, include_reads = self.REPLAY_MODES[mode]
+        from register_journal import TransactionJournal, JournalError, WRITE, replay
+        
+        try:
+            journal = TransactionJournal.load(file_path)
+            if self.data and journal.map_fingerprint not in (bytes(32), RegisterMap(self.data).fingerprint()):
+                self.log_message("   ⚠️ 저널을 기록한 레지스터 맵과 현재 맵이 다릅니다")
+            self.log_message(f"{self.log_icon('⏩')} REPLAY: {os.path.basename(file_path)} "
+                             f"({len(journal)}개 트랜잭션, {mode})")
+            with self.bus_lock:
+                result = replay(journal, self.current_port(), self.current_protocol, timing, include_reads,
+                                response_wait=0.1 if self.current_protocol == "UART" else 0.0)
+            self.log_message(f"   쓰기 {result.writes}, 읽기 {result.reads}, 배치 {result.batches}회, "
+                             f"{result.elapsed_s * 1000:.2f}ms (원래 {result.original_s * 1000:.2f}ms)")
+            for index, addr, expected, actual in result.mismatched:
+                self.log_message(f"   ❌ #{index} 0x{addr:02X}: 0x{actual:08X} (기록 0x{expected:08X})")
+            
+            # 재생한 마지막 쓰기 값으로 저장소/현재 레지스터 갱신
+            if self.data:
+                address_keys = {int(register['address'], 16): register['address']
+                                for registers in self.data.values() for register in registers}
+                written = journal.view[journal.view["direction"] == WRITE]
+                for addr, value in zip(written["addr"].tolist(), written["value"].tolist()):
+                    if addr in address_keys:
+                        self.register_data_store[address_keys[addr]] = value
+                if self.current_register in self.register_data_store:
+                    self.value_model.setValue(self.register_data_store[self.current_register])
+            return result
+            
+        except JournalError as e:
+            QMessageBox.critical(self, "저널 오류", f"저널 파일 오류:\n{str(e)}")
+            self.log_message(f"❌ 저널 오류: {str(e)}")
+        except Exception as e:
+            QMessageBox.critical(self, "저널 오류", f"저널 재생 실패:\n{str(e)}")
+            self.log_message(f"❌ 저널 재생 실패: {str(e)}")
+        return None
+
+    # ========== 전송 시간 통계 ==========
+
+    def toggle_latency(self, enabled):
+        if enabled:
+            self.start_latency()
+        else:
+            self.stop_latency()
+    
+    def start_latency(self):
+        """전송 단계별 시간 집계 시작, 상태 표시줄에 프레임당 p50/p95/p99 표시"""
+        if self.latency is not None:
+            return self.latency
+        self.latency = LatencyRecorder().attach()
+        if self.latency_label is None:
+            self.latency_label = QLabel()
+            self.statusBar().addPermanentWidget(self.latency_label)
+            self.latency_timer = QTimer(self)
+            self.latency_timer.setInterval(500)
+            self.latency_timer.timeout.connect(self.update_latency_label)
+        self.latency_label.setText(self.latency.status_text())
+        self.latency_label.show()
+        self.latency_timer.start()
+        self.log_message("⏱ LATENCY: 전송 시간 집계 시작")
+        return self.latency
+    
+    def update_latency_label(self):
+        if self.latency is not None:
+            self.latency_label.setText(self.latency.status_text())
+    
+    def stop_latency(self):
+        """집계 중지, 요약을 로그에 출력 (집계 결과는 내보내기용으로 유지)"""
+        if hasattr(self.ui, 'action_latency_stats') and self.ui.action_latency_stats.isChecked():
+            self.ui.action_latency_stats.blockSignals(True)
+            self.ui.action_latency_stats.setChecked(False)
+            self.ui.action_latency_stats.blockSignals(False)
+        if self.latency is None:
+            return None
+        recorder = self.latency.detach()
+        self.latency = None
+        self.last_latency = recorder
+        self.latency_timer.stop()
+        self.latency_label.hide()
+        summary = recorder.summary()
+        self.log_message(f"⏱ LATENCY: 집계 중지 (프레임 {summary['frames']:,}, 배치 {summary['batches']}회, "
+                         f"단일 전송 {summary['transactions']}회)")
+        for row in summary["histograms"]:
+            self.log_message(f"   {row['scope']:<11} {row['phase']:<6} n={row['count']:<6} "
+                             f"p50 {row['p50_ms']:.3f} · p95 {row['p95_ms']:.3f} · p99 {row['p99_ms']:.3f} ms")
+        return recorder
+    
+    def export_latency_file(self, file_path=None):
+        """집계 중이거나 마지막으로 집계한 히스토그램을 CSV / Prometheus 텍스트(.prom)로 저장"""
+        recorder = self.latency if self.latency is not None else self.last_latency
+        if recorder is None:
+            QMessageBox.warning(self, "경고", "전송 시간 통계가 없습니다. View → Latency Statistics 로 먼저 집계하세요.")
+            return None
+        if not file_path:
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, "전송 시간 통계 저장", "", "CSV (*.csv);;Prometheus text (*.prom)")
+            if not file_path:
+                return None
+        try:
+            recorder.save(file_path)
+            self.log_message(f"⏱ LATENCY: {os.path.basename(file_path)} 저장")
+        except OSError as e:
+            QMessageBox.critical(self, "저장 오류", f"전송 시간 통계 저장 실패:\n{str(e)}")
+            self.log_message(f"❌ 전송 시간 통계 저장 실패: {str(e)}")
+            return None
+        return file_path
+
+    # ========== USB 전송 효율 ==========
+
+    def toggle_usb_meter(self, enabled):
+        if enabled:
+            self.start_usb_meter()
+        else:
+            self.stop_usb_meter()
+    
+    def start_usb_meter(self):
+        """현재 포트의 payload 대 USB 전송 측정 시작, 상태 표시줄에 패킷 채움 게이지 표시"""
+        if self.usb_meter is not None:
+            return self.usb_meter
         try:
-            addr = int(self.current_register, 16)
-            
-            if self.simulation_mode:
-                # 시뮬레이션 모드: 가상 레지스터에서 값 읽기
-                value = self.simulation_registers.get(addr, 0)  # 기본값 0
-                print(f"🎭 시뮬레이션 읽기: Addr=0x{addr:02X}, Value=0x{value:08X}")
-                self.log_message(f"🎭 SIMUL READ: Addr={self.current_register}, Value=0x{value:08X} ({value})")
-            else:
-                # 실제 SPI 통신 모드
-                # SPI 읽기 명령 (RW=1, 주소 7비트)
-                read_cmd = 0x80 | (addr & 0x7F)  # RW=1, 주소 7비트
-                
-                # SPI 전송 (읽기는 4바이트 수신)
-                response = self.spi.exchange([read_cmd, 0x00, 0x00, 0x00, 0x00])
-                
-                # 응답에서 데이터 추출 (첫 바이트는 명령 에코)
-                if len(response) >= 5:
-                    value = (response[1] << 24) | (response[2] << 16) | (response[3] << 8) | response[4]
-                else:
-                    value = 0
-                    
-                self.log_message(f"📖 READ: Addr={self.current_register}, Value=0x{value:08X} ({value})")
-            
-            # UI 업데이트 (unsigned to signed 변환)
-            if value > 2147483647:
-                signed_value = value - 4294967296
-            else:
-                signed_value = value
-            self.ui.hex_value_spinbox.setValue(signed_value)
-            
+            port = self.current_port()
         except Exception as e:
-            QMessageBox.critical(self, "읽기 오류", f"레지스터 읽기 실패:\n{str(e)}")
-            self.log_message(f"❌ 읽기 실패: {str(e)}")
+            QMessageBox.warning(self, "경고", f"USB 효율을 측정할 연결이 없습니다:\n{str(e)}")
+            self._set_usb_meter_checked(False)
+            return None
+        self.usb_meter = UsbEfficiencyMeter().attach(port)
+        if self.usb_meter_bar is None:
+            self.usb_meter_bar = QProgressBar()
+            self.usb_meter_bar.setRange(0, 100)
+            self.usb_meter_bar.setMaximumWidth(420)
+            self.statusBar().addPermanentWidget(self.usb_meter_bar)
+            self.usb_meter_timer = QTimer(self)
+            self.usb_meter_timer.setInterval(500)
+            self.usb_meter_timer.timeout.connect(self.update_usb_meter)
+        self.update_usb_meter()
+        self.usb_meter_bar.show()
+        self.usb_meter_timer.start()
+        self.log_message("📶 USB: 전송 효율 측정 시작")
+        return self.usb_meter
+    
+    def update_usb_meter(self):
+        if self.usb_meter is None:
+            return
+        summary = self.usb_meter.summary()
+        fill = summary["packet_fill"]
+        self.usb_meter_bar.setValue(round(fill * 100) if fill is not None else 0)
+        self.usb_meter_bar.setFormat(self.usb_meter.status_text())
+    
+    def stop_usb_meter(self):
+        """측정 중지, 요약을 로그에 출력"""
+        self._set_usb_meter_checked(False)
+        if self.usb_meter is None:
+            return None
+        meter = self.usb_meter.detach()
+        self.usb_meter = None
+        self.usb_meter_timer.stop()
+        self.usb_meter_bar.hide()
+        self.log_message("📶 USB: 전송 효율 측정 중지")
+        for line in meter.report_lines():
+            self.log_message(f"   {line}")
+        return meter
+    
+    def _set_usb_meter_checked(self, checked):
+        if hasattr(self.ui, 'action_usb_efficiency') and self.ui.action_usb_efficiency.isChecked() != checked:
+            self.ui.action_usb_efficiency.blockSignals(True)
+            self.ui.action_usb_efficiency.setChecked(checked)
+            self.ui.action_usb_efficiency.blockSignals(False)
 
-    def read_all_registers(self):
-        """모든 레지스터 읽기"""
-        print("📖 Read All Registers 버튼 클릭됨")
-        
-        if (not self.spi and not self.simulation_mode) or not self.data:
-            QMessageBox.warning(self, "경고", "SPI가 연결되지 않았거나 데이터가 없습니다.")
+    # ========== 구간 추적 ==========
+
+    def toggle_trace(self, enabled):
+        if enabled:
+            self.start_trace()
+        else:
+            self.stop_trace()
+    
+    def start_trace(self):
+        """파서 / 트리 / 값 모델 / 로그 / 전송 구간 기록 시작"""
+        if self.trace is not None:
+            return self.trace
+        try:
+            self.trace = TraceRecorder().start()
+        except RuntimeError as e:
+            QMessageBox.warning(self, "경고", str(e))
+            self._set_trace_checked(False)
+            return None
+        self.log_message("🧵 TRACE: 구간 기록 시작 (다시 선택하면 중지 후 저장)")
+        return self.trace
+    
+    def stop_trace(self, file_path=None):
+        """기록 중지 후 Chrome trace-event JSON 으로 저장 (Perfetto / chrome://tracing 에서 열기)"""
+        self._set_trace_checked(False)
+        if self.trace is None:
+            return None
+        recorder = self.trace.stop()
+        self.trace = None
+        if not file_path:
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, "추적 저장", "register_trace.json", "Chrome trace (*.json)")
+            if not file_path:
+                self.log_message(f"🧵 TRACE: 기록 중지, 저장 안 함 (이벤트 {len(recorder.events):,}개 버림)")
+                return None
+        try:
+            recorder.save(file_path)
+        except OSError as e:
+            QMessageBox.critical(self, "저장 오류", f"추적 저장 실패:\n{str(e)}")
+            self.log_message(f"❌ 추적 저장 실패: {str(e)}")
+            return None
+        dropped = f", 한도 초과로 {recorder.dropped:,}개 누락" if recorder.dropped else ""
+        self.log_message(f"🧵 TRACE: {os.path.basename(file_path)} 저장 "
+                         f"({recorder.stopped - recorder.started:.2f}초, 이벤트 {len(recorder.events):,}개{dropped})")
+        return file_path
+    
+    def _set_trace_checked(self, checked):
+        if hasattr(self.ui, 'action_record_trace') and self.ui.action_record_trace.isChecked() != checked:
+            self.ui.action_record_trace.blockSignals(True)
+            self.ui.action_record_trace.setChecked(checked)
+            self.ui.action_record_trace.blockSignals(False)
+
+    # ========== 샘플링 프로파일러 ==========
+
+    def toggle_profiler(self, enabled):
+        if enabled:
+            self.start_profiler()
+        else:
+            self.stop_profiler()
+    
+    def start_profiler(self):
+        """GUI 스레드와 전송 워커 스택 샘플링 + 이벤트 루프 멈춤 감시 시작"""
+        if self.profiler is not None:
+            return self.profiler
+        self.profiler = SamplingProfiler().start()
+        if self.profiler_timer is None:
+            self.profiler_timer = QTimer(self)
+            self.profiler_timer.setInterval(int(HEARTBEAT_INTERVAL_S * 1000))
+            self.profiler_timer.timeout.connect(self.profiler_heartbeat)
+        self.profiler_timer.start()
+        self.log_message(f"🩺 PROFILER: 샘플링 시작 (설정 {1 / self.profiler.interval_s:.0f}Hz, "
+                         f"{self.profiler.stall_threshold_s * 1000:.0f}ms 이상 멈춤 기록)")
+        # 실제 샘플링 속도는 GIL 경쟁에 따라 설정보다 낮을 수 있으므로 잠시 뒤 측정값을 남김
+        profiler = self.profiler
+        QTimer.singleShot(PROFILER_RATE_CHECK_MS, lambda: self._log_profiler_rate(profiler))
+        return self.profiler
+    
+    def _log_profiler_rate(self, profiler):
+        if profiler is not self.profiler:
             return
-            
+        summary = profiler.summary()
+        self.log_message(f"🩺 PROFILER: 실제 샘플링 {summary['rate_hz']:.0f}Hz "
+                         f"(설정 {summary['target_hz']:.0f}Hz, 놓친 샘플 {summary['missed']:,}개)")
+    
+    def profiler_heartbeat(self):
+        """이벤트 루프가 돌고 있음을 알림, 막 끝난 멈춤이 있으면 로그에 남김"""
+        if self.profiler is not None:
+            self._log_stall(self.profiler.heartbeat())
+    
+    def _log_stall(self, stall):
+        if stall is not None:
+            self.log_message(f"🐢 STALL: GUI 스레드 {stall['duration_s'] * 1000:.0f}ms 멈춤 "
+                             f"(샘플 {stall['samples']}개, {stall['top']})")
+    
+    def stop_profiler(self, file_path=None):
+        """샘플링 중지 후 collapsed stack 파일(flamegraph.pl / speedscope)로 저장"""
+        if hasattr(self.ui, 'action_sampling_profiler') and self.ui.action_sampling_profiler.isChecked():
+            self.ui.action_sampling_profiler.blockSignals(True)
+            self.ui.action_sampling_profiler.setChecked(False)
+            self.ui.action_sampling_profiler.blockSignals(False)
+        if self.profiler is None:
+            return None
+        self.profiler_timer.stop()
+        profiler = self.profiler
+        stalls = len(profiler.stalls)
+        profiler.stop()
+        self.profiler = None
+        for stall in profiler.stalls[stalls:]:
+            self._log_stall(stall)
+        summary = profiler.summary()
+        self.log_message(f"🩺 PROFILER: 중지 ({summary['duration_s']:.1f}초, 샘플 {summary['samples']:,}회 "
+                         f"= {summary['rate_hz']:.0f}Hz / 설정 {summary['target_hz']:.0f}Hz, "
+                         f"멈춤 {len(summary['stalls'])}회 / 멈춤 샘플 {summary['stall_samples']:,}개)")
+        if not file_path:
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, "프로파일 저장", "register_profile.folded", "Collapsed stacks (*.folded *.txt)")
+            if not file_path:
+                return None
         try:
-            count = 0
-            mode_str = "시뮬레이션" if self.simulation_mode else "실제"
-            print(f"📖 Read All 시작: 모든 레지스터 읽기 ({mode_str} 모드)")
-            
-            for registers in self.data.values():
-                for register in registers:
-                    addr = int(register['address'], 16)
-                    
-                    if self.simulation_mode:
-                        # 시뮬레이션 모드: 가상 레지스터에서 값 읽기
-                        value = self.simulation_registers.get(addr, 0)
-                        self.log_message(f"🎭 SIMUL READ: Addr=0x{addr:02X}, Value=0x{value:08X}")
-                    else:
-                        # 실제 SPI 통신 모드
-                        # SPI 읽기 명령
-                        read_cmd = 0x80 | (addr & 0x7F)
-                        response = self.spi.exchange([read_cmd, 0x00, 0x00, 0x00, 0x00])
-                        
-                        if len(response) >= 5:
-                            value = (response[1] << 24) | (response[2] << 16) | (response[3] << 8) | response[4]
-                            self.log_message(f"📖 READ: Addr=0x{addr:02X}, Value=0x{value:08X}")
-                    
-                    count += 1
-            
-            mode_prefix = "🎭 SIMUL" if self.simulation_mode else "📖"
-            self.log_message(f"{mode_prefix} READ ALL: {count}개 레지스터 읽기 완료")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "읽기 오류", f"전체 읽기 실패:\n{str(e)}")
-            self.log_message(f"❌ 전체 읽기 실패: {str(e)}")
+            profiler.save(file_path)
+            self.log_message(f"🩺 PROFILER: {os.path.basename(file_path)} 저장 ({summary['stacks']:,}개 스택)")
+        except OSError as e:
+            QMessageBox.critical(self, "저장 오류", f"프로파일 저장 실패:\n{str(e)}")
+            self.log_message(f"❌ 프로파일 저장 실패: {str(e)}")
+            return None
+        return file_path
 
+    @traced("log")
     def log_message(self, message):
-        """로그 메시지 추가"""
+        """로그 메시지 추가 (전송 시간 집계 중이면 GUI 로그 출력 시간도 기록)"""
+        started = time.perf_counter() if self.latency is not None else None
         self.ui.log_text.append(message)
         # 스크롤을 맨 아래로
         scrollbar = self.ui.log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
+        if started is not None and self.latency is not None:
+            self.latency.record_phase("log", time.perf_counter() - started)
 
     def clear_log(self):
         """로그 지우기"""
         self.ui.log_text.clear()
 
+    @traced("ui")
     def on_item_clicked(self, item, column):
         """트리 아이템 클릭 이벤트"""
-        print(f"🖱️ 트리 아이템 클릭됨: '{item.text(0)}'")
+        if ui_log.isEnabledFor(DEBUG):
+            ui_log.debug("🖱️ 트리 아이템 클릭됨: '%s'", item.text(0))
         
         # 아이템의 사용자 데이터 확인
         item_data = item.data(0, Qt.UserRole)
-        print(f"📄 아이템 데이터: {item_data}")
+        ui_log.debug("📄 아이템 데이터: %s", item_data)
         
         if item_data and isinstance(item_data, dict):
-            print(f"🔍 데이터 타입: {item_data.get('type')}")
+            ui_log.debug("🔍 데이터 타입: %s", item_data.get('type'))
+            
+            # 대기 중인 값 변경을 이전 레지스터에 먼저 반영
+            if self.value_model.hasPendingValue():
+                self.value_model.flush()
             
             if item_data.get('type') == 'register':
                 # 레지스터 선택
@@ -1303,34 +1704,32 @@ class RegisterTreeViewerController(QMainWindow):
                 # 기존 데이터가 있으면 사용, 없으면 기본값 계산
                 if new_register in self.register_data_store:
                     register_value = self.register_data_store[new_register]
-                    print(f"🔄 기존 레지스터 데이터 사용: {new_register} = 0x{register_value:08X}")
+                    ui_log.debug("🔄 기존 레지스터 데이터 사용: %s = 0x%08X", new_register, register_value)
                 else:
                     register_value = self.calculate_register_default_value(item_data.get('fields', []))
-                    print(f"📊 새 레지스터 기본값 계산: {new_register} = 0x{register_value:08X}")
+                    ui_log.debug("📊 새 레지스터 기본값 계산: %s = 0x%08X", new_register, register_value)
                 
                 # 전역 상태 업데이트 (독립 저장)
                 self.update_global_register_state(new_register, register_value, "레지스터 선택")
                 
                 self.current_register = new_register
                 self.current_register_data = item_data
+                self.current_register_item = item
                 
                 # 현재 선택된 필드 해제 (레지스터 전체 선택)
                 self.current_field = None
                 self.current_field_data = None
                 
-                print(f"🎯 레지스터 선택: {self.current_register} - {item_data.get('description', '')}")
+                ui_log.debug("🎯 레지스터 선택: %s - %s", self.current_register, item_data.get('description', ''))
                 
-                # 레지스터 선택 시 비트 강조 해제
+                # 레지스터 선택 시 비트 강조 해제 (SpinBox 범위는 값 동기화 시 전체 32비트로 복원됨)
                 self.clear_bit_highlights()
                 
-                # SpinBox 범위 복원 (전체 32비트)
-                self.reset_spinbox_range()
-                
                 self.update_register_ui(item_data, register_value)
                 
             elif item_data.get('type') == 'field':
                 # 필드 선택 시 부모 레지스터 찾기
-                print(f"🔧 필드 선택: {item_data.get('name')} [{item_data.get('bit_range')}]")
+                ui_log.debug("🔧 필드 선택: %s [%s]", item_data.get('name'), item_data.get('bit_range'))
                 
                 parent_item = item.parent()
                 if parent_item:
@@ -1342,23 +1741,24 @@ class RegisterTreeViewerController(QMainWindow):
                         # 기존 레지스터 데이터가 있으면 사용, 없으면 기본값 계산
                         if parent_register in self.register_data_store:
                             current_value = self.register_data_store[parent_register]
-                            print(f"🔄 기존 레지스터 값 사용: 0x{current_value:08X}")
+                            ui_log.debug("🔄 기존 레지스터 값 사용: 0x%08X", current_value)
                         else:
                             current_value = self.calculate_register_default_value(parent_data.get('fields', []))
-                            print(f"📊 기본값으로 설정: 0x{current_value:08X}")
+                            ui_log.debug("📊 기본값으로 설정: 0x%08X", current_value)
                         
                         # 전역 상태 업데이트 (독립 저장)
                         self.update_global_register_state(parent_register, current_value, "필드 선택")
                         
                         self.current_register = parent_register
                         self.current_register_data = parent_data
+                        self.current_register_item = parent_item
                         
                         # 현재 선택된 필드 정보 저장
                         self.current_field = item_data.get('name', '')
                         self.current_field_data = item_data
                         
-                        print(f"🎯 부모 레지스터 자동 선택: {self.current_register} - {parent_data.get('description', '')}")
-                        print(f"🎯 현재 선택된 필드: {self.current_field}")
+                        ui_log.debug("🎯 부모 레지스터 자동 선택: %s - %s", self.current_register, parent_data.get('description', ''))
+                        ui_log.debug("🎯 현재 선택된 필드: %s", self.current_field)
                         
                         # UI 업데이트 (현재 값 유지)
                         self.update_register_ui_preserve_value(parent_data, current_value)
@@ -1367,7 +1767,7 @@ class RegisterTreeViewerController(QMainWindow):
                         field_name = item_data.get('name', '')
                         bit_range = item_data.get('bit_range', '')
                         field_meaning = item_data.get('meaning', '')
-                        print(f"✨ 선택된 필드: {field_name} [{bit_range}]")
+                        ui_log.debug("✨ 선택된 필드: %s [%s]", field_name, bit_range)
                         
                         # desc_text에 필드 정보 표시
                         if hasattr(self.ui, 'desc_text'):
@@ -1383,16 +1783,16 @@ class RegisterTreeViewerController(QMainWindow):
                             </div>
                             """
                             self.ui.desc_text.setHtml(field_desc_html)
-                            print(f"✅ desc_text에 필드 정보 업데이트됨")
+                            ui_log.debug("✅ desc_text에 필드 정보 업데이트됨")
                         
                         # 선택된 필드의 비트 버튼들 강조 (현재 값 기반)
                         self.highlight_field_bits(item_data)
         else:
-            print(f"⚠️ 아이템 데이터가 없거나 올바르지 않음")
+            ui_log.warning("⚠️ 아이템 데이터가 없거나 올바르지 않음")
             # desc_text 초기화
             if hasattr(self.ui, 'desc_text'):
                 self.ui.desc_text.setPlainText("Select a register or field to view description")
-                print(f"✅ desc_text 초기화됨")
+                ui_log.debug("✅ desc_text 초기화됨")
                 
     def update_register_ui(self, register_data, default_value):
         """레지스터 UI 업데이트"""
@@ -1409,33 +1809,19 @@ class RegisterTreeViewerController(QMainWindow):
                 </div>
                 """
                 self.ui.desc_text.setHtml(desc_html)
-                print(f"✅ desc_text에 레지스터 정보 업데이트됨")
+                ui_log.debug("✅ desc_text에 레지스터 정보 업데이트됨")
             else:
-                print(f"⚠️ desc_text를 찾을 수 없음")
-                
-            # QSpinBox에 값 설정 (unsigned to signed 변환)
-            self._updating_ui = True  # 플래그 설정
-            try:
-                if default_value > 2147483647:
-                    signed_value = default_value - 4294967296
-                else:
-                    signed_value = default_value
-                self.ui.hex_value_spinbox.setValue(signed_value)
-                print(f"✅ SpinBox 값 설정: {signed_value}")
-            finally:
-                self._updating_ui = False  # 플래그 해제
-            
-            # 비트 버튼들 업데이트
-            self.update_bit_buttons_from_value(default_value)
-            
-            # DEC 표시 업데이트
-            self.update_dec_display(default_value)
-            print(f"✅ DEC 표시 업데이트 완료")
+                ui_log.warning("⚠️ desc_text를 찾을 수 없음")
+            
+            # 비트 위젯 필드 경계
+            self.update_field_boundaries(register_data)
+            
+            # 값 모델에 설정 - 레지스터가 바뀌었으므로 값이 같아도 모든 뷰를 다시 동기화
+            self.value_model.setValue(default_value)
+            self.value_model.invalidate()
                     
         except Exception as e:
-            print(f"❌ 값 업데이트 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            ui_log.exception("❌ 값 업데이트 오류: %s", e)
 
     def update_register_ui_preserve_value(self, register_data, current_value):
         """레지스터 UI 업데이트 (현재 값 보존)"""
@@ -1452,98 +1838,44 @@ class RegisterTreeViewerController(QMainWindow):
                 </div>
                 """
                 self.ui.desc_text.setHtml(desc_html)
-                print(f"✅ desc_text에 레지스터 정보 업데이트됨")
-            
-            print(f"✅ 현재 값 보존됨: 0x{current_value:08X} ({current_value})")
+                ui_log.debug("✅ desc_text에 레지스터 정보 업데이트됨")
             
-            # 🔥 중요: 비트 버튼들을 현재 레지스터 값으로 업데이트
-            self.update_bit_buttons_from_value(current_value)
+            ui_log.debug("✅ 현재 값 보존됨: 0x%08X (%s)", current_value, current_value)
             
-            # DEC 표시 업데이트
-            self.update_dec_display(current_value)
+            # 비트 위젯 필드 경계
+            self.update_field_boundaries(register_data)
             
-            # SpinBox 값 업데이트 (unsigned to signed 변환)
-            self._updating_ui = True  # 플래그 설정
-            try:
-                if current_value > 2147483647:
-                    signed_value = current_value - 4294967296
-                else:
-                    signed_value = current_value
-                self.ui.hex_value_spinbox.setValue(signed_value)
-                print(f"✅ SpinBox 값 설정: {signed_value}")
-            finally:
-                self._updating_ui = False  # 플래그 해제
+            # 값 모델에 설정 - 필드 선택이 바뀌면 SpinBox 표시(필드 값)가 달라지므로 다시 동기화
+            self.value_model.setValue(current_value)
+            self.value_model.invalidate()
                     
         except Exception as e:
-            print(f"❌ UI 업데이트 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            ui_log.exception("❌ UI 업데이트 오류: %s", e)
+    
+    def update_field_boundaries(self, register_data):
+        """레지스터의 필드 경계선을 비트 위젯에 표시합니다."""
+        try:
+            ranges = [self.parse_bit_range(field.get('bit_range', ''))
+                      for field in register_data.get('fields', [])]
+            self.bit_widget.setFieldBoundaries(ranges)
+        except Exception as e:
+            ui_log.error("❌ 필드 경계 표시 오류: %s", e)
     
     def highlight_field_bits(self, field_data):
-        """선택된 필드의 비트 버튼들을 강조 표시하고 활성화합니다."""
+        """선택된 필드의 비트 범위를 강조하고 범위 밖 비트를 비활성화합니다."""
         try:
-            # 모든 비트 버튼 강조 해제
-            self.clear_bit_highlights()
-            
             # 비트 범위 파싱 (공용 함수 사용)
             bit_range = field_data.get('bit_range', '')
             upper_bit, lower_bit = self.parse_bit_range(bit_range)
             
-            print(f"🎯 필드 비트 범위 강조: {upper_bit}:{lower_bit}")
+            ui_log.debug("🎯 필드 비트 범위 강조: %s:%s", upper_bit, lower_bit)
             
-            # SpinBox 범위 제한 설정
-            self.set_spinbox_range_for_field(upper_bit, lower_bit)
-            
-            # 모든 비트 버튼을 순회하면서 상태 설정
-            for i in range(32):
-                if i < len(self.bit_buttons):
-                    button = self.bit_buttons[i]
-                    bit_pos = i  # 직접 인덱스 사용
-                    
-                    if lower_bit <= bit_pos <= upper_bit:
-                        # 필드 범위 내의 버튼: 강조 표시 + 활성화
-                        button.setEnabled(True)
-                        button.setStyleSheet("""
-                            QPushButton {
-                                background-color: #FFD700;
-                                border: 3px solid #FFA500;
-                                font-weight: bold;
-                                font-size: 10px;
-                                color: #000;
-                            }
-                            QPushButton:checked {
-                                background-color: #FF8C00;
-                                color: white;
-                                border: 3px solid #FF6347;
-                            }
-                            QPushButton:hover {
-                                background-color: #FFA500;
-                            }
-                            QPushButton:checked:hover {
-                                background-color: #FF6347;
-                            }
-                        """)
-                        print(f"✨ 비트 {bit_pos} 버튼 강조 및 활성화됨")
-                    else:
-                        # 필드 범위 밖의 버튼: 비활성화
-                        button.setEnabled(False)
-                        button.setStyleSheet("""
-                            QPushButton {
-                                background-color: #e0e0e0;
-                                border: 2px solid #bbb;
-                                font-weight: normal;
-                                font-size: 10px;
-                                color: #888;
-                            }
-                            QPushButton:checked {
-                                background-color: #ccc;
-                                color: #666;
-                                border: 2px solid #999;
-                            }
-                        """)
+            # 필드 강조 (위젯 다시 그리기 한 번)
+            # SpinBox 범위는 값 모델 동기화 시 update_hex_display에서 필드에 맞춰 설정됨
+            self.bit_widget.setHighlightedField(upper_bit, lower_bit)
             
         except Exception as e:
-            print(f"❌ 필드 비트 강조 오류: {e}")
+            ui_log.error("❌ 필드 비트 강조 오류: %s", e)
     
     def set_spinbox_range_for_field(self, upper_bit, lower_bit):
         """선택된 필드의 비트 범위에 따라 SpinBox 범위를 제한합니다."""
@@ -1555,8 +1887,6 @@ class RegisterTreeViewerController(QMainWindow):
             max_value = (1 << bit_count) - 1
             min_value = 0
             
-            print(f"📊 필드 범위 제한: {bit_count}비트 → 0 ~ {max_value} (0x{max_value:X})")
-            
             # SpinBox 범위 설정 (unsigned 값 기준)
             # signed 범위로 변환: 양수는 그대로, 음수는 2^32를 빼서 표현
             if max_value <= 2147483647:
@@ -1568,80 +1898,54 @@ class RegisterTreeViewerController(QMainWindow):
                 signed_min = -2147483648
                 signed_max = 2147483647
             
-            # SpinBox 범위 적용
+            # SpinBox 범위 적용 (값은 호출자가 필드 값으로 바로 설정함)
             if hasattr(self.ui, 'hex_value_spinbox'):
-                self.ui.hex_value_spinbox.setRange(signed_min, signed_max)
-                print(f"✅ SpinBox 범위 설정: {signed_min} ~ {signed_max}")
-                
-                # 현재 값이 범위를 벗어나면 0으로 초기화
-                current_value = self.ui.hex_value_spinbox.value()
-                if current_value < signed_min or current_value > signed_max:
-                    self.ui.hex_value_spinbox.setValue(0)
-                    print(f"⚠️ 현재 값이 범위를 벗어나서 0으로 초기화됨")
+                spinbox = self.ui.hex_value_spinbox
+                if spinbox.minimum() != signed_min or spinbox.maximum() != signed_max:
+                    spinbox.setRange(signed_min, signed_max)
+                    ui_log.debug("📊 필드 범위 제한: %s비트 → 0 ~ %s (0x%X)", bit_count, max_value, max_value)
             
         except Exception as e:
-            print(f"❌ SpinBox 범위 설정 오류: {e}")
+            ui_log.error("❌ SpinBox 범위 설정 오류: %s", e)
     
     def reset_spinbox_range(self):
         """SpinBox 범위를 전체 32비트로 복원합니다."""
         try:
             if hasattr(self.ui, 'hex_value_spinbox'):
+                spinbox = self.ui.hex_value_spinbox
                 # 32비트 전체 범위로 복원 (signed int 범위)
-                self.ui.hex_value_spinbox.setRange(-2147483648, 2147483647)
-                print(f"✅ SpinBox 범위 복원: 32비트 전체 범위")
+                if spinbox.minimum() != -2147483648 or spinbox.maximum() != 2147483647:
+                    spinbox.setRange(-2147483648, 2147483647)
+                    ui_log.debug("✅ SpinBox 범위 복원: 32비트 전체 범위")
         except Exception as e:
-            print(f"❌ SpinBox 범위 복원 오류: {e}")
+            ui_log.error("❌ SpinBox 범위 복원 오류: %s", e)
     
     def clear_bit_highlights(self):
-        """모든 비트 버튼의 강조를 해제하고 모든 버튼을 활성화합니다."""
+        """비트 강조를 해제하고 모든 비트를 활성화합니다."""
         try:
-            for button in self.bit_buttons:
-                # 모든 버튼 활성화
-                button.setEnabled(True)
-                # 기본 스타일로 복원
-                button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #f0f0f0;
-                        border: 2px solid #ccc;
-                        font-weight: bold;
-                        font-size: 10px;
-                    }
-                    QPushButton:checked {
-                        background-color: #4CAF50;
-                        color: white;
-                        border: 2px solid #45a049;
-                    }
-                    QPushButton:hover {
-                        background-color: #e0e0e0;
-                    }
-                    QPushButton:checked:hover {
-                        background-color: #45a049;
-                    }
-                """)
+            self.bit_widget.clearHighlight()
         except Exception as e:
-            print(f"❌ 비트 버튼 강조 해제 오류: {e}")
+            ui_log.error("❌ 비트 강조 해제 오류: %s", e)
     
     def on_selection_changed(self):
         """트리 아이템 선택 변경 이벤트"""
-        print("🖱️ 트리 선택 변경 감지됨")
+        ui_log.debug("🖱️ 트리 선택 변경 감지됨")
         
         current_items = self.ui.tree_widget.selectedItems()
         if current_items:
             item = current_items[0]  # 첫 번째 선택된 아이템
-            print(f"📋 선택된 아이템: '{item.text(0)}'")
+            if ui_log.isEnabledFor(DEBUG):
+                ui_log.debug("📋 선택된 아이템: '%s'", item.text(0))
             
             # 기존 on_item_clicked와 동일한 로직 실행
             self.on_item_clicked(item, 0)
         else:
-            print("⚠️ 선택된 아이템이 없음")
+            ui_log.warning("⚠️ 선택된 아이템이 없음")
     
     def calculate_register_default_value(self, fields):
         """필드들의 기본값으로부터 전체 레지스터 기본값을 계산합니다."""
-        print(f"  📊 레지스터 기본값 계산 시작 (필드 수: {len(fields)})")
-        
-        final_value = self.calculate_register_value_from_fields(fields)
-        print(f"  📊 최종 레지스터 기본값: 0x{final_value:08X} ({final_value})")
-        return final_value
+        return register_fields.calculate_register_default_value(fields)
+    
     
     def update_global_register_state(self, addr, data, source="unknown"):
         """전역 레지스터 상태를 업데이트하고 각 레지스터별 독립 데이터를 저장합니다."""
@@ -1649,7 +1953,7 @@ class RegisterTreeViewerController(QMainWindow):
             # 이전 레지스터 데이터 저장
             if self.reg_addr and self.reg_addr != addr:
                 self.register_data_store[self.reg_addr] = self.reg_data
-                print(f"💾 이전 레지스터 데이터 저장: {self.reg_addr} = 0x{self.reg_data:08X}")
+                ui_log.debug("💾 이전 레지스터 데이터 저장: %s = 0x%08X", self.reg_addr, self.reg_data)
             
             # 새 레지스터로 전환
             self.reg_addr = addr
@@ -1657,14 +1961,14 @@ class RegisterTreeViewerController(QMainWindow):
             # 새 레지스터의 기존 데이터가 있으면 복원, 없으면 새 값 사용
             if addr in self.register_data_store:
                 self.reg_data = self.register_data_store[addr]
-                print(f"🔄 기존 레지스터 데이터 복원: {addr} = 0x{self.reg_data:08X} (소스: 저장된 값)")
+                ui_log.debug("🔄 기존 레지스터 데이터 복원: %s = 0x%08X (소스: 저장된 값)", addr, self.reg_data)
             else:
                 self.reg_data = data
                 self.register_data_store[addr] = data
-                print(f"📊 새 레지스터 데이터 설정: {addr} = 0x{self.reg_data:08X} (소스: {source})")
+                ui_log.debug("📊 새 레지스터 데이터 설정: %s = 0x%08X (소스: %s)", addr, self.reg_data, source)
             
         except Exception as e:
-            print(f"❌ 전역 상태 업데이트 오류: {e}")
+            ui_log.error("❌ 전역 상태 업데이트 오류: %s", e)
     
     def get_register_data(self, addr):
         """특정 레지스터의 현재 데이터를 가져옵니다."""
@@ -1674,527 +1978,163 @@ class RegisterTreeViewerController(QMainWindow):
             return 0  # 기본값
 
     def load_excel_file(self, file_path):
-        """Excel 파일을 로드합니다."""
+        """Excel 파일을 GUI 스레드에서 바로 로드합니다 (시작 시 기본 파일, 스크립트용)."""
+        if self.startup_timer:
+            self.startup_timer.begin("map_load")
         try:
-            self.data = self.load_excel(file_path)
-            if self.data:
-                self.build_tree()
+            data = load_excel(file_path)
+            if data:
+                self.apply_register_map(data)
                 self.log_message(f"✅ Excel 파일 로드: {file_path}")
             else:
                 self.log_message(f"❌ Excel 파일 로드 실패: {file_path}")
         except Exception as e:
             QMessageBox.critical(self, "파일 로드 오류", f"Excel 파일을 로드할 수 없습니다:\\n{str(e)}")
             self.log_message(f"❌ Excel 로드 오류: {str(e)}")
+        self.mark_startup_phase("map_load")
+    
 
-    def load_excel(self, file_path):
-        """Excel 파일에서 레지스터 정보를 읽어옵니다 (개선된 병합 셀 처리)."""
-        try:
-            print(f"📂 Excel 파일 로딩 시작: {file_path}")
-            
-            # pandas로 데이터 읽기
-            df = pd.read_excel(file_path, header=None)
-            
-            # openpyxl로 병합된 셀 정보 읽기
-            wb = load_workbook(file_path, read_only=False)
-            sheet = wb.active
-            merged_ranges = sheet.merged_cells.ranges
-            
-            print(f"📊 Excel 파일 크기: {df.shape[0]}행 x {df.shape[1]}열")
-            print(f"🔗 병합된 셀 범위: {len(merged_ranges)}개")
-            
-            # 병합된 셀 정보를 딕셔너리로 변환 (더 빠른 검색을 위해)
-            merged_info = {}
-            for merged_range in merged_ranges:
-                min_row, min_col = merged_range.min_row - 1, merged_range.min_col - 1  # 0-based 인덱스
-                max_row, max_col = merged_range.max_row - 1, merged_range.max_col - 1
-                for r in range(min_row, max_row + 1):
-                    for c in range(min_col, max_col + 1):
-                        merged_info[(r, c)] = {
-                            'min_row': min_row, 'max_row': max_row,
-                            'min_col': min_col, 'max_col': max_col,
-                            'is_master': (r == min_row and c == min_col)
-                        }
-            
-            print(f"🔧 병합된 셀 정보 인덱스 구축 완료: {len(merged_info)}개 셀")
-            
-            # Meaning 테이블들을 찾아서 필드 의미 매핑 생성 (개선된 방법)
-            field_meanings = self.extract_all_meaning_tables_improved(df)
-            
-            # 레지스터 데이터 파싱 (개선된 방법)
-            data = {"registers": []}
-            register_count = 0
-            
-            print(f"🔍 레지스터 검색 시작 (전체 DataFrame 스캔)")
-            
-            # DataFrame에서 "Addr" 키워드를 찾아 레지스터 시작점 확인
-            for row_idx in range(len(df)):
-                for col_idx in range(min(5, len(df.columns))):  # 첫 5열만 확인
-                    cell_value = df.iat[row_idx, col_idx]
-                    
-                    # 디버깅: 첫 10행의 값들 출력
-                    if row_idx <= 10 and col_idx <= 4:
-                        print(f"   Row {row_idx}, Col {col_idx}: '{cell_value}' (type: {type(cell_value)})")
-                    
-                    # "Addr" 키워드를 찾아 레지스터 시작점 확인
-                    if pd.notna(cell_value) and str(cell_value).strip() == "Addr":
-                        addr_col = col_idx
-                        print(f"\\n🎯 레지스터 발견: Row {row_idx}, Col {col_idx} (Addr 열)")
-                        
-                        register_data = self.parse_register_at_row_improved(df, row_idx, addr_col, merged_info, field_meanings)
-                        if register_data:
-                            data["registers"].append(register_data)
-                            register_count += 1
-                            print(f"✅ 레지스터 #{register_count} 추가됨")
-                        else:
-                            print(f"❌ 레지스터 파싱 실패")
-                        break  # 이 행에서 Addr을 찾았으면 다음 행으로
-            
-            print(f"\\n📊 총 {register_count}개 레지스터 파싱 완료")
-            
-            # 임시로 샘플 데이터 추가 (파싱이 실패한 경우)
-            if register_count == 0:
-                print("⚠️ 레지스터가 발견되지 않아 샘플 데이터 추가")
-                sample_register = {
-                    "address": "0x00",
-                    "description": "Sample Register",
-                    "fields": [
-                        {
-                            "name": "sample_field",
-                            "bit_range": "15:0",
-                            "upper_bit": 15,
-                            "lower_bit": 0,
-                            "default_value": "0",
-                            "meaning": "Sample field for testing"
-                        }
-                    ],
-                    "default_value": 0
-                }
-                data["registers"].append(sample_register)
-                print("✅ 샘플 레지스터 추가됨")
-            
-            # JSON 파일로 저장
-            json_path = file_path.replace('.xlsx', '_tree.json').replace('.xls', '_tree.json')
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"✅ JSON 파일 저장 완료: {json_path}")
-            print(f"📝 저장된 레지스터 수: {len(data['registers'])}")
-            
-            # 워크북 닫기
-            wb.close()
-            
-            return {"Sheet1": data["registers"]}
-            
-        except Exception as e:
-            print(f"❌ Excel 파일 로드 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
-
-    def extract_all_meaning_tables_improved(self, df):
-        """모든 Meaning 테이블을 찾아서 필드 의미를 추출합니다 (개선된 방법)."""
-        field_meanings = {}
-        
-        # Excel 파일 전체에서 모든 Meaning 열 찾기
-        meaning_positions = []
-        for row_idx in range(len(df)):
-            for col_idx in range(len(df.columns)):
-                cell_value = df.iat[row_idx, col_idx]
-                if pd.notna(cell_value) and str(cell_value).strip() == "Meaning":
-                    meaning_positions.append((row_idx, col_idx))
-        
-        print(f"🔍 총 {len(meaning_positions)}개의 Meaning 테이블 발견")
-        
-        # 각 Meaning 테이블에서 정보 수집
-        for table_idx, (meaning_row, meaning_col) in enumerate(meaning_positions):
-            print(f"📋 Meaning 테이블 #{table_idx + 1} 처리 중 (Row {meaning_row}, Col {meaning_col})")
-            
-            # Name 열은 보통 Meaning 열보다 4칸 앞에 위치
-            name_col = meaning_col - 4
-            if name_col < 0:
-                continue
-                
-            # 해당 테이블의 데이터 행들 처리
-            for data_row_idx in range(meaning_row + 1, len(df)):
-                if data_row_idx >= len(df):
-                    break
-                    
-                data_row = df.iloc[data_row_idx]
-                
-                # Name과 Meaning 값 가져오기
-                name_val = data_row.iloc[name_col] if name_col < len(data_row) else None
-                meaning_val = data_row.iloc[meaning_col] if meaning_col < len(data_row) else None
-                
-                # 유효한 데이터인지 확인
-                if pd.notna(name_val) and pd.notna(meaning_val):
-                    name_str = str(name_val).strip()
-                    meaning_str = str(meaning_val).strip()
-                    
-                    # "Name" 헤더가 다시 나오면 다음 테이블 시작이므로 중단
-                    if name_str == "Name":
-                        break
-                        
-                    if name_str and meaning_str and meaning_str != "nan":
-                        field_meanings[name_str] = meaning_str
-                        print(f"   📝 필드 의미: {name_str} = {meaning_str}")
-                
-                # 빈 행이 연속으로 나오면 테이블 끝
-                elif pd.isna(name_val) and pd.isna(meaning_val):
-                    # 다음 몇 행도 확인해서 정말 끝인지 체크
-                    empty_count = 0
-                    for check_row in range(data_row_idx, min(data_row_idx + 3, len(df))):
-                        check_data = df.iloc[check_row]
-                        if pd.isna(check_data.iloc[name_col]) and pd.isna(check_data.iloc[meaning_col]):
-                            empty_count += 1
-                    if empty_count >= 2:  # 2행 이상 비어있으면 테이블 끝
-                        break
-        
-        return field_meanings
-
-    def parse_register_at_row_improved(self, df, register_row, addr_col, merged_info, field_meanings):
-        """특정 행에서 레지스터 정보를 파싱합니다 (개선된 병합 셀 처리)."""
-        try:
-            # 주소 값과 레지스터 이름 읽기
-            addr_value = df.iat[register_row, addr_col + 1] if addr_col + 1 < len(df.columns) else None
-            reg_name = df.iat[register_row, addr_col + 2] if addr_col + 2 < len(df.columns) else None
-            
-            if pd.isna(addr_value):
-                return None
-            
-            address = str(addr_value).strip()
-            description = str(reg_name).strip() if pd.notna(reg_name) else ""
-            
-            print(f"   📍 주소: {address}, 설명: {description}")
-            
-            # Bit, Name, Default 행 찾기
-            bit_row = register_row + 1
-            name_row = register_row + 2  
-            default_row = register_row + 3
-            
-            print(f"   📋 Bit행: {bit_row}, Name행: {name_row}, Default행: {default_row}")
-            
-            # 필드들 파싱 (addr_col+1부터 시작 - 비트 번호들)
-            fields = []
-            processed_merged_fields = set()  # 이미 처리된 병합 필드 추적
-            
-            # 비트 15부터 0까지 순서대로 처리 (Excel에서 왼쪽부터 오른쪽으로)
-            for bit_col in range(addr_col + 1, min(addr_col + 17, len(df.columns))):  # 16비트까지
-                if bit_row >= len(df) or name_row >= len(df) or default_row >= len(df):
-                    break
-                
-                # 비트 번호 가져오기
-                bit_num_cell = df.iat[bit_row, bit_col] if bit_col < len(df.columns) else None
-                name_cell = df.iat[name_row, bit_col] if bit_col < len(df.columns) else None
-                default_cell = df.iat[default_row, bit_col] if bit_col < len(df.columns) else None
-                
-                if pd.isna(bit_num_cell):
-                    continue
-                    
-                try:
-                    bit_num = int(bit_num_cell)
-                except:
-                    continue
-                
-                # Name 셀 처리 (병합된 셀 고려)
-                field_name = ""
-                if pd.notna(name_cell):
-                    field_name = str(name_cell).strip()
-                
-                # 필드명 정리 (더 나은 처리)
-                clean_name = ""
-                if field_name and field_name not in ["nan", ""]:
-                    # Verilog 스타일의 1'b0, 1'b1 처리
-                    if field_name.startswith("1'b"):
-                        # 1'b0 -> BIT0, 1'b1 -> BIT1 등으로 변환
-                        bit_value = field_name.replace("1'b", "")
-                        clean_name = f"BIT{bit_value}"
-                    else:
-                        # 일반적인 필드명 정리
-                        clean_name = field_name.replace("<", "").replace(">", "").replace(":", "_").replace(" ", "_")
-                        clean_name = clean_name.replace("'", "").replace("(", "").replace(")", "")
-                    
-                    # 빈 문자열이나 숫자만 있는 경우 비트 위치 기반 이름 생성
-                    if not clean_name or clean_name.isdigit():
-                        clean_name = f"BIT_{bit_num}"
-                
-                # 병합된 셀인지 확인
-                merge_info = merged_info.get((name_row, bit_col))
-                if merge_info:
-                    # 병합된 셀의 시작점에서 이름 가져오기
-                    master_name = df.iat[merge_info['min_row'], merge_info['min_col']]
-                    if pd.notna(master_name):
-                        field_name = str(master_name).strip()
-                        # 동일한 필드명 정리 로직 적용
-                        if field_name.startswith("1'b"):
-                            bit_value = field_name.replace("1'b", "")
-                            clean_name = f"BIT{bit_value}"
-                        else:
-                            clean_name = field_name.replace("<", "").replace(">", "").replace(":", "_").replace(" ", "_")
-                            clean_name = clean_name.replace("'", "").replace("(", "").replace(")", "")
-                        
-                        if not clean_name or clean_name.isdigit():
-                            # 병합된 필드의 경우 범위 기반 이름 생성
-                            bit_range_name = f"{upper_bit}_{lower_bit}" if upper_bit != lower_bit else str(upper_bit)
-                            clean_name = f"FIELD_{bit_range_name}"
-                    
-                    # 이미 처리된 병합 필드인지 확인
-                    merge_key = (merge_info['min_row'], merge_info['min_col'], merge_info['max_row'], merge_info['max_col'])
-                    if merge_key in processed_merged_fields:
-                        continue  # 이미 처리된 병합 필드는 스킵
-                    processed_merged_fields.add(merge_key)
-                    
-                    # 병합 범위 계산 (비트 번호 기준)
-                    upper_bit = 15 - (merge_info['min_col'] - addr_col - 1)
-                    lower_bit = 15 - (merge_info['max_col'] - addr_col - 1)
-                    
-                    # upper가 lower보다 작으면 바꿔줌
-                    if upper_bit < lower_bit:
-                        upper_bit, lower_bit = lower_bit, upper_bit
-                        
-                else:
-                    # 단일 비트
-                    upper_bit = lower_bit = bit_num
-                
-                # Default 값 처리 (병합된 셀도 비트별로 계산)
-                default_val = 0
-                if merge_info:
-                    # 병합된 셀의 경우 각 비트별로 Default 값을 읽어서 계산
-                    bit_count = upper_bit - lower_bit + 1
-                    calculated_default = 0
-                    
-                    print(f"      🔍 병합된 필드 '{clean_name}' [{upper_bit}:{lower_bit}] - {bit_count}비트 개별 계산")
-                    
-                    for bit_pos in range(lower_bit, upper_bit + 1):
-                        # 해당 비트 위치의 열 계산
-                        bit_col_pos = addr_col + 1 + (15 - bit_pos)
-                        if bit_col_pos < len(df.columns) and default_row < len(df):
-                            bit_default_cell = df.iat[default_row, bit_col_pos]
-                            if pd.notna(bit_default_cell):
-                                try:
-                                    bit_default_val = int(bit_default_cell)
-                                    if bit_default_val != 0:
-                                        # 해당 비트 위치에 값 설정
-                                        bit_offset = bit_pos - lower_bit
-                                        calculated_default |= (bit_default_val << bit_offset)
-                                        print(f"        🔸 비트 {bit_pos}: {bit_default_val} -> 오프셋 {bit_offset}")
-                                except:
-                                    pass
-                    
-                    default_val = calculated_default
-                    print(f"      ✅ 병합된 필드 '{clean_name}' 계산된 Default: {default_val} (0x{default_val:X})")
-                else:
-                    # 단일 비트의 경우
-                    if pd.notna(default_cell):
-                        try:
-                            default_val = int(default_cell)
-                        except:
-                            default_val = 0
-                    print(f"      🔸 단일 비트 '{clean_name}' Default: {default_val}")
-                
-                # 필드명이 있는 경우만 추가
-                if field_name and field_name not in ["nan", ""] and clean_name:
-                    # 같은 이름의 필드가 이미 있는지 확인
-                    existing_field = None
-                    for field in fields:
-                        if field["name"] == clean_name:
-                            existing_field = field
-                            break
-                    
-                    if existing_field is None:
-                        # 의미 정보 가져오기
-                        field_meaning = field_meanings.get(field_name, f"{field_name} bits {upper_bit}:{lower_bit}" if upper_bit != lower_bit else f"{field_name} bit {upper_bit}")
-                        
-                        # 비트 범위 문자열 생성
-                        if upper_bit == lower_bit:
-                            bit_range_str = str(upper_bit)
-                        else:
-                            bit_range_str = f"{upper_bit}:{lower_bit}"
-                        
-                        field_data = {
-                            "name": clean_name,
-                            "bit_range": bit_range_str,
-                            "upper_bit": upper_bit,
-                            "lower_bit": lower_bit,
-                            "default_value": str(default_val),
-                            "meaning": field_meaning
-                        }
-                        
-                        fields.append(field_data)
-                        print(f"     🔹 필드: {clean_name} = bit {upper_bit}:{lower_bit}, 기본값: {default_val}, 의미: {field_meaning}")
-            
-            if not fields:
-                print("   ⚠️ 필드가 발견되지 않음")
-                return None
-            
-            # 레지스터 기본값 계산
-            default_value = self.calculate_register_default_value(fields)
-            
-            register_data = {
-                "address": address,
-                "description": description,
-                "fields": fields,
-                "default_value": default_value
-            }
-            
-            print(f"   ✅ 레지스터 파싱 완료: {len(fields)}개 필드, 기본값: {default_value}")
-            return register_data
-            
-        except Exception as e:
-            print(f"   ❌ 레지스터 파싱 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
-
-    def group_consecutive_fields(self, bit_info):
-        """연속된 같은 이름의 필드들을 그룹화합니다."""
-        if not bit_info:
-            return []
-        
-        groups = []
-        
-        # 비트 번호 순으로 정렬 (내림차순 - MSB부터)
-        sorted_bits = sorted(bit_info, key=lambda x: x['bit'], reverse=True)
-        
-        # 이름이 있는 비트와 없는 비트를 구분
-        named_bits = [bit for bit in sorted_bits if bit['name'] is not None]
-        unnamed_bits = [bit for bit in sorted_bits if bit['name'] is None]
-        
-        # 이름이 있는 필드들을 처리
-        for bit_data in named_bits:
-            bit_num = bit_data['bit']
-            field_name = str(bit_data['name']).strip()
-            
-            # 이미 처리된 비트는 건너뛰기
-            if any(bit_num in group.get('bits', []) for group in groups):
-                continue
-            
-            # 필드 이름에서 비트 범위 정보 추출 (예: TX_SEN<13:0>, RX0_SEN<15:0>)
-            extracted_range = self.extract_bit_range_from_name(field_name)
-            
-            if extracted_range:
-                # 이름에 비트 범위가 명시된 경우
-                upper_bit, lower_bit = extracted_range
-                clean_name = self.clean_field_name(field_name)
-                
-                groups.append({
-                    'name': clean_name,
-                    'max_bit': upper_bit,
-                    'min_bit': lower_bit,
-                    'default': bit_data['default'],
-                    'bits': list(range(upper_bit, lower_bit - 1, -1))
-                })
-                print(f"      🔍 범위 추출: {field_name} -> {clean_name} = {upper_bit}:{lower_bit}")
-                
-            else:
-                # 일반적인 필드 처리
-                same_name_bits = [b for b in named_bits if str(b['name']).strip() == field_name]
-                
-                if len(same_name_bits) == 1:
-                    # 단일 이름의 필드
-                    if len(unnamed_bits) >= 15 and bit_num == 15:
-                        # 15번 비트에 이름이 있고 나머지가 모두 unnamed이면 전체 필드로 간주 (reset 케이스)
-                        groups.append({
-                            'name': field_name,
-                            'max_bit': 15,
-                            'min_bit': 0,
-                            'default': bit_data['default'],
-                            'bits': list(range(15, -1, -1))
-                        })
-                    else:
-                        # 일반 단일 비트 필드
-                        groups.append({
-                            'name': field_name,
-                            'max_bit': bit_num,
-                            'min_bit': bit_num,
-                            'default': bit_data['default'],
-                            'bits': [bit_num]
-                        })
-                else:
-                    # 같은 이름의 여러 비트들을 연속 그룹으로 처리
-                    consecutive_groups = self.find_consecutive_groups(same_name_bits)
-                    for group_bits in consecutive_groups:
-                        bit_numbers = [b['bit'] for b in group_bits]
-                        groups.append({
-                            'name': field_name,
-                            'max_bit': max(bit_numbers),
-                            'min_bit': min(bit_numbers),
-                            'default': group_bits[0]['default'],
-                            'bits': sorted(bit_numbers, reverse=True)
-                        })
-        
-        return groups
+    def start_excel_load(self, file_path):
+        """Excel 파일을 백그라운드 스레드에서 로드합니다 (현재 맵은 완료 시까지 계속 사용 가능)."""
+        # 이전 로드가 진행 중이면 취소 (결과는 버림)
+        if self.excel_worker is not None:
+            self.excel_worker.cancel()
+        
+        worker = ExcelLoadWorker(file_path, self)
+        worker.progress.connect(self.on_excel_load_progress)
+        worker.loaded.connect(self.on_excel_loaded)
+        worker.failed.connect(self.on_excel_load_failed)
+        worker.cancelled.connect(self.on_excel_load_cancelled)
+        worker.finished.connect(worker.deleteLater)
+        self.excel_worker = worker
+        
+        self.load_progress_bar.setRange(0, 0)  # 블록 수를 알기 전에는 busy 표시
+        self.load_progress_bar.show()
+        self.load_cancel_btn.setEnabled(True)
+        self.load_cancel_btn.show()
+        self.statusBar().showMessage(f"Excel 로드 중: {file_path}")
+        self.log_message(f"📂 Excel 파일 로드 시작: {file_path}")
+        
+        if self.startup_timer:
+            self.startup_timer.begin("map_load")
+        worker.start()
     
-    def extract_bit_range_from_name(self, field_name):
-        """필드 이름에서 비트 범위를 추출합니다. 예: TX_SEN<13:0> -> (13, 0)"""
-        import re
-        
-        # <숫자:숫자> 패턴 찾기
-        pattern = r'<(\d+):(\d+)>'
-        match = re.search(pattern, field_name)
-        if match:
-            upper = int(match.group(1))
-            lower = int(match.group(2))
-            return (upper, lower)
-        
-        # <숫자> 패턴 찾기 (단일 비트)
-        pattern = r'<(\d+)>'
-        match = re.search(pattern, field_name)
-        if match:
-            bit_num = int(match.group(1))
-            return (bit_num, bit_num)
-        
-        return None
     
-    def clean_field_name(self, field_name):
-        """필드 이름에서 비트 범위 표기를 제거합니다. 예: TX_SEN<13:0> -> TX_SEN"""
-        import re
-        # <...> 부분 제거
-        cleaned = re.sub(r'<[^>]+>', '', field_name)
-        return cleaned.strip()
+    def cancel_excel_load(self):
+        """진행 중인 백그라운드 Excel 로드 취소 요청"""
+        if self.excel_worker is not None:
+            self.excel_worker.cancel()
+            self.load_cancel_btn.setEnabled(False)
+            self.statusBar().showMessage("Excel 로드 취소 중...")
     
-    def find_consecutive_groups(self, bits):
-        """같은 이름의 비트들을 연속된 그룹들로 나눕니다."""
-        if not bits:
-            return []
-        
-        # 비트 번호로 정렬
-        sorted_bits = sorted(bits, key=lambda x: x['bit'], reverse=True)
-        
-        groups = []
-        current_group = [sorted_bits[0]]
-        
-        for i in range(1, len(sorted_bits)):
-            current_bit = sorted_bits[i]['bit']
-            prev_bit = sorted_bits[i-1]['bit']
-            
-            if prev_bit - current_bit == 1:
-                # 연속된 비트
-                current_group.append(sorted_bits[i])
-            else:
-                # 연속되지 않음 - 새 그룹 시작
-                groups.append(current_group)
-                current_group = [sorted_bits[i]]
+    
+    def is_current_excel_worker(self):
+        """시그널을 보낸 작업이 현재 로드 작업인지 확인 (취소/대체된 작업의 결과는 무시)"""
+        return self.excel_worker is not None and self.sender() is self.excel_worker
+    
+    
+    def finish_excel_load(self):
+        """로드 작업 종료 공통 처리 (진행률 위젯 숨김)"""
+        self.excel_worker = None
+        self.load_progress_bar.hide()
+        self.load_cancel_btn.hide()
+        self.mark_startup_phase("map_load")
+    
+    
+    def on_excel_load_progress(self, blocks_found, registers_parsed):
+        """백그라운드 로드 진행률 (발견된 블록 수, 파싱된 레지스터 수)"""
+        if not self.is_current_excel_worker():
+            return
+        self.load_progress_bar.setRange(0, max(1, blocks_found))
+        self.load_progress_bar.setValue(registers_parsed)
+        self.statusBar().showMessage(
+            f"Excel 로드 중: 블록 {blocks_found}개 발견, 레지스터 {registers_parsed}개 파싱")
+    
+    
+    @traced("parser")
+    def on_excel_loaded(self, data):
+        """백그라운드 로드 완료 - 트리를 한 번에 교체"""
+        if not self.is_current_excel_worker():
+            return
+        file_path = self.excel_worker.file_path
+        self.finish_excel_load()
+        self.apply_register_map(data)
+        self.log_message(f"✅ Excel 파일 로드: {file_path}")
+        self.statusBar().showMessage("Excel 로드 완료", 3000)
+        ui_log.debug("📂 새 엑셀 파일 로딩 완료: %s", file_path)
+    
+    
+    def on_excel_load_failed(self, message):
+        """백그라운드 로드 실패 - 현재 맵 유지"""
+        if not self.is_current_excel_worker():
+            return
+        file_path = self.excel_worker.file_path
+        self.finish_excel_load()
+        self.statusBar().showMessage("Excel 로드 실패", 3000)
+        self.log_message(f"❌ Excel 파일 로드 실패: {file_path} ({message})")
+        QMessageBox.critical(self, "파일 로드 오류", f"Excel 파일을 로드할 수 없습니다:\n{message}")
+    
+    
+    def on_excel_load_cancelled(self):
+        """백그라운드 로드 취소됨 - 현재 맵 유지"""
+        if not self.is_current_excel_worker():
+            return
+        file_path = self.excel_worker.file_path
+        self.finish_excel_load()
+        self.statusBar().showMessage("Excel 로드 취소됨", 3000)
+        self.log_message(f"⏹️ Excel 파일 로드 취소: {file_path}")
+    
+    
+    @traced("tree")
+    def apply_register_map(self, data):
+        """새 레지스터 맵을 적용합니다 (선택 상태 초기화 후 트리 교체)."""
+        self.data = data
         
-        # 마지막 그룹 추가
-        groups.append(current_group)
+        # 이전 맵의 레지스터/필드 선택 해제
+        self.current_register = None
+        self.current_register_data = None
+        self.current_field = None
+        self.current_field_data = None
+        self.clear_bit_highlights()
+        self.bit_widget.setFieldBoundaries([])
         
-        return groups
-
+        self.build_tree()
+    
+    @traced("tree")
     def build_tree(self):
-        """트리 구조를 구축합니다."""
-        self.ui.tree_widget.clear()
+        """트리 구조를 구축합니다 (아이템을 먼저 만든 뒤 한 번에 교체)."""
+        sheet_items = self.create_tree_items(self.data)
         
-        if not self.data:
-            return
+        tree = self.ui.tree_widget
+        tree.setUpdatesEnabled(False)
+        try:
+            tree.clear()
+            self.current_register_item = None  # clear()로 삭제된 아이템 참조 해제
+            tree.addTopLevelItems(sheet_items)
+            # 트리 확장
+            tree.expandAll()
+        finally:
+            tree.setUpdatesEnabled(True)
+        ui_log.debug("✅ 트리 구성 완료")
+    
+
+    @traced("tree")
+    def create_tree_items(self, data):
+        """레지스터 데이터로 트리에 붙지 않은 시트 아이템 목록을 만듭니다."""
+        sheet_items = []
+        if not data:
+            return sheet_items
         
-        print(f"🌳 트리 구성 시작, 데이터 구조: {type(self.data)}")
+        ui_log.debug("🌳 트리 구성 시작, 데이터 구조: %s", type(data))
         
         # 데이터 구조에 따라 처리
-        if isinstance(self.data, dict):
-            for sheet_name, registers in self.data.items():
-                print(f"📋 시트: {sheet_name}, 레지스터 수: {len(registers)}")
+        if isinstance(data, dict):
+            for sheet_name, registers in data.items():
+                ui_log.debug("📋 시트: %s, 레지스터 수: %s", sheet_name, len(registers))
                 
                 # 시트 아이템 생성
-                sheet_item = QTreeWidgetItem(self.ui.tree_widget, [sheet_name])
+                sheet_item = QTreeWidgetItem([sheet_name])
+                sheet_items.append(sheet_item)
                 
                 for register in registers:
                     # 레지스터 아이템 생성
@@ -2214,7 +2154,7 @@ class RegisterTreeViewerController(QMainWindow):
                         'fields': register.get('fields', [])
                     })
                     
-                    print(f"  📌 레지스터 추가: {register['address']} - {register['description']}")
+                    ui_log.debug("  📌 레지스터 추가: %s - %s", register['address'], register['description'])
                     
                     # 필드 아이템들 추가
                     for field in register.get('fields', []):
@@ -2230,20 +2170,16 @@ class RegisterTreeViewerController(QMainWindow):
                             'meaning': field.get('meaning', '')
                         })
         
-        # 트리 확장
-        self.ui.tree_widget.expandAll()
-        print("✅ 트리 구성 완료")
-
+        return sheet_items
+    
+    
     def open_excel_file(self):
-        """Excel 파일 열기 대화상자"""
+        """Excel 파일 열기 대화상자 (백그라운드 로드)"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Excel 파일 선택", "", "Excel Files (*.xlsx *.xls)"
         )
         if file_path:
-            self.load_excel_file(file_path)
-            import os
-            file_name = os.path.basename(file_path)
-            print(f"📂 새 엑셀 파일 로딩 완료: {file_name}")
+            self.start_excel_load(file_path)
 
     def save_json_file(self):
         """JSON 파일 저장 대화상자"""
@@ -2262,32 +2198,36 @@ class RegisterTreeViewerController(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "저장 오류", f"파일 저장 실패:\\n{str(e)}")
 
+    def find_register_item(self, address):
+        """주소로 트리에서 레지스터 아이템을 찾습니다 (없으면 None)."""
+        root = self.ui.tree_widget.invisibleRootItem()
+        for sheet_idx in range(root.childCount()):
+            sheet_item = root.child(sheet_idx)
+            for reg_idx in range(sheet_item.childCount()):
+                reg_item = sheet_item.child(reg_idx)
+                reg_data = reg_item.data(0, Qt.UserRole)
+                if reg_data and reg_data.get('address') == address:
+                    return reg_item
+        return None
+
+    @traced("tree")
     def update_tree_display_values(self, new_value):
         """현재 선택된 레지스터의 Tree 표시 값만 업데이트합니다."""
         try:
             if not self.current_register or not hasattr(self, 'ui') or not hasattr(self.ui, 'tree_widget'):
                 return
                 
-            print(f"🌳 Tree 값 업데이트 시작 (레지스터 {self.current_register}): 0x{new_value:08X}")
+            ui_log.debug("🌳 Tree 값 업데이트 시작 (레지스터 %s): 0x%08X", self.current_register, new_value)
             
-            # 현재 선택된 레지스터만 찾기
-            root = self.ui.tree_widget.invisibleRootItem()
-            target_register_item = None
-            
-            for sheet_idx in range(root.childCount()):
-                sheet_item = root.child(sheet_idx)
-                for reg_idx in range(sheet_item.childCount()):
-                    reg_item = sheet_item.child(reg_idx)
-                    reg_data = reg_item.data(0, Qt.UserRole)
-                    
-                    if reg_data and reg_data.get('address') == self.current_register:
-                        target_register_item = reg_item
-                        break
-                if target_register_item:
-                    break
+            # 선택 시 기억해 둔 아이템 사용, 없거나 다른 레지스터면 트리에서 찾기
+            target_register_item = self.current_register_item
+            cached_data = target_register_item.data(0, Qt.UserRole) if target_register_item else None
+            if not cached_data or cached_data.get('address') != self.current_register:
+                target_register_item = self.find_register_item(self.current_register)
+                self.current_register_item = target_register_item
             
             if not target_register_item:
-                print(f"⚠️ 현재 레지스터 {self.current_register}를 Tree에서 찾을 수 없음")
+                ui_log.warning("⚠️ 현재 레지스터 %s를 Tree에서 찾을 수 없음", self.current_register)
                 return
             
             # 현재 선택된 레지스터의 데이터 가져오기
@@ -2296,7 +2236,7 @@ class RegisterTreeViewerController(QMainWindow):
             # 레지스터 아이템 텍스트 업데이트 (값 표시 없이)
             reg_text = f"0x{self.current_register} - {reg_data.get('description', '')}"
             target_register_item.setText(0, reg_text)
-            print(f"📋 레지스터 아이템 업데이트: {reg_text} (값: {new_value})")
+            ui_log.debug("📋 레지스터 아이템 업데이트: %s (값: %s)", reg_text, new_value)
             
             # 현재 선택된 레지스터의 각 필드 값 계산 및 업데이트
             for field_idx in range(target_register_item.childCount()):
@@ -2315,22 +2255,20 @@ class RegisterTreeViewerController(QMainWindow):
                     
                     # 현재 선택된 필드인지 확인하여 추가 디버깅
                     if self.current_field_data and field_name == self.current_field_data.get('name'):
-                        print(f"  🎯 현재 선택된 필드 업데이트: {field_name}")
-                        print(f"     비트 범위: {upper_bit}:{lower_bit}")
-                        print(f"     레지스터 값: 0x{new_value:08X}")
-                        print(f"     계산된 필드 값: {field_value}")
+                        ui_log.debug("  🎯 현재 선택된 필드 업데이트: %s", field_name)
+                        ui_log.debug("     비트 범위: %s:%s", upper_bit, lower_bit)
+                        ui_log.debug("     레지스터 값: 0x%08X", new_value)
+                        ui_log.debug("     계산된 필드 값: %s", field_value)
                     
                     # 필드 아이템 텍스트 업데이트
                     field_text = f"{field_name} [{bit_range}] = {field_value}"
                     field_item.setText(0, field_text)
-                    print(f"  🔹 필드 업데이트: {field_text}")
+                    ui_log.debug("  🔹 필드 업데이트: %s", field_text)
             
-            print(f"✅ Tree 값 업데이트 완료 (레지스터 {self.current_register}만)")
+            ui_log.debug("✅ Tree 값 업데이트 완료 (레지스터 %s만)", self.current_register)
             
         except Exception as e:
-            print(f"❌ Tree 값 업데이트 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            ui_log.exception("❌ Tree 값 업데이트 중 오류: %s", e)
 
     def show_protocol_guide(self):
         """프로토콜 연결 가이드 대화상자 (스크롤 가능 및 크기 조절 가능)"""
@@ -2535,9 +2473,9 @@ class RegisterTreeViewerController(QMainWindow):
             if text.strip():
                 # 입력값이 유효한 16진수인지 확인
                 int(text, 16)
-                print(f"📍 주소 입력: 0x{text}")
+                ui_log.debug("📍 주소 입력: 0x%s", text)
         except ValueError:
-            print(f"⚠️ 잘못된 주소 형식: {text}")
+            ui_log.warning("⚠️ 잘못된 주소 형식: %s", text)
 
     def on_data_changed(self, text):
         """데이터 입력 필드 변경 이벤트"""
@@ -2546,13 +2484,13 @@ class RegisterTreeViewerController(QMainWindow):
             if text.strip():
                 # 입력값이 유효한 16진수인지 확인
                 value = int(text, 16)
-                print(f"🔢 데이터 입력: 0x{text} ({value})")
+                ui_log.debug("🔢 데이터 입력: 0x%s (%s)", text, value)
         except ValueError:
-            print(f"⚠️ 잘못된 데이터 형식: {text}")
+            ui_log.warning("⚠️ 잘못된 데이터 형식: %s", text)
 
     def single_write_register(self):
         """주소/데이터 입력 필드의 값으로 단일 레지스터 쓰기"""
-        print("✍️ Single Write 버튼 클릭됨")
+        transport_log.debug("✍️ Single Write 버튼 클릭됨")
         
         # 연결 확인 (Tree 선택과 무관하게 동작)
         is_connected = (self.spi_controller or self.i2c_controller or self.uart_serial or self.simulation_mode)
@@ -2573,50 +2511,11 @@ class RegisterTreeViewerController(QMainWindow):
             addr = int(addr_text, 16)
             value = int(data_text, 16)
             
-            print(f"📝 Single Write: Addr=0x{addr:02X}, Data=0x{value:08X}")
+            transport_log.debug("📝 Single Write: Addr=0x%02X, Data=0x%08X", addr, value)
             
-            if self.simulation_mode:
-                # 시뮬레이션 모드: 가상으로 레지스터에 쓰기
-                self.simulation_registers[addr] = value
-                self.log_message(f"🎭 SIMUL {self.current_protocol} SINGLE WRITE: Addr=0x{addr:02X}, Value=0x{value:08X} ({value})")
-                self.log_message(f"   시뮬레이션 데이터 저장됨")
-                
-            else:
-                # 실제 통신 모드 - 프로토콜별 처리
-                if self.current_protocol == "SPI" and self.spi:
-                    # SPI 쓰기 명령 (RW=0, 주소 7비트 + 데이터 32비트)
-                    write_cmd = (addr & 0x7F)  # RW=0, 주소 7비트
-                    data_byte3 = (value >> 24) & 0xFF
-                    data_byte2 = (value >> 16) & 0xFF
-                    data_byte1 = (value >> 8) & 0xFF
-                    data_byte0 = value & 0xFF
-                    
-                    # SPI 전송 (32비트 데이터)
-                    response = self.spi.exchange([write_cmd, data_byte3, data_byte2, data_byte1, data_byte0])
-                    
-                    self.log_message(f"📝 SPI SINGLE WRITE: Addr=0x{addr:02X}, Value=0x{value:08X} ({value})")
-                    self.log_message(f"   CMD: 0x{write_cmd:02X} 0x{data_byte3:02X} 0x{data_byte2:02X} 0x{data_byte1:02X} 0x{data_byte0:02X}")
-                    
-                elif self.current_protocol == "I2C" and self.i2c:
-                    # I2C 쓰기 (레지스터 주소 + 4바이트 데이터)
-                    data_bytes = [addr, 
-                                  (value >> 24) & 0xFF, 
-                                  (value >> 16) & 0xFF, 
-                                  (value >> 8) & 0xFF, 
-                                  value & 0xFF]
-                    self.i2c.write(data_bytes)
-                    
-                    self.log_message(f"📝 I2C SINGLE WRITE: Addr=0x{addr:02X}, Value=0x{value:08X} ({value})")
-                    
-                elif self.current_protocol == "UART" and self.uart_serial:
-                    # UART 쓰기 (텍스트 형태로 전송)
-                    cmd_str = f"W,{addr:02X},{value:08X}\n"
-                    self.uart_serial.write(cmd_str.encode())
-                    
-                    self.log_message(f"📝 UART SINGLE WRITE: {cmd_str.strip()}")
-                    
-                else:
-                    raise Exception(f"{self.current_protocol} 연결이 없습니다.")
+            command = self.transport_write(addr, value)
+            self.log_message(f"{self.log_icon('📝')} {self.current_protocol} SINGLE WRITE: Addr=0x{addr:02X}, Value=0x{value:08X} ({value})")
+            self.log_message(f"   {command}")
             
         except ValueError as e:
             QMessageBox.critical(self, "입력 오류", f"주소 또는 데이터 형식이 올바르지 않습니다:\n{str(e)}")
@@ -2627,7 +2526,7 @@ class RegisterTreeViewerController(QMainWindow):
 
     def single_read_register(self):
         """주소 입력 필드의 값으로 단일 레지스터 읽기"""
-        print("📖 Single Read 버튼 클릭됨")
+        transport_log.debug("📖 Single Read 버튼 클릭됨")
         
         # 연결 확인 (Tree 선택과 무관하게 동작)
         is_connected = (self.spi_controller or self.i2c_controller or self.uart_serial or self.simulation_mode)
@@ -2646,71 +2545,15 @@ class RegisterTreeViewerController(QMainWindow):
             # 16진수 값으로 변환
             addr = int(addr_text, 16)
             
-            print(f"📖 Single Read: Addr=0x{addr:02X}")
+            transport_log.debug("📖 Single Read: Addr=0x%02X", addr)
             
-            if self.simulation_mode:
-                # 시뮬레이션 모드: 가상 레지스터에서 값 읽기
-                value = self.simulation_registers.get(addr, 0)  # 기본값 0
-                self.log_message(f"🎭 SIMUL {self.current_protocol} SINGLE READ: Addr=0x{addr:02X}, Value=0x{value:08X} ({value})")
-                
-            else:
-                # 실제 통신 모드 - 프로토콜별 처리
-                if self.current_protocol == "SPI" and self.spi:
-                    # SPI 읽기 명령 (RW=1, 주소 7비트)
-                    read_cmd = 0x80 | (addr & 0x7F)  # RW=1, 주소 7비트
-                    
-                    # SPI 전송 (읽기는 4바이트 수신)
-                    response = self.spi.exchange([read_cmd, 0x00, 0x00, 0x00, 0x00])
-                    
-                    # 응답에서 데이터 추출 (첫 바이트는 명령 에코)
-                    if len(response) >= 5:
-                        value = (response[1] << 24) | (response[2] << 16) | (response[3] << 8) | response[4]
-                    else:
-                        value = 0
-                        
-                    self.log_message(f"📖 SPI SINGLE READ: Addr=0x{addr:02X}, Value=0x{value:08X} ({value})")
-                    
-                elif self.current_protocol == "I2C" and self.i2c:
-                    # I2C 읽기 (레지스터 주소 전송 후 4바이트 읽기)
-                    self.i2c.write([addr])  # 주소 전송
-                    response = self.i2c.read(4)  # 4바이트 읽기
-                    
-                    if len(response) >= 4:
-                        value = (response[0] << 24) | (response[1] << 16) | (response[2] << 8) | response[3]
-                    else:
-                        value = 0
-                        
-                    self.log_message(f"📖 I2C SINGLE READ: Addr=0x{addr:02X}, Value=0x{value:08X} ({value})")
-                    
-                elif self.current_protocol == "UART" and self.uart_serial:
-                    # UART 읽기 (텍스트 형태로 전송하고 응답 수신)
-                    cmd_str = f"R,{addr:02X}\n"
-                    self.uart_serial.write(cmd_str.encode())
-                    
-                    # 응답 읽기 (간단한 구현)
-                    import time
-                    time.sleep(0.1)  # 응답 대기
-                    response = self.uart_serial.read(20)  # 최대 20바이트 읽기
-                    
-                    try:
-                        response_str = response.decode().strip()
-                        # 응답 형식: "0x12345678" 또는 "12345678"
-                        if response_str.startswith('0x'):
-                            value = int(response_str, 16)
-                        else:
-                            value = int(response_str, 16)
-                    except:
-                        value = 0
-                        
-                    self.log_message(f"📖 UART SINGLE READ: {cmd_str.strip()}, Response: 0x{value:08X}")
-                    
-                else:
-                    raise Exception(f"{self.current_protocol} 연결이 없습니다.")
+            value = self.transport_read(addr)
+            self.log_message(f"{self.log_icon('📖')} {self.current_protocol} SINGLE READ: Addr=0x{addr:02X}, Value=0x{value:08X} ({value})")
             
             # 읽은 값을 데이터 입력 필드에 표시
             self.ui.data_edit.setText(f"{value:08X}")
             
-            print(f"✅ Single Read 완료: 0x{value:08X}")
+            transport_log.debug("✅ Single Read 완료: 0x%08X", value)
             
         except ValueError as e:
             QMessageBox.critical(self, "입력 오류", f"주소 형식이 올바르지 않습니다:\n{str(e)}")
@@ -2726,19 +2569,52 @@ class RegisterTreeViewerController(QMainWindow):
                          "Excel 파일에서 레지스터 정보를 읽어와 트리 구조로 표시하고\\n"
                          "FT2232H를 통한 SPI 통신으로 레지스터를 제어합니다.")
 
+    def closeEvent(self, event):
+        """창 닫기 - 진행 중인 백그라운드 Excel 로드를 취소하고 종료를 기다림"""
+        # 다른 파일로 대체되어 취소된 작업도 아직 실행 중일 수 있으므로 모두 확인
+        for worker in self.findChildren(ExcelLoadWorker):
+            worker.cancel()
+            worker.wait()
+        self.excel_worker = None
+        self._stop_poll_worker()    # 남은 poll-until 타이머는 다음 단계에서 바로 끝남
+        if self.monitor_window is not None:
+            self.monitor_window.close()
+        if self.journal is not None:
+            self.journal.detach()
+            self.journal = None
+        if self.latency is not None:
+            self.latency.detach()
+            self.latency = None
+        if self.trace is not None:
+            self.trace.stop()
+            self.trace = None
+        if self.usb_meter is not None:
+            self.usb_meter.detach()
+            self.usb_meter = None
+        if self.profiler is not None:
+            self.profiler_timer.stop()
+            self.profiler.stop()
+            self.profiler = None
+        super().closeEvent(event)
+
 def main():
+    configure_logging()
+    startup_timer = StartupTimer(_STARTUP_T0)
+    startup_timer.record("import", _STARTUP_T0, _STARTUP_IMPORTED)
     app = QApplication(sys.argv)
     
     # Excel 파일 경로 (있으면 자동 로드)
-    import os
     excel_path = os.path.join(os.path.dirname(__file__), "Sample.xlsx")
     
     try:
-        window = RegisterTreeViewerController(excel_path)
+        # 창을 먼저 띄우고 레지스터 맵은 백그라운드에서 로드
+        window = RegisterTreeViewerController(excel_path, load_in_background=True,
+                                              startup_timer=startup_timer)
+        startup_timer.begin("first_paint")
         window.show()
         sys.exit(app.exec())
     except Exception as e:
-        print(f"애플리케이션 시작 오류: {e}")
+        ui_log.debug("애플리케이션 시작 오류: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+고장 프로파일별 유효 처리량 측정 (하드웨어 불필요)
+
+sim_faults 의 프로파일(clean / noisy_cable / long_cable / flaky_usb / worst)마다
+시뮬레이션 SPI 포트로 128개 레지스터를 쓰고 비교합니다.
+    - 검증 없음     : 쓰기만 수행 → 디바이스 상태와 비교해 조용히 틀린 레지스터 수를 셈
+    - 배치 검증     : register_transfer.write_and_verify() (전체 쓰기 → 전체 읽기 → 실패분만 재전송)
+가상 시계 기준 검증 완료된 레지스터/초(good frames/s), 라운드 수, 재전송 프레임 수를 출력하므로
+현장 케이블 상태에 맞는 재시도 횟수(max_rounds)를 정할 수 있습니다.
+시뮬레이션 포트는 배치도 프레임 단위로 보내므로, 마지막 표에서 가상 FT2232H(MPSSE) 위의
+프레임 단위 검증(쓰기/읽기마다 USB 왕복)과 배치 검증(라운드당 쓰기 배치 + 읽기 배치)을 비교합니다.
+MPSSE 표의 고장은 디바이스 MISO 비트 반전(프로파일의 bit_flip_rate)만 주입합니다.
+
+사용법:
+    python Test_Script/fault_verify_benchmark.py [max_rounds, 기본 3] [USB 왕복 지연(ms), 기본 1.0]
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+from pyftdi.spi import SpiController
+
+from ftdi_virtual import VirtualFtdiBackend, VirtualFtdiDevice, SpiTarget
+from register_transfer import write_frame, read_frame, write_and_verify, VerifyResult, TransportError
+from sim_device import SimulatedRegisterDevice, SimulatedSpiPort, UsbLatencyModel, REGISTER_COUNT
+from sim_faults import FaultInjectingPort, FaultProfile, PROFILES
+
+
+def pattern(addr):
+    return (0x5A000000 | (addr << 16) | (addr * 0x0303)) & 0xFFFFFFFF
+
+
+def make_port(profile, usb, seed):
+    device = SimulatedRegisterDevice()
+    port = FaultInjectingPort(SimulatedSpiPort(device, frequency=1_000_000, usb=usb), profile, seed=seed)
+    return device, port
+
+
+def run_unverified(profile, usb, values, seed):
+    device, port = make_port(profile, usb, seed)
+    for addr, value in values.items():
+        try:
+            write_frame(port, "SPI", addr, value)
+        except TransportError:
+            pass
+    wrong = sum(device.read_register(addr) != value for addr, value in values.items())
+    return len(values) - wrong, wrong, port.stats.elapsed
+
+
+def run_verified(profile, usb, values, max_rounds, seed):
+    device, port = make_port(profile, usb, seed)
+    result = write_and_verify(port, values, "SPI", max_rounds=max_rounds)
+    # 검증 읽기가 비트 반전으로 통과하는 경우까지 디바이스 상태로 최종 확인
+    silent = sum(device.read_register(addr) != value for addr, value in result.verified.items())
+    return result, silent, port.stats.elapsed
+
+
+class NoisyMisoDevice(SimulatedRegisterDevice):
+    """MISO 바이트의 비트를 확률적으로 반전하는 디바이스 (케이블 잡음 흉내)"""
+
+    def __init__(self, bit_flip_rate, seed):
+        super().__init__()
+        self.bit_flip_rate = bit_flip_rate
+        self.random = random.Random(seed)
+
+    def spi_clock_byte(self, mosi):
+        miso = super().spi_clock_byte(mosi)
+        if self.bit_flip_rate and self.random.random() < self.bit_flip_rate * 8:
+            miso ^= 1 << self.random.randrange(8)
+        return miso
+
+
+def open_mpsse(profile, usb, seed):
+    device = NoisyMisoDevice(profile.bit_flip_rate, seed)
+    backend = VirtualFtdiBackend()
+    virtual = backend.add_device(VirtualFtdiDevice(targets={1: SpiTarget(device)}, usb_timing=usb))
+    controller = SpiController()
+    controller.configure(backend.find(), interface=1)
+    port = controller.get_port(cs=0, freq=1_000_000, mode=0)
+    port.exchange(b"\x00", duplex=True)
+    virtual.reset_stats()
+    return controller, port, virtual, device
+
+
+def verify_per_frame(port, values, max_rounds):
+    """배치 이전 방식: 주소마다 write_frame, 이어서 주소마다 read_frame"""
+    result = VerifyResult()
+    pending = dict(values)
+    while pending and result.rounds < max_rounds:
+        result.rounds += 1
+        for addr, value in pending.items():
+            write_frame(port, "SPI", addr, value)
+            result.writes += 1
+        failed = {}
+        for addr, value in pending.items():
+            read_back = read_frame(port, "SPI", addr)
+            result.reads += 1
+            if read_back == value:
+                result.verified[addr] = value
+            else:
+                failed[addr] = read_back
+        result.failed = failed
+        pending = {addr: values[addr] for addr in failed}
+    return result
+
+
+def run_mpsse(profile, usb, values, max_rounds, seed, verify):
+    controller, port, virtual, device = open_mpsse(profile, usb, seed)
+    result = verify(port, values, max_rounds)
+    stats = virtual.stats()
+    controller.close()
+    silent = sum(device.read_register(addr) != value for addr, value in result.verified.items())
+    return result, silent, stats["elapsed_s"], stats["bulk_writes"] + stats["bulk_reads"]
+
+
+def main():
+    max_rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    round_trip_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    usb = UsbLatencyModel(round_trip_s=round_trip_ms / 1000.0)
+    values = {addr: pattern(addr) for addr in range(REGISTER_COUNT)}
+
+    print("=" * 96)
+    print(f"고장 프로파일별 쓰기 처리량 (SPI 1MHz, USB 왕복 {round_trip_ms:.2f}ms, "
+          f"레지스터 {REGISTER_COUNT}개, max_rounds={max_rounds})")
+    print("=" * 96)
+    print(f"{'프로파일':<13}{'검증없음 good/s':>16}{'조용한 오류':>10} │"
+          f"{'배치검증 good/s':>16}{'라운드':>7}{'재전송':>7}{'통신오류':>8}{'미해결':>7}{'오검증':>7}")
+    for seed, name in enumerate(PROFILES):
+        profile = FaultProfile.named(name)
+        good, wrong, elapsed = run_unverified(profile, usb, values, seed)
+        result, silent, verified_elapsed = run_verified(profile, usb, values, max_rounds, seed)
+        resent = result.writes - len(values)
+        good_verified = len(result.verified) - silent
+        print(f"{name:<13}{good / elapsed:>16.0f}{wrong:>10} │"
+              f"{good_verified / verified_elapsed:>16.0f}{result.rounds:>7}{resent:>7}"
+              f"{result.errors:>8}{len(result.failed):>7}{silent:>7}")
+
+    print()
+    print("MPSSE (가상 FT2232H): 프레임 단위 검증 vs 배치 검증 (write_and_verify)")
+    print(f"{'프로파일':<13}{'프레임 good/s':>14}{'USB 전송':>9}{'라운드':>7} │"
+          f"{'배치 good/s':>14}{'USB 전송':>9}{'라운드':>7}{'미해결':>7}{'오검증':>7}")
+    for seed, name in enumerate(PROFILES):
+        profile = FaultProfile.named(name)
+        rows = []
+        for verify in (verify_per_frame,
+                       lambda port, values, rounds: write_and_verify(port, values, "SPI", max_rounds=rounds)):
+            rows.append(run_mpsse(profile, usb, values, max_rounds, seed, verify))
+        (single, _, single_elapsed, single_usb), (batched, silent, batched_elapsed, batched_usb) = rows
+        print(f"{name:<13}{len(single.verified) / single_elapsed:>14.0f}{single_usb:>9}{single.rounds:>7} │"
+              f"{(len(batched.verified) - silent) / batched_elapsed:>14.0f}{batched_usb:>9}{batched.rounds:>7}"
+              f"{len(batched.failed):>7}{silent:>7}")
+
+
+if __name__ == "__main__":
+    main()
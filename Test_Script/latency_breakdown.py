@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Write All 전송 시간 분해 (가상 FT2232H, 하드웨어 불필요)
+
+128개 레지스터 쓰기를 두 방식으로 보내며 register_latency.LatencyRecorder 로 단계별 시간
+(encode / submit / usb / decode)과 프레임당 p50/p95/p99, register_usb_meter 의 USB 효율
+(전송당 payload, 패킷 채움, MPSSE 명령 오버헤드)을 출력합니다.
+    single  : write_frame() 을 레지스터마다 호출 (GUI Write All 방식)
+    batched : transfer_batch() 한 번 (mpsse_batch.SpiFrameBatch)
+시간은 호스트 실측입니다. 가상 USB 지연은 가상 시계에만 더해지므로 usb 단계는 pyftdi 의 Python 경로
+(명령 생성, pyusb 호출) 비용이고, 실제 장치에서는 여기에 USB 왕복이 더해집니다.
+마지막으로 집계를 켜지 않았을 때와 켰을 때의 Write All 시간을 비교해 계측 비용을 보여 줍니다.
+
+사용법:
+    python Test_Script/latency_breakdown.py [USB 왕복 지연(ms), 기본 1.0] [반복 횟수, 기본 5] [--prom 파일]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+from pyftdi.spi import SpiController
+
+from ftdi_virtual import VirtualFtdiBackend, VirtualFtdiDevice, SpiTarget
+from register_latency import LatencyRecorder
+from register_transfer import write_frame, transfer_batch
+from register_usb_meter import UsbEfficiencyMeter
+from sim_device import SimulatedRegisterDevice, UsbLatencyModel, REGISTER_COUNT
+
+SPI_FREQUENCY = 10_000_000
+
+
+def open_spi(round_trip_s):
+    backend = VirtualFtdiBackend()
+    backend.add_device(VirtualFtdiDevice(targets={1: SpiTarget(SimulatedRegisterDevice())},
+                                         usb_timing=UsbLatencyModel(round_trip_s)))
+    controller = SpiController()
+    controller.configure(backend.find(), interface=1)
+    return controller, controller.get_port(cs=0, freq=SPI_FREQUENCY, mode=0)
+
+
+def write_all_single(port):
+    for addr in range(REGISTER_COUNT):
+        write_frame(port, "SPI", addr, addr * 0x01010101)
+
+
+def write_all_batched(port):
+    transfer_batch(port, "SPI", [("W", addr, addr * 0x01010101) for addr in range(REGISTER_COUNT)])
+
+
+def host_time(run, port, repeats):
+    """repeats 회 중 가장 짧은 시간 (GC / 스케줄러 잡음 제외)"""
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run(port)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    prom = sys.argv[sys.argv.index("--prom") + 1] if "--prom" in sys.argv else None
+    if prom in args:
+        args.remove(prom)
+    round_trip_ms = float(args[0]) if args else 1.0
+    repeats = int(args[1]) if len(args) > 1 else 5
+
+    controller, port = open_spi(round_trip_ms / 1000.0)
+    print("=" * 84)
+    print(f"Write All 전송 시간 분해 (가상 FT2232H, SPI {SPI_FREQUENCY // 1_000_000}MHz, "
+          f"USB 왕복 {round_trip_ms:.2f}ms, {REGISTER_COUNT}개 x {repeats}회)")
+    print("=" * 84)
+    for label, run in (("single", write_all_single), ("batched", write_all_batched)):
+        meter = UsbEfficiencyMeter().attach(port)
+        with LatencyRecorder() as recorder:
+            for _ in range(repeats):
+                run(port)
+        meter.detach()
+        print(f"\n[{label}] {recorder.status_text()}")
+        for line in meter.report_lines():
+            print(f"  {line}")
+        print(f"{'범위':<12}{'단계':<8}{'개수':>8}{'평균 (ms)':>12}{'p50':>10}{'p95':>10}{'p99':>10}")
+        for row in recorder.rows():
+            print(f"{row['scope']:<12}{row['phase']:<8}{row['count']:>8}{row['mean_ms']:>12.4f}"
+                  f"{row['p50_ms']:>10.4f}{row['p95_ms']:>10.4f}{row['p99_ms']:>10.4f}")
+        if prom:
+            recorder.save_prometheus(f"{os.path.splitext(prom)[0]}_{label}.prom")
+
+    # 계측 비용 (호스트 실측, 가상 USB 는 호스트 시간을 쓰지 않으므로 Python 경로 비용만 남음)
+    print(f"\n{'방식':<10}{'집계 끔 (ms)':>16}{'집계 켬 (ms)':>16}{'차이':>10}")
+    for label, run in (("single", write_all_single), ("batched", write_all_batched)):
+        off = host_time(run, port, repeats * 4)
+        with LatencyRecorder():
+            on = host_time(run, port, repeats * 4)
+        print(f"{label:<10}{off * 1000:>16.3f}{on * 1000:>16.3f}{(on / off - 1) * 100:>9.1f}%")
+    controller.close()
+
+
+if __name__ == "__main__":
+    main()
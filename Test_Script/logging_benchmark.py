@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+로깅 레벨별 Excel 로드 시간 / 트리 클릭 지연 벤치마크
+
+DEBUG 레벨(모든 메시지 포맷팅 = 기존 print() 방식과 동일한 비용)과
+WARNING 레벨(기본값, 비활성 레벨은 포맷팅 없음)을 비교합니다.
+출력은 os.devnull 로 보내므로 터미널 출력 비용은 측정에 포함되지 않습니다.
+
+사용법:
+    python Test_Script/logging_benchmark.py [Excel 파일] [반복 횟수]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import logging
+
+from PySide6.QtWidgets import QApplication
+
+from register_logging import LOGGER_ROOT, configure_logging
+import Register_Controller
+
+
+def collect_tree_items(tree_widget):
+    """트리의 모든 레지스터/필드 아이템을 리스트로 수집"""
+    items = []
+    root = tree_widget.invisibleRootItem()
+    for i in range(root.childCount()):
+        sheet_item = root.child(i)
+        for j in range(sheet_item.childCount()):
+            reg_item = sheet_item.child(j)
+            items.append(reg_item)
+            for k in range(reg_item.childCount()):
+                items.append(reg_item.child(k))
+    return items
+
+
+def run_level(window, excel_path, level, repeat):
+    """지정된 로그 레벨로 로드/클릭 시간 측정 (결과: 평균 ms)"""
+    root = logging.getLogger(LOGGER_ROOT)
+    root.setLevel(level)
+
+    load_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        window.load_excel_file(excel_path)
+        load_times.append(time.perf_counter() - start)
+
+    items = collect_tree_items(window.ui.tree_widget)
+    click_times = []
+    for _ in range(repeat):
+        for item in items:
+            start = time.perf_counter()
+            window.on_item_clicked(item, 0)
+            click_times.append(time.perf_counter() - start)
+
+    return (sum(load_times) / len(load_times) * 1000.0,
+            sum(click_times) / max(1, len(click_times)) * 1000.0)
+
+
+def main():
+    repo_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+    excel_src = sys.argv[1] if len(sys.argv) > 1 else os.path.join(repo_dir, "Sample.xlsx")
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    # load_excel 이 옆에 _tree.json 을 쓰므로 임시 디렉터리 사본 사용
+    work_dir = tempfile.mkdtemp(prefix="reg_log_bench_")
+    excel_path = os.path.join(work_dir, os.path.basename(excel_src))
+    shutil.copy(excel_src, excel_path)
+
+    with open(os.devnull, "w", encoding="utf-8") as null_stream:
+        configure_logging("WARNING", stream=null_stream)
+        app = QApplication(sys.argv[:1])
+        window = Register_Controller.RegisterTreeViewerController(excel_path)
+
+        print("=" * 60)
+        print(f"로깅 벤치마크: {os.path.basename(excel_src)} (반복 {repeat}회)")
+        print("=" * 60)
+
+        results = {}
+        for name, level in (("DEBUG (print 방식)", logging.DEBUG), ("WARNING (기본값)", logging.WARNING)):
+            run_level(window, excel_path, level, 1)  # 워밍업
+            results[name] = run_level(window, excel_path, level, repeat)
+            load_ms, click_ms = results[name]
+            print(f"{name:<20} 로드: {load_ms:8.2f} ms   클릭: {click_ms:8.3f} ms")
+
+        (debug_load, debug_click), (warn_load, warn_click) = results.values()
+        print("-" * 60)
+        print(f"로드 시간 개선: {debug_load / warn_load:5.2f}x   클릭 지연 개선: {debug_click / warn_click:5.2f}x")
+
+        window.close()
+        del app
+
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
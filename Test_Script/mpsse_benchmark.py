@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+MPSSE 종단 간 처리량 측정 (가상 FT2232H, 하드웨어 불필요)
+
+ftdi_virtual 의 가상 USB 백엔드 위에서 실제 pyftdi SpiController / I2cController 를 실행해
+USB 명령 생성 → MPSSE 해석 → 레지스터 디바이스까지 전체 경로를 측정합니다.
+    single    : SpiPort.exchange() 를 프레임마다 호출 (현재 GUI 방식)
+    batched   : mpsse_batch.SpiFrameBatch 로 N 프레임을 USB 쓰기/읽기 한 번에 전송
+    pipelined : 배치 k+1 을 먼저 보낸 뒤 배치 k 의 응답을 수신
+프레임 크기(3 / 5 / 16 / 64 바이트)마다 호스트 실측 프레임/초, 가상 시계 기준 프레임/초,
+USB 전송당 바이트(OUT/IN), 호출당 지연(중앙값 / p95, 가상 시간)과 register_usb_meter 의 USB 효율
+(payload / USB 바이트, 패킷 채움, 프레임당 MPSSE 명령 오버헤드)을 출력합니다.
+5바이트(레지스터) 프레임은 쓰기 후 다시 읽어 값까지 검증합니다.
+
+사용법:
+    python Test_Script/mpsse_benchmark.py [USB 왕복 지연(ms), 기본 1.0] [배치 프레임 수, 기본 32]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+from pyftdi.i2c import I2cController
+from pyftdi.spi import SpiController
+
+from ftdi_virtual import VirtualFtdiBackend, VirtualFtdiDevice, SpiTarget, I2cTarget
+from mpsse_batch import SpiFrameBatch
+from register_usb_meter import UsbEfficiencyMeter
+from register_protocol import (
+    spi_write_frame, spi_read_frame, decode_spi_read, i2c_write_frame, decode_i2c_read,
+    I2C_DEFAULT_ADDRESS,
+)
+from sim_device import SimulatedRegisterDevice, UsbLatencyModel, REGISTER_COUNT
+
+FRAME_SIZES = (3, 5, 16, 64)
+FRAMES_PER_RUN = 512
+SPI_FREQUENCY = 10_000_000
+I2C_FREQUENCY = 400_000
+
+
+def pattern(addr):
+    return (0xC3000000 | (addr << 16) | (addr * 0x0505)) & 0xFFFFFFFF
+
+
+def make_frames(size, count):
+    """size 바이트 프레임 count 개 (5바이트는 레지스터 쓰기 + 읽기 프레임)"""
+    if size == 5:
+        writes = [spi_write_frame(addr % REGISTER_COUNT, pattern(addr % REGISTER_COUNT))
+                  for addr in range(count // 2)]
+        reads = [spi_read_frame(addr % REGISTER_COUNT) for addr in range(count - count // 2)]
+        return writes + reads
+    return [bytes((i + j) & 0xFF for j in range(size)) for i in range(count)]
+
+
+def count_errors(frames, responses):
+    """5바이트 프레임의 읽기 응답을 기대값과 비교"""
+    errors = 0
+    for out, response in zip(frames, responses):
+        if out[0] & 0x80:
+            addr = out[0] & 0x7F
+            errors += decode_spi_read(response) != pattern(addr)
+    return errors
+
+
+def open_spi(usb):
+    device = SimulatedRegisterDevice()
+    backend = VirtualFtdiBackend()
+    virtual = backend.add_device(VirtualFtdiDevice(targets={1: SpiTarget(device)}, usb_timing=usb))
+    controller = SpiController()
+    controller.configure(backend.find(), interface=1)
+    port = controller.get_port(cs=0, freq=SPI_FREQUENCY, mode=0)
+    # 설정 단계의 제어 전송/명령은 측정에서 제외
+    port.exchange(b"\x00", duplex=True)
+    virtual.reset_stats()
+    return controller, port, virtual
+
+
+def run_single(port, virtual, frames):
+    responses, latencies = [], []
+    for out in frames:
+        started = virtual.clock.now()
+        responses.append(port.exchange(out, duplex=True))
+        latencies.append(virtual.clock.now() - started)
+    return responses, latencies
+
+
+def run_batched(port, virtual, frames, batch_size):
+    batch = SpiFrameBatch(port)
+    responses, latencies = [], []
+    for start in range(0, len(frames), batch_size):
+        started = virtual.clock.now()
+        for out in frames[start:start + batch_size]:
+            batch.add(out)
+        responses.extend(batch.exchange())
+        latencies.append(virtual.clock.now() - started)
+    return responses, latencies
+
+
+def run_pipelined(port, virtual, frames, batch_size):
+    batch = SpiFrameBatch(port)
+    responses, latencies, started = [], [], []
+    for start in range(0, len(frames), batch_size):
+        for out in frames[start:start + batch_size]:
+            batch.add(out)
+        started.append(virtual.clock.now())
+        batch.submit()
+        # 다음 배치를 보낸 뒤에 이전 배치 응답 수신 (FTDI 안에 최대 2배치)
+        while batch.pending > 1:
+            responses.extend(batch.collect())
+            latencies.append(virtual.clock.now() - started.pop(0))
+    while batch.pending:
+        responses.extend(batch.collect())
+        latencies.append(virtual.clock.now() - started.pop(0))
+    return responses, latencies
+
+
+def run_i2c_single(usb, count):
+    """I2C 는 I2cController 의 포트 API 로 프레임마다 전송 (배치 미지원)"""
+    device = SimulatedRegisterDevice()
+    backend = VirtualFtdiBackend()
+    virtual = backend.add_device(VirtualFtdiDevice(
+        targets={1: I2cTarget(device, I2C_DEFAULT_ADDRESS)}, usb_timing=usb))
+    controller = I2cController()
+    controller.configure(backend.find(), interface=1, frequency=I2C_FREQUENCY)
+    port = controller.get_port(I2C_DEFAULT_ADDRESS)
+    virtual.reset_stats()
+    meter = UsbEfficiencyMeter().attach(port)
+    latencies, errors = [], 0
+    wall = time.perf_counter()
+    for addr in range(count // 2):
+        started = virtual.clock.now()
+        port.write(i2c_write_frame(addr % REGISTER_COUNT, pattern(addr % REGISTER_COUNT)))
+        latencies.append(virtual.clock.now() - started)
+    for addr in range(count - count // 2):
+        started = virtual.clock.now()
+        value = decode_i2c_read(port.exchange([addr % REGISTER_COUNT], 4))
+        latencies.append(virtual.clock.now() - started)
+        errors += value != pattern(addr % REGISTER_COUNT)
+    wall = time.perf_counter() - wall
+    # 쓰기: 주소 + 데이터 5바이트, 읽기: 주소 1바이트 보내고 데이터 4바이트 받음
+    meter.detach().record_payload(count, (count // 2) * 5 + (count - count // 2), (count - count // 2) * 4)
+    controller.close()
+    return wall, virtual, latencies, errors, meter
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def print_row(label, size, frames, wall, virtual, latencies, errors, meter):
+    stats = virtual.stats()
+    elapsed = stats["elapsed_s"]
+    out_per = stats["bytes_out"] / stats["bulk_writes"] if stats["bulk_writes"] else 0
+    in_per = stats["bytes_in"] / stats["bulk_reads"] if stats["bulk_reads"] else 0
+    error_text = str(errors) if errors is not None else "-"
+    print(f"{label:<11}{size:>5}{frames / wall:>12.0f}{frames / elapsed if elapsed else 0:>12.0f}"
+          f"{stats['bulk_writes'] + stats['bulk_reads']:>9}{out_per:>9.1f}{in_per:>9.1f}"
+          f"{statistics.median(latencies) * 1000:>10.3f}{percentile(latencies, 0.95) * 1000:>9.3f}"
+          f"{error_text:>7}{efficiency_columns(meter)}")
+
+
+def efficiency_columns(meter):
+    summary = meter.summary()
+    if not summary["usb_transfers"]:
+        return ""
+    return (f"{summary['efficiency'] * 100:>7.1f}{summary['packet_fill'] * 100:>7.0f}"
+            f"{summary['command_overhead_per_frame']:>9.1f}")
+
+
+def main():
+    round_trip_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    usb = UsbLatencyModel(round_trip_s=round_trip_ms / 1000.0)
+
+    print("=" * 115)
+    print(f"MPSSE 종단 간 처리량 (가상 FT2232H, SPI {SPI_FREQUENCY // 1_000_000}MHz, "
+          f"USB 왕복 {round_trip_ms:.2f}ms, 배치 {batch_size}프레임, {FRAMES_PER_RUN}프레임/회)")
+    print("=" * 115)
+    print(f"{'방식':<11}{'크기':>5}{'호스트 f/s':>12}{'모델 f/s':>12}{'USB 전송':>9}"
+          f"{'OUT B/회':>9}{'IN B/회':>9}{'지연 중앙':>10}{'p95':>9}{'오류':>7}{'효율':>7}{'패킷':>7}{'명령 B/f':>9}")
+    print(f"{'':<11}{'(B)':>5}{'':>12}{'':>12}{'':>9}{'':>9}{'':>9}{'(ms)':>10}{'(ms)':>9}{'':>7}{'(%)':>7}{'(%)':>7}")
+
+    modes = [
+        ("single", lambda port, virtual, frames: run_single(port, virtual, frames)),
+        ("batched", lambda port, virtual, frames: run_batched(port, virtual, frames, batch_size)),
+        ("pipelined", lambda port, virtual, frames: run_pipelined(port, virtual, frames, batch_size)),
+    ]
+    for size in FRAME_SIZES:
+        frames = make_frames(size, FRAMES_PER_RUN)
+        for label, run in modes:
+            controller, port, virtual = open_spi(usb)
+            meter = UsbEfficiencyMeter().attach(port)
+            wall = time.perf_counter()
+            responses, latencies = run(port, virtual, frames)
+            wall = time.perf_counter() - wall
+            # 전이중 교환이므로 보낸 바이트와 받은 바이트가 모두 버스 데이터
+            meter.detach().record_payload(len(frames), sum(map(len, frames)), sum(map(len, responses)))
+            errors = count_errors(frames, responses) if size == 5 else None
+            if len(responses) != len(frames):
+                errors = (errors or 0) + abs(len(frames) - len(responses))
+            print_row(label, size, len(frames), wall, virtual, latencies, errors, meter)
+            controller.close()
+        print("-" * 115)
+
+    wall, virtual, latencies, errors, meter = run_i2c_single(usb, FRAMES_PER_RUN // 4)
+    print(f"I2C {I2C_FREQUENCY // 1000}kHz (I2cController, 프레임마다 전송)")
+    print_row("single", 5, FRAMES_PER_RUN // 4, wall, virtual, latencies, errors, meter)
+
+
+if __name__ == "__main__":
+    main()
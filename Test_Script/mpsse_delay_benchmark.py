@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+배치 안의 하드웨어 지연 측정 (가상 FT2232H, 하드웨어 불필요)
+
+안정화 대기가 들어간 전원 인가 시퀀스(리셋 → 100us → 바이어스 → 2ms → 클럭 → 500us → 인에이블 → 상태 읽기)를
+두 방식으로 실행하고, 가상 MPSSE 엔진의 핀 기록(CS 활성 시각)으로 쓰기 프레임 사이의 실제 간격을 비교합니다.
+    host     : 대기마다 배치를 끊고 호스트 time.sleep (실제로 잠든 시간을 가상 시계에 더함)
+    hardware : transfer_batch 에 ("D", 초) 를 넣어 MPSSE 빈 클럭으로 대기 (USB 전송 한 번)
+host 의 간격은 sleep 해상도/스케줄러 지연과 USB 왕복이 더해져 요청보다 길고 흔들리며,
+hardware 의 간격은 요청 값 + 프레임 명령 실행 시간(수 us)으로 고정됩니다.
+
+사용법:
+    python Test_Script/mpsse_delay_benchmark.py [USB 왕복 지연(ms), 기본 1.0] [반복 횟수, 기본 10]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+from pyftdi.spi import SpiController
+
+from ftdi_virtual import VirtualFtdiBackend, VirtualFtdiDevice, SpiTarget
+from register_transfer import transfer_batch
+from sim_device import SimulatedRegisterDevice, UsbLatencyModel
+
+SPI_FREQUENCY = 10_000_000
+CS_BIT = 0x08
+STATUS_ADDR = 0x03
+# (주소, 값, 쓰기 뒤 대기 초)
+POWER_UP = (
+    (0x00, 0x1, 100e-6),
+    (0x01, 0x8000, 2e-3),
+    (0x02, 0x00C0FFEE, 500e-6),
+    (STATUS_ADDR, 0x3, 0.0),
+)
+
+
+def open_spi(usb):
+    device = SimulatedRegisterDevice()
+    backend = VirtualFtdiBackend()
+    virtual = backend.add_device(VirtualFtdiDevice(targets={1: SpiTarget(device)}, usb_timing=usb))
+    controller = SpiController()
+    controller.configure(backend.find(), interface=1)
+    port = controller.get_port(cs=0, freq=SPI_FREQUENCY, mode=0)
+    port.exchange(b"\x00", duplex=True)
+    virtual.reset_stats()
+    virtual.engines[1].pin_log = []
+    return controller, port, virtual
+
+
+def run_host(port, virtual):
+    """쓰기마다 전송 후 호스트 sleep (sleep 한 실제 시간만큼 가상 시계 진행)"""
+    for addr, value, settle in POWER_UP:
+        transfer_batch(port, "SPI", [("W", addr, value)])
+        if settle:
+            started = time.perf_counter()
+            time.sleep(settle)
+            virtual.clock.advance(time.perf_counter() - started)
+    return transfer_batch(port, "SPI", [("R", STATUS_ADDR)])[0]
+
+
+def run_hardware(port, virtual):
+    ops = []
+    for addr, value, settle in POWER_UP:
+        ops.append(("W", addr, value))
+        if settle:
+            ops.append(("D", settle))
+    ops.append(("R", STATUS_ADDR))
+    return transfer_batch(port, "SPI", ops)[-1]
+
+
+def frame_starts(pin_log):
+    """CS 가 활성(0)으로 바뀐 시각 목록"""
+    starts, previous = [], None
+    for timestamp, value, _ in pin_log:
+        if previous is not None and previous & CS_BIT and not value & CS_BIT:
+            starts.append(timestamp)
+        previous = value
+    return starts
+
+
+def main():
+    round_trip_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    settles = [settle for _, _, settle in POWER_UP if settle]
+
+    print("=" * 88)
+    print(f"배치 안의 하드웨어 지연 (가상 FT2232H, SPI {SPI_FREQUENCY // 1_000_000}MHz, "
+          f"USB 왕복 {round_trip_ms:.2f}ms, {repeats}회)")
+    print("=" * 88)
+    header = "".join(f"{f'{settle * 1e6:.0f}us 대기 (us)':>22}" for settle in settles)
+    print(f"{'방식':<10}{'USB 전송':>10}{header}{'전체 (ms)':>12}{'오류':>6}")
+    ranges = f"{'최소 ~ 최대':>22}" * len(settles)
+    print(f"{'':<10}{'(회/시퀀스)':>10}{ranges}{'중앙':>12}{'':>6}")
+    for label, run in (("host", run_host), ("hardware", run_hardware)):
+        gaps = [[] for _ in settles]
+        totals, transfers, errors = [], 0, 0
+        for _ in range(repeats):
+            controller, port, virtual = open_spi(UsbLatencyModel(round_trip_ms / 1000.0))
+            started = virtual.clock.now()
+            status = run(port, virtual)
+            totals.append((virtual.clock.now() - started) * 1000)
+            stats = virtual.stats()
+            transfers += stats["bulk_writes"] + stats["bulk_reads"]
+            starts = frame_starts(virtual.engines[1].pin_log)
+            for index in range(len(settles)):
+                gaps[index].append((starts[index + 1] - starts[index]) * 1e6)
+            errors += status != POWER_UP[-1][1]
+            controller.close()
+        totals.sort()
+        columns = "".join(f"{f'{min(gap):.1f} ~ {max(gap):.1f}':>22}" for gap in gaps)
+        print(f"{label:<10}{transfers / repeats:>10.1f}{columns}{totals[len(totals) // 2]:>12.3f}{errors:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+샘플링 프로파일러 비용과 멈춤 감지 확인 (시뮬레이션 디바이스, 하드웨어 불필요)
+
+1) 전송 워커 스레드가 write_frame / read_frame 을 반복하는 동안 메인 스레드에서도 같은 작업을 돌리며,
+   프로파일러 끔 / 100Hz / 1000Hz 의 처리량(프레임/초)과 실제 샘플링 속도, 마감을 놓쳐 건너뛴 샘플 수를 비교합니다.
+   두 스레드가 GIL 을 다투므로 실제 샘플링 속도는 설정보다 낮게 나옵니다.
+2) 메인 스레드가 heartbeat 를 보내다가 일부러 막혔을 때 멈춤 기록(길이, 샘플 수, 막고 있던 함수)을 출력합니다.
+
+사용법:
+    python Test_Script/profiler_overhead.py [측정 시간(초), 기본 1.0] [collapsed 스택 저장 파일]
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+from register_profiler import SamplingProfiler, HEARTBEAT_INTERVAL_S
+from register_transfer import write_frame, read_frame
+from sim_device import SimulatedRegisterDevice, SimulatedSpiPort, REGISTER_COUNT
+
+
+def transfer_loop(port, stop, counter):
+    frames = 0
+    while not stop.is_set():
+        addr = frames % REGISTER_COUNT
+        write_frame(port, "SPI", addr, frames)
+        read_frame(port, "SPI", addr)
+        frames += 2
+    counter.append(frames)
+
+
+def measure(duration_s, interval_s):
+    """(메인 스레드 프레임/초, 워커 프레임/초, 초당 샘플 수, 놓친 샘플 수)"""
+    stop, counter = threading.Event(), []
+    worker = threading.Thread(target=transfer_loop, name="transport-worker",
+                              args=(SimulatedSpiPort(SimulatedRegisterDevice()), stop, counter))
+    profiler = SamplingProfiler(interval_s=interval_s) if interval_s else None
+    if profiler:
+        profiler.start()
+    worker.start()
+    main_counter = []
+    timer = threading.Timer(duration_s, stop.set)
+    timer.start()
+    transfer_loop(SimulatedSpiPort(SimulatedRegisterDevice()), stop, main_counter)
+    worker.join()
+    summary = profiler.stop().summary() if profiler else {"rate_hz": 0.0, "missed": 0}
+    return main_counter[0] / duration_s, counter[0] / duration_s, summary["rate_hz"], summary["missed"]
+
+
+def busy_redraw(seconds):
+    """GUI 스레드를 막는 작업 흉내 (순수 Python 루프)"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(1000))
+
+
+def main():
+    duration_s = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    output = sys.argv[2] if len(sys.argv) > 2 else None
+
+    print("=" * 72)
+    print(f"샘플링 프로파일러 비용 (시뮬레이션 SPI, 메인 + 워커 스레드, {duration_s:.1f}초)")
+    print("=" * 72)
+    print(f"{'설정':<12}{'메인 (f/s)':>14}{'워커 (f/s)':>14}{'합계 대비':>12}{'샘플 (Hz)':>12}{'놓침':>8}")
+    baseline = None
+    for label, interval_s in (("끔", None), ("100Hz", 0.01), ("1000Hz", 0.001)):
+        main_rate, worker_rate, sample_rate, missed = measure(duration_s, interval_s)
+        total = main_rate + worker_rate
+        baseline = baseline or total
+        print(f"{label:<12}{main_rate:>14,.0f}{worker_rate:>14,.0f}{total / baseline * 100:>11.1f}%{sample_rate:>12.1f}{missed:>8,}")
+
+    print("\n멈춤 감지 (heartbeat 50ms 간격, 300ms 동안 메인 스레드 막힘)")
+    with SamplingProfiler() as profiler:
+        for _ in range(5):
+            profiler.heartbeat()
+            time.sleep(HEARTBEAT_INTERVAL_S)
+        busy_redraw(0.3)
+        stall = profiler.heartbeat()
+    if stall:
+        print(f"   {stall['duration_s'] * 1000:.0f}ms 멈춤, 샘플 {stall['samples']}개, 막고 있던 함수: {stall['top']}")
+    else:
+        print("   ❌ 멈춤이 감지되지 않음")
+    if output:
+        profiler.save(output)
+        print(f"   collapsed 스택 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
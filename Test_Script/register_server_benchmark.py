@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+네트워크 레지스터 서버 동시 접속 처리량 측정 (가상 FT2232H, 하드웨어 불필요)
+
+register_server.RegisterServer 가 ftdi_virtual 의 가상 FT2232H(실제 pyftdi SpiController,
+USB 왕복 지연을 실제로 대기하는 시계)를 소유하고, 여러 클라이언트 스레드가 TCP 로 동시에
+쓰기 → 읽기 검증을 수행합니다. 한 클라이언트는 모든 주소를 구독해 변경 알림 수를 셉니다.
+    직접 (잠금)  : 클라이언트들이 잠금으로 포트를 번갈아 사용하며 요청마다 전송
+    서버 (병합)  : 서버 버스 스레드가 쌓인 요청을 한 번의 USB 쓰기/읽기로 합쳐 전송
+클라이언트 연산/초, USB 전송 수, 전송당 합쳐진 요청 수, 검증 오류, 알림 수를 출력합니다.
+
+사용법:
+    python Test_Script/register_server_benchmark.py [클라이언트 수, 기본 8] [클라이언트당 연산 수, 기본 100]
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+from pyftdi.spi import SpiController
+
+from ftdi_virtual import VirtualFtdiBackend, VirtualFtdiDevice, SpiTarget
+from register_server import RegisterServer, RegisterClient
+from register_transfer import transfer_batch
+from sim_device import SimulatedRegisterDevice, SimClock, UsbLatencyModel
+
+ROUND_TRIP_S = 0.001
+
+
+def pattern(client, index):
+    return (client << 24) | (index * 0x010101) & 0xFFFFFF
+
+
+def open_virtual_spi():
+    device = SimulatedRegisterDevice()
+    backend = VirtualFtdiBackend()
+    virtual = backend.add_device(VirtualFtdiDevice(
+        targets={1: SpiTarget(device)}, usb_timing=UsbLatencyModel(round_trip_s=ROUND_TRIP_S),
+        clock=SimClock(realtime=True)))
+    controller = SpiController()
+    controller.configure(backend.find(), interface=1)
+    port = controller.get_port(cs=0, freq=10_000_000, mode=0)
+    virtual.reset_stats()
+    return controller, port, virtual
+
+
+def client_work(client_id, count, transfer, errors):
+    """클라이언트마다 전용 주소 하나에 쓰고 바로 읽어 확인"""
+    addr = client_id
+    for index in range(count):
+        value = pattern(client_id, index)
+        transfer([("W", addr, value)])
+        if transfer([("R", addr)])[0] != value:
+            errors.append((client_id, index))
+
+
+def run_clients(clients, count, make_transfer):
+    errors = []
+    threads = [threading.Thread(target=client_work, args=(client_id, count, make_transfer(client_id), errors))
+               for client_id in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started, errors
+
+
+def run_direct(clients, count):
+    controller, port, virtual = open_virtual_spi()
+    lock = threading.Lock()
+
+    def make_transfer(client_id):
+        def transfer(ops):
+            with lock:
+                return transfer_batch(port, "SPI", ops)
+        return transfer
+
+    elapsed, errors = run_clients(clients, count, make_transfer)
+    controller.close()
+    return elapsed, errors, virtual.stats(), None, 0
+
+
+def run_server(clients, count):
+    controller, port, virtual = open_virtual_spi()
+    server = RegisterServer(port, "SPI")
+    address = server.listen("tcp://127.0.0.1:0")
+    notified = []
+    watcher = RegisterClient(address)
+    watcher.subscribe(lambda changes: notified.extend(changes))
+    connections = [RegisterClient(address) for _ in range(clients)]
+    elapsed, errors = run_clients(clients, count, lambda client_id: connections[client_id].transfer_ops)
+    time.sleep(0.05)  # 마지막 알림 수신 대기
+    for connection in connections + [watcher]:
+        connection.close()
+    server.shutdown()
+    controller.close()
+    return elapsed, errors, virtual.stats(), server.stats, len(notified)
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    operations = clients * count * 2
+
+    print("=" * 86)
+    print(f"레지스터 서버 동시 접속 (가상 FT2232H SPI 10MHz, USB 왕복 {ROUND_TRIP_S * 1000:.1f}ms 실시간, "
+          f"클라이언트 {clients}개 x {count}회 쓰기+읽기)")
+    print("=" * 86)
+    print(f"{'방식':<14}{'연산/초':>10}{'USB 전송':>10}{'전송당 요청':>12}{'최대 병합':>10}{'검증 오류':>10}{'알림':>8}")
+    for label, run in (("직접 (잠금)", run_direct), ("서버 (병합)", run_server)):
+        elapsed, errors, usb, server_stats, notifications = run(clients, count)
+        transfers = usb["bulk_writes"] + usb["bulk_reads"]
+        if server_stats is not None:
+            per_transfer = server_stats.requests / server_stats.batches if server_stats.batches else 0
+            max_merged = server_stats.max_merged
+        else:
+            per_transfer, max_merged = 1.0, 1
+        print(f"{label:<14}{operations / elapsed:>10.0f}{transfers:>10}{per_transfer:>12.2f}{max_merged:>10}"
+              f"{len(errors):>10}{notifications:>8}")
+
+
+if __name__ == "__main__":
+    main()
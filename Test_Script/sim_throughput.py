@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+시뮬레이션 디바이스 처리량 측정 (하드웨어 불필요)
+
+sim_device 의 SimulatedSpiPort / SimulatedI2cPort / SimulatedSerialPort 로
+128개 레지스터 쓰기 → 읽기 검증을 수행하고, 가상 시계(SimClock) 기준의
+프레임/초와 USB 왕복 횟수를 출력합니다. Arduino 펌웨어 에뮬레이터(3바이트 프레임,
+한 프레임 늦은 응답, Serial 로그 대기)에 대해서도 같은 검증을 수행합니다.
+에뮬레이터는 최대 속도(프레임 유실, 검증 실패)와 프레임마다 loop() 가 끝나기를 기다리는 간격 맞춤
+두 가지로 실행하며, 정상 프레임/초는 펌웨어가 실제로 처리한 프레임에서 검증 오류를 뺀 값입니다.
+USB 지연과 버스 주파수를 바꿔 가며 배치/파이프라이닝 같은 처리량 개선 효과를
+Linux CI 에서 비교할 때 기준값으로 사용합니다.
+
+사용법:
+    python Test_Script/sim_throughput.py [USB 왕복 지연(ms), 기본 1.0]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+from register_protocol import (
+    spi_write_frame, spi_read_frame, decode_spi_read,
+    i2c_write_frame, decode_i2c_read, uart_write_command, uart_read_command, parse_uart_response,
+)
+from arduino_emulator import make_arduino_spi_port, NUM_REGISTERS
+from sim_device import (
+    SimulatedRegisterDevice, SimulatedSpiPort, SimulatedI2cPort, SimulatedSerialPort,
+    UsbLatencyModel, REGISTER_COUNT,
+)
+
+
+def pattern(addr):
+    return (0xA5000000 | (addr << 16) | (addr * 0x0101)) & 0xFFFFFFFF
+
+
+def run_spi(port):
+    errors = 0
+    for addr in range(REGISTER_COUNT):
+        port.exchange(spi_write_frame(addr, pattern(addr)))
+    for addr in range(REGISTER_COUNT):
+        errors += decode_spi_read(port.exchange(spi_read_frame(addr), duplex=True)) != pattern(addr)
+    return errors
+
+
+def run_i2c(port):
+    errors = 0
+    for addr in range(REGISTER_COUNT):
+        port.write(i2c_write_frame(addr, pattern(addr)))
+    for addr in range(REGISTER_COUNT):
+        port.write([addr])
+        errors += decode_i2c_read(port.read(4)) != pattern(addr)
+    return errors
+
+
+def run_uart(port):
+    errors = 0
+    for addr in range(REGISTER_COUNT):
+        port.write(uart_write_command(addr, pattern(addr)).encode())
+    for addr in range(REGISTER_COUNT):
+        port.write(uart_read_command(addr).encode())
+        errors += parse_uart_response(port.readline()) != pattern(addr)
+    return errors
+
+
+def run_arduino(port, emulator, paced=False):
+    """쓰기 후 파이프라인 읽기: 읽기 프레임 k+1 의 응답이 레지스터 k 의 값 (마지막에 더미 프레임 1개)
+
+    paced 이면 프레임마다 loop() 가 처리와 Serial 로그를 끝낼 때까지 기다림 → (검증 오류, 기다린 시간)
+    """
+    mask = 0xFFFF
+    waited = 0.0
+    for addr in range(NUM_REGISTERS):
+        port.exchange([addr, (pattern(addr) >> 8) & 0xFF, pattern(addr) & 0xFF], duplex=True)
+        if paced:
+            waited += emulator.wait_ready()
+    errors = 0
+    for addr in range(NUM_REGISTERS + 1):
+        response = port.exchange([0x80 | (addr % NUM_REGISTERS), 0, 0], duplex=True)
+        if paced:
+            waited += emulator.wait_ready()
+        if addr > 0:
+            errors += ((response[1] << 8) | response[2]) != pattern(addr - 1) & mask
+    emulator.settle()
+    return errors, waited
+
+
+def main():
+    round_trip_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    usb = UsbLatencyModel(round_trip_s=round_trip_ms / 1000.0)
+
+    cases = [
+        ("SPI 1MHz", lambda dev: SimulatedSpiPort(dev, frequency=1_000_000, usb=usb), run_spi),
+        ("SPI 10MHz", lambda dev: SimulatedSpiPort(dev, frequency=10_000_000, usb=usb), run_spi),
+        ("I2C 100kHz", lambda dev: SimulatedI2cPort(dev, frequency=100_000, usb=usb), run_i2c),
+        ("I2C 400kHz", lambda dev: SimulatedI2cPort(dev, frequency=400_000, usb=usb), run_i2c),
+        ("UART 115200", lambda dev: SimulatedSerialPort(dev, baudrate=115200, usb=usb), run_uart),
+    ]
+
+    print("=" * 72)
+    print(f"시뮬레이션 처리량 (USB 왕복 {round_trip_ms:.2f}ms, 레지스터 {REGISTER_COUNT}개 쓰기+읽기)")
+    print("=" * 72)
+    print(f"{'경로':<14}{'프레임/초':>12}{'USB 왕복':>10}{'가상 시간(ms)':>16}{'검증 오류':>10}")
+    for name, make_port, run in cases:
+        device = SimulatedRegisterDevice()
+        port = make_port(device)
+        errors = run(port)
+        elapsed = port.stats.elapsed
+        frames = device.frames
+        print(f"{name:<14}{frames / elapsed if elapsed else 0:>12.0f}{port.stats.usb_transfers:>10}"
+              f"{elapsed * 1000:>16.2f}{errors:>10}")
+
+    print("-" * 72)
+    print("Arduino 펌웨어 에뮬레이터 (3바이트 프레임, 115200 baud Serial 로그, 프레임/초는 정상 처리된 프레임 기준)")
+    for paced in (False, True):
+        for frequency in (100_000, 1_000_000):
+            port, emulator = make_arduino_spi_port(frequency=frequency, usb=usb)
+            errors, waited = run_arduino(port, emulator, paced)
+            # 간격 맞춤 대기는 포트 통계에 들어가지 않으므로 공유 시계로 잼
+            elapsed = port.clock.now()
+            good = max(0, emulator.frames - errors)
+            name = f"SPI {frequency // 1000}kHz{' 간격' if paced else ''}"
+            print(f"{name:<14}{good / elapsed if elapsed else 0:>12.0f}"
+                  f"{port.stats.usb_transfers:>10}{elapsed * 1000:>16.2f}{errors:>10}"
+                  f"   (처리 {emulator.frames}, 유실 {emulator.dropped_frames}"
+                  f"{f', 대기 {waited * 1000:.1f}ms' if paced else ''})")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,26 @@
 """
 FT2232H SPI + GPIO 통합 제어 스크립트
 SPI: Channel A, GPIO: Channel A의 여분 핀 사용
+
+GPIO 는 같은 채널의 SpiController 로 제어합니다 (별도 GpioMpsseController 로 같은 채널을 다시 열지 않음).
+stream_test 는 mpsse_batch.MpsseSequence 로 GPIO 에지와 SPI 프레임을 USB 전송 한 번에 보내므로
+에지와 프레임 사이 간격이 time.sleep / OS 스케줄러와 무관합니다.
 """
 
+import os
+import sys
 import time
 from pyftdi.spi import SpiController
-from pyftdi.gpio import GpioMpsseController
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+from mpsse_batch import MpsseSequence
+
+GPIO_PINS = {"reset": 4, "enable": 5, "trigger": 6, "led": 7}
 
 class FT2232H_SPI_GPIO_Controller:
     def __init__(self):
         self.spi = None
-        self.gpio = None
+        self.gpio = None        # SPI 컨트롤러의 GPIO (핀 4-7)
         self.spi_slave = None
         
     def connect_spi(self):
@@ -30,14 +40,17 @@ class FT2232H_SPI_GPIO_Controller:
         """GPIO 연결 (Channel A의 여분 핀)"""
         try:
             # 주의: SPI와 함께 사용시에는 SPI 핀(CS, CLK, MOSI, MISO) 제외
-            self.gpio = GpioMpsseController()
-            self.gpio.configure('ftdi://0x0403:0x6010/1')  # Channel A
+            # 같은 채널을 두 번 열 수 없으므로 SPI 컨트롤러의 GPIO 를 사용
+            if not self.spi:
+                print("❌ SPI가 연결되지 않음 (GPIO 는 SPI 컨트롤러로 제어)")
+                return False
+            self.gpio = self.spi
             
             # GPIO 핀 매핑 (SPI 핀 제외)
-            # SPI 사용 핀: CS(0), CLK(1), MOSI(2), MISO(3)
+            # SPI 사용 핀: CLK(0), MOSI(1), MISO(2), CS(3)
             # GPIO 사용 가능 핀: 4, 5, 6, 7
             gpio_mask = 0xF0  # 상위 4비트 (핀 4-7)
-            self.gpio.set_direction(gpio_mask, gpio_mask)  # 출력 모드
+            self.gpio.set_gpio_direction(gpio_mask, gpio_mask)  # 출력 모드
             
             print("✅ GPIO 연결 성공 (핀 4-7 사용)")
             return True
@@ -92,14 +105,14 @@ class FT2232H_SPI_GPIO_Controller:
             return
         
         try:
-            current_state = self.gpio.read()
+            current_state = self.gpio.read_gpio(with_output=True)
             
             if state:
                 new_state = current_state | (1 << pin)
             else:
                 new_state = current_state & ~(1 << pin)
             
-            self.gpio.write(new_state)
+            self.gpio.write_gpio(new_state & 0xF0)
             print(f"GPIO 핀 {pin}: {'ON' if state else 'OFF'}")
             
         except Exception as e:
@@ -122,15 +135,39 @@ class FT2232H_SPI_GPIO_Controller:
                 time.sleep(0.1)
             
             # 모든 핀 동시 점등
-            self.gpio.write(0xF0)  # 핀 4-7 ON
+            self.gpio.write_gpio(0xF0)  # 핀 4-7 ON
             time.sleep(0.5)
-            self.gpio.write(0x00)  # 모든 핀 OFF
+            self.gpio.write_gpio(0x00)  # 모든 핀 OFF
             
             print("✅ GPIO 패턴 테스트 완료")
             
         except Exception as e:
             print(f"❌ GPIO 패턴 테스트 실패: {e}")
     
+    def stream_test(self):
+        """GPIO 에지 + SPI 프레임을 MPSSE 명령 스트림 하나로 전송 (USB 쓰기 1회 + 읽기 1회)"""
+        if not self.spi_slave:
+            print("❌ SPI가 연결되지 않음")
+            return None
+        
+        try:
+            seq = MpsseSequence(self.spi_slave, GPIO_PINS)
+            seq.set("reset", 0).set("reset", 1)                 # 리셋 해제 직후 바로 설정
+            seq.write(0x10, 0x12345678).set("enable", 1)
+            seq.pulse("trigger")
+            readback = seq.read(0x10)
+            seq.set_many({"enable": 0, "led": 1})
+            
+            started = time.perf_counter()
+            values = seq.run()
+            elapsed = time.perf_counter() - started
+            print(f"SPI+GPIO 스트림 - Read 0x10: 0x{values[readback]:08X} ({elapsed * 1000:.3f}ms, USB 왕복 1회)")
+            return values[readback]
+            
+        except Exception as e:
+            print(f"❌ 스트림 테스트 실패: {e}")
+            return None
+    
     def combined_test(self):
         """SPI + GPIO 통합 테스트"""
         print("=" * 60)
@@ -180,6 +217,9 @@ class FT2232H_SPI_GPIO_Controller:
                 self.gpio_control(4 + (i % 4), False)
                 time.sleep(0.2)
             
+            print("\n4. SPI + GPIO 단일 스트림 테스트...")
+            self.stream_test()
+            
             print("\n✅ 통합 테스트 완료!")
             
         except Exception as e:
@@ -192,8 +232,8 @@ class FT2232H_SPI_GPIO_Controller:
         """연결 해제"""
         try:
             if self.gpio:
-                self.gpio.write(0x00)  # 모든 GPIO OFF
-                self.gpio.terminate()
+                self.gpio.write_gpio(0x00)  # 모든 GPIO OFF
+                self.gpio = None
                 print("✅ GPIO 연결 해제")
         except:
             pass
@@ -212,8 +252,9 @@ def main():
     print("1. 통합 테스트 실행")
     print("2. SPI만 테스트")
     print("3. GPIO만 테스트")
+    print("4. SPI + GPIO 단일 스트림 테스트")
     
-    choice = input("선택하세요 (1-3): ").strip()
+    choice = input("선택하세요 (1-4): ").strip()
     
     if choice == '1':
         controller.combined_test()
@@ -223,8 +264,12 @@ def main():
             controller.spi_write_read(0x15)
             controller.disconnect()
     elif choice == '3':
-        if controller.connect_gpio():
+        if controller.connect_spi() and controller.connect_gpio():
             controller.gpio_pattern()
+        controller.disconnect()
+    elif choice == '4':
+        if controller.connect_spi():
+            controller.stream_test()
             controller.disconnect()
     else:
         print("통합 테스트를 실행합니다...")
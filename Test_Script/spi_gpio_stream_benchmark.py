@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+GPIO + SPI 통합 MPSSE 스트림 측정 (가상 FT2232H, 하드웨어 불필요)
+
+전원 인가 시퀀스(리셋 해제 → 레지스터 설정 → 인에이블 → 트리거 펄스 → 다시 읽기)를 두 방식으로 실행하고
+가상 MPSSE 엔진의 핀 기록(SET_BITS_LOW 시각)으로 에지와 SPI 프레임 사이 간격을 비교합니다.
+    separate : SpiController.write_gpio() 로 에지마다, SpiPort.exchange() 로 프레임마다 전송
+               (Test_Script/spi_gpio_integrated.py 방식, 에지/프레임마다 USB 왕복)
+    stream   : mpsse_batch.MpsseSequence 로 에지와 프레임을 명령 스트림 하나로 전송
+같은 시퀀스를 반복해 간격의 최소/최대를 출력하므로, stream 의 간격이 USB 지연 변동과 무관하게
+고정되는지 확인할 수 있습니다 (separate 는 USB 왕복 지연 변동이 그대로 간격에 나타남).
+
+사용법:
+    python Test_Script/spi_gpio_stream_benchmark.py [USB 왕복 지연(ms), 기본 1.0] [반복 횟수, 기본 20]
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+from pyftdi.spi import SpiController
+
+from ftdi_virtual import VirtualFtdiBackend, VirtualFtdiDevice, SpiTarget
+from mpsse_batch import MpsseSequence, configure_gpio
+from register_protocol import spi_write_frame, spi_read_frame, decode_spi_read
+from sim_device import SimulatedRegisterDevice, UsbLatencyModel
+
+SPI_FREQUENCY = 10_000_000
+PINS = {"reset": 4, "enable": 5, "trigger": 6}
+CS_BIT = 0x08
+STATUS_ADDR = 0x01     # 시퀀스에서 쓴 값(0x8000)을 다시 읽어 확인
+
+
+class JitteryUsb(UsbLatencyModel):
+    """왕복 지연이 ±50% 흔들리는 USB (호스트 스케줄링/버스 경합 흉내)"""
+
+    def __init__(self, round_trip_s, seed=1):
+        super().__init__(round_trip_s)
+        self._base = round_trip_s
+        self._random = random.Random(seed)
+
+    @property
+    def round_trip_s(self):
+        return self._base * self._random.uniform(0.5, 1.5)
+
+    @round_trip_s.setter
+    def round_trip_s(self, value):
+        self._base = value
+
+
+def open_spi(usb):
+    device = SimulatedRegisterDevice()
+    backend = VirtualFtdiBackend()
+    virtual = backend.add_device(VirtualFtdiDevice(targets={1: SpiTarget(device)}, usb_timing=usb))
+    controller = SpiController()
+    controller.configure(backend.find(), interface=1)
+    port = controller.get_port(cs=0, freq=SPI_FREQUENCY, mode=0)
+    port.exchange(b"\x00", duplex=True)
+    virtual.reset_stats()
+    virtual.engines[1].pin_log = []
+    return controller, port, virtual
+
+
+def run_separate(controller, port):
+    """에지/프레임마다 따로 전송 (write_gpio 는 읽기-수정-쓰기라 에지마다 USB 왕복)"""
+    mask = sum(1 << bit for bit in PINS.values())
+    controller.set_gpio_direction(mask, mask)
+    level = 0
+
+    def set_pin(name, value):
+        nonlocal level
+        bit = 1 << PINS[name]
+        level = (level | bit) if value else (level & ~bit)
+        controller.write_gpio(level)
+
+    set_pin("reset", 0)
+    set_pin("reset", 1)
+    port.exchange(spi_write_frame(0x00, 0x1), duplex=True)
+    set_pin("enable", 1)
+    port.exchange(spi_write_frame(0x01, 0x8000), duplex=True)
+    set_pin("trigger", 1)
+    set_pin("trigger", 0)
+    status = decode_spi_read(port.exchange(spi_read_frame(STATUS_ADDR), duplex=True))
+    set_pin("enable", 0)
+    return status
+
+
+def run_stream(controller, port):
+    seq = MpsseSequence(port, PINS)
+    seq.set("reset", 0).set("reset", 1).write(0x00, 0x1).set("enable", 1).write(0x01, 0x8000).pulse("trigger")
+    status = seq.read(STATUS_ADDR)
+    seq.set("enable", 0)
+    return seq.run()[status]
+
+
+def intervals(pin_log):
+    """핀 기록에서 (리셋 해제 → 첫 CS 활성, 트리거 상승 → 다음 CS 활성, 전체 길이) 초"""
+    events = []     # (시각, 이름)
+    previous = None
+    for timestamp, value, _ in pin_log:
+        if previous is not None:
+            changed = value ^ previous
+            if changed & (1 << PINS["reset"]) and value & (1 << PINS["reset"]):
+                events.append((timestamp, "reset_release"))
+            if changed & (1 << PINS["trigger"]) and value & (1 << PINS["trigger"]):
+                events.append((timestamp, "trigger"))
+            if changed & CS_BIT and not value & CS_BIT:
+                events.append((timestamp, "cs"))
+        previous = value
+
+    def gap(after):
+        start = next(t for t, name in events if name == after)
+        return next(t for t, name in events if name == "cs" and t > start) - start
+
+    return gap("reset_release"), gap("trigger"), events[-1][0] - events[0][0]
+
+
+def main():
+    round_trip_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    print("=" * 84)
+    print(f"GPIO + SPI 통합 스트림 (가상 FT2232H, SPI {SPI_FREQUENCY // 1_000_000}MHz, "
+          f"USB 왕복 {round_trip_ms:.2f}ms ±50%, {repeats}회)")
+    print("=" * 84)
+    print(f"{'방식':<10}{'USB 전송':>10}{'리셋→CS (us)':>20}{'트리거→CS (us)':>20}{'전체 (us)':>14}{'오류':>8}")
+    print(f"{'':<10}{'(회/시퀀스)':>10}{'최소 ~ 최대':>20}{'최소 ~ 최대':>20}{'중앙':>14}{'':>8}")
+    for label, run in (("separate", run_separate), ("stream", run_stream)):
+        reset_gaps, trigger_gaps, totals, transfers, errors = [], [], [], 0, 0
+        usb = JitteryUsb(round_trip_ms / 1000.0)
+        for _ in range(repeats):
+            controller, port, virtual = open_spi(usb)
+            configure_gpio(port, sum(1 << bit for bit in PINS.values()))
+            status = run(controller, port)
+            stats = virtual.stats()
+            transfers += stats["bulk_writes"] + stats["bulk_reads"]
+            reset_gap, trigger_gap, total = intervals(virtual.engines[1].pin_log)
+            reset_gaps.append(reset_gap * 1e6)
+            trigger_gaps.append(trigger_gap * 1e6)
+            totals.append(total * 1e6)
+            errors += status != 0x8000
+            controller.close()
+        totals.sort()
+        print(f"{label:<10}{transfers / repeats:>10.1f}"
+              f"{f'{min(reset_gaps):.2f} ~ {max(reset_gaps):.2f}':>20}"
+              f"{f'{min(trigger_gaps):.2f} ~ {max(trigger_gaps):.2f}':>20}"
+              f"{totals[len(totals) // 2]:>14.1f}{errors:>8}")
+
+
+if __name__ == "__main__":
+    main()
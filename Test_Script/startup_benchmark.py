@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Register_Controller 시작 시간 벤치마크 (회귀 추적용)
+
+매 실행마다 새 프로세스로 앱을 띄우고(REGISTER_STARTUP_EXIT=1 → 보고 후 자동 종료),
+REGISTER_STARTUP_REPORT 로 기록된 JSON 에서 단계별 시간을 모아 중앙값/최소/최대를 출력합니다.
+GUI 없이 측정하도록 QT_QPA_PLATFORM=offscreen 을 기본으로 사용합니다.
+
+사용법:
+    python Test_Script/startup_benchmark.py [반복 횟수] [결과 JSON 저장 경로]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PHASES = ("import", "ui_build", "map_load", "first_paint", "ready")
+
+
+def run_once(repo_dir, report_path):
+    """앱을 한 번 실행하고 단계별 시간(ms) 딕셔너리 반환"""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["REGISTER_STARTUP_EXIT"] = "1"
+    env["REGISTER_STARTUP_REPORT"] = report_path
+    subprocess.run([sys.executable, os.path.join(repo_dir, "Register_Controller.py")],
+                   cwd=repo_dir, env=env, timeout=120,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    with open(report_path, encoding="utf-8") as f:
+        report = json.load(f)
+    result = dict(report["durations_ms"])
+    result["ready"] = report["ready_ms"]
+    return result
+
+
+def main():
+    repo_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+
+    print("=" * 60)
+    print(f"시작 시간 벤치마크 (반복 {repeat}회)")
+    print("=" * 60)
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="reg_startup_") as work_dir:
+        report_path = os.path.join(work_dir, "startup.json")
+        run_once(repo_dir, report_path)  # 워밍업 (.pyc 생성, 디스크 캐시)
+        for i in range(repeat):
+            result = run_once(repo_dir, report_path)
+            runs.append(result)
+            print(f"#{i + 1}: " + ", ".join(f"{p} {result.get(p, 0):.0f}ms" for p in PHASES))
+
+    print("-" * 60)
+    summary = {}
+    for phase in PHASES:
+        values = [run[phase] for run in runs if phase in run]
+        if not values:
+            continue
+        summary[phase] = {
+            "median_ms": round(statistics.median(values), 2),
+            "min_ms": round(min(values), 2),
+            "max_ms": round(max(values), 2),
+        }
+        print(f"{phase:<12} 중앙값 {summary[phase]['median_ms']:8.1f} ms   "
+              f"최소 {summary[phase]['min_ms']:8.1f} ms   최대 {summary[phase]['max_ms']:8.1f} ms")
+
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump({"repeat": repeat, "summary": summary, "runs": runs}, f, indent=2)
+        print(f"결과 저장: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -74,11 +74,23 @@ class SPI_Worker(QThread):
         super().__init__()
         self.spi_ctrl = None
         self.slave = None
+        self.emulator = None  # sim:// 연결 시 arduino_emulator.ArduinoSpiSlaveEmulator
         self.is_connected = False
         
     def connect_device(self, url: str, cs: int, freq: int, mode: int):
-        """FT2232H 연결"""
+        """FT2232H 연결 (url 이 sim:// 으로 시작하면 Arduino 펌웨어 에뮬레이터에 연결)"""
         try:
+            if url.startswith("sim://"):
+                # 보드 없이 실행: 상위 폴더의 arduino_emulator 를 사용 (USB/버스/시리얼 지연을 실제 시간으로 적용)
+                sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+                from arduino_emulator import make_arduino_spi_port
+                from sim_device import SimClock
+                self.slave, self.emulator = make_arduino_spi_port(frequency=freq, mode=mode, clock=SimClock(realtime=True))
+                self.is_connected = True
+                self.connected_signal.emit(True)
+                self.log_signal.emit(f"에뮬레이터 연결 성공: {url}, {freq}Hz, Mode={mode}")
+                return
+                
             if SpiController is None:
                 self.error_signal.emit("pyftdi가 설치되지 않았습니다. pip install pyftdi")
                 return
@@ -102,6 +114,7 @@ class SPI_Worker(QThread):
                 self.spi_ctrl.terminate()
             self.spi_ctrl = None
             self.slave = None
+            self.emulator = None
             self.is_connected = False
             self.connected_signal.emit(False)
             self.log_signal.emit("연결 해제됨")
@@ -0,0 +1,207 @@
+"""
+Arduino UNO SPI 슬레이브 펌웨어 에뮬레이터 (Arduino_UNO_SPI_Clean.ino)
+
+펌웨어 동작을 그대로 따릅니다.
+    - 128개 레지스터, 3바이트 프레임 [RW(bit7) | 7비트 주소, 데이터 상위, 데이터 하위]
+    - CS 는 프레임 구분에 쓰이지 않고 ISR 이 받은 바이트 수(byteIndex)로만 프레임을 나눔
+      (5바이트 프레임을 보내면 이후 프레임 경계가 어긋남)
+    - 응답은 한 프레임 늦게 나옴: 프레임 N 의 MISO 는 [0x00, 프레임 N-1 의 응답 데이터 2바이트]
+      (responseBuffer[0] 의 헤더는 SPDR 에 다시 실리지 않으므로 첫 바이트는 항상 0x00)
+    - loop() 는 프레임을 처리한 뒤 Serial.print 로 로그를 남기고 나서 responseBuffer 를 갱신하므로,
+      115200 baud 시리얼 송신 버퍼(64바이트)가 가득 차면 응답 준비가 늦어지고,
+      loop() 가 바쁜 동안 도착한 프레임은 다음 프레임에 덮어써져 사라짐
+    - 바이트 간격이 ISR 시간보다 짧으면 SPDR 이 제때 다시 채워지지 않아 방금 받은 바이트가 MISO 로 되돌아감
+
+시간은 sim_device.SimClock 을 사용합니다. 한 번의 exchange 안의 바이트는 같은 시작 시각에서
+SPI 바이트 시간만큼씩 떨어져 도착한 것으로 계산합니다. make_arduino_spi_port() 로
+SimulatedSpiPort 에 연결하면 ft2232h_spi_gui_simple.py 와 테스트 스크립트를 보드 없이 실행할 수 있습니다.
+"""
+
+from collections import deque
+
+from register_logging import get_logger
+from sim_device import SimClock, SimulatedSpiPort, UsbLatencyModel
+
+transport_log = get_logger("transport")
+
+NUM_REGISTERS = 128
+DATA_LENGTH_BYTES = 2
+FRAME_BYTES = 1 + DATA_LENGTH_BYTES
+READ_FLAG = 0x80
+ADDRESS_MASK = 0x7F
+
+SERIAL_BAUDRATE = 115200
+SERIAL_TX_BUFFER = 64      # HardwareSerial 송신 링 버퍼 (바이트)
+ISR_TIME_S = 4e-6          # SPI_STC_vect 진입~SPDR 재적재 시간 (16MHz UNO 근사값)
+LOOP_OVERHEAD_S = 20e-6    # loop() 한 번의 프레임 처리 시간 (Serial.print 대기 제외)
+
+
+class ArduinoSpiSlaveEmulator:
+    """Arduino_UNO_SPI_Clean.ino 의 ISR/loop() 동작을 바이트 단위로 재현하는 SPI 슬레이브"""
+
+    def __init__(self, clock=None, spi_frequency=1_000_000, serial_baudrate=SERIAL_BAUDRATE,
+                 serial_tx_buffer=SERIAL_TX_BUFFER, isr_time_s=ISR_TIME_S, loop_overhead_s=LOOP_OVERHEAD_S,
+                 log_lines=256):
+        self.clock = clock if clock is not None else SimClock()
+        self.byte_time_s = 8.0 / spi_frequency
+        self.serial_rate = serial_baudrate / 10.0  # 8N1: 바이트당 10비트
+        self.serial_tx_buffer = serial_tx_buffer
+        self.isr_time_s = isr_time_s
+        self.loop_overhead_s = loop_overhead_s
+        self.serial_output = deque(maxlen=log_lines)  # 펌웨어가 Serial 로 출력한 줄
+        self.reset()
+
+    def reset(self):
+        """setup() 직후 상태"""
+        self.registers = [0] * NUM_REGISTERS
+        self.buffer = [0] * FRAME_BYTES
+        self.response_buffer = [0x00, 0x00, 0x00]
+        self.byte_index = 0
+        self.spdr = self.response_buffer[0]
+        self.last_received = 0x00
+        self.frames = 0          # loop() 가 처리한 프레임 수
+        self.dropped_frames = 0  # loop() 가 바빠서 덮어써진 프레임 수
+        self.echoed_bytes = 0    # ISR 이 늦어 받은 바이트가 되돌아간 횟수
+        self._pending = deque()  # 완료됐지만 loop() 가 아직 읽지 않은 프레임 (완료 시각, 바이트)
+        self._scheduled = None   # (준비 시각, 새 responseBuffer)
+        self._loop_free_at = 0.0
+        self._tx_level = 0.0
+        self._tx_time = 0.0
+        self._last_clock = None
+        self._byte_offset = 0
+
+    # ----- SimulatedSpiPort 인터페이스 -----
+
+    def spi_select(self):
+        """CS 는 프레임 구분에 사용되지 않음"""
+
+    def spi_deselect(self):
+        pass
+
+    def spi_clock_byte(self, mosi):
+        now = self._byte_time()
+        self._run_loop_until(now)
+
+        # 이 바이트 구간에 시프트 아웃되는 값은 직전 ISR 이 SPDR 에 적재한 값
+        miso = self.spdr
+        received = mosi & 0xFF
+        self.buffer[self.byte_index] = received
+        self.byte_index += 1
+
+        if self.byte_index < FRAME_BYTES:
+            next_byte = self.response_buffer[self.byte_index]
+        else:
+            next_byte = 0x00
+            self.byte_index = 0
+            self._pending.append((now, list(self.buffer)))
+
+        if self.byte_time_s < self.isr_time_s:
+            # ISR 이 다음 바이트 시작 전에 SPDR 을 채우지 못함 → 수신 바이트가 그대로 나감
+            self.spdr = received
+            self.echoed_bytes += 1
+        else:
+            self.spdr = next_byte
+        self.last_received = received
+        return miso
+
+    def read_register(self, addr):
+        return self.registers[addr % NUM_REGISTERS]
+
+    def write_register(self, addr, value):
+        self.registers[addr % NUM_REGISTERS] = value & 0xFFFF
+
+    def settle(self, t=None):
+        """시각 t (기본: 현재 시계) 까지 loop() 를 진행시켜 통계를 최신 상태로 만듦"""
+        self._run_loop_until(self.clock.now() if t is None else t)
+
+    def wait_ready(self):
+        """loop() 가 받은 프레임을 모두 처리하고 응답을 준비할 때까지 시계를 진행, 기다린 시간(초) 반환
+
+        프레임 사이에 호출하면 Serial 로그 대기로 프레임이 덮어써지지 않는 속도로 보내게 됩니다
+        (실제 보드에서 프레임 사이에 두어야 할 최소 간격).
+        """
+        started = self.clock.now()
+        while True:
+            self.settle()
+            if not self._pending and self._scheduled is None:
+                return self.clock.now() - started
+            if self._scheduled is not None:
+                target = self._scheduled[0]
+            else:
+                target = max(self._pending[0][0], self._loop_free_at)
+            self.clock.advance(max(target - self.clock.now(), 1e-9))
+
+    # ----- 내부 동작 -----
+
+    def _byte_time(self):
+        """exchange 안의 바이트 도착 시각 (포트는 전송이 끝난 뒤에 시계를 진행시킴)"""
+        now = self.clock.now()
+        if now != self._last_clock:
+            self._last_clock = now
+            self._byte_offset = 0
+        self._byte_offset += 1
+        return now + self._byte_offset * self.byte_time_s
+
+    def _run_loop_until(self, t):
+        """시각 t 까지 loop() 가 처리했을 프레임을 처리하고 준비된 응답을 반영"""
+        while True:
+            if self._scheduled and self._scheduled[0] <= t:
+                self.response_buffer = self._scheduled[1]
+                self._scheduled = None
+            if not self._pending:
+                return
+            start = max(self._pending[0][0], self._loop_free_at)
+            if start > t:
+                return
+            # loop() 가 frameReady 를 확인하는 시점에는 마지막으로 완료된 프레임만 남아 있음
+            frame = None
+            while self._pending and self._pending[0][0] <= start:
+                if frame is not None:
+                    self.dropped_frames += 1
+                frame = self._pending.popleft()[1]
+            self._process_frame(start, frame)
+
+    def _process_frame(self, start, frame):
+        header = frame[0]
+        addr = header & ADDRESS_MASK
+        data = (frame[1] << 8) | frame[2]
+        if header & READ_FLAG:
+            value = self.registers[addr] & 0xFFFF
+            line = f"Read [0x{addr:X}] -> 0x{value:X} (2 bytes)"
+            response = [header, (value >> 8) & 0xFF, value & 0xFF]
+        else:
+            self.registers[addr] = data
+            line = f"Write [0x{addr:X}] = 0x{data:X} (2 bytes)"
+            response = [header, frame[1], frame[2]]
+        self.frames += 1
+        self.serial_output.append(line)
+        transport_log.debug("🎭 Arduino 에뮬레이터: %s", line)
+
+        finish = self._serial_print(start + self.loop_overhead_s, len(line) + 2)  # println 의 "\r\n"
+        self._loop_free_at = finish
+        self._scheduled = (finish, response)
+        if finish <= start:
+            self.response_buffer = response
+            self._scheduled = None
+
+    def _serial_print(self, t, nbytes):
+        """송신 버퍼에 nbytes 를 넣고 Serial.print 가 반환되는 시각 반환 (버퍼가 차면 대기)"""
+        self._tx_level = max(0.0, self._tx_level - (t - self._tx_time) * self.serial_rate)
+        self._tx_time = t
+        overflow = self._tx_level + nbytes - self.serial_tx_buffer
+        if overflow > 0:
+            wait = overflow / self.serial_rate
+            self._tx_time = t + wait
+            self._tx_level = float(self.serial_tx_buffer)
+            return t + wait
+        self._tx_level += nbytes
+        return t
+
+
+def make_arduino_spi_port(frequency=1_000_000, mode=0, usb=None, clock=None, **emulator_options):
+    """Arduino 에뮬레이터에 연결된 pyftdi SpiPort 호환 포트와 에뮬레이터를 함께 생성"""
+    clock = clock if clock is not None else SimClock()
+    emulator = ArduinoSpiSlaveEmulator(clock=clock, spi_frequency=frequency, **emulator_options)
+    port = SimulatedSpiPort(emulator, frequency=frequency, mode=mode,
+                            usb=usb if usb is not None else UsbLatencyModel(), clock=clock)
+    return port, emulator
@@ -0,0 +1,243 @@
+"""
+32비트 레지스터 편집용 커스텀 페인팅 위젯
+
+32개의 QPushButton 대신 하나의 위젯이 paintEvent 한 번으로 모든 비트,
+필드 강조 영역, 필드 경계선을 그립니다. 값 변경이나 필드 선택은 update() 한 번으로
+처리되므로 스타일시트 재적용(re-polish) 비용이 없습니다.
+"""
+
+from PySide6.QtWidgets import QWidget, QToolTip, QSizePolicy
+from PySide6.QtCore import Qt, Signal, QRect, QSize, QEvent
+from PySide6.QtGui import QPainter, QColor, QPen, QFont
+
+
+class BitRegisterWidget(QWidget):
+    """32비트 값을 2행 x 16열(31→0)로 그리는 비트 편집 위젯"""
+
+    # 클릭으로 비트가 토글되었을 때 (비트 번호, 새 상태)
+    bitToggled = Signal(int, bool)
+
+    CELL_SIZE = 30
+    CELL_SPACING = 2
+    LABEL_HEIGHT = 12
+    BITS_PER_ROW = 16
+
+    # (배경, 테두리, 글자색) - 기존 비트 버튼 스타일시트와 동일한 색상
+    STYLE_NORMAL_OFF = ("#f0f0f0", "#cccccc", "#000000")
+    STYLE_NORMAL_ON = ("#4CAF50", "#45a049", "#ffffff")
+    STYLE_FIELD_OFF = ("#FFD700", "#FFA500", "#000000")
+    STYLE_FIELD_ON = ("#FF8C00", "#FF6347", "#ffffff")
+    STYLE_DISABLED_OFF = ("#e0e0e0", "#bbbbbb", "#888888")
+    STYLE_DISABLED_ON = ("#cccccc", "#999999", "#666666")
+    HOVER_OFF = "#e0e0e0"
+    HOVER_ON = "#45a049"
+    HOVER_FIELD_OFF = "#FFA500"
+    HOVER_FIELD_ON = "#FF6347"
+    BAND_COLOR = "#FFF3C4"
+    BOUNDARY_COLOR = "#2E86AB"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._value = 0
+        self._field_range = None   # (upper_bit, lower_bit) 강조된 필드
+        self._boundaries = ()      # 현재 레지스터의 필드 (upper_bit, lower_bit) 목록
+        self._hover_bit = -1
+
+        self.setMouseTracking(True)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self._cell_font = QFont(self.font())
+        self._cell_font.setBold(True)
+        self._cell_font.setPixelSize(10)
+        self._label_font = QFont(self.font())
+        self._label_font.setPixelSize(8)
+
+    # ========== 값 / 필드 설정 ==========
+
+    def value(self):
+        """현재 32비트 unsigned 값 반환"""
+        return self._value
+
+    def setValue(self, value):
+        """32비트 값 설정 (변경된 경우에만 한 번 다시 그림)"""
+        value = int(value) & 0xFFFFFFFF
+        if value != self._value:
+            self._value = value
+            self.update()
+
+    def setHighlightedField(self, upper_bit, lower_bit):
+        """필드 비트 범위를 강조하고 범위 밖 비트는 비활성화"""
+        field_range = (max(upper_bit, lower_bit), min(upper_bit, lower_bit))
+        if field_range != self._field_range:
+            self._field_range = field_range
+            self.update()
+
+    def clearHighlight(self):
+        """필드 강조 해제 (모든 비트 활성화)"""
+        if self._field_range is not None:
+            self._field_range = None
+            self.update()
+
+    def highlightedField(self):
+        """강조된 필드의 (upper_bit, lower_bit) 또는 None"""
+        return self._field_range
+
+    def setFieldBoundaries(self, ranges):
+        """현재 레지스터의 필드 범위 목록 [(upper_bit, lower_bit), ...] 설정"""
+        boundaries = tuple((max(u, l), min(u, l)) for u, l in ranges)
+        if boundaries != self._boundaries:
+            self._boundaries = boundaries
+            self.update()
+
+    def isBitEditable(self, bit):
+        """필드가 선택된 경우 필드 범위 안의 비트만 편집 가능"""
+        if self._field_range is None:
+            return True
+        upper_bit, lower_bit = self._field_range
+        return lower_bit <= bit <= upper_bit
+
+    # ========== 기하 / 히트 테스트 ==========
+
+    def _row_top(self, row):
+        """행(0: 31~16, 1: 15~0)의 셀 상단 y 좌표"""
+        return self.LABEL_HEIGHT + row * (self.CELL_SIZE + self.CELL_SPACING)
+
+    def cellRect(self, bit):
+        """비트 셀 사각형 (MSB가 왼쪽)"""
+        row = 0 if bit >= self.BITS_PER_ROW else 1
+        col = (31 - bit) % self.BITS_PER_ROW
+        x = col * (self.CELL_SIZE + self.CELL_SPACING)
+        return QRect(x, self._row_top(row), self.CELL_SIZE, self.CELL_SIZE)
+
+    def bitAt(self, pos):
+        """좌표의 비트 번호 반환 (셀 밖이면 -1)"""
+        pitch = self.CELL_SIZE + self.CELL_SPACING
+        x, y = pos.x(), pos.y() - self.LABEL_HEIGHT
+        if x < 0 or y < 0:
+            return -1
+        col, col_offset = divmod(x, pitch)
+        row, row_offset = divmod(y, pitch)
+        if col >= self.BITS_PER_ROW or row > 1:
+            return -1
+        if col_offset >= self.CELL_SIZE or row_offset >= self.CELL_SIZE:
+            return -1
+        return (31 - col) if row == 0 else (15 - col)
+
+    def sizeHint(self):
+        pitch = self.CELL_SIZE + self.CELL_SPACING
+        width = self.BITS_PER_ROW * pitch - self.CELL_SPACING
+        height = 2 * self.LABEL_HEIGHT + 2 * self.CELL_SIZE + self.CELL_SPACING
+        return QSize(width, height)
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    # ========== 이벤트 ==========
+
+    def mousePressEvent(self, event):
+        if event.button() != Qt.LeftButton:
+            super().mousePressEvent(event)
+            return
+        bit = self.bitAt(event.position().toPoint())
+        if bit < 0 or not self.isBitEditable(bit):
+            return
+        self._value ^= (1 << bit)
+        self.update(self.cellRect(bit))
+        self.bitToggled.emit(bit, bool((self._value >> bit) & 1))
+
+    def mouseMoveEvent(self, event):
+        bit = self.bitAt(event.position().toPoint())
+        if bit != self._hover_bit:
+            previous = self._hover_bit
+            self._hover_bit = bit
+            if previous >= 0:
+                self.update(self.cellRect(previous))
+            if bit >= 0:
+                self.update(self.cellRect(bit))
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        if self._hover_bit >= 0:
+            previous = self._hover_bit
+            self._hover_bit = -1
+            self.update(self.cellRect(previous))
+        super().leaveEvent(event)
+
+    def event(self, event):
+        if event.type() == QEvent.ToolTip:
+            bit = self.bitAt(event.pos())
+            if bit >= 0:
+                QToolTip.showText(event.globalPos(), f"Bit {bit}", self)
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().event(event)
+
+    # ========== 그리기 ==========
+
+    def _cell_style(self, bit, is_set):
+        """비트 상태에 따른 (배경, 테두리, 글자색, 테두리 두께)"""
+        if self._field_range is None:
+            bg, border, fg = self.STYLE_NORMAL_ON if is_set else self.STYLE_NORMAL_OFF
+            if bit == self._hover_bit:
+                bg = self.HOVER_ON if is_set else self.HOVER_OFF
+            return bg, border, fg, 2
+        if self.isBitEditable(bit):
+            bg, border, fg = self.STYLE_FIELD_ON if is_set else self.STYLE_FIELD_OFF
+            if bit == self._hover_bit:
+                bg = self.HOVER_FIELD_ON if is_set else self.HOVER_FIELD_OFF
+            return bg, border, fg, 3
+        bg, border, fg = self.STYLE_DISABLED_ON if is_set else self.STYLE_DISABLED_OFF
+        return bg, border, fg, 2
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        dirty = event.rect()
+        pitch = self.CELL_SIZE + self.CELL_SPACING
+
+        # 비트 번호 라벨 (상단: 31~16, 하단: 15~0)
+        painter.setFont(self._label_font)
+        painter.setPen(QColor("#666666"))
+        bottom_label_top = self._row_top(1) + self.CELL_SIZE
+        for col in range(self.BITS_PER_ROW):
+            x = col * pitch
+            painter.drawText(QRect(x, 0, self.CELL_SIZE, self.LABEL_HEIGHT),
+                             Qt.AlignCenter, str(31 - col))
+            painter.drawText(QRect(x, bottom_label_top, self.CELL_SIZE, self.LABEL_HEIGHT),
+                             Qt.AlignCenter, str(15 - col))
+
+        # 강조 필드 밴드 (셀 뒤 배경)
+        if self._field_range is not None:
+            upper_bit, lower_bit = self._field_range
+            for bit in range(lower_bit, upper_bit + 1):
+                painter.fillRect(self.cellRect(bit).adjusted(-1, -1, 1, 1), QColor(self.BAND_COLOR))
+
+        # 비트 셀
+        painter.setFont(self._cell_font)
+        value = self._value
+        for bit in range(32):
+            rect = self.cellRect(bit)
+            if not rect.intersects(dirty):
+                continue
+            is_set = (value >> bit) & 1
+            bg, border, fg, border_width = self._cell_style(bit, is_set)
+            painter.setPen(QPen(QColor(border), border_width))
+            painter.setBrush(QColor(bg))
+            inset = border_width // 2
+            painter.drawRect(rect.adjusted(inset, inset, -inset, -inset))
+            painter.setPen(QColor(fg))
+            painter.drawText(rect, Qt.AlignCenter, "1" if is_set else "0")
+
+        # 필드 경계선 (필드의 LSB 오른쪽 / MSB 왼쪽)
+        if self._boundaries:
+            painter.setPen(QPen(QColor(self.BOUNDARY_COLOR), 2))
+            half_gap = self.CELL_SPACING // 2
+            for upper_bit, lower_bit in self._boundaries:
+                for bit, edge in ((upper_bit, "left"), (lower_bit, "right")):
+                    if not 0 <= bit <= 31:
+                        continue
+                    rect = self.cellRect(bit)
+                    x = rect.left() - half_gap if edge == "left" else rect.right() + half_gap + 1
+                    painter.drawLine(x, rect.top() - 2, x, rect.bottom() + 2)
+
+        painter.end()
@@ -0,0 +1,60 @@
+"""
+Excel 레지스터 맵 백그라운드 로더
+
+register_excel_parser.load_excel() 을 QThread 에서 실행하여 큰 사양서를 읽는 동안에도
+GUI 가 멈추지 않게 합니다. 결과는 시그널로 GUI 스레드에 전달되며(queued connection),
+컨트롤러는 완료 시점에 트리를 한 번에 교체합니다.
+"""
+
+import threading
+
+from PySide6.QtCore import QThread, Signal
+
+from register_excel_parser import load_excel, ParseCancelled
+from register_logging import get_logger
+
+parser_log = get_logger("parser")
+
+
+class ExcelLoadWorker(QThread):
+    """Excel 파싱 작업 스레드"""
+
+    # (발견된 레지스터 블록 수, 파싱된 레지스터 수)
+    progress = Signal(int, int)
+    # 파싱 결과 {"Sheet1": [...]}
+    loaded = Signal(object)
+    # 오류 메시지
+    failed = Signal(str)
+    # 사용자가 취소함
+    cancelled = Signal()
+
+    def __init__(self, file_path, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """다음 검사 지점에서 파싱을 중단하도록 요청 (스레드 안전)"""
+        self._cancel_event.set()
+
+    def is_cancel_requested(self):
+        return self._cancel_event.is_set()
+
+    def run(self):
+        try:
+            data = load_excel(self.file_path, progress=self.progress.emit,
+                              cancel_event=self._cancel_event)
+        except ParseCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            parser_log.exception("❌ 백그라운드 Excel 로드 오류: %s", e)
+            self.failed.emit(str(e))
+            return
+
+        if self._cancel_event.is_set():
+            self.cancelled.emit()
+        elif data:
+            self.loaded.emit(data)
+        else:
+            self.failed.emit("레지스터 맵을 파싱할 수 없습니다.")
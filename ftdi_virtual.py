@@ -0,0 +1,566 @@
+"""
+가상 FT2232H USB 백엔드 (하드웨어 없이 pyftdi 실행)
+
+pyusb 의 IBackend 를 구현해 FT2232H 한 개를 흉내 냅니다. pyftdi 의 Ftdi / SpiController /
+I2cController 코드는 수정 없이 그대로 실행되며, USB 로 전송된 MPSSE 명령 스트림을
+MpsseEngine 이 해석해 스크립트된 레지스터 디바이스(sim_device.SimulatedRegisterDevice 등)를 구동합니다.
+    SpiTarget : SET_BITS_LOW 의 CS 비트로 프레임을 나누고, 데이터 시프트 명령의 바이트를
+                spi_select / spi_clock_byte / spi_deselect 로 전달
+    I2cTarget : SCL/SDA 레벨 변화에서 START/STOP 을 검출하고, 바이트 쓰기/ACK 읽기/바이트 읽기를
+                i2c_write / i2c_read 로 전달
+
+시간은 sim_device.SimClock 에 누적됩니다.
+    bulk OUT : USB 왕복 지연의 절반 + 전송 시간, 이후 MPSSE 가 버스 시간만큼 명령을 실행
+    bulk IN  : USB 왕복 지연의 절반 + 전송 시간, 응답이 아직 준비되지 않았으면 준비될 때까지 대기
+따라서 다음 배치를 먼저 쓰고 이전 배치 응답을 읽는 파이프라이닝의 효과도 가상 시간에 반영됩니다.
+
+사용법:
+    backend = VirtualFtdiBackend()
+    backend.add_device(VirtualFtdiDevice(targets={1: SpiTarget(SimulatedRegisterDevice())}))
+    controller = SpiController(); controller.configure(backend.find(), interface=1)
+또는 install(backend) 후 'ftdi://ftdi:2232h/1' URL 로 연결합니다.
+"""
+
+import array
+from contextlib import contextmanager
+
+import usb.backend
+import usb.core
+
+from sim_device import SimClock, UsbLatencyModel
+
+FTDI_VENDOR = 0x0403
+FT2232H_PRODUCT = 0x6010
+FT2232H_BCD = 0x0700
+MAX_PACKET_SIZE = 512
+MODEM_STATUS = bytes((0x32, 0x60))  # CTS/DSR + TX 비어 있음
+
+# FTDI 벤더 요청
+SIO_REQ_RESET = 0x00
+SIO_REQ_POLL_MODEM_STATUS = 0x05
+SIO_REQ_GET_LATENCY_TIMER = 0x0A
+SIO_REQ_SET_LATENCY_TIMER = 0x09
+SIO_REQ_SET_BITMODE = 0x0B
+SIO_REQ_READ_PINS = 0x0C
+SIO_REQ_READ_EEPROM = 0x90
+
+# MPSSE 명령
+SET_BITS_LOW = 0x80
+GET_BITS_LOW = 0x81
+SET_BITS_HIGH = 0x82
+GET_BITS_HIGH = 0x83
+SET_TCK_DIVISOR = 0x86
+DISABLE_CLK_DIV5 = 0x8A
+ENABLE_CLK_DIV5 = 0x8B
+ENABLE_CLK_3PHASE = 0x8C
+DISABLE_CLK_3PHASE = 0x8D
+CLK_BITS_NO_DATA = 0x8E
+CLK_BYTES_NO_DATA = 0x8F
+
+# 인자 바이트 수 (데이터 시프트 명령 제외)
+_COMMAND_ARGS = {
+    0x80: 2, 0x81: 0, 0x82: 2, 0x83: 0, 0x84: 0, 0x85: 0, 0x86: 2, 0x87: 0,
+    0x88: 0, 0x89: 0, 0x8A: 0, 0x8B: 0, 0x8C: 0, 0x8D: 0, 0x8E: 1, 0x8F: 2,
+    0x94: 0, 0x95: 0, 0x96: 0, 0x97: 0, 0x9C: 2, 0x9D: 2, 0x9E: 2,
+}
+
+# 데이터 시프트 명령 비트
+_SHIFT_WRITE = 0x10
+_SHIFT_READ = 0x20
+_SHIFT_BITS = 0x02
+_SHIFT_TMS = 0x40
+
+_LOW_SPEED_CLOCK = 12.0e6
+_HIGH_SPEED_CLOCK = 60.0e6
+
+
+class _Descriptor:
+    """pyusb 디스크립터 자리 표시 객체"""
+
+    def __init__(self, **fields):
+        self.extra_descriptors = []
+        self.__dict__.update(fields)
+
+
+# ========== 버스 타깃 ==========
+
+class SpiTarget:
+    """MPSSE SPI 버스에 연결된 슬레이브 (CS0 = ADBUS3)"""
+
+    CS_BIT = 0x08
+
+    def __init__(self, device, cs=0):
+        self.device = device
+        self.cs_mask = self.CS_BIT << cs
+        self.selected = False
+
+    def gpio(self, value, direction):
+        selected = bool(direction & self.cs_mask) and not (value & self.cs_mask)
+        if selected and not self.selected:
+            self.device.spi_select()
+        elif self.selected and not selected:
+            self.device.spi_deselect()
+        self.selected = selected
+
+    def shift_bytes(self, out, count, read):
+        """count 바이트를 클럭, out 이 None 이면 MOSI 0x00"""
+        if not self.selected:
+            return bytes([0xFF] * count) if read else b""
+        miso = bytes(self.device.spi_clock_byte(out[i] if out is not None else 0x00) for i in range(count))
+        return miso if read else b""
+
+    def shift_bits(self, out, nbits, read):
+        # 레지스터 프레임은 바이트 단위이므로 비트 시프트는 버스 값만 흉내 냄
+        return bytes([0xFF]) if read else b""
+
+
+class I2cTarget:
+    """MPSSE I2C 버스에 연결된 슬레이브 (SCL = ADBUS0, SDA = ADBUS1/2)"""
+
+    SCL_BIT = 0x01
+    SDA_O_BIT = 0x02
+
+    def __init__(self, device, address=0x50):
+        self.device = device
+        self.address = address
+        self.scl = True
+        self.sda = True
+        self.state = "idle"      # idle / address / write / read / nack
+        self.last_ack = False
+        self._write_buffer = []
+        self._read_data = []
+        self.starts = 0
+
+    def gpio(self, value, direction):
+        scl = bool(value & self.SCL_BIT) if direction & self.SCL_BIT else True
+        sda = bool(value & self.SDA_O_BIT) if direction & self.SDA_O_BIT else True
+        if self.scl and scl and self.sda and not sda:
+            self._start()
+        elif self.scl and scl and not self.sda and sda:
+            self._stop()
+        self.scl, self.sda = scl, sda
+
+    def _flush_write(self):
+        if self.state == "write" and self._write_buffer:
+            self.device.i2c_write(self._write_buffer)
+        self._write_buffer = []
+
+    def _start(self):
+        self._flush_write()
+        self.starts += 1
+        self.state = "address"
+
+    def _stop(self):
+        self._flush_write()
+        self.state = "idle"
+
+    def shift_bytes(self, out, count, read):
+        if out is not None and not read:
+            for byte in out[:count]:
+                self._write_byte(byte)
+            return b""
+        if read:
+            data = []
+            for _ in range(count):
+                data.append(self._read_data.pop(0) if self.state == "read" and self._read_data else 0xFF)
+            return bytes(data)
+        return b""
+
+    def shift_bits(self, out, nbits, read):
+        # 1비트 읽기 = 슬레이브 ACK(0)/NACK(1), 1비트 쓰기 = 마스터 ACK/NACK
+        if read:
+            return bytes([0x00 if self.last_ack else 0x01])
+        return b""
+
+    def _write_byte(self, byte):
+        if self.state == "address":
+            if (byte >> 1) == self.address:
+                self.last_ack = True
+                if byte & 0x01:
+                    self.state = "read"
+                    self._read_data = list(self.device.i2c_read(64))
+                else:
+                    self.state = "write"
+            else:
+                self.last_ack = False
+                self.state = "nack"
+        elif self.state == "write":
+            self._write_buffer.append(byte)
+            self.last_ack = True
+        else:
+            self.last_ack = False
+
+
+# ========== MPSSE 엔진 ==========
+
+class MpsseEngine:
+    """한 인터페이스의 MPSSE 명령 해석기"""
+
+    def __init__(self, target=None):
+        self.target = target
+        self.low_value = 0
+        self.low_dir = 0
+        self.high_value = 0
+        self.high_dir = 0
+        self.divisor = 0
+        self.div5 = True
+        self.three_phase = False
+        self._pending = bytearray()  # 여러 bulk OUT 에 걸쳐 잘린 명령
+        self.commands = 0
+        self.pin_log = None          # 리스트를 넣으면 SET_BITS_LOW 마다 (시각, 값, 방향) 기록
+
+    @property
+    def bit_time(self):
+        base = _LOW_SPEED_CLOCK if self.div5 else _HIGH_SPEED_CLOCK
+        frequency = base / ((1 + self.divisor) * 2)
+        return (1.5 if self.three_phase else 1.0) / frequency
+
+    def execute(self, data, start=0.0):
+        """명령 스트림 실행 → (응답 바이트, 버스 시간), start 는 pin_log 시각 기준"""
+        buf = self._pending + bytes(data)
+        response = bytearray()
+        bits = 0.0
+        pos = 0
+        while pos < len(buf):
+            opcode = buf[pos]
+            if opcode < 0x80:
+                size = self._shift_size(buf, pos)
+                if size is None or pos + size > len(buf):
+                    break
+                response += self._shift(buf, pos, size)
+                bits += self._shift_bits_count(buf, pos)
+            elif opcode in _COMMAND_ARGS:
+                size = 1 + _COMMAND_ARGS[opcode]
+                if pos + size > len(buf):
+                    break
+                if opcode == SET_BITS_LOW and self.pin_log is not None:
+                    self.pin_log.append((start + bits * self.bit_time, buf[pos + 1], buf[pos + 2]))
+                response += self._command(opcode, buf[pos + 1:pos + size])
+                bits += self._command_bits(opcode, buf, pos)
+            else:
+                # 알 수 없는 명령: FTDI 는 0xFA + 명령 으로 응답
+                size = 1
+                response += bytes((0xFA, opcode))
+            self.commands += 1
+            pos += size
+        self._pending = bytearray(buf[pos:])
+        return bytes(response), bits * self.bit_time
+
+    @staticmethod
+    def _command_bits(opcode, buf, pos):
+        """비시프트 명령의 버스 시간 (클럭 주기 수, 빈 클럭 명령은 지정한 클럭 수)"""
+        if opcode == CLK_BITS_NO_DATA:
+            return buf[pos + 1] + 1
+        if opcode == CLK_BYTES_NO_DATA:
+            return 8 * (buf[pos + 1] + (buf[pos + 2] << 8) + 1)
+        return 1
+
+    def _shift_size(self, buf, pos):
+        opcode = buf[pos]
+        if opcode & _SHIFT_BITS:
+            if pos + 2 > len(buf):
+                return None
+            return 2 + (1 if opcode & (_SHIFT_WRITE | _SHIFT_TMS) else 0)
+        if pos + 3 > len(buf):
+            return None
+        length = buf[pos + 1] + (buf[pos + 2] << 8) + 1
+        return 3 + (length if opcode & _SHIFT_WRITE else 0)
+
+    def _shift_bits_count(self, buf, pos):
+        if buf[pos] & _SHIFT_BITS:
+            return buf[pos + 1] + 1
+        return 8 * (buf[pos + 1] + (buf[pos + 2] << 8) + 1)
+
+    def _shift(self, buf, pos, size):
+        opcode = buf[pos]
+        read = bool(opcode & _SHIFT_READ)
+        write = bool(opcode & (_SHIFT_WRITE | _SHIFT_TMS))
+        if self.target is None:
+            if opcode & _SHIFT_BITS:
+                return bytes([0xFF]) if read else b""
+            return bytes([0xFF] * (buf[pos + 1] + (buf[pos + 2] << 8) + 1)) if read else b""
+        if opcode & _SHIFT_BITS:
+            out = buf[pos + 2] if write else None
+            return self.target.shift_bits(out, buf[pos + 1] + 1, read)
+        count = buf[pos + 1] + (buf[pos + 2] << 8) + 1
+        out = bytes(buf[pos + 3:pos + 3 + count]) if write else None
+        return self.target.shift_bytes(out, count, read)
+
+    def _command(self, opcode, args):
+        if opcode == SET_BITS_LOW:
+            self.low_value, self.low_dir = args[0], args[1]
+            if self.target is not None:
+                self.target.gpio(self.low_value, self.low_dir)
+        elif opcode == SET_BITS_HIGH:
+            self.high_value, self.high_dir = args[0], args[1]
+        elif opcode == GET_BITS_LOW:
+            return bytes([(self.low_value & self.low_dir) | (~self.low_dir & 0xFF)])
+        elif opcode == GET_BITS_HIGH:
+            return bytes([(self.high_value & self.high_dir) | (~self.high_dir & 0xFF)])
+        elif opcode == SET_TCK_DIVISOR:
+            self.divisor = args[0] | (args[1] << 8)
+        elif opcode == DISABLE_CLK_DIV5:
+            self.div5 = False
+        elif opcode == ENABLE_CLK_DIV5:
+            self.div5 = True
+        elif opcode == ENABLE_CLK_3PHASE:
+            self.three_phase = True
+        elif opcode == DISABLE_CLK_3PHASE:
+            self.three_phase = False
+        return b""
+
+
+# ========== 가상 USB 장치 ==========
+
+class VirtualFtdiDevice:
+    """FT2232H (인터페이스 A/B) 가상 장치와 USB 전송 시간 모델"""
+
+    def __init__(self, targets=None, usb_timing=None, clock=None, serial="VIRT0001", bus=1, address=1):
+        self.clock = clock if clock is not None else SimClock()
+        self.usb_timing = usb_timing if usb_timing is not None else UsbLatencyModel()
+        self.serial = serial
+        self.bus = bus
+        self.address = address
+        self.engines = {1: MpsseEngine(), 2: MpsseEngine()}
+        for interface, target in (targets or {}).items():
+            self.engines[interface].target = target
+        self.latency_timer = 16
+        self.bitmode = 0
+        self._rx = {1: [], 2: []}             # 인터페이스 -> [(준비 시각, 응답 바이트)]
+        self._busy_until = {1: 0.0, 2: 0.0}   # MPSSE 명령 실행이 끝나는 시각
+        self.reset_stats()
+
+        self.descriptor = _Descriptor(
+            bLength=18, bDescriptorType=1, bcdUSB=0x0200, bDeviceClass=0, bDeviceSubClass=0,
+            bDeviceProtocol=0, bMaxPacketSize0=64, idVendor=FTDI_VENDOR, idProduct=FT2232H_PRODUCT,
+            bcdDevice=FT2232H_BCD, iManufacturer=1, iProduct=2, iSerialNumber=3, bNumConfigurations=1,
+            address=address, bus=bus, port_number=1, port_numbers=(1,), speed=3)
+        self.config_descriptor = _Descriptor(
+            bLength=9, bDescriptorType=2, wTotalLength=55, bNumInterfaces=2, bConfigurationValue=1,
+            iConfiguration=0, bmAttributes=0x80, bMaxPower=45)
+        self.interface_descriptors = [
+            _Descriptor(bLength=9, bDescriptorType=4, bInterfaceNumber=index, bAlternateSetting=0,
+                        bNumEndpoints=2, bInterfaceClass=0xFF, bInterfaceSubClass=0xFF,
+                        bInterfaceProtocol=0xFF, iInterface=2)
+            for index in range(2)]
+        self.endpoint_descriptors = [
+            [_Descriptor(bLength=7, bDescriptorType=5, bEndpointAddress=0x81 + 2 * index, bmAttributes=2,
+                         wMaxPacketSize=MAX_PACKET_SIZE, bInterval=0, bRefresh=0, bSynchAddress=0),
+             _Descriptor(bLength=7, bDescriptorType=5, bEndpointAddress=0x02 + 2 * index, bmAttributes=2,
+                         wMaxPacketSize=MAX_PACKET_SIZE, bInterval=0, bRefresh=0, bSynchAddress=0)]
+            for index in range(2)]
+        self.strings = {1: "FTDI", 2: "Dual RS232-HS", 3: serial}
+
+    def reset_stats(self):
+        self.bulk_writes = 0
+        self.bulk_reads = 0
+        self.bytes_out = 0
+        self.bytes_in = 0       # 상태 바이트를 제외한 응답 바이트
+        self.ctrl_transfers = 0
+
+    def stats(self):
+        return {
+            "bulk_writes": self.bulk_writes, "bulk_reads": self.bulk_reads,
+            "bytes_out": self.bytes_out, "bytes_in": self.bytes_in,
+            "ctrl_transfers": self.ctrl_transfers, "elapsed_s": self.clock.now(),
+        }
+
+    @staticmethod
+    def _interface_of(endpoint):
+        return 1 + ((endpoint & 0x0F) - 1) // 2
+
+    def bulk_write(self, endpoint, data):
+        interface = self._interface_of(endpoint)
+        usb = self.usb_timing
+        self.clock.advance(usb.round_trip_s / 2 + len(data) / usb.bytes_per_second)
+        start = max(self._busy_until[interface], self.clock.now())
+        response, bus_time = self.engines[interface].execute(data, start)
+        finished = start + bus_time
+        self._busy_until[interface] = finished
+        if response:
+            self._rx[interface].append((finished, response))
+        self.bulk_writes += 1
+        self.bytes_out += len(data)
+        return len(data)
+
+    def bulk_read(self, endpoint, size):
+        """응답을 512바이트 패킷(각 패킷 앞에 모뎀 상태 2바이트)으로 반환"""
+        interface = self._interface_of(endpoint)
+        queue = self._rx[interface]
+        usb = self.usb_timing
+        self.clock.advance(usb.round_trip_s / 2)
+        if queue and queue[0][0] > self.clock.now():
+            # 호스트의 IN 요청은 FTDI 가 응답을 보낼 때까지 대기
+            self.clock.advance(queue[0][0] - self.clock.now())
+        payload = bytearray()
+        capacity = (size // MAX_PACKET_SIZE) * (MAX_PACKET_SIZE - 2) or (size - 2)
+        while queue and queue[0][0] <= self.clock.now() and len(payload) < capacity:
+            ready, data = queue.pop(0)
+            room = capacity - len(payload)
+            payload += data[:room]
+            if len(data) > room:
+                queue.insert(0, (ready, data[room:]))
+        packets = bytearray()
+        for offset in range(0, len(payload), MAX_PACKET_SIZE - 2):
+            packets += MODEM_STATUS + payload[offset:offset + MAX_PACKET_SIZE - 2]
+        if not packets:
+            packets = bytearray(MODEM_STATUS)
+        self.clock.advance(len(payload) / usb.bytes_per_second)
+        self.bulk_reads += 1
+        self.bytes_in += len(payload)
+        return bytes(packets)
+
+    def control(self, request_type, request, value, index, length_or_data):
+        self.ctrl_transfers += 1
+        interface = index & 0xFF or 1
+        if request_type & 0x80:
+            if request_type == 0x80 and request == 0x06:   # GET_DESCRIPTOR
+                return self._get_descriptor(value, length_or_data)
+            if request == SIO_REQ_POLL_MODEM_STATUS:
+                return MODEM_STATUS
+            if request == SIO_REQ_GET_LATENCY_TIMER:
+                return bytes([self.latency_timer])
+            if request == SIO_REQ_READ_PINS:
+                engine = self.engines.get(interface)
+                return bytes([engine.low_value if engine else 0])
+            if request == SIO_REQ_READ_EEPROM:
+                return b"\xff\xff"
+            return bytes(length_or_data if isinstance(length_or_data, int) else 0)
+        if request == SIO_REQ_SET_LATENCY_TIMER:
+            self.latency_timer = value & 0xFF
+        elif request == SIO_REQ_SET_BITMODE:
+            self.bitmode = value >> 8
+        elif request == SIO_REQ_RESET and value in (0, 1) and interface in self._rx:
+            # 리셋/RX 퍼지: 아직 읽지 않은 응답을 버림
+            self._rx[interface].clear()
+        return b""
+
+    def _get_descriptor(self, value, length):
+        kind, index = value >> 8, value & 0xFF
+        if kind == 3:  # STRING
+            if index == 0:
+                data = bytes((4, 3, 0x09, 0x04))
+            else:
+                text = self.strings.get(index, "").encode("utf-16-le")
+                data = bytes((2 + len(text), 3)) + text
+            return data[:length]
+        return b""
+
+
+class _Handle:
+    def __init__(self, device):
+        self.device = device
+
+
+class VirtualFtdiBackend(usb.backend.IBackend):
+    """가상 FTDI 장치를 열거하는 pyusb 백엔드"""
+
+    def __init__(self):
+        self.devices = []
+
+    def add_device(self, device):
+        self.devices.append(device)
+        return device
+
+    def find(self, index=0):
+        """pyusb Device 객체 반환 (SpiController.configure(device) 용)"""
+        devices = list(usb.core.find(find_all=True, backend=self))
+        return devices[index]
+
+    # ----- IBackend -----
+
+    def enumerate_devices(self):
+        return iter(self.devices)
+
+    def get_device_descriptor(self, dev):
+        return dev.descriptor
+
+    def get_configuration_descriptor(self, dev, config):
+        return dev.config_descriptor
+
+    def get_interface_descriptor(self, dev, intf, alt, config):
+        if alt != 0:
+            # pyusb 는 IndexError 가 날 때까지 대체 설정을 열거
+            raise IndexError(alt)
+        return dev.interface_descriptors[intf]
+
+    def get_endpoint_descriptor(self, dev, ep, intf, alt, config):
+        return dev.endpoint_descriptors[intf][ep]
+
+    def open_device(self, dev):
+        return _Handle(dev)
+
+    def close_device(self, dev_handle):
+        pass
+
+    def set_configuration(self, dev_handle, config_value):
+        pass
+
+    def get_configuration(self, dev_handle):
+        return 1
+
+    def set_interface_altsetting(self, dev_handle, intf, altsetting):
+        pass
+
+    def claim_interface(self, dev_handle, intf):
+        pass
+
+    def release_interface(self, dev_handle, intf):
+        pass
+
+    def bulk_write(self, dev_handle, ep, intf, data, timeout):
+        return dev_handle.device.bulk_write(ep, data)
+
+    def bulk_read(self, dev_handle, ep, intf, buff, timeout):
+        data = dev_handle.device.bulk_read(ep, len(buff))
+        buff[:len(data)] = array.array('B', data)
+        return len(data)
+
+    def ctrl_transfer(self, dev_handle, bmRequestType, bRequest, wValue, wIndex, data, timeout):
+        if bmRequestType & 0x80:
+            result = dev_handle.device.control(bmRequestType, bRequest, wValue, wIndex, len(data))
+            data[:len(result)] = array.array('B', result)
+            return len(result)
+        dev_handle.device.control(bmRequestType, bRequest, wValue, wIndex, bytes(data))
+        return len(data)
+
+    def clear_halt(self, dev_handle, ep):
+        pass
+
+    def reset_device(self, dev_handle):
+        pass
+
+    def is_kernel_driver_active(self, dev_handle, intf):
+        return False
+
+    def detach_kernel_driver(self, dev_handle, intf):
+        pass
+
+    def attach_kernel_driver(self, dev_handle, intf):
+        pass
+
+
+# pyftdi UsbTools 가 모듈 이름으로 백엔드를 불러올 때 사용하는 진입점
+_installed_backend = None
+
+
+def get_backend(find_library=None):
+    return _installed_backend
+
+
+@contextmanager
+def install(backend):
+    """블록 안에서 'ftdi://' URL 이 backend 의 가상 장치로 연결되도록 pyftdi 설정"""
+    global _installed_backend
+    from pyftdi.usbtools import UsbTools
+    saved = UsbTools.BACKENDS
+    _installed_backend = backend
+    UsbTools.BACKENDS = (__name__,)
+    UsbTools.flush_cache()
+    try:
+        yield backend
+    finally:
+        UsbTools.release_all_devices()
+        UsbTools.flush_cache()
+        UsbTools.BACKENDS = saved
+        _installed_backend = None
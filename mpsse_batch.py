@@ -0,0 +1,296 @@
+"""
+여러 SPI 프레임을 MPSSE 명령 하나로 묶어 전송 (USB 왕복 줄이기)
+
+pyftdi SpiPort.exchange() 는 프레임마다 USB 쓰기 1~2회 + 읽기 1회를 수행하므로
+USB 왕복 지연(약 1ms)이 프레임 처리량을 결정합니다. SpiFrameBatch 는 SpiController 가
+프레임마다 만드는 것과 같은 명령(CS 활성 → 전이중 시프트 → CS 비활성)을 여러 프레임만큼
+이어 붙여 write_data 한 번으로 보내고, 응답을 read_data_bytes 한 번으로 받아 프레임별로 나눕니다.
+
+    submit()  : 명령만 전송 (응답은 FTDI 안에서 대기)
+    collect() : 이전에 submit 한 배치의 응답 수신
+submit 을 먼저 여러 번 호출한 뒤 순서대로 collect 하면 다음 배치 전송과
+이전 배치 응답 대기가 겹치는 파이프라이닝이 됩니다.
+
+GPIO (ADBUS4-7): set_gpio() 로 넣은 출력 변경은 프레임 사이에 SET_BITS_LOW 명령으로 들어가
+같은 USB 전송 안에서 MPSSE 가 순서대로 실행하므로, 에지와 프레임 사이 간격이 OS 스케줄러와
+무관하게 명령 실행 시간으로 정해집니다. MpsseSequence 는 이름 붙인 핀과 레지스터 프레임으로
+이런 스트림을 만드는 도구입니다.
+
+지연: delay() 로 넣은 대기는 CS 비활성 상태의 빈 클럭(CLK_BYTES_NO_DATA / CLK_BITS_NO_DATA)으로
+바뀌어 MPSSE 가 SPI 클럭 주기 단위로 기다립니다. 전원 인가 시퀀스의 안정화 대기까지 USB 전송 한 번에
+들어가고, 대기 길이가 호스트 sleep(밀리초 단위, 스케줄러 지연) 대신 클럭 수로 정해집니다.
+배치가 지연으로 끝나면 GET_BITS_LOW 응답 1바이트를 덧붙여, collect() 가 지연이 끝난 뒤 돌아오게 합니다.
+
+    seq = MpsseSequence(port, pins={"reset": 4, "enable": 5, "trigger": 6})
+    seq.set("reset", 0).delay(10e-6).set("reset", 1).delay(0.002)
+    seq.write(0x00, 0x1).set("enable", 1)
+    status = seq.read(0x2B)
+    seq.pulse("trigger", width_s=1e-6)
+    values = seq.run()          # USB 쓰기 1회 + 읽기 1회
+    values[status]
+
+주의: CS/GPIO 마스크는 pyftdi 0.57 SpiController 의 내부 속성(_spi_mask, _gpio_low, _gpio_dir, _cs_bits,
+_frequency, _clock_phase)과 SpiPort 의 _cs_prolog/_cs_epilog 를 사용합니다.
+"""
+
+import math
+import time
+from struct import pack as spack
+
+from pyftdi.ftdi import Ftdi
+
+from register_protocol import spi_write_frame, spi_read_frame, decode_spi_read
+from register_transfer import TransportError
+
+# FT2232H 채널당 RX FIFO (응답 바이트가 이 크기를 넘으면 배치를 나눔)
+RX_FIFO_SIZE = 4096
+# SPI(SCK/MOSI/MISO/CS0 = ADBUS0-3) 가 쓰지 않는 하위 바이트 GPIO
+GPIO_PINS = 0xF0
+# CLK_BYTES_NO_DATA 명령 하나가 보낼 수 있는 최대 바이트 (길이 u16 + 1)
+MAX_IDLE_BYTES = 0x10000
+# 지연이 든 배치의 응답을 기다릴 때 지연 시간에 더하는 여유 (초)
+DELAY_READ_MARGIN_S = 1.0
+
+
+def configure_gpio(port, pins=GPIO_PINS):
+    """pins 를 출력으로 설정 (USB 전송 없음, 다음 SET_BITS_LOW 부터 적용)"""
+    port._controller.set_gpio_direction(pins, pins)
+
+
+class SpiFrameBatch:
+    """SpiPort 에 보낼 전이중 프레임 묶음"""
+
+    def __init__(self, port, max_response_bytes=RX_FIFO_SIZE):
+        self.port = port
+        self.controller = port._controller
+        self.max_response_bytes = max_response_bytes
+        self._items = []      # 프레임(bytes), GPIO 변경 (값, 마스크) 또는 지연 초(float)
+        self._frames = 0
+        self._submitted = []  # submit 후 아직 collect 하지 않은 청크의 (프레임 길이 목록, 지연 초, 펜스 바이트 수)
+
+    def add(self, out):
+        """프레임 추가, 배치 안의 (프레임) 인덱스 반환"""
+        self._items.append(bytes(out))
+        self._frames += 1
+        return self._frames - 1
+
+    def set_gpio(self, value, mask=GPIO_PINS):
+        """GPIO 출력 변경을 배치 순서대로 추가 (앞뒤 프레임과 같은 USB 전송으로 실행)"""
+        missing = mask & ~self.controller._gpio_dir & 0xFF
+        if missing:
+            raise ValueError(f"출력으로 설정되지 않은 GPIO 핀: 0x{missing:02X} (configure_gpio 먼저 호출)")
+        self._items.append((value & mask, mask))
+
+    def delay(self, seconds):
+        """배치 순서대로 대기 추가 (CS 비활성 빈 클럭, SPI 클럭 주기 단위로 올림)"""
+        if seconds < 0:
+            raise ValueError(f"지연은 0 이상이어야 함: {seconds}")
+        if seconds:
+            self._items.append(float(seconds))
+
+    def __len__(self):
+        return self._frames
+
+    def _prepare_clock(self):
+        controller = self.controller
+        cpha = self.port._cpha
+        frequency = self.port._frequency
+        if cpha:
+            # SpiController 와 같은 방식: CPHA 는 3상 클럭으로 구현하므로 주파수 보정
+            frequency = (3 * frequency) // 2
+        if controller._frequency != frequency:
+            controller._ftdi.set_frequency(frequency)
+            controller._frequency = frequency
+        if controller._clock_phase != cpha:
+            controller._ftdi.enable_3phase_clock(cpha)
+            controller._clock_phase = cpha
+
+    def _frame_command(self, out, gpio):
+        controller = self.controller
+        direction = controller.direction & 0xFF
+        command = bytearray()
+        for ctrl in self.port._cs_prolog:
+            command.extend((Ftdi.SET_BITS_LOW, (ctrl & controller._spi_mask) | gpio, direction))
+        opcode = Ftdi.RW_BYTES_NVE_PVE_MSB if self.port._cpol else Ftdi.RW_BYTES_PVE_NVE_MSB
+        command.extend(spack('<BH', opcode, len(out) - 1))
+        command.extend(out)
+        for ctrl in self.port._cs_epilog:
+            command.extend((Ftdi.SET_BITS_LOW, (ctrl & controller._spi_mask) | gpio, direction))
+        command.extend((Ftdi.SET_BITS_LOW, controller._cs_bits | gpio, direction))
+        return command
+
+    def _idle_command(self, seconds):
+        """seconds 동안 빈 클럭 (CPHA 3상 클럭에서도 클럭 주기는 port 주파수 기준)"""
+        cycles = max(1, math.ceil(seconds * self.port._frequency))
+        command = bytearray()
+        count, bits = divmod(cycles, 8)
+        while count:
+            size = min(count, MAX_IDLE_BYTES)
+            command.extend(spack('<BH', Ftdi.CLK_BYTES_NO_DATA, size - 1))
+            count -= size
+        if bits:
+            command.extend((Ftdi.CLK_BITS_NO_DATA, bits - 1))
+        return command
+
+    def _chunks(self, items):
+        """응답 바이트가 max_response_bytes 를 넘지 않도록 항목 나누기 (프레임 앞에서만 나눔)"""
+        chunk, size = [], 0
+        for item in items:
+            if isinstance(item, bytes):
+                if size and size + len(item) > self.max_response_bytes:
+                    yield chunk
+                    chunk, size = [], 0
+                size += len(item)
+            chunk.append(item)
+        if chunk:
+            yield chunk
+
+    def submit(self):
+        """모인 프레임/GPIO 변경을 전송 (RX FIFO 크기 단위로 나눠 쓰기), 다음 배치를 위해 비움"""
+        if not self._items:
+            return 0
+        controller = self.controller
+        if not controller._ftdi.is_connected:
+            raise TransportError("FTDI 컨트롤러가 연결되어 있지 않음")
+        self._prepare_clock()
+        direction = controller.direction & 0xFF
+        gpio = controller._gpio_low
+        for chunk in self._chunks(self._items):
+            command, lengths = bytearray(), []
+            delay_s, trailing_delay = 0.0, False
+            for item in chunk:
+                if isinstance(item, bytes):
+                    command += self._frame_command(item, gpio)
+                    lengths.append(len(item))
+                    trailing_delay = False
+                elif isinstance(item, float):
+                    command += self._idle_command(item)
+                    delay_s += item
+                    trailing_delay = True
+                else:
+                    value, mask = item
+                    gpio = (gpio & ~mask) | value
+                    command.extend((Ftdi.SET_BITS_LOW, controller._cs_bits | gpio, direction))
+            # 지연으로 끝나면 응답 1바이트(GET_BITS_LOW)로 지연이 끝난 시점을 알림
+            fence = 1 if trailing_delay else 0
+            if fence:
+                command.append(Ftdi.GET_BITS_LOW)
+            if lengths or fence:
+                command.append(Ftdi.SEND_IMMEDIATE)
+                self._submitted.append((lengths, delay_s, fence))
+            controller._ftdi.write_data(command)
+        # 이후 pyftdi exchange() 의 CS 명령도 바뀐 GPIO 값을 유지하도록
+        controller._gpio_low = gpio
+        count = self._frames
+        self._items = []
+        self._frames = 0
+        return count
+
+    def collect(self):
+        """가장 먼저 submit 한 배치(청크 하나)의 응답을 프레임별로 반환"""
+        lengths, delay_s, fence = self._submitted.pop(0)
+        ftdi = self.controller._ftdi
+        size = sum(lengths) + fence
+        data = ftdi.read_data_bytes(size, 4)
+        if delay_s:
+            # read_data_bytes 는 빈 응답 몇 번(지연 타이머 단위)이면 포기하므로 지연 길이만큼 더 기다림
+            deadline = time.perf_counter() + delay_s + DELAY_READ_MARGIN_S
+            while len(data) < size and time.perf_counter() < deadline:
+                data += ftdi.read_data_bytes(size - len(data), 4)
+        if len(data) < size:
+            # 늦게 도착할 나머지 바이트가 다음 배치 응답 앞에 붙지 않도록 RX FIFO 를 비우고,
+            # 같은 FIFO 를 쓰는 남은 청크의 응답도 버림
+            ftdi.purge_rx_buffer()
+            self._submitted = []
+            raise TransportError(f"배치 응답이 짧음: {len(data)}/{size}바이트")
+        responses, offset = [], 0
+        for length in lengths:
+            responses.append(bytes(data[offset:offset + length]))
+            offset += length
+        return responses
+
+    @property
+    def pending(self):
+        """collect 하지 않은 청크 수"""
+        return len(self._submitted)
+
+    def exchange(self):
+        """submit + 모든 응답 collect"""
+        self.submit()
+        responses = []
+        while self._submitted:
+            responses.extend(self.collect())
+        return responses
+
+
+def exchange_frames(port, frames, max_response_bytes=RX_FIFO_SIZE):
+    """프레임 목록을 배치로 전이중 교환하고 응답 목록 반환"""
+    batch = SpiFrameBatch(port, max_response_bytes)
+    for out in frames:
+        batch.add(out)
+    return batch.exchange()
+
+
+class MpsseSequence:
+    """이름 붙인 GPIO 핀(ADBUS4-7) 에지와 레지스터 읽기/쓰기를 MPSSE 명령 스트림 하나로 전송"""
+
+    def __init__(self, port, pins=None, max_response_bytes=RX_FIFO_SIZE):
+        self.pins = {}
+        for name, bit in (pins or {}).items():
+            if not (1 << bit) & GPIO_PINS:
+                raise ValueError(f"GPIO 핀은 ADBUS4~7 만 사용 가능: {name}={bit}")
+            self.pins[name] = 1 << bit
+        self.batch = SpiFrameBatch(port, max_response_bytes)
+        self._reads = []    # 배치 프레임 인덱스 (read() 순서)
+        mask = 0
+        for bit in self.pins.values():
+            mask |= bit
+        if mask:
+            configure_gpio(port, mask)
+
+    def _mask(self, name):
+        if name not in self.pins:
+            raise KeyError(f"정의되지 않은 핀: {name}")
+        return self.pins[name]
+
+    def set(self, name, level):
+        mask = self._mask(name)
+        self.batch.set_gpio(mask if level else 0, mask)
+        return self
+
+    def set_many(self, levels):
+        """{핀 이름: 레벨} 을 SET_BITS_LOW 명령 하나로 (동시에 바뀜)"""
+        value = mask = 0
+        for name, level in levels.items():
+            bit = self._mask(name)
+            mask |= bit
+            value |= bit if level else 0
+        self.batch.set_gpio(value, mask)
+        return self
+
+    def pulse(self, name, active=1, width_s=0.0):
+        """active 레벨로 바꿨다가 되돌림 (width_s 가 0 이면 폭은 MPSSE 명령 하나 실행 시간)"""
+        self.set(name, active)
+        if width_s:
+            self.delay(width_s)
+        return self.set(name, not active)
+
+    def delay(self, seconds):
+        """MPSSE 빈 클럭으로 대기 (USB 전송을 나누지 않음)"""
+        self.batch.delay(seconds)
+        return self
+
+    def write(self, addr, value):
+        self.batch.add(spi_write_frame(addr, value))
+        return self
+
+    def read(self, addr):
+        """읽기 추가, run() 결과 목록에서의 위치 반환"""
+        self._reads.append(self.batch.add(spi_read_frame(addr)))
+        return len(self._reads) - 1
+
+    def run(self):
+        """전송 후 read() 순서대로 32비트 값 목록 반환 (다음 run 을 위해 비움)"""
+        responses = self.batch.exchange()
+        reads, self._reads = self._reads, []
+        return [decode_spi_read(responses[index]) for index in reads]
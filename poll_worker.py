@@ -0,0 +1,50 @@
+"""
+poll-until 백그라운드 실행기
+
+register_poll.PollUntil.poll_once() (조건식 레지스터의 배치 읽기 한 번)를 QThread 에서 실행하여
+느린 버스(UART 응답 대기 등)나 다른 스레드가 잡은 포트 잠금을 기다리는 동안에도 GUI 가 멈추지 않게 합니다.
+시도 사이의 대기는 GUI 의 QTimer 가 맡고, 타이머가 step() 을 부르면 작업 스레드가 다음 시도를 실행합니다.
+결과는 시그널로 GUI 스레드에 전달됩니다 (queued connection).
+"""
+
+import queue
+
+from PySide6.QtCore import QThread, Signal
+
+from register_logging import get_logger
+
+transport_log = get_logger("transport")
+
+
+class PollWorker(QThread):
+    """poll-until 시도 실행 스레드"""
+
+    # 다음 시도까지 대기 (초), None 이면 끝남 (task.result 에 결과)
+    stepped = Signal(object)
+    # 오류 메시지
+    failed = Signal(str)
+
+    def __init__(self, task, parent=None):
+        super().__init__(parent)
+        self.task = task
+        self._requests = queue.Queue()
+
+    def step(self):
+        """다음 시도 요청 (스레드 안전)"""
+        self._requests.put(True)
+
+    def cancel(self):
+        """진행 중인 시도가 끝나면 종료 (스레드 안전)"""
+        self._requests.put(False)
+
+    def run(self):
+        while self._requests.get():
+            try:
+                delay = self.task.poll_once()
+            except Exception as e:
+                transport_log.exception("❌ poll-until 읽기 오류: %s", e)
+                self.failed.emit(str(e))
+                return
+            self.stepped.emit(delay)
+            if delay is None:
+                return
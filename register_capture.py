@@ -0,0 +1,256 @@
+"""
+레지스터 샘플 스트리밍 캡처 (메모리 맵 바이너리 파일, Qt 의존성 없음)
+
+장시간 소크 테스트용으로 타임스탬프가 붙은 레지스터 샘플을 추가 전용 파일에 기록합니다.
+파일은 CHUNK_RECORDS 단위로 미리 늘려 메모리 맵으로 쓰므로 샘플마다 시스템 호출이 없고,
+메모리 사용량은 기록 시간과 무관하게 청크 하나 크기로 고정됩니다.
+
+파일 형식 (리틀 엔디언):
+    헤더 HEADER_SIZE 바이트
+        magic "RCAP", version u16, 주소 수 u16, 레코드 크기 u32, 레코드 수 u64,
+        시작 시각 f64 (Unix 초), 레지스터 맵 SHA-256 32바이트 (register_map.RegisterMap.fingerprint)
+        주소 목록 u16 x 주소 수
+    레코드 [t f64 (시작 기준 초), values u32 x 주소 수] 반복
+
+레코드 수는 flush_interval_s 마다, 그리고 close() 때 헤더에 기록됩니다 (비정상 종료 시 마지막 주기분만 손실).
+
+    with CaptureWriter("soak.rcap", [0x01, 0x2B], register_map) as capture:
+        monitor = RegisterMonitor(port, "SPI", capture.addresses, rate_hz=1000, sink=capture)
+    reader = CaptureReader("soak.rcap")
+    reader.timestamps, reader.values            # 복사 없는 NumPy 뷰
+    reader.field("EN.EN_TX", register_map)       # 필요할 때만 필드 디코딩
+
+명령줄:
+    python register_capture.py info soak.rcap [--map Sample_tree.json]
+    python register_capture.py export soak.rcap out.csv [--map Sample_tree.json --fields EN_TX RO_DATA_5]
+"""
+
+import os
+import struct
+import threading
+import time
+
+import numpy as np
+
+from register_logging import get_logger
+
+transport_log = get_logger("transport")
+
+MAGIC = b"RCAP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIQd32s")
+HEADER_SIZE = 1024          # 고정 헤더 영역 (주소 최대 (1024 - HEADER.size) / 2 개)
+COUNT_OFFSET = 12           # 헤더 안 레코드 수(u64) 위치
+CHUNK_RECORDS = 1 << 16
+MAX_ADDRESSES = (HEADER_SIZE - HEADER.size) // 2
+
+
+class CaptureError(ValueError):
+    """캡처 파일 형식 오류"""
+
+
+def record_dtype(width):
+    return np.dtype([("t", "<f8"), ("values", "<u4", (width,))])
+
+
+class CaptureWriter:
+    """추가 전용 메모리 맵 캡처 파일 기록기 (여러 스레드에서 append 가능)"""
+
+    def __init__(self, path, addresses, register_map=None, chunk_records=CHUNK_RECORDS, flush_interval_s=1.0,
+                 started_at=None):
+        self.addresses = list(dict.fromkeys(addresses))
+        if not self.addresses or len(self.addresses) > MAX_ADDRESSES:
+            raise CaptureError(f"주소 수는 1~{MAX_ADDRESSES} 개여야 합니다")
+        self.path = path
+        self.dtype = record_dtype(len(self.addresses))
+        self.chunk_records = int(chunk_records)
+        self.flush_interval_s = flush_interval_s
+        self.count = 0
+        self.started_at = time.time() if started_at is None else started_at
+        self._lock = threading.Lock()
+        self._chunk = None          # 현재 청크 np.memmap
+        self._chunk_start = 0       # 현재 청크의 첫 레코드 번호
+        self._last_flush = time.monotonic()
+        self.closed = False
+
+        fingerprint = register_map.fingerprint() if register_map is not None else bytes(32)
+        header = HEADER.pack(MAGIC, VERSION, len(self.addresses), self.dtype.itemsize, 0,
+                             self.started_at, fingerprint)
+        header += np.asarray(self.addresses, dtype="<u2").tobytes()
+        self._file = open(path, "w+b")
+        self._file.write(header.ljust(HEADER_SIZE, b"\0"))
+        self._file.flush()
+        self._map_chunk(0)
+
+    def _map_chunk(self, start):
+        if self._chunk is not None:
+            self._chunk.flush()
+            del self._chunk
+        self._file.truncate(HEADER_SIZE + (start + self.chunk_records) * self.dtype.itemsize)
+        self._chunk = np.memmap(self._file, dtype=self.dtype, mode="r+",
+                                offset=HEADER_SIZE + start * self.dtype.itemsize, shape=(self.chunk_records,))
+        self._chunk_start = start
+
+    def append(self, timestamp, values):
+        """샘플 하나 기록 (RegisterMonitor sink 인터페이스), 닫힌 뒤에는 무시"""
+        with self._lock:
+            if self.closed:
+                return
+            index = self.count - self._chunk_start
+            if index >= self.chunk_records:
+                self._write_count()
+                self._map_chunk(self.count)
+                index = 0
+            record = self._chunk[index]
+            record["t"] = timestamp
+            record["values"] = values
+            self.count += 1
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_interval_s:
+                self._chunk.flush()
+                self._write_count()
+                self._last_flush = now
+
+    def _write_count(self):
+        """헤더의 레코드 수 갱신 (데이터는 memmap 으로 쓰므로 파일 위치는 쓰지 않음)"""
+        self._file.seek(COUNT_OFFSET)
+        self._file.write(struct.pack("<Q", self.count))
+        self._file.flush()
+
+    def close(self):
+        """남은 청크를 기록하고 파일을 실제 레코드 수 크기로 줄임"""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            self._chunk.flush()
+            del self._chunk
+            self._chunk = None
+            self._write_count()
+            self._file.truncate(HEADER_SIZE + self.count * self.dtype.itemsize)
+            self._file.close()
+        transport_log.info("💾 캡처 저장: %s (%d샘플 x %d개 레지스터)", self.path, self.count, len(self.addresses))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class CaptureReader:
+    """캡처 파일을 복사 없이 NumPy 배열로 열기"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER.size or header[:4] != MAGIC:
+            raise CaptureError(f"캡처 파일이 아님: {path}")
+        _, version, width, record_size, count, self.started_at, self.map_fingerprint = HEADER.unpack_from(header)
+        if version != VERSION:
+            raise CaptureError(f"지원하지 않는 캡처 버전: {version}")
+        self.addresses = np.frombuffer(header, dtype="<u2", count=width, offset=HEADER.size).tolist()
+        self.dtype = record_dtype(width)
+        if record_size != self.dtype.itemsize:
+            raise CaptureError(f"레코드 크기 불일치: {record_size} != {self.dtype.itemsize}")
+        # 기록 중(또는 비정상 종료)인 파일은 헤더의 레코드 수까지만 사용
+        available = (os.path.getsize(path) - HEADER_SIZE) // record_size
+        self.count = min(count, available)
+        if self.count:
+            self.records = np.memmap(path, dtype=self.dtype, mode="r", offset=HEADER_SIZE, shape=(self.count,))
+        else:
+            self.records = np.zeros(0, dtype=self.dtype)
+        self._columns = {addr: index for index, addr in enumerate(self.addresses)}
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def timestamps(self):
+        """시작 기준 초 (뷰)"""
+        return self.records["t"]
+
+    @property
+    def values(self):
+        """[샘플, 주소] 레지스터 값 (뷰)"""
+        return self.records["values"]
+
+    def matches(self, register_map):
+        """캡처가 같은 레지스터 맵으로 기록되었는지 (맵 없이 기록했으면 항상 True)"""
+        return self.map_fingerprint == bytes(32) or self.map_fingerprint == register_map.fingerprint()
+
+    def register(self, addr):
+        """주소 하나의 값 열 (뷰)"""
+        if addr not in self._columns:
+            raise CaptureError(f"캡처에 없는 주소: 0x{addr:02X}")
+        return self.values[:, self._columns[addr]]
+
+    def field(self, target, register_map):
+        """대상(레지스터/필드 이름)의 값 배열 (필드는 이때 디코딩)"""
+        addr, field = register_map.resolve(target)
+        column = self.register(addr)
+        if field is None:
+            return column
+        return (column & np.uint32(field.mask)) >> np.uint32(field.lower_bit)
+
+    def info(self):
+        duration = float(self.timestamps[-1] - self.timestamps[0]) if self.count > 1 else 0.0
+        return {
+            "path": self.path, "samples": self.count, "registers": len(self.addresses),
+            "addresses": [f"0x{addr:02X}" for addr in self.addresses],
+            "started_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started_at)),
+            "duration_s": round(duration, 3),
+            "rate_hz": round((self.count - 1) / duration, 1) if duration > 0 else 0.0,
+        }
+
+
+# ========== 명령줄 ==========
+
+def main(argv=None):
+    import argparse
+    import json
+    parser = argparse.ArgumentParser(description="레지스터 캡처 파일 조회/내보내기")
+    sub = parser.add_subparsers(dest="command", required=True)
+    info = sub.add_parser("info", help="캡처 요약")
+    info.add_argument("capture")
+    info.add_argument("--map", default=None, help="레지스터 맵 (일치 여부 확인)")
+    export = sub.add_parser("export", help="CSV 로 내보내기")
+    export.add_argument("capture")
+    export.add_argument("out")
+    export.add_argument("--map", default=None, help="레지스터 맵 (--fields 사용 시 필요)")
+    export.add_argument("--fields", nargs="+", default=None, help="내보낼 대상 (기본: 모든 레지스터)")
+    args = parser.parse_args(argv)
+
+    reader = CaptureReader(args.capture)
+    register_map = None
+    if args.map:
+        from register_map import RegisterMap
+        register_map = RegisterMap.from_file(args.map)
+        if not reader.matches(register_map):
+            transport_log.warning("⚠️ 캡처를 기록한 레지스터 맵과 다릅니다: %s", args.map)
+
+    if args.command == "info":
+        summary = reader.info()
+        if register_map is not None:
+            summary["map_matches"] = reader.matches(register_map)
+        print(json.dumps(summary, ensure_ascii=False, indent=1))
+        return 0
+
+    if args.fields:
+        if register_map is None:
+            parser.error("--fields 에는 --map 이 필요합니다")
+        columns = [(target, reader.field(target, register_map)) for target in args.fields]
+    else:
+        columns = [(f"0x{addr:02X}", reader.register(addr)) for addr in reader.addresses]
+    with open(args.out, "w", encoding="utf-8", newline="") as f:
+        f.write(",".join(["time_s"] + [name for name, _ in columns]) + "\n")
+        for row, timestamp in enumerate(reader.timestamps):
+            f.write(f"{timestamp:.6f}," + ",".join(str(int(values[row])) for _, values in columns) + "\n")
+    print(f"{reader.count}샘플 → {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
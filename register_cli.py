@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+헤드리스 레지스터 명령줄 도구 (Qt 를 임포트하지 않음)
+
+레지스터 맵(JSON 또는 Excel)을 읽고 SPI / I2C / UART 또는 시뮬레이터에 연결해
+읽기/쓰기/덤프/필드 조회·설정/시퀀스 실행을 수행합니다. 결과는 JSON 또는 CSV 로 출력하므로
+생산 테스트 스크립트에서 그대로 파싱할 수 있습니다.
+서브명령마다 필요한 모듈만 임포트합니다 (pyftdi 는 실제 장치 연결 시, pandas/openpyxl 은 Excel 맵일 때만).
+
+사용법:
+    python register_cli.py --map Sample_tree.json read EN 0x02
+    python register_cli.py --map Sample_tree.json --url ftdi://ftdi:2232h/1 write 0x02 0x1234
+    python register_cli.py --map Sample_tree.json dump --fields --format csv
+    python register_cli.py --map Sample_tree.json field get EN.EN_TX
+    python register_cli.py --map Sample_tree.json field set EN.EN_TX 1
+    python register_cli.py --map Sample_tree.json run Sample_sequence.csv
+    python register_cli.py --map Sample_tree.json profile save golden.json
+    python register_cli.py --map Sample_tree.json profile apply golden.json --verify
+    python register_cli.py --map Sample_tree.json wait "EN_TX == 1" --timeout-ms 500
+    python register_cli.py --map Sample_tree.json monitor EN RO_DATA_5 --rate 5000 --duration-s 2 --out mon.csv
+    python register_cli.py --map Sample_tree.json monitor EN RO_DATA_5 --rate 0 --duration-s 3600 --capture soak.rcap
+    python register_cli.py --map Sample_tree.json sweep --axis TX_SEN13_0=0:0x3FFF:0x100 --read RO_DATA_5 --out sweep.csv
+    python register_cli.py --map Sample_tree.json --journal bringup.rjnl run Sample_sequence.csv
+    python register_cli.py --map Sample_tree.json replay bringup.rjnl --timing original --reads
+    python register_cli.py --map Sample_tree.json --latency station.prom run Sample_sequence.csv
+    python register_cli.py --map Sample_tree.json --trace run.json run Sample_sequence.csv
+
+--url sim (기본값) 은 맵 기본값으로 초기화된 시뮬레이션 디바이스입니다.
+--url tcp://127.0.0.1:5555 처럼 지정하면 장치를 소유한 register_server.py 를 통해 접근합니다.
+--sim-state 파일을 지정하면 시뮬레이터 레지스터 값을 호출 사이에 저장/복원합니다.
+--journal 파일을 지정하면 명령이 보낸 모든 버스 트랜잭션을 트랜잭션 저널(.rjnl)로 기록합니다.
+--latency 파일을 지정하면 전송 단계별 시간 히스토그램을 CSV 또는 Prometheus 텍스트(.prom)로 저장합니다.
+--trace 파일을 지정하면 명령 실행 구간과 전송을 Chrome trace-event JSON 으로 저장합니다 (Perfetto 에서 열기).
+종료 코드: 0 성공, 1 expect/poll/wait 실패 또는 모니터 읽기 오류, 2 사용법/맵/통신 오류
+"""
+
+import json
+import sys
+
+from register_device import RegisterDevice
+from register_map import RegisterMapError, parse_value
+from register_trace import TraceRecorder, span
+from register_transfer import TransportError, transfer_source
+
+PROTOCOLS = ("SPI", "I2C", "UART")
+
+
+# ========== 출력 ==========
+
+def _row(register_map, addr, field, value):
+    row = {"addr": f"0x{addr:02X}", "register": register_map.name_of(addr), "field": field.name if field else "",
+           "bits": f"{field.upper_bit}:{field.lower_bit}" if field else "31:0", "value": value,
+           "hex": f"0x{value:X}" if field else f"0x{value:08X}"}
+    return row
+
+
+def emit(rows, output_format, stream=None):
+    """결과 행을 JSON 또는 CSV 로 출력 (run 의 JSON 출력은 요약 dict)"""
+    stream = stream or sys.stdout
+    if output_format == "csv":
+        import csv
+        if not rows:
+            return
+        writer = csv.DictWriter(stream, fieldnames=list(rows[0]), lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        json.dump(rows, stream, ensure_ascii=False, indent=1)
+        stream.write("\n")
+
+
+# ========== 서브명령 ==========
+
+def cmd_read(args, device):
+    values = device.read_many(args.targets)
+    rows = []
+    for target in args.targets:
+        addr, field = device.register_map.resolve(target)
+        rows.append(_row(device.register_map, addr, field, values[target]))
+    return rows, 0
+
+
+def _write_pairs(device, pairs):
+    """(대상, 값) 목록 쓰기: 필드 대상은 레지스터별로 묶어 읽기 배치 1회 + 쓰기 배치 1회"""
+    device.write_many({target: value for target, value in pairs})
+    rows = []
+    for target, value in pairs:
+        addr, field = device.register_map.resolve(target)
+        rows.append(_row(device.register_map, addr, field, parse_value(value) & 0xFFFFFFFF))
+    return rows, 0
+
+
+def cmd_write(args, device):
+    if len(args.pairs) % 2:
+        raise ValueError("write 인자는 '대상 값' 쌍이어야 합니다")
+    return _write_pairs(device, list(zip(args.pairs[0::2], args.pairs[1::2])))
+
+
+def cmd_dump(args, device):
+    register_map = device.register_map
+    values = device.dump()
+    rows = []
+    for addr in register_map.addresses():
+        rows.append(_row(register_map, addr, None, values[addr]))
+        if args.fields:
+            rows.extend(_row(register_map, addr, field, field.extract(values[addr]))
+                        for field in register_map.fields_of(addr))
+    return rows, 0
+
+
+def cmd_field(args, device):
+    targets = args.targets if args.action == "get" else args.targets[0::2]
+    for target in targets:
+        if device.register_map.resolve(target)[1] is None:
+            raise RegisterMapError(f"필드 대상이 아님: {target} ('레지스터.필드' 또는 필드 이름)")
+    if args.action == "get":
+        return cmd_read(args, device)
+    if len(args.targets) % 2:
+        raise ValueError("field set 인자는 '필드 값' 쌍이어야 합니다")
+    return _write_pairs(device, list(zip(args.targets[0::2], args.targets[1::2])))
+
+
+def cmd_run(args, device):
+    from register_sequence import SequenceEngine, load_sequence
+    steps = load_sequence(args.sequence)
+    engine = SequenceEngine(device.port, device.protocol, device.register_map, stop_on_fail=not args.keep_going,
+                            response_wait=device.response_wait)
+    result = engine.run(steps)
+    rows = []
+    for step_result in result.steps:
+        row = step_result.as_dict()
+        row["addr"] = f"0x{row['addr']:02X}" if row["addr"] is not None else ""
+        rows.append(row)
+    if args.format == "json":
+        summary = result.as_dict()
+        summary["steps"] = rows
+        return summary, 0 if result.ok else 1
+    return rows, 0 if result.ok else 1
+
+
+def cmd_profile(args, device):
+    from register_profile import RegisterProfile, apply_profile, snapshot_profile
+    if args.action == "save":
+        profile = snapshot_profile(device, args.name or "")
+        profile.save(args.path)
+        return [{"path": args.path, "registers": len(profile)}], 0
+    profile = RegisterProfile.load(args.path)
+    result = apply_profile(device, profile, verify=args.verify)
+    return [result.as_dict()], 0 if result.ok else 1
+
+
+def cmd_sweep(args, device):
+    from register_sweep import FieldSweep, check_output
+    check_output(args.out)      # Parquet 엔진이 없으면 측정 전에 종료 코드 2
+    sweep = FieldSweep(device, args.axis, args.read, nested=not args.zip, settle_s=args.settle_ms / 1000.0,
+                       points_per_batch=args.points_per_batch)
+    result = sweep.run()
+    if args.out:
+        summary = result.as_dict()
+        summary["path"] = result.save(args.out)
+        return [summary], 0
+    rows = [dict(zip(["time_s"] + result.columns, [round(float(timestamp), 6)] + [int(value) for value in row]))
+            for timestamp, row in zip(result.timestamps, result.data[:result.completed])]
+    return rows, 0
+
+
+def cmd_wait(args, device):
+    from register_poll import poll_statistics
+    result = device.poll_until(args.expression, args.timeout_ms / 1000.0,
+                               args.min_interval_ms / 1000.0, args.max_interval_ms / 1000.0)
+    row = result.as_dict()
+    if args.stats:
+        row["histogram"] = poll_statistics.as_dict().get(result.expression)
+    if args.format == "csv":
+        row = {key: json.dumps(value) if isinstance(value, dict) else value for key, value in row.items()}
+    return [row], 0 if result.ok else 1
+
+
+def cmd_monitor(args, device):
+    import time
+    from register_monitor import RegisterMonitor
+    addresses = [device.register_map.resolve(target)[0] for target in args.targets]
+    monitor = RegisterMonitor(device.port, device.protocol, addresses, args.rate,
+                              capacity=args.capacity, response_wait=device.response_wait)
+    capture = None
+    if args.capture:
+        from register_capture import CaptureWriter
+        capture = monitor.sink = CaptureWriter(args.capture, monitor.addresses, device.register_map)
+    monitor.start()
+    try:
+        time.sleep(args.duration_s)
+    finally:
+        monitor.stop()
+        if capture is not None:
+            capture.close()
+    stats = monitor.stats()
+    if args.out:
+        timestamps, values = monitor.ring.snapshot()
+        with open(args.out, "w", encoding="utf-8", newline="") as f:
+            f.write(",".join(["time_s"] + [f"0x{addr:02X}" for addr in monitor.addresses]) + "\n")
+            for timestamp, row in zip(timestamps, values):
+                f.write(f"{timestamp:.6f}," + ",".join(f"0x{int(value):08X}" for value in row) + "\n")
+    summary = {key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()}
+    if args.out:
+        summary["path"] = args.out
+    if args.capture:
+        summary["capture"] = args.capture
+    return [summary], 0 if not stats["errors"] else 1
+
+
+def cmd_replay(args, device):
+    from register_journal import TransactionJournal, replay
+    journal = TransactionJournal.load(args.path)
+    if journal.map_fingerprint not in (bytes(32), device.register_map.fingerprint()):
+        print(f"⚠️ 저널을 기록한 레지스터 맵과 다릅니다: {args.map}", file=sys.stderr)
+    addresses = [device.register_map.resolve(target)[0] for target in args.targets] if args.targets else None
+    indices = journal.select(args.start_s, args.end_s, addresses)
+    result = replay(journal, device.port, device.protocol, args.timing, args.reads, indices, args.speed,
+                    response_wait=device.response_wait)
+    row = result.as_dict()
+    if args.format == "json" and result.mismatched:
+        row["mismatches"] = [{"record": index, "addr": f"0x{addr:02X}", "expected": f"0x{expected:08X}",
+                              "actual": f"0x{actual:08X}"} for index, addr, expected, actual in result.mismatched]
+    return [row], 0 if result.ok else 1
+
+
+def build_parser():
+    import argparse
+    parser = argparse.ArgumentParser(prog="register_cli", description="헤드리스 레지스터 도구 (Qt 불필요)")
+    parser.add_argument("--map", required=True, help="레지스터 맵 (.json 또는 Excel)")
+    parser.add_argument("--protocol", default="SPI", type=str.upper, choices=PROTOCOLS)
+    parser.add_argument("--url", default="sim", help="'sim', ftdi:// URL 또는 서버 tcp:// / unix:// (기본 sim)")
+    parser.add_argument("--frequency", type=int, default=None, help="버스 주파수 / 보드레이트")
+    parser.add_argument("--sim-state", default=None, help="시뮬레이터 레지스터 값을 저장/복원할 JSON 파일")
+    parser.add_argument("--format", default="json", choices=("json", "csv"))
+    parser.add_argument("--journal", default=None, help="명령의 모든 버스 트랜잭션을 기록할 저널 파일 (.rjnl)")
+    parser.add_argument("--latency", default=None,
+                        help="전송 단계별 시간 히스토그램을 저장할 파일 (.csv, .prom 이면 Prometheus 텍스트)")
+    parser.add_argument("--trace", default=None, help="명령 실행 구간과 전송을 기록할 Chrome trace JSON 파일")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    read = sub.add_parser("read", help="레지스터/필드 읽기")
+    read.add_argument("targets", nargs="+")
+    read.set_defaults(handler=cmd_read)
+
+    write = sub.add_parser("write", help="레지스터/필드 쓰기 (대상 값 [대상 값 ...])")
+    write.add_argument("pairs", nargs="+")
+    write.set_defaults(handler=cmd_write)
+
+    dump = sub.add_parser("dump", help="맵의 모든 레지스터 읽기")
+    dump.add_argument("--fields", action="store_true", help="필드 값도 출력")
+    dump.set_defaults(handler=cmd_dump)
+
+    field = sub.add_parser("field", help="필드 조회/설정")
+    field.add_argument("action", choices=("get", "set"))
+    field.add_argument("targets", nargs="+", help="get: 필드 ... / set: 필드 값 [필드 값 ...]")
+    field.set_defaults(handler=cmd_field)
+
+    run = sub.add_parser("run", help="시퀀스 파일 실행")
+    run.add_argument("sequence")
+    run.add_argument("--keep-going", action="store_true", help="expect/poll 실패 후에도 계속 실행")
+    run.set_defaults(handler=cmd_run)
+
+    profile = sub.add_parser("profile", help="설정 프로파일 저장(스냅샷)/적용(최소 변경분)")
+    profile.add_argument("action", choices=("save", "apply"))
+    profile.add_argument("path")
+    profile.add_argument("--name", default=None, help="save: 프로파일 이름")
+    profile.add_argument("--verify", action="store_true", help="apply: 같은 배치에서 다시 읽어 검증")
+    profile.set_defaults(handler=cmd_profile)
+
+    sweep = sub.add_parser("sweep", help="필드 스윕 (지점마다 쓰기+읽기 배치)")
+    sweep.add_argument("--axis", action="append", required=True,
+                       help="'대상=시작:끝[:간격]' 또는 '대상=값,값' (여러 번 지정 시 첫 축이 바깥 루프)")
+    sweep.add_argument("--read", nargs="+", default=[], help="지점마다 읽을 대상")
+    sweep.add_argument("--zip", action="store_true", help="축을 중첩하지 않고 함께 진행")
+    sweep.add_argument("--settle-ms", type=float, default=0.0, help="쓰기 후 읽기 전 대기 (ms)")
+    sweep.add_argument("--points-per-batch", type=int, default=1, help="한 배치에 묶을 지점 수")
+    sweep.add_argument("--out", default=None, help="결과 파일 (.csv / .parquet), 없으면 표준 출력")
+    sweep.set_defaults(handler=cmd_sweep)
+
+    wait = sub.add_parser("wait", help="조건식이 참이 될 때까지 대기 (적응형 백오프)")
+    wait.add_argument("expression", help="예: 'EN_TX == 1 and RO_DATA_5 & 0x1'")
+    wait.add_argument("--timeout-ms", type=float, default=1000.0)
+    wait.add_argument("--min-interval-ms", type=float, default=1.0)
+    wait.add_argument("--max-interval-ms", type=float, default=100.0)
+    wait.add_argument("--stats", action="store_true", help="충족 시간 히스토그램 요약 포함")
+    wait.set_defaults(handler=cmd_wait)
+
+    monitor = sub.add_parser("monitor", help="레지스터를 백그라운드에서 주기적으로 배치 읽기")
+    monitor.add_argument("targets", nargs="+")
+    monitor.add_argument("--rate", type=float, default=1000.0, help="목표 샘플/초 (0 = 버스 최대 속도)")
+    monitor.add_argument("--duration-s", type=float, default=1.0)
+    monitor.add_argument("--capacity", type=int, default=1 << 16, help="링 버퍼 샘플 수 (최근 샘플만 유지)")
+    monitor.add_argument("--out", default=None, help="링 버퍼 내용을 저장할 CSV")
+    monitor.add_argument("--capture", default=None, help="모든 샘플을 스트리밍할 메모리 맵 캡처 파일 (.rcap)")
+    monitor.set_defaults(handler=cmd_monitor)
+
+    replay = sub.add_parser("replay", help="트랜잭션 저널을 장치로 재생 (기본: 쓰기만, 배치로 최대 속도)")
+    replay.add_argument("path")
+    replay.add_argument("--targets", nargs="+", default=None, help="재생할 레지스터 (기본: 전체)")
+    replay.add_argument("--timing", default="fast", choices=("fast", "original"),
+                        help="original: 기록된 배치와 간격 유지")
+    replay.add_argument("--speed", type=float, default=1.0, help="original 재생 배속")
+    replay.add_argument("--reads", action="store_true", help="읽기도 재생하고 기록된 값과 비교")
+    replay.add_argument("--start-s", type=float, default=None, help="저널 시작 기준 재생 구간 시작 (초)")
+    replay.add_argument("--end-s", type=float, default=None, help="재생 구간 끝 (초)")
+    replay.set_defaults(handler=cmd_replay)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        device = RegisterDevice.open(args.map, args.url, args.protocol, args.frequency, args.sim_state)
+    except (OSError, ValueError, RegisterMapError) as e:
+        print(f"❌ 연결/맵 오류: {e}", file=sys.stderr)
+        return 2
+    journal = None
+    if args.journal:
+        from register_journal import TransactionJournal
+        journal = TransactionJournal(register_map=device.register_map).attach()
+    latency = None
+    if args.latency:
+        from register_latency import LatencyRecorder
+        latency = LatencyRecorder().attach()
+    trace = None
+    if args.trace:
+        trace = TraceRecorder().start()
+    try:
+        with device, transfer_source(args.command):
+            with span(args.command, "cli"):
+                rows, status = args.handler(args, device)
+    except (ValueError, RegisterMapError, TransportError) as e:
+        print(f"❌ {args.command} 실패: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if journal is not None:
+            journal.detach()
+            journal.save(args.journal)
+        if latency is not None:
+            latency.detach()
+            latency.save(args.latency)
+        if trace is not None:
+            trace.stop().save(args.trace)
+    emit(rows, args.format)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,6 +30,35 @@ class Ui_RegisterTreeViewer(object):
         RegisterTreeViewer.resize(1400, 800)
         self.action_open_excel = QAction(RegisterTreeViewer)
         self.action_open_excel.setObjectName(u"action_open_excel")
+        self.action_run_sequence = QAction(RegisterTreeViewer)
+        self.action_run_sequence.setObjectName(u"action_run_sequence")
+        self.action_save_profile = QAction(RegisterTreeViewer)
+        self.action_save_profile.setObjectName(u"action_save_profile")
+        self.action_apply_profile = QAction(RegisterTreeViewer)
+        self.action_apply_profile.setObjectName(u"action_apply_profile")
+        self.action_poll_until = QAction(RegisterTreeViewer)
+        self.action_poll_until.setObjectName(u"action_poll_until")
+        self.action_record_journal = QAction(RegisterTreeViewer)
+        self.action_record_journal.setObjectName(u"action_record_journal")
+        self.action_record_journal.setCheckable(True)
+        self.action_replay_journal = QAction(RegisterTreeViewer)
+        self.action_replay_journal.setObjectName(u"action_replay_journal")
+        self.action_monitor = QAction(RegisterTreeViewer)
+        self.action_monitor.setObjectName(u"action_monitor")
+        self.action_latency_stats = QAction(RegisterTreeViewer)
+        self.action_latency_stats.setObjectName(u"action_latency_stats")
+        self.action_latency_stats.setCheckable(True)
+        self.action_export_latency = QAction(RegisterTreeViewer)
+        self.action_export_latency.setObjectName(u"action_export_latency")
+        self.action_usb_efficiency = QAction(RegisterTreeViewer)
+        self.action_usb_efficiency.setObjectName(u"action_usb_efficiency")
+        self.action_usb_efficiency.setCheckable(True)
+        self.action_record_trace = QAction(RegisterTreeViewer)
+        self.action_record_trace.setObjectName(u"action_record_trace")
+        self.action_record_trace.setCheckable(True)
+        self.action_sampling_profiler = QAction(RegisterTreeViewer)
+        self.action_sampling_profiler.setObjectName(u"action_sampling_profiler")
+        self.action_sampling_profiler.setCheckable(True)
         self.action_save_json = QAction(RegisterTreeViewer)
         self.action_save_json.setObjectName(u"action_save_json")
         self.action_exit = QAction(RegisterTreeViewer)
@@ -330,11 +359,27 @@ class Ui_RegisterTreeViewer(object):
         self.menu_file.addAction(self.action_open_excel)
         self.menu_file.addAction(self.action_save_json)
         self.menu_file.addSeparator()
+        self.menu_file.addAction(self.action_run_sequence)
+        self.menu_file.addAction(self.action_save_profile)
+        self.menu_file.addAction(self.action_apply_profile)
+        self.menu_file.addAction(self.action_poll_until)
+        self.menu_file.addSeparator()
+        self.menu_file.addAction(self.action_record_journal)
+        self.menu_file.addAction(self.action_replay_journal)
+        self.menu_file.addSeparator()
         self.menu_file.addAction(self.action_exit)
         self.menu_view.addAction(self.action_expand_all)
         self.menu_view.addAction(self.action_collapse_all)
+        self.menu_view.addSeparator()
+        self.menu_view.addAction(self.action_monitor)
+        self.menu_view.addAction(self.action_latency_stats)
+        self.menu_view.addAction(self.action_export_latency)
+        self.menu_view.addAction(self.action_usb_efficiency)
+        self.menu_view.addAction(self.action_record_trace)
         self.menu_help.addAction(self.action_protocol_guide)
         self.menu_help.addSeparator()
+        self.menu_help.addAction(self.action_sampling_profiler)
+        self.menu_help.addSeparator()
         self.menu_help.addAction(self.action_about)
 
         self.retranslateUi(RegisterTreeViewer)
@@ -347,6 +392,42 @@ class Ui_RegisterTreeViewer(object):
         self.action_open_excel.setText(QCoreApplication.translate("RegisterTreeViewer", u"Open Excel File", None))
 #if QT_CONFIG(shortcut)
         self.action_open_excel.setShortcut(QCoreApplication.translate("RegisterTreeViewer", u"Ctrl+O", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_run_sequence.setText(QCoreApplication.translate("RegisterTreeViewer", u"Run Sequence...", None))
+#if QT_CONFIG(shortcut)
+        self.action_run_sequence.setShortcut(QCoreApplication.translate("RegisterTreeViewer", u"Ctrl+R", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_save_profile.setText(QCoreApplication.translate("RegisterTreeViewer", u"Save Profile...", None))
+        self.action_apply_profile.setText(QCoreApplication.translate("RegisterTreeViewer", u"Apply Profile...", None))
+        self.action_poll_until.setText(QCoreApplication.translate("RegisterTreeViewer", u"Poll Until...", None))
+#if QT_CONFIG(shortcut)
+        self.action_poll_until.setShortcut(QCoreApplication.translate("RegisterTreeViewer", u"Ctrl+U", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_record_journal.setText(QCoreApplication.translate("RegisterTreeViewer", u"Record Journal", None))
+#if QT_CONFIG(shortcut)
+        self.action_record_journal.setShortcut(QCoreApplication.translate("RegisterTreeViewer", u"Ctrl+J", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_replay_journal.setText(QCoreApplication.translate("RegisterTreeViewer", u"Replay Journal...", None))
+        self.action_monitor.setText(QCoreApplication.translate("RegisterTreeViewer", u"Register Monitor...", None))
+#if QT_CONFIG(shortcut)
+        self.action_monitor.setShortcut(QCoreApplication.translate("RegisterTreeViewer", u"Ctrl+M", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_latency_stats.setText(QCoreApplication.translate("RegisterTreeViewer", u"Latency Statistics", None))
+#if QT_CONFIG(shortcut)
+        self.action_latency_stats.setShortcut(QCoreApplication.translate("RegisterTreeViewer", u"Ctrl+L", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_export_latency.setText(QCoreApplication.translate("RegisterTreeViewer", u"Export Latency...", None))
+        self.action_usb_efficiency.setText(QCoreApplication.translate("RegisterTreeViewer", u"USB Efficiency", None))
+#if QT_CONFIG(shortcut)
+        self.action_usb_efficiency.setShortcut(QCoreApplication.translate("RegisterTreeViewer", u"Ctrl+B", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_record_trace.setText(QCoreApplication.translate("RegisterTreeViewer", u"Record Trace", None))
+#if QT_CONFIG(shortcut)
+        self.action_record_trace.setShortcut(QCoreApplication.translate("RegisterTreeViewer", u"Ctrl+T", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_sampling_profiler.setText(QCoreApplication.translate("RegisterTreeViewer", u"Sampling Profiler (Stall Diagnosis)", None))
+#if QT_CONFIG(shortcut)
+        self.action_sampling_profiler.setShortcut(QCoreApplication.translate("RegisterTreeViewer", u"Ctrl+Shift+P", None))
 #endif // QT_CONFIG(shortcut)
         self.action_save_json.setText(QCoreApplication.translate("RegisterTreeViewer", u"Save as JSON", None))
 #if QT_CONFIG(shortcut)
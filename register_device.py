@@ -0,0 +1,270 @@
+"""
+레지스터 디바이스 API (Qt 의존성 없음)
+
+레지스터 맵(register_map.RegisterMap)과 포트(pyftdi / pyserial / 시뮬레이션)를 묶어
+이름 기반 읽기/쓰기와 필드 단위 읽기-수정-쓰기를 제공합니다. 생산 테스트 스크립트가 GUI 없이
+바로 사용할 수 있으며, 모든 묶음 연산은 register_transfer.transfer_batch() 로 전송되므로
+pyftdi SPI 에서는 USB 쓰기/읽기 한 번에 처리됩니다.
+
+    with RegisterDevice.open("Sample_tree.json", url="sim") as dev:
+        dev.write("TX PATH_SEL", 0x1234)
+        values = dev.read_many(["EN", "EN.EN_TX", 0x02])
+        dev.update_fields({"EN.EN_TX": 1, "EN.EN_VCM": 1})   # 읽기 배치 1회 + 쓰기 배치 1회
+        with dev.transaction() as tx:                          # 블록을 나갈 때 한 번에 전송
+            tx.write("reset", 1)
+            tx.update_fields({"EN_RX0": 1})
+            tx.delay(0.002)                                    # 안정화 대기 (SPI 는 같은 USB 전송 안에서)
+            status = tx.read("RO_DATA_5")
+        print(status.value)
+
+대상은 주소(정수 또는 "0x02"), 레지스터 이름, "레지스터.필드", 고유한 필드 이름입니다.
+필드 대상을 읽으면 필드 값, 레지스터 대상을 읽으면 32비트 값을 돌려줍니다.
+"""
+
+from register_logging import get_logger
+from register_map import RegisterMap, parse_value
+from register_ports import open_port
+from register_transfer import transfer_batch
+
+transport_log = get_logger("transport")
+
+
+class PendingValue:
+    """트랜잭션 안의 읽기 결과 (commit 후 value 사용 가능)"""
+
+    def __init__(self, target, field):
+        self.target = target
+        self.field = field
+        self.register_value = None
+
+    @property
+    def ready(self):
+        return self.register_value is not None
+
+    @property
+    def value(self):
+        if self.register_value is None:
+            raise RuntimeError(f"트랜잭션이 아직 전송되지 않음: {self.target}")
+        return self.field.extract(self.register_value) if self.field else self.register_value
+
+    def __repr__(self):
+        return f"PendingValue({self.target}={self.value if self.ready else '?'})"
+
+
+class Transaction:
+    """쓰기/필드 수정/읽기를 모아 commit 시 배치로 전송
+
+    필드 수정에 필요한 현재 값은 commit 시작 시 한 번의 읽기 배치로 가져오고
+    (트랜잭션 안에서 먼저 전체 값을 쓴 레지스터는 읽지 않음), 나머지는 큐 순서대로 한 배치로 보냅니다.
+    with 블록에서 예외가 나면 아무것도 전송하지 않고 버립니다.
+    """
+
+    def __init__(self, device):
+        self.device = device
+        self._queue = []        # ("W", 주소, 값) / ("F", 주소, {FieldRef: 값}) / ("R", 주소, PendingValue) / ("D", None, 초)
+        self.committed = False
+
+    def write(self, target, value):
+        addr, field = self.device.register_map.resolve(target)
+        if field is not None:
+            return self.update_fields({target: value})
+        self._queue.append(("W", addr, parse_value(value) & 0xFFFFFFFF))
+        return self
+
+    def update_fields(self, values):
+        """{필드 대상: 값} → 레지스터별로 묶어 읽기-수정-쓰기"""
+        grouped = {}
+        for target, value in values.items():
+            addr, field = self.device.register_map.resolve(target)
+            if field is None:
+                raise ValueError(f"필드 대상이 아님: {target}")
+            grouped.setdefault(addr, []).append((field, parse_value(value)))
+        for addr, fields in grouped.items():
+            self._queue.append(("F", addr, fields))
+        return self
+
+    def read(self, target):
+        addr, field = self.device.register_map.resolve(target)
+        pending = PendingValue(target, field)
+        self._queue.append(("R", addr, pending))
+        return pending
+
+    def delay(self, seconds):
+        """큐 순서대로 대기 (pyftdi SPI 에서는 배치 안의 MPSSE 빈 클럭)"""
+        self._queue.append(("D", None, seconds))
+        return self
+
+    def __len__(self):
+        return len(self._queue)
+
+    def commit(self):
+        """큐의 연산 전송 (최대 읽기 배치 1회 + 연산 배치 1회)"""
+        if self.committed:
+            raise RuntimeError("이미 전송된 트랜잭션")
+        self.committed = True
+        if not self._queue:
+            return
+        device = self.device
+
+        # 1) 필드 수정 대상 중 값을 모르는 레지스터만 미리 읽기
+        known, prefetch = set(), []
+        for kind, addr, _ in self._queue:
+            if kind == "W":
+                known.add(addr)
+            elif kind == "F" and addr not in known and addr not in prefetch:
+                if not (device.trust_shadow and addr in device.shadow):
+                    prefetch.append(addr)
+                known.add(addr)
+        current = dict(device.shadow)
+        if prefetch:
+            current.update(device._transfer([("R", addr) for addr in prefetch], prefetch))
+
+        # 2) 큐 순서대로 쓰기/읽기 배치 구성
+        ops, reads = [], []
+        for kind, addr, arg in self._queue:
+            if kind == "W":
+                current[addr] = arg
+                ops.append(("W", addr, arg))
+            elif kind == "D":
+                ops.append(("D", arg))
+            elif kind == "F":
+                value = current[addr]
+                for field, field_value in arg:
+                    value = field.insert(value, field_value)
+                current[addr] = value
+                ops.append(("W", addr, value))
+            else:
+                ops.append(("R", addr))
+                reads.append((len(ops) - 1, arg))
+        values = device._transfer(ops)
+        for index, pending in reads:
+            pending.register_value = values[index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            transport_log.debug("↩️ 트랜잭션 취소 (%d개 연산 미전송): %s", len(self._queue), exc)
+        return False
+
+
+class RegisterDevice:
+    """레지스터 맵 + 포트
+
+    shadow: {주소: 값} 마지막으로 읽거나 쓴 값
+    trust_shadow: True 이면 필드 수정 시 섀도 값이 있는 레지스터는 다시 읽지 않음
+                  (디바이스가 스스로 값을 바꾸지 않는 경우에만 사용)
+    """
+
+    def __init__(self, port, register_map, protocol="SPI", response_wait=0.0, trust_shadow=False, closer=None):
+        if not isinstance(register_map, RegisterMap):
+            register_map = RegisterMap(register_map)
+        self.port = port
+        self.register_map = register_map
+        self.protocol = protocol
+        self.response_wait = response_wait
+        self.trust_shadow = trust_shadow
+        self.shadow = {}
+        self.batches = 0
+        self.frames = 0
+        self._closer = closer
+
+    @classmethod
+    def open(cls, register_map, url="sim", protocol="SPI", frequency=None, sim_state=None, **options):
+        """맵 파일(또는 RegisterMap)과 URL 로 연결 ('sim' 은 시뮬레이터, register_ports.open_port)"""
+        if not isinstance(register_map, RegisterMap):
+            register_map = RegisterMap.from_file(register_map)
+        port, closer = open_port(protocol, url, register_map, frequency, sim_state)
+        options.setdefault("response_wait", 0.1 if protocol == "UART" and url != "sim" else 0.0)
+        return cls(port, register_map, protocol, closer=closer, **options)
+
+    def close(self):
+        if self._closer is not None:
+            self._closer.close()
+            self._closer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # ----- 전송 -----
+
+    def _transfer(self, ops, keys=None):
+        """배치 전송 후 섀도 갱신, 읽기 값 목록(keys 를 주면 {키: 값}) 반환"""
+        values = transfer_batch(self.port, self.protocol, ops, self.response_wait)
+        self.batches += 1
+        self.frames += sum(op[0] != "D" for op in ops)
+        for op, value in zip(ops, values):
+            if op[0] != "D":
+                self.shadow[op[1]] = op[2] if op[0] == "W" else value
+        if keys is not None:
+            return dict(zip(keys, values))
+        return values
+
+    # ----- 읽기 -----
+
+    def read(self, target):
+        return self.read_many([target])[target]
+
+    def read_many(self, targets):
+        """대상 목록을 한 배치로 읽기 → {대상: 값} (같은 레지스터는 한 번만 읽음)"""
+        resolved = [(target, *self.register_map.resolve(target)) for target in targets]
+        addresses = list(dict.fromkeys(addr for _, addr, _ in resolved))
+        values = self._transfer([("R", addr) for addr in addresses], addresses)
+        return {target: field.extract(values[addr]) if field else values[addr]
+                for target, addr, field in resolved}
+
+    def read_addresses(self, addresses):
+        """주소 목록을 한 배치로 읽기 → {주소: 값}"""
+        addresses = list(dict.fromkeys(addresses))
+        if not addresses:
+            return {}
+        return self._transfer([("R", addr) for addr in addresses], addresses)
+
+    def dump(self):
+        """맵의 모든 레지스터를 한 배치로 읽기 → {주소: 값}"""
+        return self.read_addresses(self.register_map.addresses())
+
+    # ----- 쓰기 -----
+
+    def write(self, target, value):
+        self.write_many({target: value})
+
+    def write_many(self, values):
+        """{대상: 값} 쓰기 (레지스터 대상은 그대로, 필드 대상은 레지스터별로 묶어 읽기-수정-쓰기)"""
+        with self.transaction() as tx:
+            fields = {}
+            for target, value in dict(values).items():
+                if self.register_map.resolve(target)[1] is None:
+                    tx.write(target, value)
+                else:
+                    fields[target] = value
+            if fields:
+                tx.update_fields(fields)
+
+    def update_fields(self, values):
+        """{필드 대상: 값} 읽기-수정-쓰기 (읽기 배치 1회 + 쓰기 배치 1회), {주소: 새 레지스터 값} 반환"""
+        with self.transaction() as tx:
+            tx.update_fields(values)
+        addresses = {self.register_map.resolve(target)[0] for target in values}
+        return {addr: self.shadow[addr] for addr in sorted(addresses)}
+
+    def transaction(self):
+        return Transaction(self)
+
+    # ----- 대기 -----
+
+    def poll_until(self, expression, timeout_s=1.0, min_interval_s=0.001, max_interval_s=0.1, **options):
+        """조건식(예: "EN_TX == 1 and RO_DATA_5 & 0x1")이 참이 될 때까지 배치 읽기 반복 → PollResult
+
+        간격은 min_interval_s 부터 지수적으로 늘어 max_interval_s 까지 (register_poll 참고).
+        """
+        from register_poll import PollCondition, poll_until
+        condition = PollCondition(expression, self.register_map)
+        return poll_until(condition, self.read_addresses, timeout_s, min_interval_s, max_interval_s, **options)
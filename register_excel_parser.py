@@ -0,0 +1,569 @@
+"""
+Excel 레지스터 맵 파서 (Qt 의존성 없음)
+
+GUI 스레드 밖(ExcelLoadWorker)에서도 실행할 수 있도록 컨트롤러에서 분리한 파싱 함수들입니다.
+load_excel() 은 진행 상황 콜백과 threading.Event 기반 취소를 지원합니다.
+pandas / openpyxl 은 임포트 비용이 커서 load_excel() 이 처음 호출될 때 임포트합니다.
+"""
+
+import json
+import re
+
+from register_fields import calculate_register_default_value
+from register_logging import get_logger, DEBUG
+from register_trace import span, traced
+
+parser_log = get_logger("parser")
+
+# load_excel() 첫 호출 시 _import_excel_libs() 가 채움
+pd = None
+load_workbook = None
+
+
+def _import_excel_libs():
+    """pandas / openpyxl 지연 임포트 (앱 시작 시간 단축)"""
+    global pd, load_workbook
+    if pd is None:
+        import pandas
+        from openpyxl import load_workbook as openpyxl_load_workbook
+        pd = pandas
+        load_workbook = openpyxl_load_workbook
+
+
+class ParseCancelled(Exception):
+    """cancel_event 가 설정되어 파싱이 중단되었을 때 발생"""
+
+
+def _check_cancelled(cancel_event):
+    if cancel_event is not None and cancel_event.is_set():
+        raise ParseCancelled()
+
+
+@traced("parser")
+def load_excel(file_path, progress=None, cancel_event=None):
+    """Excel 파일에서 레지스터 정보를 읽어옵니다 (개선된 병합 셀 처리).
+
+    progress(blocks_found, registers_parsed) 는 레지스터 블록("Addr" 행)을 모두 찾은 뒤
+    한 번, 이후 레지스터를 하나 파싱할 때마다 호출됩니다.
+    cancel_event(threading.Event)가 설정되면 다음 검사 지점에서 ParseCancelled 를 발생시킵니다.
+    반환값: {"Sheet1": [레지스터, ...]} 또는 오류 시 None
+    """
+    wb = None
+    try:
+        parser_log.info("📂 Excel 파일 로딩 시작: %s", file_path)
+        debug = parser_log.isEnabledFor(DEBUG)
+        _import_excel_libs()
+
+        # pandas로 데이터 읽기
+        with span("read_excel", "parser"):
+            df = pd.read_excel(file_path, header=None)
+        _check_cancelled(cancel_event)
+
+        # openpyxl로 병합된 셀 정보 읽기
+        with span("load_workbook", "parser"):
+            wb = load_workbook(file_path, read_only=False)
+        sheet = wb.active
+        merged_ranges = sheet.merged_cells.ranges
+        _check_cancelled(cancel_event)
+
+        parser_log.debug("📊 Excel 파일 크기: %s행 x %s열", df.shape[0], df.shape[1])
+        parser_log.debug("🔗 병합된 셀 범위: %s개", len(merged_ranges))
+
+        # 병합된 셀 정보를 딕셔너리로 변환 (더 빠른 검색을 위해)
+        merged_info = {}
+        for merged_range in merged_ranges:
+            min_row, min_col = merged_range.min_row - 1, merged_range.min_col - 1  # 0-based 인덱스
+            max_row, max_col = merged_range.max_row - 1, merged_range.max_col - 1
+            for r in range(min_row, max_row + 1):
+                for c in range(min_col, max_col + 1):
+                    merged_info[(r, c)] = {
+                        'min_row': min_row, 'max_row': max_row,
+                        'min_col': min_col, 'max_col': max_col,
+                        'is_master': (r == min_row and c == min_col)
+                    }
+
+        parser_log.debug("🔧 병합된 셀 정보 인덱스 구축 완료: %s개 셀", len(merged_info))
+
+        # Meaning 테이블들을 찾아서 필드 의미 매핑 생성 (개선된 방법)
+        with span("meaning_tables", "parser"):
+            field_meanings = extract_all_meaning_tables_improved(df, cancel_event)
+
+        parser_log.debug("🔍 레지스터 검색 시작 (전체 DataFrame 스캔)")
+
+        # DataFrame에서 "Addr" 키워드를 찾아 레지스터 블록 시작점 수집
+        blocks = []
+        for row_idx in range(len(df)):
+            _check_cancelled(cancel_event)
+            for col_idx in range(min(5, len(df.columns))):  # 첫 5열만 확인
+                cell_value = df.iat[row_idx, col_idx]
+
+                # 디버깅: 첫 10행의 값들 출력
+                if debug and row_idx <= 10:
+                    parser_log.debug("   Row %s, Col %s: '%s' (type: %s)", row_idx, col_idx, cell_value, type(cell_value))
+
+                if pd.notna(cell_value) and str(cell_value).strip() == "Addr":
+                    parser_log.debug("🎯 레지스터 발견: Row %s, Col %s (Addr 열)", row_idx, col_idx)
+                    blocks.append((row_idx, col_idx))
+                    break  # 이 행에서 Addr을 찾았으면 다음 행으로
+
+        if progress:
+            progress(len(blocks), 0)
+
+        # 레지스터 데이터 파싱 (개선된 방법)
+        data = {"registers": []}
+        register_count = 0
+        for block_idx, (row_idx, addr_col) in enumerate(blocks):
+            _check_cancelled(cancel_event)
+            with span("parse_register", "parser", {"row": row_idx}):
+                register_data = parse_register_at_row_improved(df, row_idx, addr_col, merged_info, field_meanings)
+            if register_data:
+                data["registers"].append(register_data)
+                register_count += 1
+                parser_log.debug("✅ 레지스터 #%s 추가됨", register_count)
+            else:
+                parser_log.error("❌ 레지스터 파싱 실패")
+            if progress:
+                progress(len(blocks), block_idx + 1)
+
+        parser_log.info("📊 총 %s개 레지스터 파싱 완료", register_count)
+
+        # 임시로 샘플 데이터 추가 (파싱이 실패한 경우)
+        if register_count == 0:
+            parser_log.warning("⚠️ 레지스터가 발견되지 않아 샘플 데이터 추가")
+            sample_register = {
+                "address": "0x00",
+                "description": "Sample Register",
+                "fields": [
+                    {
+                        "name": "sample_field",
+                        "bit_range": "15:0",
+                        "upper_bit": 15,
+                        "lower_bit": 0,
+                        "default_value": "0",
+                        "meaning": "Sample field for testing"
+                    }
+                ],
+                "default_value": 0
+            }
+            data["registers"].append(sample_register)
+            parser_log.debug("✅ 샘플 레지스터 추가됨")
+
+        # JSON 파일로 저장
+        json_path = file_path.replace('.xlsx', '_tree.json').replace('.xls', '_tree.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        parser_log.info("✅ JSON 파일 저장 완료: %s", json_path)
+        parser_log.debug("📝 저장된 레지스터 수: %s", len(data['registers']))
+
+        return {"Sheet1": data["registers"]}
+
+    except ParseCancelled:
+        parser_log.info("⏹️ Excel 파일 로딩 취소됨: %s", file_path)
+        raise
+    except Exception as e:
+        parser_log.exception("❌ Excel 파일 로드 중 오류: %s", e)
+        return None
+    finally:
+        # 워크북 닫기
+        if wb is not None:
+            wb.close()
+
+
+def extract_all_meaning_tables_improved(df, cancel_event=None):
+    """모든 Meaning 테이블을 찾아서 필드 의미를 추출합니다 (개선된 방법)."""
+    field_meanings = {}
+
+    # Excel 파일 전체에서 모든 Meaning 열 찾기
+    meaning_positions = []
+    for row_idx in range(len(df)):
+        _check_cancelled(cancel_event)
+        for col_idx in range(len(df.columns)):
+            cell_value = df.iat[row_idx, col_idx]
+            if pd.notna(cell_value) and str(cell_value).strip() == "Meaning":
+                meaning_positions.append((row_idx, col_idx))
+
+    parser_log.debug("🔍 총 %s개의 Meaning 테이블 발견", len(meaning_positions))
+
+    # 각 Meaning 테이블에서 정보 수집
+    for table_idx, (meaning_row, meaning_col) in enumerate(meaning_positions):
+        parser_log.debug("📋 Meaning 테이블 #%s 처리 중 (Row %s, Col %s)", table_idx + 1, meaning_row, meaning_col)
+
+        # Name 열은 보통 Meaning 열보다 4칸 앞에 위치
+        name_col = meaning_col - 4
+        if name_col < 0:
+            continue
+
+        # 해당 테이블의 데이터 행들 처리
+        for data_row_idx in range(meaning_row + 1, len(df)):
+            if data_row_idx >= len(df):
+                break
+
+            data_row = df.iloc[data_row_idx]
+
+            # Name과 Meaning 값 가져오기
+            name_val = data_row.iloc[name_col] if name_col < len(data_row) else None
+            meaning_val = data_row.iloc[meaning_col] if meaning_col < len(data_row) else None
+
+            # 유효한 데이터인지 확인
+            if pd.notna(name_val) and pd.notna(meaning_val):
+                name_str = str(name_val).strip()
+                meaning_str = str(meaning_val).strip()
+
+                # "Name" 헤더가 다시 나오면 다음 테이블 시작이므로 중단
+                if name_str == "Name":
+                    break
+
+                if name_str and meaning_str and meaning_str != "nan":
+                    field_meanings[name_str] = meaning_str
+                    parser_log.debug("   📝 필드 의미: %s = %s", name_str, meaning_str)
+
+            # 빈 행이 연속으로 나오면 테이블 끝
+            elif pd.isna(name_val) and pd.isna(meaning_val):
+                # 다음 몇 행도 확인해서 정말 끝인지 체크
+                empty_count = 0
+                for check_row in range(data_row_idx, min(data_row_idx + 3, len(df))):
+                    check_data = df.iloc[check_row]
+                    if pd.isna(check_data.iloc[name_col]) and pd.isna(check_data.iloc[meaning_col]):
+                        empty_count += 1
+                if empty_count >= 2:  # 2행 이상 비어있으면 테이블 끝
+                    break
+
+    return field_meanings
+
+
+def _bit_number_at(df, bit_row, col, addr_col):
+    """Bit 행의 해당 열 비트 번호 (숫자가 아니면 열 위치 기준: 주소 다음 열이 비트 15)"""
+    cell = df.iat[bit_row, col] if col < len(df.columns) else None
+    try:
+        return int(cell)
+    except (TypeError, ValueError):
+        return 15 - (col - addr_col - 1)
+
+
+def parse_register_at_row_improved(df, register_row, addr_col, merged_info, field_meanings):
+    """특정 행에서 레지스터 정보를 파싱합니다 (개선된 병합 셀 처리)."""
+    try:
+        # 주소 값과 레지스터 이름 읽기
+        addr_value = df.iat[register_row, addr_col + 1] if addr_col + 1 < len(df.columns) else None
+        reg_name = df.iat[register_row, addr_col + 2] if addr_col + 2 < len(df.columns) else None
+
+        if pd.isna(addr_value):
+            return None
+
+        address = str(addr_value).strip()
+        description = str(reg_name).strip() if pd.notna(reg_name) else ""
+
+        parser_log.debug("   📍 주소: %s, 설명: %s", address, description)
+
+        # Bit, Name, Default 행 찾기
+        bit_row = register_row + 1
+        name_row = register_row + 2  
+        default_row = register_row + 3
+
+        parser_log.debug("   📋 Bit행: %s, Name행: %s, Default행: %s", bit_row, name_row, default_row)
+
+        # 필드들 파싱 (addr_col+1부터 시작 - 비트 번호들)
+        fields = []
+        processed_merged_fields = set()  # 이미 처리된 병합 필드 추적
+
+        # 비트 15부터 0까지 순서대로 처리 (Excel에서 왼쪽부터 오른쪽으로)
+        for bit_col in range(addr_col + 1, min(addr_col + 17, len(df.columns))):  # 16비트까지
+            if bit_row >= len(df) or name_row >= len(df) or default_row >= len(df):
+                break
+
+            # 비트 번호 가져오기
+            bit_num_cell = df.iat[bit_row, bit_col] if bit_col < len(df.columns) else None
+            name_cell = df.iat[name_row, bit_col] if bit_col < len(df.columns) else None
+            default_cell = df.iat[default_row, bit_col] if bit_col < len(df.columns) else None
+
+            if pd.isna(bit_num_cell):
+                continue
+
+            try:
+                bit_num = int(bit_num_cell)
+            except:
+                continue
+
+            # Name 셀 처리 (병합된 셀 고려)
+            field_name = ""
+            if pd.notna(name_cell):
+                field_name = str(name_cell).strip()
+
+            # 필드명 정리 (더 나은 처리)
+            clean_name = ""
+            if field_name and field_name not in ["nan", ""]:
+                # Verilog 스타일의 1'b0, 1'b1 처리
+                if field_name.startswith("1'b"):
+                    # 1'b0 -> BIT0, 1'b1 -> BIT1 등으로 변환
+                    bit_value = field_name.replace("1'b", "")
+                    clean_name = f"BIT{bit_value}"
+                else:
+                    # 일반적인 필드명 정리
+                    clean_name = field_name.replace("<", "").replace(">", "").replace(":", "_").replace(" ", "_")
+                    clean_name = clean_name.replace("'", "").replace("(", "").replace(")", "")
+
+                # 빈 문자열이나 숫자만 있는 경우 비트 위치 기반 이름 생성
+                if not clean_name or clean_name.isdigit():
+                    clean_name = f"BIT_{bit_num}"
+
+            # 병합된 셀인지 확인
+            merge_info = merged_info.get((name_row, bit_col))
+            if merge_info:
+                # 이미 처리된 병합 필드인지 확인
+                merge_key = (merge_info['min_row'], merge_info['min_col'], merge_info['max_row'], merge_info['max_col'])
+                if merge_key in processed_merged_fields:
+                    continue  # 이미 처리된 병합 필드는 스킵
+                processed_merged_fields.add(merge_key)
+
+                # 병합 범위 계산 (양 끝 열의 Bit 행 값, 없으면 열 위치 기준 비트 번호)
+                upper_bit = _bit_number_at(df, bit_row, merge_info['min_col'], addr_col)
+                lower_bit = _bit_number_at(df, bit_row, merge_info['max_col'], addr_col)
+
+                # upper가 lower보다 작으면 바꿔줌
+                if upper_bit < lower_bit:
+                    upper_bit, lower_bit = lower_bit, upper_bit
+
+                # 병합된 셀의 시작점에서 이름 가져오기
+                master_name = df.iat[merge_info['min_row'], merge_info['min_col']]
+                if pd.notna(master_name):
+                    field_name = str(master_name).strip()
+                    # 동일한 필드명 정리 로직 적용
+                    if field_name.startswith("1'b"):
+                        bit_value = field_name.replace("1'b", "")
+                        clean_name = f"BIT{bit_value}"
+                    else:
+                        clean_name = field_name.replace("<", "").replace(">", "").replace(":", "_").replace(" ", "_")
+                        clean_name = clean_name.replace("'", "").replace("(", "").replace(")", "")
+
+                    if not clean_name or clean_name.isdigit():
+                        # 병합된 필드의 경우 범위 기반 이름 생성
+                        bit_range_name = f"{upper_bit}_{lower_bit}" if upper_bit != lower_bit else str(upper_bit)
+                        clean_name = f"FIELD_{bit_range_name}"
+
+            else:
+                # 단일 비트
+                upper_bit = lower_bit = bit_num
+
+            # Default 값 처리 (병합된 셀도 비트별로 계산)
+            default_val = 0
+            if merge_info:
+                # 병합된 셀의 경우 각 비트별로 Default 값을 읽어서 계산
+                bit_count = upper_bit - lower_bit + 1
+                calculated_default = 0
+
+                parser_log.debug("      🔍 병합된 필드 '%s' [%s:%s] - %s비트 개별 계산", clean_name, upper_bit, lower_bit, bit_count)
+
+                for bit_pos in range(lower_bit, upper_bit + 1):
+                    # 해당 비트 위치의 열 계산
+                    bit_col_pos = addr_col + 1 + (15 - bit_pos)
+                    if bit_col_pos < len(df.columns) and default_row < len(df):
+                        bit_default_cell = df.iat[default_row, bit_col_pos]
+                        if pd.notna(bit_default_cell):
+                            try:
+                                bit_default_val = int(bit_default_cell)
+                                if bit_default_val != 0:
+                                    # 해당 비트 위치에 값 설정
+                                    bit_offset = bit_pos - lower_bit
+                                    calculated_default |= (bit_default_val << bit_offset)
+                                    parser_log.debug("        🔸 비트 %s: %s -> 오프셋 %s", bit_pos, bit_default_val, bit_offset)
+                            except:
+                                pass
+
+                default_val = calculated_default
+                parser_log.debug("      ✅ 병합된 필드 '%s' 계산된 Default: %s (0x%X)", clean_name, default_val, default_val)
+            else:
+                # 단일 비트의 경우
+                if pd.notna(default_cell):
+                    try:
+                        default_val = int(default_cell)
+                    except:
+                        default_val = 0
+                parser_log.debug("      🔸 단일 비트 '%s' Default: %s", clean_name, default_val)
+
+            # 필드명이 있는 경우만 추가
+            if field_name and field_name not in ["nan", ""] and clean_name:
+                # 같은 이름의 필드가 이미 있는지 확인
+                existing_field = None
+                for field in fields:
+                    if field["name"] == clean_name:
+                        existing_field = field
+                        break
+
+                if existing_field is None:
+                    # 의미 정보 가져오기
+                    field_meaning = field_meanings.get(field_name, f"{field_name} bits {upper_bit}:{lower_bit}" if upper_bit != lower_bit else f"{field_name} bit {upper_bit}")
+
+                    # 비트 범위 문자열 생성
+                    if upper_bit == lower_bit:
+                        bit_range_str = str(upper_bit)
+                    else:
+                        bit_range_str = f"{upper_bit}:{lower_bit}"
+
+                    field_data = {
+                        "name": clean_name,
+                        "bit_range": bit_range_str,
+                        "upper_bit": upper_bit,
+                        "lower_bit": lower_bit,
+                        "default_value": str(default_val),
+                        "meaning": field_meaning
+                    }
+
+                    fields.append(field_data)
+                    parser_log.debug("     🔹 필드: %s = bit %s:%s, 기본값: %s, 의미: %s", clean_name, upper_bit, lower_bit, default_val, field_meaning)
+
+        if not fields:
+            parser_log.warning("   ⚠️ 필드가 발견되지 않음")
+            return None
+
+        # 레지스터 기본값 계산
+        default_value = calculate_register_default_value(fields)
+
+        register_data = {
+            "address": address,
+            "description": description,
+            "fields": fields,
+            "default_value": default_value
+        }
+
+        parser_log.debug("   ✅ 레지스터 파싱 완료: %s개 필드, 기본값: %s", len(fields), default_value)
+        return register_data
+
+    except Exception as e:
+        parser_log.exception("   ❌ 레지스터 파싱 중 오류: %s", e)
+        return None
+
+
+def group_consecutive_fields(bit_info):
+    """연속된 같은 이름의 필드들을 그룹화합니다."""
+    if not bit_info:
+        return []
+
+    groups = []
+
+    # 비트 번호 순으로 정렬 (내림차순 - MSB부터)
+    sorted_bits = sorted(bit_info, key=lambda x: x['bit'], reverse=True)
+
+    # 이름이 있는 비트와 없는 비트를 구분
+    named_bits = [bit for bit in sorted_bits if bit['name'] is not None]
+    unnamed_bits = [bit for bit in sorted_bits if bit['name'] is None]
+
+    # 이름이 있는 필드들을 처리
+    for bit_data in named_bits:
+        bit_num = bit_data['bit']
+        field_name = str(bit_data['name']).strip()
+
+        # 이미 처리된 비트는 건너뛰기
+        if any(bit_num in group.get('bits', []) for group in groups):
+            continue
+
+        # 필드 이름에서 비트 범위 정보 추출 (예: TX_SEN<13:0>, RX0_SEN<15:0>)
+        extracted_range = extract_bit_range_from_name(field_name)
+
+        if extracted_range:
+            # 이름에 비트 범위가 명시된 경우
+            upper_bit, lower_bit = extracted_range
+            clean_name = clean_field_name(field_name)
+
+            groups.append({
+                'name': clean_name,
+                'max_bit': upper_bit,
+                'min_bit': lower_bit,
+                'default': bit_data['default'],
+                'bits': list(range(upper_bit, lower_bit - 1, -1))
+            })
+            parser_log.debug("      🔍 범위 추출: %s -> %s = %s:%s", field_name, clean_name, upper_bit, lower_bit)
+
+        else:
+            # 일반적인 필드 처리
+            same_name_bits = [b for b in named_bits if str(b['name']).strip() == field_name]
+
+            if len(same_name_bits) == 1:
+                # 단일 이름의 필드
+                if len(unnamed_bits) >= 15 and bit_num == 15:
+                    # 15번 비트에 이름이 있고 나머지가 모두 unnamed이면 전체 필드로 간주 (reset 케이스)
+                    groups.append({
+                        'name': field_name,
+                        'max_bit': 15,
+                        'min_bit': 0,
+                        'default': bit_data['default'],
+                        'bits': list(range(15, -1, -1))
+                    })
+                else:
+                    # 일반 단일 비트 필드
+                    groups.append({
+                        'name': field_name,
+                        'max_bit': bit_num,
+                        'min_bit': bit_num,
+                        'default': bit_data['default'],
+                        'bits': [bit_num]
+                    })
+            else:
+                # 같은 이름의 여러 비트들을 연속 그룹으로 처리
+                consecutive_groups = find_consecutive_groups(same_name_bits)
+                for group_bits in consecutive_groups:
+                    bit_numbers = [b['bit'] for b in group_bits]
+                    groups.append({
+                        'name': field_name,
+                        'max_bit': max(bit_numbers),
+                        'min_bit': min(bit_numbers),
+                        'default': group_bits[0]['default'],
+                        'bits': sorted(bit_numbers, reverse=True)
+                    })
+
+    return groups
+
+
+def extract_bit_range_from_name(field_name):
+    """필드 이름에서 비트 범위를 추출합니다. 예: TX_SEN<13:0> -> (13, 0)"""
+    # <숫자:숫자> 패턴 찾기
+    pattern = r'<(\d+):(\d+)>'
+    match = re.search(pattern, field_name)
+    if match:
+        upper = int(match.group(1))
+        lower = int(match.group(2))
+        return (upper, lower)
+
+    # <숫자> 패턴 찾기 (단일 비트)
+    pattern = r'<(\d+)>'
+    match = re.search(pattern, field_name)
+    if match:
+        bit_num = int(match.group(1))
+        return (bit_num, bit_num)
+
+    return None
+
+
+def clean_field_name(field_name):
+    """필드 이름에서 비트 범위 표기를 제거합니다. 예: TX_SEN<13:0> -> TX_SEN"""
+    # <...> 부분 제거
+    cleaned = re.sub(r'<[^>]+>', '', field_name)
+    return cleaned.strip()
+
+
+def find_consecutive_groups(bits):
+    """같은 이름의 비트들을 연속된 그룹들로 나눕니다."""
+    if not bits:
+        return []
+
+    # 비트 번호로 정렬
+    sorted_bits = sorted(bits, key=lambda x: x['bit'], reverse=True)
+
+    groups = []
+    current_group = [sorted_bits[0]]
+
+    for i in range(1, len(sorted_bits)):
+        current_bit = sorted_bits[i]['bit']
+        prev_bit = sorted_bits[i-1]['bit']
+
+        if prev_bit - current_bit == 1:
+            # 연속된 비트
+            current_group.append(sorted_bits[i])
+        else:
+            # 연속되지 않음 - 새 그룹 시작
+            groups.append(current_group)
+            current_group = [sorted_bits[i]]
+
+    # 마지막 그룹 추가
+    groups.append(current_group)
+
+    return groups
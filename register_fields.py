@@ -0,0 +1,100 @@
+"""
+레지스터 필드 비트 연산 공용 함수 (Qt 의존성 없음)
+
+비트 범위 문자열 파싱, 필드 값 추출/삽입, 필드 기본값으로부터 레지스터 값 계산을
+GUI 컨트롤러와 Excel 파서가 함께 사용합니다.
+"""
+
+from register_logging import get_logger
+
+parser_log = get_logger("parser")
+
+
+def parse_bit_range(bit_range_str):
+    """비트 범위 문자열을 파싱하여 (upper_bit, lower_bit) 튜플 반환"""
+    try:
+        bit_range_str = str(bit_range_str).strip()
+        if ':' in bit_range_str:
+            parts = bit_range_str.split(':')
+            upper_bit = int(parts[0])
+            lower_bit = int(parts[1])
+        else:
+            # 단일 비트인 경우
+            upper_bit = lower_bit = int(bit_range_str)
+        return upper_bit, lower_bit
+    except (ValueError, AttributeError) as e:
+        parser_log.warning("⚠️ 비트 범위 파싱 오류 (%s): %s", bit_range_str, e)
+        return 0, 0
+
+
+def extract_field_value_from_register(register_value, upper_bit, lower_bit):
+    """레지스터 값에서 특정 비트 범위의 필드 값을 추출"""
+    if upper_bit >= lower_bit and upper_bit <= 31 and lower_bit >= 0:
+        mask = ((1 << (upper_bit - lower_bit + 1)) - 1) << lower_bit
+        field_value = (register_value & mask) >> lower_bit
+        return field_value
+    return 0
+
+
+def insert_field_value_to_register(register_value, field_value, upper_bit, lower_bit):
+    """레지스터 값의 특정 비트 범위에 필드 값을 삽입"""
+    if upper_bit >= lower_bit and upper_bit <= 31 and lower_bit >= 0:
+        # 기존 해당 비트 범위를 0으로 클리어
+        mask = ((1 << (upper_bit - lower_bit + 1)) - 1) << lower_bit
+        register_value &= ~mask
+
+        # 새로운 필드 값을 해당 위치에 삽입
+        field_mask = (1 << (upper_bit - lower_bit + 1)) - 1
+        shifted_value = (field_value & field_mask) << lower_bit
+        register_value |= shifted_value
+
+        return register_value & 0xFFFFFFFF  # 32비트 마스크
+    return register_value
+
+
+def calculate_register_value_from_fields(fields):
+    """필드들의 값으로부터 전체 레지스터 값을 계산"""
+    total_value = 0
+
+    for field in fields:
+        try:
+            # 기본값 파싱
+            default_str = str(field.get('default_value', '0')).strip()
+            if default_str.startswith('0x') or default_str.startswith('0X'):
+                field_value = int(default_str, 16)
+            else:
+                field_value = int(default_str)
+
+            # 비트 범위 파싱
+            bit_range = field.get('bit_range', '0')
+            upper_bit, lower_bit = parse_bit_range(bit_range)
+
+            # 비트 범위가 설정되지 않았으면 기존 방식으로 가져오기
+            if upper_bit == 0 and lower_bit == 0:
+                upper_bit = field.get('upper_bit', 0)
+                lower_bit = field.get('lower_bit', 0)
+
+            # 필드 값이 0이 아닌 경우에만 레지스터에 값 설정
+            if field_value != 0:
+                total_value = insert_field_value_to_register(
+                    total_value, field_value, upper_bit, lower_bit
+                )
+                parser_log.debug("    🔸 필드 '%s': 값=%s, 비트=%s:%s", field.get('name', 'unknown'), field_value, upper_bit, lower_bit)
+            else:
+                parser_log.debug("    🔸 필드 '%s': 값=%s (0이므로 스킵)", field.get('name', 'unknown'), field_value)
+
+        except Exception as e:
+            parser_log.error("    ❌ 필드 처리 오류 '%s': %s", field.get('name', 'unknown'), e)
+            continue
+
+    final_value = total_value & 0xFFFFFFFF  # 32비트 마스크
+    return final_value
+
+
+def calculate_register_default_value(fields):
+    """필드들의 기본값으로부터 전체 레지스터 기본값을 계산합니다."""
+    parser_log.debug("  📊 레지스터 기본값 계산 시작 (필드 수: %s)", len(fields))
+
+    final_value = calculate_register_value_from_fields(fields)
+    parser_log.debug("  📊 최종 레지스터 기본값: 0x%08X (%s)", final_value, final_value)
+    return final_value
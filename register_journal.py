@@ -0,0 +1,323 @@
+"""
+트랜잭션 저널과 재생 (Qt 의존성 없음)
+
+모든 버스 트랜잭션(방향, 프로토콜, 주소, 데이터, 시각, 소요 시간, 출처, 상태)을 레코드당 27바이트의
+NumPy 구조체 배열로 기록합니다. register_transfer 의 전송 관찰자로 붙으므로 GUI / 시퀀스 / 프로파일 /
+모니터 등 어디서 보낸 전송이든 기록되고, 출처는 register_transfer.transfer_source() 로 붙은 이름입니다.
+짧은 응답 등으로 실패한 배치도 버스에 나간 연산까지 status=FAILED 로 기록합니다 (MPSSE 배치는 읽기가
+실패해도 쓰기는 이미 클럭되어 나갔으므로 현장 고장 재현에 필요). 실패한 읽기의 값은 0 입니다.
+
+    journal = TransactionJournal().attach()
+    ...                                            # 평소처럼 전송
+    journal.detach()
+    journal.save("field_failure.rjnl")
+
+    journal = TransactionJournal.load("field_failure.rjnl")
+    journal.for_address(0x01)                      # 주소 색인 (레코드 번호)
+    journal.between(1.5, 2.0)                      # 시간 색인 (레코드 범위)
+    replay(journal, port, "SPI")                   # 쓰기를 배치로 최대 속도 재생
+    replay(journal, port, "SPI", timing="original", include_reads=True)   # 원래 간격 + 읽기 비교
+
+파일 형식 (리틀 엔디언): 헤더 HEADER_SIZE 바이트
+    magic "RJNL", version u16, 예약 u16, 시작 시각 f64 (Unix 초), 레코드 수 u64,
+    출처 목록 위치 u64, 레지스터 맵 SHA-256 32바이트
+뒤이어 레코드 배열, 마지막에 출처 이름 목록 (JSON, 레코드의 source 는 이 목록의 번호)
+버전 1 파일(status 열 없음, 26바이트 레코드)도 읽을 수 있으며 모든 레코드를 OK 로 봅니다.
+"""
+
+import json
+import struct
+import threading
+import time
+
+import numpy as np
+
+from register_logging import get_logger
+from register_transfer import (
+    PROTOCOLS, add_transfer_observer, remove_transfer_observer, transfer_batch, transfer_source,
+)
+
+transport_log = get_logger("transport")
+
+MAGIC = b"RJNL"
+VERSION = 2
+HEADER = struct.Struct("<4sHHdQQ32s")
+HEADER_SIZE = 128
+
+RECORD = np.dtype([
+    ("t", "<f8"),           # 저널 시작 기준 초
+    ("duration", "<f4"),    # 트랜잭션(배치) 소요 초
+    ("batch", "<u4"),       # 같은 전송에 들어 있던 레코드는 같은 번호
+    ("value", "<u4"),       # 쓴 값 / 읽은 값 / 지연 마이크로초
+    ("addr", "<u2"),        # 지연은 0
+    ("source", "<u2"),      # 출처 이름 번호 (sources)
+    ("protocol", "u1"),     # PROTOCOLS 순서 (SPI=0, I2C=1, UART=2)
+    ("direction", "u1"),    # 0 = 쓰기, 1 = 읽기, 2 = 지연 (transfer_batch 의 ("D", 초))
+    ("status", "u1"),       # 0 = OK, 1 = 실패한 전송에 들어 있던 연산
+])
+RECORD_V1 = np.dtype([(name, RECORD.fields[name][0]) for name in RECORD.names if name != "status"])
+WRITE, READ, DELAY = 0, 1, 2
+OK, FAILED = 0, 1
+_DIRECTIONS = {"W": WRITE, "R": READ, "D": DELAY}
+DEFAULT_REPLAY_BATCH = 256
+
+
+class JournalError(ValueError):
+    """저널 파일 형식 오류"""
+
+
+class TransactionJournal:
+    """버스 트랜잭션 기록 (메모리, 필요할 때 파일로 저장)"""
+
+    def __init__(self, capacity=4096, register_map=None):
+        self.records = np.zeros(capacity, dtype=RECORD)
+        self.count = 0
+        self.batches = 0
+        self.sources = [""]
+        self.started_at = time.time()
+        self.map_fingerprint = register_map.fingerprint() if register_map is not None else bytes(32)
+        self._source_ids = {"": 0}
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self._address_index = None      # {주소: 레코드 번호 배열} (기록이 늘면 다시 만듦)
+
+    # ----- 기록 -----
+
+    def attach(self):
+        """전송 관찰자로 등록 (이후 모든 전송을 기록)"""
+        add_transfer_observer(self.record)
+        return self
+
+    def detach(self):
+        remove_transfer_observer(self.record)
+        return self
+
+    def __enter__(self):
+        return self.attach()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.detach()
+        return False
+
+    def record(self, protocol, ops, values, started, duration, source, error=None):
+        """전송 관찰자: 배치 하나를 레코드로 추가 (error 가 있으면 보낸 연산을 FAILED 로)"""
+        with self._lock:
+            needed = self.count + len(ops)
+            if needed > len(self.records):
+                grown = np.zeros(max(needed, len(self.records) * 2), dtype=RECORD)
+                grown[:self.count] = self.records[:self.count]
+                self.records = grown
+            source_id = self._source_ids.get(source)
+            if source_id is None:
+                source_id = self._source_ids[source] = len(self.sources)
+                self.sources.append(source)
+            rows = self.records[self.count:needed]
+            rows["t"] = started - self._t0
+            rows["duration"] = duration
+            rows["batch"] = self.batches
+            rows["source"] = source_id
+            rows["protocol"] = PROTOCOLS.index(protocol) if protocol in PROTOCOLS else 255
+            rows["addr"] = [0 if op[0] == "D" else op[1] for op in ops]
+            rows["direction"] = [_DIRECTIONS[op[0]] for op in ops]
+            rows["value"] = [_record_value(op, value) for op, value in zip(ops, values)]
+            rows["status"] = OK if error is None else FAILED
+            self.count = needed
+            self.batches += 1
+            self._address_index = None
+
+    # ----- 조회 / 색인 -----
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def view(self):
+        """기록된 레코드 (뷰)"""
+        return self.records[:self.count]
+
+    def for_address(self, addr):
+        """주소의 레코드 번호 (시간순, 지연 레코드 제외)"""
+        with self._lock:
+            if self._address_index is None:
+                view = self.records[:self.count]
+                rows = np.flatnonzero(view["direction"] != DELAY)
+                order = rows[np.argsort(view["addr"][rows], kind="stable")]
+                addresses, starts = np.unique(view["addr"][order], return_index=True)
+                bounds = list(starts[1:]) + [len(order)]
+                self._address_index = {int(a): order[s:e] for a, s, e in zip(addresses, starts, bounds)}
+            return self._address_index.get(addr, np.zeros(0, dtype=np.int64))
+
+    def between(self, start_s=None, end_s=None):
+        """시각 범위 [start_s, end_s) 의 레코드 번호 범위 (기록이 시간순이므로 이진 탐색)"""
+        times = self.records["t"][:self.count]
+        first = 0 if start_s is None else int(np.searchsorted(times, start_s, side="left"))
+        last = self.count if end_s is None else int(np.searchsorted(times, end_s, side="left"))
+        return range(first, last)
+
+    def select(self, start_s=None, end_s=None, addresses=None, sources=None):
+        """조건에 맞는 레코드 번호 배열 (시간순)"""
+        span = self.between(start_s, end_s)
+        indices = np.arange(span.start, span.stop)
+        if addresses is not None:
+            indices = np.intersect1d(indices, np.concatenate([self.for_address(a) for a in addresses] or
+                                                             [np.zeros(0, dtype=np.int64)]))
+        if sources is not None:
+            ids = [self.sources.index(name) for name in sources if name in self.sources]
+            indices = indices[np.isin(self.records["source"][indices], ids)]
+        return indices
+
+    def summary(self):
+        view = self.view
+        registers = view["addr"][view["direction"] != DELAY]
+        return {
+            "records": self.count, "batches": int(len(np.unique(view["batch"]))) if self.count else 0,
+            "writes": int((view["direction"] == WRITE).sum()), "reads": int((view["direction"] == READ).sum()),
+            "delays": int((view["direction"] == DELAY).sum()),
+            "failed": int((view["status"] == FAILED).sum()),
+            "addresses": int(len(np.unique(registers))),
+            "duration_s": round(float(view["t"][-1] - view["t"][0]), 6) if self.count else 0.0,
+            "sources": [name for name in self.sources if name],
+        }
+
+    # ----- 파일 -----
+
+    def save(self, path):
+        view = self.view
+        sources = json.dumps(self.sources, ensure_ascii=False).encode("utf-8")
+        sources_offset = HEADER_SIZE + view.nbytes
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, 0, self.started_at, self.count, sources_offset,
+                                self.map_fingerprint).ljust(HEADER_SIZE, b"\0"))
+            f.write(view.tobytes())
+            f.write(sources)
+        transport_log.info("🧾 저널 저장: %s (%d개 트랜잭션)", path, self.count)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER_SIZE or data[:4] != MAGIC:
+            raise JournalError(f"저널 파일이 아님: {path}")
+        _, version, _, started_at, count, sources_offset, fingerprint = HEADER.unpack_from(data)
+        record_type = {1: RECORD_V1, VERSION: RECORD}.get(version)
+        if record_type is None:
+            raise JournalError(f"지원하지 않는 저널 버전: {version}")
+        if HEADER_SIZE + count * record_type.itemsize > sources_offset or sources_offset > len(data):
+            raise JournalError(f"저널 파일이 잘림: {path}")
+        journal = cls(capacity=max(1, count))
+        stored = np.frombuffer(data, dtype=record_type, count=count, offset=HEADER_SIZE)
+        for name in record_type.names:
+            journal.records[name][:count] = stored[name]
+        journal.count = count
+        journal.batches = int(journal.records["batch"][:count].max()) + 1 if count else 0
+        journal.sources = json.loads(data[sources_offset:].decode("utf-8") or '[""]')
+        journal._source_ids = {name: index for index, name in enumerate(journal.sources)}
+        journal.started_at = started_at
+        journal.map_fingerprint = fingerprint
+        return journal
+
+
+def _record_value(op, value):
+    if op[0] == "W":
+        return op[2]
+    if op[0] == "D":
+        return min(round(op[1] * 1e6), 0xFFFFFFFF)
+    return value or 0
+
+
+# ========== 재생 ==========
+
+class ReplayResult:
+    """replay() 결과"""
+
+    def __init__(self):
+        self.records = 0
+        self.writes = 0
+        self.reads = 0
+        self.batches = 0
+        self.mismatched = []    # [(레코드 번호, 주소, 기록된 값, 읽은 값)]
+        self.elapsed_s = 0.0
+        self.original_s = 0.0   # 기록된 구간 길이
+
+    @property
+    def ok(self):
+        return not self.mismatched
+
+    def as_dict(self):
+        return {
+            "ok": self.ok, "records": self.records, "writes": self.writes, "reads": self.reads,
+            "batches": self.batches, "mismatched": len(self.mismatched),
+            "elapsed_ms": round(self.elapsed_s * 1000, 3), "original_ms": round(self.original_s * 1000, 3),
+        }
+
+
+def _groups(journal, indices, timing, batch_frames):
+    """재생 단위 [(레코드 번호 배열)]: original 은 원래 배치 그대로, fast 는 batch_frames 개씩"""
+    if not len(indices):
+        return []
+    if timing == "original":
+        batches = journal.records["batch"][indices]
+        cuts = np.flatnonzero(np.diff(batches)) + 1
+        return np.split(indices, cuts)
+    return [indices[start:start + batch_frames] for start in range(0, len(indices), batch_frames)]
+
+
+def _replay_op(row):
+    direction = row["direction"]
+    if direction == WRITE:
+        return ("W", int(row["addr"]), int(row["value"]))
+    if direction == DELAY:
+        return ("D", int(row["value"]) / 1e6)
+    return ("R", int(row["addr"]))
+
+
+def replay(journal, port, protocol, timing="fast", include_reads=False, indices=None, speed=1.0,
+           batch_frames=DEFAULT_REPLAY_BATCH, response_wait=0.0, sleep=time.sleep, clock=time.perf_counter):
+    """저널을 디바이스로 다시 보냄 → ReplayResult
+
+    timing="fast"     : 레코드 순서대로 batch_frames 개씩 묶어 최대 속도로 전송
+    timing="original" : 기록된 배치 단위로, 기록된 시작 간격(speed 배속)을 지켜 전송
+    include_reads     : 읽기도 재생하고 기록된 값과 다르면 mismatched 에 기록 (기본은 쓰기만)
+                        FAILED 읽기는 기록된 값이 없으므로 보내기만 하고 비교하지 않음
+    FAILED 쓰기도 버스에 나갔던 연산이므로 그대로 재생
+    지연 레코드는 두 timing 모두 같은 자리에서 ("D", 초) 로 다시 보냄 (pyftdi SPI 에서는 배치 안의 빈 클럭)
+    indices           : 재생할 레코드 번호 (journal.select() 결과, 기본 전체)
+    """
+    if timing not in ("fast", "original"):
+        raise ValueError(f"timing 은 'fast' 또는 'original': {timing}")
+    records = journal.records
+    if indices is None:
+        indices = np.arange(journal.count)
+    if not include_reads:
+        indices = indices[records["direction"][indices] != READ]
+    result = ReplayResult()
+    result.records = len(indices)
+    if len(indices):
+        result.original_s = float(records["t"][indices[-1]] - records["t"][indices[0]])
+
+    started = clock()
+    base_t = float(records["t"][indices[0]]) if len(indices) else 0.0
+    with transfer_source("replay"):
+        for group in _groups(journal, indices, timing, batch_frames):
+            if timing == "original":
+                due = started + (float(records["t"][group[0]]) - base_t) / speed
+                wait = due - clock()
+                if wait > 0:
+                    sleep(wait)
+            rows = records[group]
+            ops = [_replay_op(row) for row in rows]
+            values = transfer_batch(port, protocol, ops, response_wait)
+            result.batches += 1
+            for index, row, op, value in zip(group, rows, ops, values):
+                if op[0] != "R":
+                    result.writes += op[0] == "W"
+                    continue
+                result.reads += 1
+                if row["status"] == OK and value != int(row["value"]):
+                    result.mismatched.append((int(index), op[1], int(row["value"]), value))
+    result.elapsed_s = clock() - started
+    transport_log.info("⏩ 저널 재생: %d개 (쓰기 %d, 읽기 %d), 배치 %d회, %.1fms (원래 %.1fms)%s",
+                       result.records, result.writes, result.reads, result.batches, result.elapsed_s * 1000,
+                       result.original_s * 1000,
+                       f", 불일치 {len(result.mismatched)}" if result.mismatched else "")
+    return result
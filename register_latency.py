@@ -0,0 +1,182 @@
+"""
+전송 단계별 시간/처리량 집계 (Qt 의존성 없음)
+
+register_transfer 의 단계 관찰자로 붙어 전송마다 단계별 시간(encode / submit / usb / decode)과 전체 시간을
+register_stats.LatencyHistogram 에 기록합니다. Write All 처럼 여러 계층을 거치는 작업에서 시간이
+Python 인코딩, USB, 버스, GUI 로그 중 어디에 쓰였는지 나눠 볼 수 있습니다.
+
+히스토그램 키는 (범위, 단계):
+    transaction : write_frame / read_frame 한 번
+    batch       : transfer_batch 한 번
+    frame       : 프레임 하나당 시간 (transaction 전체, batch 전체를 프레임 수로 나눈 값) - 상태 표시줄 값
+    gui         : record_phase() 로 기록한 GUI 쪽 시간 (로그 출력 등)
+
+    recorder = LatencyRecorder().attach()
+    ...                                       # 평소처럼 전송
+    recorder.status_text()                    # "p50 0.081 · p95 0.120 · p99 0.250 ms · 1,234 f/s"
+    recorder.save_csv("latency.csv")
+    recorder.save_prometheus("/var/lib/node_exporter/register_latency.prom")
+"""
+
+import csv
+import os
+import threading
+import time
+
+from register_stats import LatencyHistogram, SUMMARY_PERCENTILES
+from register_transfer import PHASES, add_phase_observer, remove_phase_observer
+
+SCOPES = ("transaction", "batch", "frame", "gui")
+METRIC_PREFIX = "register_transport"
+
+
+class LatencyRecorder:
+    """전송 단계별 시간 히스토그램과 처리량 카운터"""
+
+    def __init__(self):
+        self.histograms = {}        # (범위, 단계) -> LatencyHistogram
+        self._lock = threading.Lock()
+        self.reset()
+
+    # ----- 기록 -----
+
+    def attach(self):
+        add_phase_observer(self.record)
+        return self
+
+    def detach(self):
+        remove_phase_observer(self.record)
+        return self
+
+    def __enter__(self):
+        return self.attach()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.detach()
+        return False
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.transactions = 0
+            self.batches = 0
+            self.frames = 0
+            self.busy_s = 0.0            # 전송 호출 안에서 보낸 시간 합
+            self.by_source = {}          # 출처 -> 프레임 수
+            self.started = time.perf_counter()
+
+    def _histogram(self, scope, phase):
+        histogram = self.histograms.get((scope, phase))
+        if histogram is None:
+            histogram = self.histograms[(scope, phase)] = LatencyHistogram()
+        return histogram
+
+    def record(self, protocol, kind, ops, phases, duration, source):
+        """단계 관찰자: 전송 한 번의 단계별 시간 기록"""
+        frames = sum(op[0] != "D" for op in ops)
+        with self._lock:
+            for phase, seconds in phases.items():
+                if seconds:
+                    self._histogram(kind, phase).record(seconds)
+            self._histogram(kind, "total").record(duration)
+            if frames:
+                self._histogram("frame", "total").record(duration / frames, frames)
+            if kind == "batch":
+                self.batches += 1
+            else:
+                self.transactions += 1
+            self.frames += frames
+            self.busy_s += duration
+            self.by_source[source] = self.by_source.get(source, 0) + frames
+
+    def record_phase(self, phase, seconds, scope="gui"):
+        """전송 밖의 시간 기록 (GUI 로그 출력 등)"""
+        with self._lock:
+            self._histogram(scope, phase).record(seconds)
+
+    # ----- 조회 -----
+
+    def throughput(self):
+        """{"frames_per_s": 측정 시작 이후, "busy_frames_per_s": 전송 호출 안의 시간 기준}"""
+        elapsed = time.perf_counter() - self.started
+        return {
+            "frames_per_s": self.frames / elapsed if elapsed > 0 else 0.0,
+            "busy_frames_per_s": self.frames / self.busy_s if self.busy_s > 0 else 0.0,
+        }
+
+    def rows(self):
+        """히스토그램별 요약 [{scope, phase, count, min_ms, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}]"""
+        with self._lock:
+            items = list(self.histograms.items())
+        order = {scope: index for index, scope in enumerate(SCOPES)}
+        phases = {phase: index for index, phase in enumerate(PHASES + ("total",))}
+        items.sort(key=lambda item: (order.get(item[0][0], len(order)), phases.get(item[0][1], len(phases)),
+                                     item[0][1]))
+        return [{"scope": scope, "phase": phase, **histogram.as_dict()} for (scope, phase), histogram in items]
+
+    def summary(self):
+        return {
+            "transactions": self.transactions, "batches": self.batches, "frames": self.frames,
+            "busy_ms": round(self.busy_s * 1000, 3),
+            **{key: round(value, 1) for key, value in self.throughput().items()},
+            "sources": {name or "-": count for name, count in self.by_source.items()},
+            "histograms": self.rows(),
+        }
+
+    def status_text(self):
+        """상태 표시줄용 프레임당 p50/p95/p99 와 처리량"""
+        histogram = self.histograms.get(("frame", "total"))
+        if histogram is None or not histogram.count:
+            return "⏱ 전송 없음"
+        percentiles = " · ".join(f"p{percent} {histogram.percentile(percent) * 1000:.3f}"
+                                 for percent in SUMMARY_PERCENTILES)
+        return f"⏱ {percentiles} ms · {self.throughput()['frames_per_s']:,.0f} f/s"
+
+    # ----- 내보내기 -----
+
+    def save_csv(self, path):
+        rows = self.rows()
+        fields = ["scope", "phase", "count", "min_ms", "mean_ms"] + \
+                 [f"p{percent}_ms" for percent in SUMMARY_PERCENTILES] + ["max_ms"]
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def prometheus_text(self):
+        """Prometheus 텍스트 형식 (summary 지표 + 카운터)"""
+        name = f"{METRIC_PREFIX}_latency_seconds"
+        lines = [f"# HELP {name} Register transfer latency by scope and phase.",
+                 f"# TYPE {name} summary"]
+        with self._lock:
+            items = sorted(self.histograms.items())
+        for (scope, phase), histogram in items:
+            labels = f'scope="{scope}",phase="{phase}"'
+            for percent in SUMMARY_PERCENTILES:
+                lines.append(f'{name}{{{labels},quantile="{percent / 100:g}"}} {histogram.percentile(percent):.9g}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.total_s:.9g}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        for counter, value, text in (("frames", self.frames, "Register frames transferred."),
+                                     ("batches", self.batches, "transfer_batch calls."),
+                                     ("transactions", self.transactions, "Single-frame transfers.")):
+            lines.append(f"# HELP {METRIC_PREFIX}_{counter}_total {text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{counter}_total counter")
+            lines.append(f"{METRIC_PREFIX}_{counter}_total {value}")
+        lines.append(f"# HELP {METRIC_PREFIX}_busy_seconds_total Time spent inside transfer calls.")
+        lines.append(f"# TYPE {METRIC_PREFIX}_busy_seconds_total counter")
+        lines.append(f"{METRIC_PREFIX}_busy_seconds_total {self.busy_s:.9g}")
+        return "\n".join(lines) + "\n"
+
+    def save_prometheus(self, path):
+        """node_exporter textfile 수집기용 .prom 파일 (임시 파일에 쓴 뒤 교체해 읽는 쪽이 반쯤 쓴 파일을 보지 않음)"""
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+        os.replace(temporary, path)
+
+    def save(self, path):
+        """확장자로 형식 선택: .prom → Prometheus 텍스트, 그 밖 → CSV"""
+        if str(path).lower().endswith(".prom"):
+            self.save_prometheus(path)
+        else:
+            self.save_csv(path)
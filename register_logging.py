@@ -0,0 +1,71 @@
+"""
+레지스터 컨트롤러 공용 로깅 설정
+
+서브시스템별 로거(parser, transport, ui)를 제공합니다.
+로그 메시지는 f-string 대신 %-스타일 인자로 전달하므로, 비활성화된 레벨의 호출은
+isEnabledFor() 검사 한 번으로 끝나고 문자열 포맷팅 비용이 발생하지 않습니다.
+
+레벨은 환경 변수 REGISTER_LOG_LEVEL 로 지정합니다 (기본값: WARNING).
+    REGISTER_LOG_LEVEL=DEBUG                  # 전체 DEBUG
+    REGISTER_LOG_LEVEL=WARNING,parser=DEBUG   # 파서만 DEBUG
+"""
+
+import logging
+import os
+
+LOGGER_ROOT = "register"
+SUBSYSTEMS = ("parser", "transport", "ui")
+DEFAULT_LEVEL = "WARNING"
+
+# 핫 패스에서 `if log.isEnabledFor(DEBUG):` 형태로 사용하기 위한 재노출
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+
+
+def get_logger(subsystem):
+    """서브시스템 로거 반환 (예: get_logger("parser") -> 'register.parser')"""
+    return logging.getLogger(f"{LOGGER_ROOT}.{subsystem}")
+
+
+def _parse_level(text):
+    """'DEBUG' 또는 '10' 형태의 레벨 문자열을 정수 레벨로 변환"""
+    text = str(text).strip().upper()
+    if text.isdigit():
+        return int(text)
+    level = logging.getLevelName(text)
+    if not isinstance(level, int):
+        raise ValueError(f"알 수 없는 로그 레벨: {text}")
+    return level
+
+
+def configure_logging(level=None, stream=None):
+    """'register' 로거 계층에 레벨과 콘솔 핸들러를 설정합니다.
+
+    level 을 생략하면 REGISTER_LOG_LEVEL 환경 변수를 사용합니다.
+    'WARNING,parser=DEBUG' 처럼 서브시스템별 레벨을 덧붙일 수 있습니다.
+    여러 번 호출해도 핸들러는 한 번만 추가됩니다.
+    """
+    if level is None:
+        level = os.environ.get("REGISTER_LOG_LEVEL", DEFAULT_LEVEL)
+
+    root = logging.getLogger(LOGGER_ROOT)
+    if isinstance(level, int):
+        root.setLevel(level)
+    else:
+        for part in str(level).split(","):
+            part = part.strip()
+            if not part:
+                continue
+            if "=" in part:
+                name, sub_level = part.split("=", 1)
+                get_logger(name.strip()).setLevel(_parse_level(sub_level))
+            else:
+                root.setLevel(_parse_level(part))
+
+    if not any(getattr(h, "_register_handler", False) for h in root.handlers):
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler._register_handler = True
+        root.addHandler(handler)
+    root.propagate = False
+    return root
@@ -0,0 +1,179 @@
+"""
+레지스터 맵 이름 조회 (Qt 의존성 없음)
+
+Excel 파서/JSON 이 만든 {시트: [레지스터]} 데이터에서 주소, 레지스터 이름(description),
+필드 이름으로 레지스터와 필드를 찾습니다. 시퀀스/CLI/API 가 GUI 없이 함께 사용합니다.
+
+대상 문자열 형식:
+    "0x01" / "1"          : 주소
+    "EN"                  : 레지스터 이름 (description, 대소문자 무시)
+    "EN.EN_TX"            : 레지스터 이름 또는 주소 + 필드 이름
+    "EN_TX"               : 맵 전체에서 하나뿐인 필드 이름
+"""
+
+import json
+
+from register_fields import parse_bit_range
+
+
+class RegisterMapError(KeyError):
+    """레지스터/필드를 찾을 수 없거나 이름이 모호함"""
+
+    def __str__(self):
+        return str(self.args[0]) if self.args else ""
+
+
+class FieldRef:
+    """레지스터 안의 필드 위치"""
+
+    def __init__(self, name, upper_bit, lower_bit):
+        self.name = name
+        self.upper_bit = upper_bit
+        self.lower_bit = lower_bit
+
+    @property
+    def width(self):
+        return self.upper_bit - self.lower_bit + 1
+
+    @property
+    def mask(self):
+        """레지스터 안에서의 (정렬된) 마스크"""
+        return ((1 << self.width) - 1) << self.lower_bit
+
+    def extract(self, register_value):
+        return (register_value & self.mask) >> self.lower_bit
+
+    def insert(self, register_value, field_value):
+        return ((register_value & ~self.mask) | ((field_value << self.lower_bit) & self.mask)) & 0xFFFFFFFF
+
+    def __repr__(self):
+        return f"FieldRef({self.name}[{self.upper_bit}:{self.lower_bit}])"
+
+
+def parse_address(text):
+    """'0x1A' / '1A' 형식 주소 문자열을 정수로 (레지스터 맵은 16진수 주소 사용)"""
+    if isinstance(text, int):
+        return text
+    return int(str(text).strip(), 16)
+
+
+def parse_value(value):
+    """'0x...' / '0b...' / 10진수 문자열 또는 정수를 정수로"""
+    if isinstance(value, int):
+        return value
+    return int(str(value).strip().replace("_", ""), 0)
+
+
+class RegisterMap:
+    """주소/이름/필드 이름 색인"""
+
+    def __init__(self, data):
+        self.data = data or {}
+        self.registers = {}       # 주소 -> 레지스터 dict
+        self._by_name = {}        # 소문자 레지스터 이름 -> 주소
+        self._fields = {}         # 주소 -> {소문자 필드 이름: FieldRef}
+        self._field_owners = {}   # 소문자 필드 이름 -> [주소]
+        for registers in self.data.values():
+            for register in registers:
+                self._add(register)
+
+    @classmethod
+    def from_json(cls, path):
+        """save_json_file() 로 저장한 JSON ({시트: [레지스터]}) 로드"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def from_file(cls, path):
+        """.json 또는 Excel 레지스터 맵 로드"""
+        if str(path).lower().endswith(".json"):
+            return cls.from_json(path)
+        from register_excel_parser import load_excel
+        return cls(load_excel(path))
+
+    def _add(self, register):
+        addr = parse_address(register["address"])
+        self.registers[addr] = register
+        name = str(register.get("description", "")).strip().lower()
+        if name:
+            self._by_name.setdefault(name, addr)
+        fields = {}
+        for field in register.get("fields", []):
+            upper_bit, lower_bit = parse_bit_range(field.get("bit_range", "0"))
+            if upper_bit == 0 and lower_bit == 0 and "upper_bit" in field:
+                upper_bit, lower_bit = field["upper_bit"], field["lower_bit"]
+            field_name = str(field.get("name", "")).strip()
+            fields[field_name.lower()] = FieldRef(field_name, upper_bit, lower_bit)
+            self._field_owners.setdefault(field_name.lower(), []).append(addr)
+        self._fields[addr] = fields
+
+    def __contains__(self, addr):
+        return addr in self.registers
+
+    def __len__(self):
+        return len(self.registers)
+
+    def addresses(self):
+        return sorted(self.registers)
+
+    def name_of(self, addr):
+        return self.registers.get(addr, {}).get("description", "")
+
+    def fields_of(self, addr):
+        """주소의 FieldRef 목록 (하위 비트 순)"""
+        return sorted(self._fields.get(addr, {}).values(), key=lambda f: f.lower_bit)
+
+    def default_value(self, addr):
+        value = self.registers.get(addr, {}).get("default_value", 0)
+        return parse_value(value) if value != "" else 0
+
+    def defaults(self):
+        """{주소: 기본값}"""
+        return {addr: self.default_value(addr) for addr in self.registers}
+
+    def fingerprint(self):
+        """주소/이름/필드 배치의 SHA-256 (캡처 파일이 같은 맵으로 기록되었는지 확인용, 기본값은 제외)"""
+        import hashlib
+        layout = [[addr, self.name_of(addr), [[f.name, f.upper_bit, f.lower_bit] for f in self.fields_of(addr)]]
+                  for addr in self.addresses()]
+        return hashlib.sha256(json.dumps(layout, ensure_ascii=False).encode("utf-8")).digest()
+
+    def register_address(self, target):
+        """주소 또는 레지스터 이름 → 주소"""
+        key = str(target).strip()
+        addr = self._by_name.get(key.lower())
+        if addr is not None:
+            return addr
+        try:
+            addr = parse_address(key)
+        except ValueError:
+            raise RegisterMapError(f"레지스터를 찾을 수 없음: {target}") from None
+        if self.registers and addr not in self.registers:
+            raise RegisterMapError(f"레지스터 맵에 없는 주소: 0x{addr:02X}")
+        return addr
+
+    def field(self, addr, name):
+        field = self._fields.get(addr, {}).get(str(name).strip().lower())
+        if field is None:
+            raise RegisterMapError(f"필드를 찾을 수 없음: 0x{addr:02X}.{name}")
+        return field
+
+    def resolve(self, target):
+        """대상 문자열 → (주소, FieldRef 또는 None)"""
+        if isinstance(target, int):
+            return target, None
+        key = str(target).strip()
+        if "." in key:
+            register, field_name = key.rsplit(".", 1)
+            addr = self.register_address(register)
+            return addr, self.field(addr, field_name)
+        try:
+            return self.register_address(key), None
+        except RegisterMapError:
+            owners = self._field_owners.get(key.lower(), [])
+            if len(owners) == 1:
+                return owners[0], self._fields[owners[0]][key.lower()]
+            if len(owners) > 1:
+                names = ", ".join(f"0x{addr:02X}" for addr in owners)
+                raise RegisterMapError(f"필드 이름이 모호함: {key} (레지스터 {names}) → '레지스터.필드' 로 지정") from None
+            raise
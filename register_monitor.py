@@ -0,0 +1,222 @@
+"""
+고속 백그라운드 레지스터 모니터 (Qt 의존성 없음)
+
+선택한 레지스터들을 백그라운드 스레드에서 목표 주기(또는 버스 한계 속도)로 배치 읽기하고,
+타임스탬프와 함께 고정 크기 NumPy 링 버퍼에 저장합니다. 화면 쪽은 샘플링과 무관한 주기로
+SampleRing.latest() / decimate() 만 가져가므로 샘플링 속도가 화면 갱신 비용에 영향을 주지 않습니다.
+
+    monitor = RegisterMonitor(port, "SPI", [0x01, 0x2B], rate_hz=2000, lock=bus_lock)
+    monitor.start()
+    ...
+    t, low, high = monitor.ring.decimate(1, points=400)    # 0x2B 열을 400점으로 (구간별 최소/최대)
+    monitor.stop()
+
+rate_hz=0 이면 쉬지 않고 읽어 버스가 허용하는 최대 속도로 동작합니다.
+lock 을 주면 매 읽기를 그 잠금 안에서 수행하므로 GUI 의 쓰기/읽기와 포트를 안전하게 나눠 씁니다.
+sink(예: register_capture.CaptureWriter)를 주면 모든 샘플을 링 버퍼와 함께 파일로도 스트리밍합니다.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from register_logging import get_logger
+from register_transfer import transfer_batch, transfer_source, TransportError
+
+transport_log = get_logger("transport")
+
+DEFAULT_CAPACITY = 1 << 16
+MAX_CONSECUTIVE_ERRORS = 10
+
+
+def min_max_decimate(series, points):
+    """시계열을 최대 points 개 구간으로 줄임 → (구간 최소, 구간 최대)
+
+    최소/최대를 함께 돌려주므로 짧은 스파이크도 그래프에서 사라지지 않습니다.
+    """
+    if len(series) <= points:
+        return series, series
+    starts = np.linspace(0, len(series), int(points) + 1).astype(np.int64)[:-1]
+    return np.minimum.reduceat(series, starts), np.maximum.reduceat(series, starts)
+
+
+class SampleRing:
+    """고정 크기 샘플 링 버퍼: timestamps[capacity] (초), values[capacity, 레지스터 수]"""
+
+    def __init__(self, width, capacity=DEFAULT_CAPACITY):
+        self.capacity = int(capacity)
+        self.width = width
+        self.timestamps = np.zeros(self.capacity, dtype=np.float64)
+        self.values = np.zeros((self.capacity, width), dtype=np.uint32)
+        self.total = 0          # 지금까지 추가된 샘플 수 (덮어쓴 것 포함)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    @property
+    def overwritten(self):
+        return max(0, self.total - self.capacity)
+
+    def append(self, timestamp, values):
+        with self._lock:
+            index = self.total % self.capacity
+            self.timestamps[index] = timestamp
+            self.values[index] = values
+            self.total += 1
+
+    def clear(self):
+        with self._lock:
+            self.total = 0
+
+    def latest(self):
+        """(타임스탬프, 값 배열 복사본) 또는 None"""
+        with self._lock:
+            if not self.total:
+                return None
+            index = (self.total - 1) % self.capacity
+            return self.timestamps[index], self.values[index].copy()
+
+    def snapshot(self, last=None):
+        """시간순 (timestamps, values) 복사본 (last: 최근 샘플 수 제한)"""
+        with self._lock:
+            count = len(self) if last is None else min(int(last), len(self))
+            end = self.total % self.capacity
+            start = end - count
+            if start >= 0:
+                return self.timestamps[start:end].copy(), self.values[start:end].copy()
+            return (np.concatenate((self.timestamps[start:], self.timestamps[:end])),
+                    np.concatenate((self.values[start:], self.values[:end])))
+
+    def decimate(self, column, points, last=None):
+        """열 하나를 최대 points 개 구간으로 줄임 → (구간 시작 시각, 구간 최소, 구간 최대)"""
+        timestamps, values = self.snapshot(last)
+        low, high = min_max_decimate(values[:, column], points)
+        if len(timestamps) > points:
+            timestamps = timestamps[np.linspace(0, len(timestamps), int(points) + 1).astype(np.int64)[:-1]]
+        return timestamps, low, high
+
+
+class RegisterMonitor:
+    """백그라운드 스레드에서 레지스터 묶음을 주기적으로 배치 읽기"""
+
+    def __init__(self, port, protocol, addresses, rate_hz=1000.0, capacity=DEFAULT_CAPACITY,
+                 response_wait=0.0, lock=None, sink=None, clock=time.perf_counter):
+        if not addresses:
+            raise ValueError("모니터할 레지스터가 없습니다")
+        self.port = port
+        self.protocol = protocol
+        self.addresses = list(dict.fromkeys(addresses))
+        self.rate_hz = float(rate_hz)
+        self.response_wait = response_wait
+        self.lock = lock
+        self.sink = sink            # append(타임스탬프, 값) 을 가진 추가 기록 대상 (예: register_capture.CaptureWriter)
+        self.clock = clock
+        self.ring = SampleRing(len(self.addresses), capacity)
+        self.errors = 0
+        self.last_error = None
+        self.started_at = None      # 첫 start() 의 time.time() (타임스탬프 0 의 절대 시각)
+        self._ops = [("R", addr) for addr in self.addresses]
+        self._stop = threading.Event()
+        self._thread = None
+        self._t0 = None             # 타임스탬프 기준 (일시 정지 후 다시 시작해도 유지)
+        self._run_t0 = None         # 이번 실행 시작 (속도 통계용)
+        self._elapsed = 0.0
+        self._start_total = 0
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return self
+        self._stop.clear()
+        self.errors = 0
+        self.last_error = None
+        self._start_total = self.ring.total
+        self._run_t0 = self.clock()
+        if self._t0 is None:
+            self.started_at = time.time()
+            self._t0 = self._run_t0
+        self._thread = threading.Thread(target=self._run, name="RegisterMonitor", daemon=True)
+        self._thread.start()
+        transport_log.info("📊 모니터 시작: %d개 레지스터, 목표 %s", len(self.addresses),
+                           f"{self.rate_hz:.0f}Hz" if self.rate_hz > 0 else "최대 속도")
+        return self
+
+    def stop(self, timeout=1.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                # 읽기가 아직 끝나지 않음 (느린 버스, 다른 스레드가 잡은 포트 잠금) - 참조를 남겨 running 으로 보이게 함
+                transport_log.warning("⚠️ 모니터 스레드가 %.1f초 안에 끝나지 않음 (진행 중인 읽기 후 종료, "
+                                      "포트는 같은 잠금 안에서 닫아야 함)", timeout)
+                return
+            self._thread = None
+            stats = self.stats()
+            transport_log.info("📊 모니터 정지: %d샘플, %.0f샘플/s, 오류 %d",
+                               stats["samples"], stats["rate_hz"], self.errors)
+
+    def _read(self):
+        """배치 읽기 한 번 (잠금을 기다리는 동안 stop() 이 호출됐으면 읽지 않고 None)"""
+        if self.lock is None:
+            return transfer_batch(self.port, self.protocol, self._ops, self.response_wait)
+        with self.lock:
+            # stop() 이 시간 초과로 돌아간 뒤 잠금을 잡은 쪽이 포트를 닫았을 수 있으므로 다시 확인
+            if self._stop.is_set():
+                return None
+            return transfer_batch(self.port, self.protocol, self._ops, self.response_wait)
+
+    def _run(self):
+        with transfer_source("monitor"):
+            self._sample_loop()
+
+    def _sample_loop(self):
+        period = 1.0 / self.rate_hz if self.rate_hz > 0 else 0.0
+        next_due = self._run_t0
+        consecutive = 0
+        while not self._stop.is_set():
+            try:
+                values = self._read()
+                if values is None:
+                    break
+            except (TransportError, OSError) as e:
+                self.errors += 1
+                consecutive += 1
+                self.last_error = str(e)
+                if consecutive == 1:
+                    transport_log.warning("⚠️ 모니터 읽기 오류: %s", e)
+                if consecutive >= MAX_CONSECUTIVE_ERRORS:
+                    transport_log.error("❌ 모니터 중단: 연속 오류 %d회 (%s)", consecutive, e)
+                    break
+            else:
+                consecutive = 0
+                timestamp = self.clock() - self._t0
+                self.ring.append(timestamp, values)
+                sink = self.sink
+                if sink is not None:
+                    sink.append(timestamp, values)
+            if period:
+                next_due += period
+                wait = next_due - self.clock()
+                if wait > 0:
+                    self._stop.wait(wait)
+                elif wait < -period:
+                    next_due = self.clock()     # 밀린 주기는 몰아서 읽지 않음
+        self._elapsed = self.clock() - self._run_t0
+
+    def stats(self):
+        if self._run_t0 is None:
+            elapsed = 0.0
+        else:
+            elapsed = self.clock() - self._run_t0 if self.running else self._elapsed
+        return {
+            "samples": self.ring.total, "registers": len(self.addresses),
+            "rate_hz": (self.ring.total - self._start_total) / elapsed if elapsed > 0 else 0.0,
+            "target_hz": self.rate_hz,
+            "elapsed_s": elapsed, "overwritten": self.ring.overwritten, "errors": self.errors,
+            "last_error": self.last_error,
+        }
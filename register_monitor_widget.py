@@ -0,0 +1,188 @@
+"""
+레지스터 모니터 창 (register_monitor.RegisterMonitor 표시)
+
+샘플링은 백그라운드 스레드가 하고, 이 창은 고정 주기(DISPLAY_FPS)로 링 버퍼의 최신 값과
+화면 폭만큼 줄인(구간별 최소/최대) 시계열만 가져와 그립니다. 샘플링 속도가 아무리 높아도
+화면 갱신 비용은 레지스터 수와 그래프 폭에만 비례합니다.
+"""
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QLabel, QPushButton,
+    QWidget, QHeaderView, QAbstractItemView, QFileDialog, QMessageBox
+)
+from PySide6.QtCore import Qt, QTimer, Signal, QPointF
+from PySide6.QtGui import QPainter, QColor, QPen, QPolygonF
+
+from register_capture import CaptureWriter
+from register_monitor import min_max_decimate
+
+DISPLAY_FPS = 20
+PLOT_WINDOW_SAMPLES = 20000     # 그래프에 표시할 최근 샘플 수
+
+
+class SeriesPlot(QWidget):
+    """구간별 최소/최대 띠로 시계열 하나를 그리는 위젯"""
+
+    BACKGROUND = "#ffffff"
+    GRID_COLOR = "#e0e0e0"
+    LINE_COLOR = "#2E86AB"
+    BAND_COLOR = "#A8D5E8"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(160)
+        self._low = self._high = None
+
+    def set_series(self, low, high):
+        self._low, self._high = low, high
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(self.BACKGROUND))
+        painter.setPen(QPen(QColor(self.GRID_COLOR), 1))
+        for step in range(1, 4):
+            y = self.height() * step // 4
+            painter.drawLine(0, y, self.width(), y)
+        if self._low is None or not len(self._low):
+            return
+        low, high = self._low.astype(float), self._high.astype(float)
+        bottom, top = float(low.min()), float(high.max())
+        span = (top - bottom) or 1.0
+        margin = 6
+        height = self.height() - 2 * margin
+        x_scale = (self.width() - 1) / max(1, len(low) - 1)
+
+        def y_of(value):
+            return margin + height * (1.0 - (value - bottom) / span)
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        band = QPolygonF([QPointF(i * x_scale, y_of(v)) for i, v in enumerate(high)] +
+                         [QPointF(i * x_scale, y_of(v)) for i, v in reversed(list(enumerate(low)))])
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(self.BAND_COLOR))
+        painter.drawPolygon(band)
+        painter.setPen(QPen(QColor(self.LINE_COLOR), 1.5))
+        painter.drawPolyline(QPolygonF([QPointF(i * x_scale, y_of(v)) for i, v in enumerate(high)]))
+        painter.setPen(QColor("#666666"))
+        painter.drawText(4, 14, f"0x{int(top):X}")
+        painter.drawText(4, self.height() - 4, f"0x{int(bottom):X}")
+
+
+class MonitorWindow(QDialog):
+    """모니터 값 표 + 선택한 레지스터 그래프 + 캡처 파일 기록 (창을 닫으면 모니터 정지)"""
+
+    closed = Signal()
+
+    COLUMNS = ("주소", "레지스터", "값", "최소", "최대")
+
+    def __init__(self, monitor, names=None, register_map=None, parent=None):
+        super().__init__(parent)
+        self.monitor = monitor
+        self.register_map = register_map
+        self.capture = None
+        self.setWindowTitle("Register Monitor")
+        self.resize(560, 420)
+        names = names or {}
+
+        self.table = QTableWidget(len(monitor.addresses), len(self.COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        for row, addr in enumerate(monitor.addresses):
+            self.table.setItem(row, 0, QTableWidgetItem(f"0x{addr:02X}"))
+            self.table.setItem(row, 1, QTableWidgetItem(names.get(addr, "")))
+            for column in range(2, len(self.COLUMNS)):
+                self.table.setItem(row, column, QTableWidgetItem("-"))
+        self.table.selectRow(0)
+
+        self.plot = SeriesPlot(self)
+        self.status_label = QLabel(self)
+        self.pause_btn = QPushButton("일시 정지", self)
+        self.pause_btn.setCheckable(True)
+        self.pause_btn.toggled.connect(self.on_pause_toggled)
+        self.capture_btn = QPushButton("기록...", self)
+        self.capture_btn.setCheckable(True)
+        self.capture_btn.toggled.connect(self.on_capture_toggled)
+
+        bottom = QHBoxLayout()
+        bottom.addWidget(self.status_label, 1)
+        bottom.addWidget(self.capture_btn)
+        bottom.addWidget(self.pause_btn)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addWidget(self.plot, 1)
+        layout.addLayout(bottom)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000 // DISPLAY_FPS)
+
+    def on_pause_toggled(self, paused):
+        if paused:
+            self.monitor.stop()
+        else:
+            self.monitor.start()
+        self.pause_btn.setText("계속" if paused else "일시 정지")
+
+    def on_capture_toggled(self, recording):
+        """모든 샘플을 메모리 맵 캡처 파일(.rcap)로 스트리밍 시작/정지"""
+        if not recording:
+            self.stop_capture()
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "캡처 파일", "", "Register Capture (*.rcap)")
+        if path:
+            try:
+                self.start_capture(path)
+                return
+            except OSError as e:
+                QMessageBox.critical(self, "캡처 오류", f"캡처 파일을 만들 수 없습니다:\n{str(e)}")
+        self.capture_btn.blockSignals(True)
+        self.capture_btn.setChecked(False)
+        self.capture_btn.blockSignals(False)
+
+    def start_capture(self, path):
+        self.stop_capture()
+        self.capture = CaptureWriter(path, self.monitor.addresses, self.register_map,
+                                     started_at=self.monitor.started_at)
+        self.monitor.sink = self.capture
+        self.capture_btn.setText("기록 중지")
+        return self.capture
+
+    def stop_capture(self):
+        capture, self.capture = self.capture, None
+        if capture is not None:
+            self.monitor.sink = None
+            capture.close()
+        self.capture_btn.setText("기록...")
+        return capture
+
+    def refresh(self):
+        """최신 값/최소/최대와 선택 레지스터 그래프 갱신 (표시 주기마다)"""
+        ring = self.monitor.ring
+        _, values = ring.snapshot(PLOT_WINDOW_SAMPLES)
+        if len(values):
+            latest, low, high = values[-1], values.min(axis=0), values.max(axis=0)
+            for row in range(len(self.monitor.addresses)):
+                for column, value in ((2, latest[row]), (3, low[row]), (4, high[row])):
+                    self.table.item(row, column).setText(f"0x{int(value):08X}")
+            row = max(0, self.table.currentRow())
+            self.plot.set_series(*min_max_decimate(values[:, row], max(1, self.plot.width())))
+        stats = self.monitor.stats()
+        target = f"{stats['target_hz']:,.0f}/s" if stats["target_hz"] else "최대 속도"
+        text = f"{stats['samples']:,}샘플  {stats['rate_hz']:,.0f}샘플/s (목표 {target})"
+        if self.capture is not None:
+            text += f"  기록 {self.capture.count:,}"
+        if stats["errors"]:
+            text += f"  오류 {stats['errors']}: {stats['last_error']}"
+        self.status_label.setText(text)
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        self.monitor.stop()
+        self.stop_capture()
+        self.closed.emit()
+        super().closeEvent(event)
@@ -0,0 +1,269 @@
+"""
+조건 대기 (poll-until) 와 적응형 백오프 (Qt 의존성 없음)
+
+락 비트, 캘리브레이션 완료 플래그처럼 "조건이 참이 될 때까지" 레지스터를 다시 읽는 기능입니다.
+조건식에 쓰인 레지스터는 매 시도마다 배치 읽기 한 번으로 가져오고, 읽기 간격은 최소 간격에서 시작해
+시도마다 factor 배씩 늘어나 최대 간격에서 멈춥니다. 읽은 값이 바뀌면(진행 중) 다시 최소 간격으로 돌아갑니다.
+
+조건식 (파이썬 식 일부만 허용):
+    "EN_TX == 1"                          필드/레지스터 이름
+    "EN.EN_TX and EN.EN_VCM"              레지스터.필드
+    "(RO_DATA_5 & 0x3) == 0x3 or not EN_TX"
+    "'TX PATH_SEL' >= 0x100"              공백이 있는 이름은 따옴표로
+허용 연산: == != < <= > >=, and or not, & | ^ << >> ~ + -
+
+동기 사용 (API / 시퀀스 / CLI):
+    result = poll_until(condition, device.read_addresses, timeout_s=1.0)
+비동기 사용 (GUI 이벤트 루프): PollUntil.start() 후 poll_once() 가 돌려주는 시간 뒤에 다시 호출
+
+완료 시간은 조건식별 LatencyHistogram(poll_statistics)에 기록됩니다.
+"""
+
+import ast
+import operator
+import threading
+import time
+
+from register_logging import get_logger
+from register_map import RegisterMapError
+from register_stats import LatencyHistogram
+
+transport_log = get_logger("transport")
+
+DEFAULT_TIMEOUT_S = 1.0
+DEFAULT_MIN_INTERVAL_S = 0.001
+DEFAULT_MAX_INTERVAL_S = 0.1
+DEFAULT_BACKOFF_FACTOR = 2.0
+
+
+class PollConditionError(ValueError):
+    """조건식 형식 오류 또는 알 수 없는 대상"""
+
+
+# ========== 조건식 ==========
+
+_COMPARE = {ast.Eq: operator.eq, ast.NotEq: operator.ne, ast.Lt: operator.lt,
+            ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge}
+_BINARY = {ast.BitAnd: operator.and_, ast.BitOr: operator.or_, ast.BitXor: operator.xor,
+           ast.LShift: operator.lshift, ast.RShift: operator.rshift,
+           ast.Add: operator.add, ast.Sub: operator.sub}
+_UNARY = {ast.Not: operator.not_, ast.Invert: operator.invert, ast.USub: operator.neg}
+
+
+class PollCondition:
+    """레지스터 값 {주소: 값} 에 대해 평가되는 조건식"""
+
+    def __init__(self, expression, register_map):
+        self.expression = expression.strip()
+        self.register_map = register_map
+        self._targets = {}      # 대상 문자열 → (주소, FieldRef 또는 None)
+        try:
+            tree = ast.parse(self.expression, mode="eval")
+        except SyntaxError as e:
+            raise PollConditionError(f"조건식 문법 오류: {self.expression} ({e.msg})") from None
+        self._evaluate = self._compile(tree.body)
+        if not self._targets:
+            raise PollConditionError(f"조건식에 레지스터/필드가 없음: {self.expression}")
+
+    @property
+    def addresses(self):
+        """조건식이 읽는 레지스터 주소 (중복 없음, 정렬)"""
+        return sorted({addr for addr, _ in self._targets.values()})
+
+    def _target(self, name):
+        if name not in self._targets:
+            try:
+                self._targets[name] = self.register_map.resolve(name)
+            except RegisterMapError as e:
+                raise PollConditionError(f"조건식 대상 오류: {e}") from None
+        addr, field = self._targets[name]
+        if field is None:
+            return lambda values: values[addr]
+        return lambda values: field.extract(values[addr])
+
+    @staticmethod
+    def _dotted_name(node):
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return None
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+
+    def _compile(self, node):
+        """허용된 노드만 클로저로 변환 (eval 사용 안 함)"""
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, str):
+                return self._target(node.value)
+            if isinstance(node.value, int):
+                value = node.value
+                return lambda values: value
+        elif isinstance(node, (ast.Name, ast.Attribute)):
+            name = self._dotted_name(node)
+            if name is not None:
+                return self._target(name)
+        elif isinstance(node, ast.BoolOp):
+            operands = [self._compile(value) for value in node.values]
+            if isinstance(node.op, ast.And):
+                return lambda values: all(operand(values) for operand in operands)
+            return lambda values: any(operand(values) for operand in operands)
+        elif isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY:
+            function, operand = _UNARY[type(node.op)], self._compile(node.operand)
+            return lambda values: function(operand(values))
+        elif isinstance(node, ast.BinOp) and type(node.op) in _BINARY:
+            function, left, right = _BINARY[type(node.op)], self._compile(node.left), self._compile(node.right)
+            return lambda values: function(left(values), right(values))
+        elif isinstance(node, ast.Compare) and all(type(op) in _COMPARE for op in node.ops):
+            operands = [self._compile(node.left)] + [self._compile(value) for value in node.comparators]
+            functions = [_COMPARE[type(op)] for op in node.ops]
+
+            def compare(values):
+                results = [operand(values) for operand in operands]
+                return all(function(a, b) for function, a, b in zip(functions, results, results[1:]))
+            return compare
+        raise PollConditionError(f"조건식에 허용되지 않는 요소: {ast.dump(node)[:60]}")
+
+    def evaluate(self, values):
+        return bool(self._evaluate(values))
+
+    def __repr__(self):
+        return f"PollCondition({self.expression!r})"
+
+
+# ========== 통계 ==========
+
+class PollStatistics:
+    """조건식별 조건 충족까지 걸린 시간 히스토그램 + 시간 초과 횟수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {}
+        self.timeouts = {}
+
+    def record(self, result):
+        with self._lock:
+            if result.ok:
+                histogram = self.histograms.setdefault(result.expression, LatencyHistogram())
+            else:
+                self.timeouts[result.expression] = self.timeouts.get(result.expression, 0) + 1
+                return
+        histogram.record(result.elapsed_s)
+
+    def histogram(self, expression):
+        return self.histograms.get(expression.strip())
+
+    def as_dict(self):
+        with self._lock:
+            expressions = sorted(set(self.histograms) | set(self.timeouts))
+            return {expression: dict(self.histograms[expression].as_dict() if expression in self.histograms
+                                     else LatencyHistogram().as_dict(),
+                                     timeouts=self.timeouts.get(expression, 0))
+                    for expression in expressions}
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.timeouts.clear()
+
+
+poll_statistics = PollStatistics()
+
+
+# ========== 대기 ==========
+
+class PollResult:
+    """poll-until 결과"""
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.ok = False
+        self.attempts = 0
+        self.elapsed_s = 0.0
+        self.values = {}        # 마지막으로 읽은 {주소: 값}
+
+    def as_dict(self):
+        return {"expression": self.expression, "ok": self.ok, "attempts": self.attempts,
+                "elapsed_ms": round(self.elapsed_s * 1000, 3),
+                "values": {f"0x{addr:02X}": f"0x{value:08X}" for addr, value in self.values.items()}}
+
+
+class PollUntil:
+    """조건이 참이 되거나 시간이 다 될 때까지 반복 읽기 (한 번에 한 시도씩 진행하는 상태 기계)
+
+    read(주소 목록) → {주소: 값} 은 보통 RegisterDevice.read_addresses 입니다.
+    """
+
+    def __init__(self, condition, read, timeout_s=DEFAULT_TIMEOUT_S, min_interval_s=DEFAULT_MIN_INTERVAL_S,
+                 max_interval_s=DEFAULT_MAX_INTERVAL_S, factor=DEFAULT_BACKOFF_FACTOR,
+                 clock=time.perf_counter, statistics=poll_statistics):
+        if min_interval_s < 0 or max_interval_s < min_interval_s:
+            raise ValueError("간격은 0 <= min_interval <= max_interval 이어야 합니다")
+        self.condition = condition
+        self.read = read
+        self.timeout_s = timeout_s
+        self.min_interval_s = min_interval_s
+        self.max_interval_s = max_interval_s
+        self.factor = max(1.0, factor)
+        self.clock = clock
+        self.statistics = statistics
+        self.result = PollResult(condition.expression)
+        self.done = False
+        self._started = None
+        self._interval = min_interval_s
+
+    def start(self):
+        self._started = self.clock()
+        self._interval = self.min_interval_s
+        return self
+
+    def poll_once(self):
+        """한 번 읽고 평가 → 다음 시도까지 기다릴 초 (끝났으면 None)"""
+        if self._started is None:
+            self.start()
+        result = self.result
+        values = self.read(self.condition.addresses)
+        result.attempts += 1
+        now = self.clock()
+        result.elapsed_s = now - self._started
+        changed = bool(result.values) and values != result.values
+        result.values = values
+        if self.condition.evaluate(values):
+            result.ok = True
+            return self._finish()
+        remaining = self._started + self.timeout_s - now
+        if remaining <= 0:
+            return self._finish()
+        # 적응형 백오프: 값이 움직이면 최소 간격으로, 아니면 factor 배씩 늘림
+        if changed:
+            self._interval = self.min_interval_s
+        delay = self._interval
+        self._interval = min(self._interval * self.factor, self.max_interval_s)
+        return min(delay, remaining)
+
+    def _finish(self):
+        self.done = True
+        if self.statistics is not None:
+            self.statistics.record(self.result)
+        transport_log.debug("⏳ poll-until '%s': %s, %d회 읽기, %.3fms", self.result.expression,
+                            "충족" if self.result.ok else "시간 초과", self.result.attempts,
+                            self.result.elapsed_s * 1000)
+        return None
+
+    def run(self, sleep=time.sleep):
+        """끝날 때까지 동기 실행 → PollResult"""
+        self.start()
+        while True:
+            delay = self.poll_once()
+            if delay is None:
+                return self.result
+            sleep(delay)
+
+
+def poll_until(condition, read, timeout_s=DEFAULT_TIMEOUT_S, min_interval_s=DEFAULT_MIN_INTERVAL_S,
+               max_interval_s=DEFAULT_MAX_INTERVAL_S, factor=DEFAULT_BACKOFF_FACTOR,
+               sleep=time.sleep, clock=time.perf_counter, statistics=poll_statistics):
+    """조건이 참이 될 때까지 대기 → PollResult (시간 초과 시 ok=False)"""
+    return PollUntil(condition, read, timeout_s, min_interval_s, max_interval_s, factor,
+                     clock, statistics).run(sleep)
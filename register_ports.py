@@ -0,0 +1,72 @@
+"""
+레지스터 포트 연결 (Qt 의존성 없음)
+
+URL 하나로 시뮬레이터, register_server.py, FT2232H(SPI / I2C / UART) 포트를 열어
+register_transfer 의 전송 함수에 바로 넘길 수 있는 포트를 돌려줍니다.
+register_cli, RegisterDevice.open, 시퀀스 / 서버 명령줄이 같은 함수를 씁니다.
+pyftdi 와 서버 클라이언트는 해당 URL 을 열 때만 임포트합니다.
+
+    port, closer = open_port("SPI", "ftdi://ftdi:2232h/1", register_map, frequency=10_000_000)
+    ...
+    if closer is not None:
+        closer.close()
+"""
+
+import json
+
+
+class _SimSession:
+    """시뮬레이터 레지스터 값을 JSON 파일에 저장/복원"""
+
+    def __init__(self, device, state_path):
+        self.device = device
+        self.state_path = state_path
+        if state_path:
+            try:
+                with open(state_path, "r", encoding="utf-8") as f:
+                    for addr, value in json.load(f).items():
+                        device.write_register(int(addr, 16), value)
+            except FileNotFoundError:
+                pass
+
+    def close(self):
+        if self.state_path:
+            state = {f"0x{addr:02X}": value for addr, value in enumerate(self.device.registers)}
+            with open(self.state_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=1)
+
+
+def open_port(protocol, url, register_map, frequency=None, sim_state=None):
+    """포트 열기 → (포트, close() 를 가진 객체 또는 None)
+
+    url 이 'sim' 이면 맵 기본값으로 초기화된 시뮬레이션 디바이스에,
+    'tcp://host:port' / 'unix:///path' 이면 register_server.py 에 연결합니다.
+    """
+    if url.startswith(("tcp://", "unix://")):
+        # register_server.py 가 장치를 소유하고 있으면 서버를 통해 접근 (프로토콜은 서버 설정을 따름)
+        from register_server import RegisterClient
+        client = RegisterClient(url)
+        return client, client
+    if url == "sim":
+        from sim_device import SimulatedRegisterDevice, SimulatedSpiPort, SimulatedI2cPort, SimulatedSerialPort
+        device = SimulatedRegisterDevice(defaults=register_map.defaults())
+        session = _SimSession(device, sim_state)
+        if protocol == "SPI":
+            return SimulatedSpiPort(device, frequency=frequency or 1_000_000), session
+        if protocol == "I2C":
+            return SimulatedI2cPort(device, frequency=frequency or 100_000), session
+        return SimulatedSerialPort(device, baudrate=frequency or 115200), session
+    if protocol == "SPI":
+        from pyftdi.spi import SpiController
+        controller = SpiController()
+        controller.configure(url)
+        return controller.get_port(cs=0, freq=frequency or 1_000_000, mode=0), controller
+    if protocol == "I2C":
+        from pyftdi.i2c import I2cController
+        from register_protocol import I2C_DEFAULT_ADDRESS
+        controller = I2cController()
+        controller.configure(url, frequency=frequency or 100_000)
+        return controller.get_port(I2C_DEFAULT_ADDRESS), controller
+    from pyftdi.serialext import serial_for_url
+    port = serial_for_url(url, baudrate=frequency or 115200, timeout=1)
+    return port, port
@@ -0,0 +1,178 @@
+"""
+레지스터 설정 프로파일 (골든 설정 저장/적용, Qt 의존성 없음)
+
+프로파일은 {대상: 값} JSON 파일입니다. 대상은 주소, 레지스터 이름 또는 필드("EN.EN_TX")입니다.
+    {
+      "name": "low_power",
+      "registers": {"0x02": "0x00001234", "EN.EN_TX": 0, "EN.EN_VCM": 1}
+    }
+
+저장: GUI 의 register_data_store 또는 디바이스 스냅샷(RegisterDevice.dump())에서 만듭니다.
+적용: 현재 상태(섀도 또는 배치 읽기 1회)와 비교해 바뀌는 레지스터만 골라,
+      쓰기와 (선택) 검증 읽기를 한 번의 배치 전송으로 보냅니다.
+"""
+
+import json
+import time
+
+from register_logging import get_logger
+from register_map import parse_address, parse_value
+
+transport_log = get_logger("transport")
+
+PROFILE_VERSION = 1
+
+
+class ProfileError(ValueError):
+    """프로파일 파일 형식 오류"""
+
+
+class RegisterProfile:
+    """{대상 문자열: 값} 설정 묶음"""
+
+    def __init__(self, values=None, name=""):
+        self.name = name
+        self.values = dict(values or {})
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ProfileError(f"프로파일 JSON 오류: {e}") from None
+        if isinstance(data, dict) and "registers" in data:
+            values, name = data["registers"], data.get("name", "")
+        elif isinstance(data, dict):
+            values, name = data, ""
+        else:
+            raise ProfileError("프로파일은 {대상: 값} 객체여야 합니다")
+        try:
+            values = {str(target): parse_value(value) for target, value in values.items()}
+        except (TypeError, ValueError) as e:
+            raise ProfileError(f"프로파일 값 오류: {e}") from None
+        return cls(values, name)
+
+    def save(self, path):
+        data = {
+            "name": self.name,
+            "version": PROFILE_VERSION,
+            "registers": {target: f"0x{value:08X}" if target.lower().startswith("0x") else value
+                          for target, value in self.values.items()},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def from_register_values(cls, values, name="", addresses=None):
+        """{주소(int 또는 '0x01'): 값} → 레지스터 단위 프로파일 (register_data_store / dump() 결과)"""
+        profile = {}
+        for addr, value in values.items():
+            addr = parse_address(addr)
+            if addresses is None or addr in addresses:
+                profile[f"0x{addr:02X}"] = int(value) & 0xFFFFFFFF
+        return cls(dict(sorted(profile.items())), name)
+
+    def __len__(self):
+        return len(self.values)
+
+    # ----- 계산 -----
+
+    def target_values(self, register_map, current):
+        """적용 후 레지스터 값 {주소: 값} (전체 값 먼저, 그 위에 필드 값)
+
+        current: 필드만 지정된 레지스터의 현재 값 {주소: 값}
+        """
+        resolved = [(register_map.resolve(target), value) for target, value in self.values.items()]
+        result = {}
+        for (addr, field), value in resolved:
+            if field is None:
+                result[addr] = value & 0xFFFFFFFF
+        for (addr, field), value in resolved:
+            if field is not None:
+                if addr not in result:
+                    if addr not in current:
+                        raise ProfileError(f"현재 값을 모르는 레지스터: 0x{addr:02X}")
+                    result[addr] = current[addr]
+                result[addr] = field.insert(result[addr], value)
+        return result
+
+
+def compute_delta(targets, current):
+    """현재 값과 다른 레지스터만 {주소: 새 값} (현재 값을 모르면 변경으로 간주)"""
+    return {addr: value for addr, value in sorted(targets.items()) if current.get(addr) != value}
+
+
+class ApplyResult:
+    """apply_profile() 결과"""
+
+    def __init__(self):
+        self.targets = {}       # 프로파일 적용 후 값
+        self.delta = {}         # 실제로 쓴 레지스터
+        self.state_reads = 0    # 현재 상태 확인을 위해 읽은 레지스터 수
+        self.mismatched = {}    # 검증 실패 {주소: 읽은 값}
+        self.verified = False
+        self.batches = 0
+        self.elapsed_s = 0.0
+
+    @property
+    def ok(self):
+        return not self.mismatched
+
+    @property
+    def skipped(self):
+        return len(self.targets) - len(self.delta)
+
+    def as_dict(self):
+        return {
+            "ok": self.ok, "registers": len(self.targets), "written": len(self.delta), "skipped": self.skipped,
+            "state_reads": self.state_reads, "verified": self.verified, "batches": self.batches,
+            "mismatched": {f"0x{addr:02X}": f"0x{value:08X}" for addr, value in self.mismatched.items()},
+            "elapsed_ms": round(self.elapsed_s * 1000, 3),
+        }
+
+
+def apply_profile(device, profile, verify=False, use_shadow=True):
+    """프로파일을 최소 변경분으로 적용 (device: register_device.RegisterDevice)
+
+    use_shadow=True 이면 디바이스 섀도 값이 있는 레지스터는 읽지 않고 비교합니다.
+    현재 값을 모르는 레지스터는 배치 읽기 1회로 가져오고, 변경분 쓰기와 검증 읽기는 한 배치로 보냅니다.
+    """
+    result = ApplyResult()
+    started = time.perf_counter()
+    register_map = device.register_map
+    batches_before = device.batches
+
+    # 1) 비교에 필요한 현재 값 확보
+    needed = {register_map.resolve(target)[0] for target in profile.values}
+    current = {addr: device.shadow[addr] for addr in needed if use_shadow and addr in device.shadow}
+    missing = sorted(needed - set(current))
+    if missing:
+        current.update(device.read_addresses(missing))
+        result.state_reads = len(missing)
+
+    # 2) 변경분만 쓰기 (+ 검증 읽기) 를 한 트랜잭션으로
+    result.targets = profile.target_values(register_map, current)
+    result.delta = compute_delta(result.targets, current)
+    if result.delta:
+        with device.transaction() as tx:
+            for addr, value in result.delta.items():
+                tx.write(addr, value)
+            reads = {addr: tx.read(addr) for addr in result.delta} if verify else {}
+        result.verified = verify
+        for addr, pending in reads.items():
+            if pending.value != result.delta[addr]:
+                result.mismatched[addr] = pending.value
+    result.batches = device.batches - batches_before
+    result.elapsed_s = time.perf_counter() - started
+    transport_log.info("🎛️ 프로파일 '%s' 적용: %d개 중 %d개 변경, 배치 %d회, %.2fms%s",
+                       profile.name, len(result.targets), len(result.delta), result.batches,
+                       result.elapsed_s * 1000,
+                       f", 검증 실패 {len(result.mismatched)}" if result.mismatched else "")
+    return result
+
+
+def snapshot_profile(device, name="", addresses=None):
+    """디바이스의 맵 레지스터를 배치 읽기 1회로 읽어 프로파일 생성"""
+    values = device.dump()
+    return RegisterProfile.from_register_values(values, name, addresses)
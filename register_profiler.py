@@ -0,0 +1,198 @@
+"""
+샘플링 프로파일러와 GUI 멈춤 감시 (Qt 의존성 없음)
+
+별도 데몬 스레드가 interval_s 마다 sys._current_frames() 로 모든 Python 스레드(GUI 스레드, RegisterMonitor
+같은 전송 워커, Excel 로드 워커)의 호출 스택을 읽어 스택별 샘플 수를 셉니다. 계측 코드를 넣지 않으므로
+프로파일러를 켜지 않으면 비용이 없습니다. 켜면 샘플마다 GIL 을 잡아 스택을 훑어야 하는데, 다른 스레드가
+Python 코드를 바쁘게 돌리는 동안에는 GIL 전환 간격(sys.getswitchinterval(), 기본 5ms)만큼 기다리는 일이
+잦아 샘플 하나가 ms 단위로 늘어납니다. 샘플 시각은 시작 시각 기준의 마감 시각으로 잡아 이런 지연이 간격에
+누적되지 않게 하고, 이미 지난 마감은 몰아서 찍지 않고 건너뜁니다 (missed). 그래도 설정보다 느리게 돌 수
+있으므로 실제 샘플링 속도는 summary() 의 rate_hz 로 확인합니다.
+
+감시 대상 스레드(start() 를 호출한 스레드, 보통 GUI 스레드)는 이벤트 루프에서 heartbeat() 를 주기적으로
+호출합니다. 마지막 heartbeat 이후 stall_threshold_s 보다 오래 지나면 이벤트 루프가 막힌 것으로 보고,
+그동안의 감시 대상 스레드 샘플을 "[stall]" 아래에 따로 모읍니다 (평소 샘플과 중복 집계하지 않음).
+멈춤이 끝난 뒤 처음 호출된 heartbeat() 가 멈춤 기록을 돌려주므로 GUI 로그에 바로 남길 수 있습니다.
+
+    profiler = SamplingProfiler().start()      # GUI 스레드에서
+    timer.timeout.connect(profiler.heartbeat)  # HEARTBEAT_INTERVAL_S 간격 QTimer
+    ...
+    profiler.stop().save("stall.folded")       # flamegraph.pl / speedscope / Perfetto 에서 열기
+
+저장 형식은 flamegraph.pl 의 collapsed stack ("스레드;바깥 함수;...;안쪽 함수 샘플수" 한 줄씩) 입니다.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+DEFAULT_INTERVAL_S = 0.01            # 100Hz
+DEFAULT_STALL_THRESHOLD_S = 0.2
+HEARTBEAT_INTERVAL_S = 0.05          # 임계값보다 충분히 짧아야 함
+STALL_ROOT = "[stall]"
+
+
+class SamplingProfiler:
+    """모든 Python 스레드의 스택 샘플러 + 감시 스레드 멈춤 감지"""
+
+    def __init__(self, interval_s=DEFAULT_INTERVAL_S, stall_threshold_s=DEFAULT_STALL_THRESHOLD_S,
+                 thread_names=None):
+        if interval_s <= 0:
+            raise ValueError("샘플 간격은 0보다 커야 합니다")
+        if stall_threshold_s <= interval_s:
+            raise ValueError("멈춤 임계값은 샘플 간격보다 길어야 합니다")
+        self.interval_s = interval_s
+        self.stall_threshold_s = stall_threshold_s
+        self.thread_names = set(thread_names) if thread_names else None   # None 이면 모든 스레드
+        self.counts = Counter()      # collapsed 스택 -> 샘플 수
+        self.samples = 0             # 샘플링 횟수 (스레드 수와 무관)
+        self.missed = 0              # 마감을 놓쳐 건너뛴 샘플 수
+        self.stalls = []             # 끝난 멈춤 [{started_s, duration_s, samples, top}]
+        self.started = None
+        self.stopped = None
+        self._labels = {}            # 코드 객체 -> 프레임 이름
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._watched = None
+        self._heartbeat = 0.0
+        self._stall = None           # 진행 중인 멈춤 {"started": heartbeat 시각, "counts": Counter}
+
+    # ----- 시작 / 중지 -----
+
+    def start(self):
+        """호출한 스레드를 감시 대상으로 삼고 샘플링 시작"""
+        if self._thread is not None:
+            return self
+        self._watched = threading.get_ident()
+        self._heartbeat = self.started = time.perf_counter()
+        self.stopped = None
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is None:
+            return self
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.stopped = time.perf_counter()
+        self.heartbeat()             # 중지 시점까지 이어진 멈춤 마무리
+        return self
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def heartbeat(self):
+        """감시 대상 스레드의 이벤트 루프에서 주기적으로 호출, 막 끝난 멈춤이 있으면 그 기록 반환"""
+        now = time.perf_counter()
+        with self._lock:
+            self._heartbeat = now
+            stall, self._stall = self._stall, None
+            if stall is None:
+                return None
+            top = stall["counts"].most_common(1)
+            record = {
+                "started_s": stall["started"] - self.started,
+                "duration_s": now - stall["started"],
+                "samples": sum(stall["counts"].values()),
+                "top": top[0][0].rsplit(";", 1)[-1] if top else "",
+            }
+            self.stalls.append(record)
+        return record
+
+    # ----- 샘플링 -----
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, "co_qualname", code.co_name)
+            label = self._labels[code] = f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        return label
+
+    def _stack(self, frame):
+        labels = []
+        while frame is not None:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        labels.reverse()
+        return labels
+
+    def _snapshot(self, own):
+        """[(스레드 ID, collapsed 스택)] - 프레임 참조는 이 함수 안에서만 잡음
+
+        프레임을 잡고 있는 동안 락 대기 등으로 GIL 을 놓으면 대상 함수가 끝난 뒤에도 지역 변수가 살아남으므로
+        (paintEvent 의 QPainter 등) 스레드 이름은 먼저 구하고, 프레임은 문자열로 바꾼 즉시 놓아 잡는 시간을 줄입니다.
+        """
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        stacks = []
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            name = names.get(ident, f"thread-{ident}")
+            if self.thread_names is not None and name not in self.thread_names and ident != self._watched:
+                continue
+            stacks.append((ident, ";".join([name] + self._stack(frame))))
+        return stacks
+
+    def _run(self):
+        own = threading.get_ident()
+        due = time.perf_counter() + self.interval_s
+        while not self._stop.wait(max(0.0, due - time.perf_counter())):
+            stacks = self._snapshot(own)
+            now = time.perf_counter()
+            due += self.interval_s
+            # 스냅샷이 GIL 대기로 늦어져 다음 마감까지 지났으면 놓친 샘플은 건너뜀
+            missed = int((now - due) / self.interval_s) + 1 if now > due else 0
+            due += missed * self.interval_s
+            with self._lock:
+                self.samples += 1
+                self.missed += missed
+                stalled = now - self._heartbeat > self.stall_threshold_s
+                if stalled and self._stall is None:
+                    self._stall = {"started": self._heartbeat, "counts": Counter()}
+                for ident, stack in stacks:
+                    if stalled and ident == self._watched:
+                        self._stall["counts"][stack] += 1
+                        self.counts[f"{STALL_ROOT};{stack}"] += 1
+                    else:
+                        self.counts[stack] += 1
+
+    # ----- 결과 -----
+
+    def summary(self):
+        elapsed = (self.stopped or time.perf_counter()) - (self.started or time.perf_counter())
+        with self._lock:
+            stall_samples = sum(count for stack, count in self.counts.items() if stack.startswith(STALL_ROOT))
+            return {
+                "duration_s": round(elapsed, 3),
+                "samples": self.samples,
+                "rate_hz": round(self.samples / elapsed, 1) if elapsed > 0 else 0.0,
+                "target_hz": round(1 / self.interval_s, 1),
+                "missed": self.missed,
+                "stacks": len(self.counts),
+                "stall_samples": stall_samples,
+                "stalls": list(self.stalls),
+            }
+
+    def collapsed(self):
+        """flamegraph.pl collapsed stack 텍스트 (샘플 수 내림차순)"""
+        with self._lock:
+            items = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+        return "".join(f"{stack} {count}\n" for stack, count in items)
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.collapsed())
@@ -0,0 +1,86 @@
+"""
+레지스터 통신 프레임 형식 (Qt 의존성 없음)
+
+GUI 컨트롤러, 시뮬레이터, 스크립트가 같은 프레임 인코딩/디코딩을 사용합니다.
+    SPI : [RW(bit7, 1=읽기) | 7비트 주소] + 32비트 데이터 (big-endian)
+          읽기는 전이중(full-duplex) 5바이트 교환, 응답의 1~4번째 바이트가 데이터
+    I2C : 쓰기 [주소, 4바이트 데이터] / 읽기 [주소] 쓰기 후 4바이트 읽기
+    UART: "W,AA,VVVVVVVV\\n" / "R,AA\\n" 텍스트 명령, 응답은 16진수 문자열
+"""
+
+READ_FLAG = 0x80        # RW 비트 (1 = 읽기)
+ADDRESS_MASK = 0x7F     # 7비트 레지스터 주소
+DATA_BYTES = 4          # 32비트 데이터
+FRAME_BYTES = 1 + DATA_BYTES
+VALUE_MASK = 0xFFFFFFFF
+
+I2C_DEFAULT_ADDRESS = 0x50
+
+
+def value_to_bytes(value):
+    """32비트 값을 big-endian 4바이트 리스트로 변환"""
+    value = int(value) & VALUE_MASK
+    return [(value >> 24) & 0xFF, (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF]
+
+
+def bytes_to_value(data):
+    """big-endian 바이트열(최대 4바이트)을 정수로 변환"""
+    value = 0
+    for byte in data[:DATA_BYTES]:
+        value = (value << 8) | (byte & 0xFF)
+    return value
+
+
+# ========== SPI ==========
+
+def spi_write_frame(addr, value):
+    """SPI 쓰기 프레임 (RW=0) [cmd, d3, d2, d1, d0]"""
+    return [addr & ADDRESS_MASK] + value_to_bytes(value)
+
+
+def spi_read_frame(addr):
+    """SPI 읽기 프레임 (RW=1) [cmd, 0, 0, 0, 0]"""
+    return [READ_FLAG | (addr & ADDRESS_MASK)] + [0x00] * DATA_BYTES
+
+
+def decode_spi_read(response):
+    """전이중 읽기 응답에서 32비트 값 추출 (첫 바이트는 명령 구간), 길이가 짧으면 None"""
+    if response is None or len(response) < FRAME_BYTES:
+        return None
+    return bytes_to_value(response[1:FRAME_BYTES])
+
+
+# ========== I2C ==========
+
+def i2c_write_frame(addr, value):
+    """I2C 쓰기 프레임 [주소, d3, d2, d1, d0]"""
+    return [addr & 0xFF] + value_to_bytes(value)
+
+
+def decode_i2c_read(response):
+    """I2C 4바이트 읽기 응답에서 32비트 값 추출, 길이가 짧으면 None"""
+    if response is None or len(response) < DATA_BYTES:
+        return None
+    return bytes_to_value(response)
+
+
+# ========== UART ==========
+
+def uart_write_command(addr, value):
+    """UART 쓰기 명령 문자열"""
+    return f"W,{addr:02X},{int(value) & VALUE_MASK:08X}\n"
+
+
+def uart_read_command(addr):
+    """UART 읽기 명령 문자열"""
+    return f"R,{addr:02X}\n"
+
+
+def parse_uart_response(response):
+    """UART 응답("0x12345678" 또는 "12345678")을 정수로 변환, 해석할 수 없으면 None"""
+    try:
+        text = response.decode(errors="ignore") if isinstance(response, (bytes, bytearray)) else str(response)
+        text = text.strip().splitlines()[0].strip() if text.strip() else ""
+        return int(text, 16) & VALUE_MASK if text else None
+    except ValueError:
+        return None
@@ -0,0 +1,549 @@
+"""
+레지스터 시퀀스 엔진 (Qt 의존성 없음)
+
+보드 bring-up 절차를 파일(CSV / JSON / YAML)로 적어 두고 GUI 또는 명령줄에서 실행합니다.
+대상은 레지스터 맵의 주소, 레지스터 이름, 필드 이름으로 지정합니다 (register_map.RegisterMap.resolve).
+
+단계 종류:
+    write   target=레지스터 value=32비트 값        (target 이 필드면 field 와 같음)
+    field   target=레지스터.필드 value=필드 값      (섀도 값에 필드를 넣어 전체 레지스터 쓰기)
+    read    target=레지스터 또는 필드               (읽은 값을 결과에 기록)
+    expect  target value [mask]                   (읽어서 비교, 다르면 실패)
+    delay   value=ms  (소수 가능: 0.01 = 10us)
+    poll    target value [mask] [timeout_ms] [interval_ms]   (값이 맞을 때까지 반복 읽기)
+    until   target=조건식 [timeout_ms] [interval_ms] [max_interval_ms]
+            (조건식이 참이 될 때까지 반복 읽기, 간격은 interval_ms 부터 max_interval_ms 까지 지수 증가,
+             조건식 형식은 register_poll 참고: "EN_TX == 1 and RO_DATA_5 & 0x1")
+
+컴파일: 서로 의존하지 않는 연속된 write/field/read/expect 단계는 하나의 배치로 묶여
+register_transfer.transfer_batch() 한 번(pyftdi SPI 에서는 USB 쓰기/읽기 한 번)으로 전송됩니다.
+HARDWARE_DELAY_MAX_MS 이하의 delay 는 배치 안의 ("D", 초) 연산이 되어 pyftdi SPI 에서는 MPSSE 빈 클럭으로
+대기합니다 (전원 인가 시퀀스의 안정화 대기까지 USB 전송 한 번, 클럭 주기 단위의 정확한 대기).
+그 밖의 포트에서는 같은 자리에서 호스트 sleep 으로 기다립니다.
+배치가 끊기는 곳:
+    - HARDWARE_DELAY_MAX_MS 보다 긴 delay / poll / until (시간에 의존)
+    - 같은 배치 안에서 읽은 값이 필요한 field 쓰기 (읽기 결과가 배치 실행 후에야 나옴)
+    - 섀도 값을 모르는 레지스터의 field 쓰기 → 현재 배치 끝에 읽기를 추가하고 배치를 닫음
+    - stop_on_fail 일 때 expect 뒤 (실패하면 다음 단계를 보내지 않도록)
+
+CSV 형식 (첫 줄 헤더, '#' 으로 시작하는 줄은 주석):
+    op,target,value,mask,timeout_ms,interval_ms,max_interval_ms
+    write,EN,0x00000003
+    field,EN.EN_TX,1
+    poll,RO_DATA_5,0x1,0x1,500,5
+    until,EN_TX == 1 and EN_VCM == 1,,,500,1,50
+
+명령줄:
+    python register_sequence.py bringup.csv --map Sample_tree.json [--protocol SPI] [--url sim]
+"""
+
+import csv
+import json
+import os
+import time
+
+from register_logging import get_logger
+from register_map import RegisterMap, RegisterMapError, parse_value
+from register_poll import PollCondition, PollConditionError, PollUntil
+from register_transfer import transfer_batch, TransportError
+
+transport_log = get_logger("transport")
+
+STEP_TYPES = ("write", "field", "read", "expect", "delay", "poll", "until")
+BATCHED_TYPES = ("write", "field", "read", "expect")
+# 이보다 긴 delay 는 배치를 끊고 호스트에서 sleep (긴 대기 동안 USB 응답 대기를 붙잡지 않도록)
+HARDWARE_DELAY_MAX_MS = 50
+
+DEFAULT_POLL_TIMEOUT_MS = 1000
+DEFAULT_POLL_INTERVAL_MS = 10
+DEFAULT_UNTIL_MIN_INTERVAL_MS = 1
+DEFAULT_UNTIL_MAX_INTERVAL_MS = 100
+
+
+class SequenceError(ValueError):
+    """시퀀스 파일 또는 단계 형식 오류"""
+
+
+class Step:
+    """시퀀스 한 단계 (대상은 compile 시 주소/필드로 해석)"""
+
+    def __init__(self, op, target=None, value=None, mask=None, timeout_ms=None, interval_ms=None, line=None,
+                 max_interval_ms=None):
+        self.op = op
+        self.target = target
+        self.value = value
+        self.mask = mask
+        self.timeout_ms = timeout_ms
+        self.interval_ms = interval_ms
+        self.max_interval_ms = max_interval_ms
+        self.line = line          # 파일의 줄/항목 번호 (오류 메시지용)
+        self.addr = None
+        self.field = None
+        self.condition = None     # until: register_poll.PollCondition
+
+    @property
+    def label(self):
+        parts = [self.op]
+        if self.target is not None:
+            parts.append(str(self.target))
+        if self.value is not None:
+            parts.append(f"0x{self.value:X}" if self.op != "delay" else f"{self.value}ms")
+        return " ".join(parts)
+
+    def __repr__(self):
+        return f"Step({self.label})"
+
+
+# ========== 파일 로드 ==========
+
+def _number(value, name, line):
+    if value is None or str(value).strip() == "":
+        return None
+    try:
+        return parse_value(value)
+    except ValueError:
+        raise SequenceError(f"{line}번 단계: {name} 값이 숫자가 아님: {value}") from None
+
+
+def _milliseconds(value, line):
+    """delay 값 (소수 ms 허용)"""
+    if value is None or str(value).strip() == "":
+        return None
+    try:
+        return parse_value(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        raise SequenceError(f"{line}번 단계: value 값이 숫자가 아님: {value}") from None
+
+
+def parse_steps(records):
+    """dict 목록 → Step 목록 (형식 검사 포함)"""
+    steps = []
+    for line, record in enumerate(records, 1):
+        record = {str(k).strip().lower(): v for k, v in record.items() if k is not None}
+        line = record.pop("_line", line)
+        op = str(record.get("op", "")).strip().lower()
+        if op not in STEP_TYPES:
+            raise SequenceError(f"{line}번 단계: 알 수 없는 op '{op}' (사용 가능: {', '.join(STEP_TYPES)})")
+        target = record.get("target")
+        target = str(target).strip() if target not in (None, "") else None
+        value = record.get("value", record.get("ms"))
+        step = Step(op, target,
+                    _milliseconds(value, line) if op == "delay" else _number(value, "value", line),
+                    _number(record.get("mask"), "mask", line),
+                    _number(record.get("timeout_ms"), "timeout_ms", line),
+                    _number(record.get("interval_ms"), "interval_ms", line),
+                    line,
+                    _number(record.get("max_interval_ms"), "max_interval_ms", line))
+        if op != "delay" and target is None:
+            raise SequenceError(f"{line}번 단계: {op} 에는 target 이 필요합니다")
+        if op in ("write", "field", "expect", "poll", "delay") and step.value is None:
+            raise SequenceError(f"{line}번 단계: {op} 에는 value 가 필요합니다")
+        if op == "delay" and step.value < 0:
+            raise SequenceError(f"{line}번 단계: delay 는 0 이상이어야 합니다")
+        steps.append(step)
+    return steps
+
+
+def _read_csv(path):
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        lines = [(number, text) for number, text in enumerate(f, 1)
+                 if text.strip() and not text.lstrip().startswith("#")]
+    rows = list(csv.DictReader([text for _, text in lines]))
+    for (number, _), row in zip(lines[1:], rows):
+        row["_line"] = number
+    return rows
+
+
+def load_sequence(path):
+    """.csv / .json / .yaml(.yml) 시퀀스 파일 로드"""
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension == ".csv":
+        records = _read_csv(path)
+    elif extension == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+    elif extension in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise SequenceError("YAML 시퀀스에는 PyYAML 이 필요합니다 (pip install pyyaml)") from None
+        with open(path, "r", encoding="utf-8") as f:
+            records = yaml.safe_load(f)
+    else:
+        raise SequenceError(f"지원하지 않는 시퀀스 형식: {extension} (.csv / .json / .yaml)")
+    if isinstance(records, dict):
+        records = records.get("steps", [])
+    if not isinstance(records, list):
+        raise SequenceError("시퀀스는 단계 목록이어야 합니다 (또는 {'steps': [...]})")
+    return parse_steps(records)
+
+
+# ========== 컴파일 ==========
+
+class Block:
+    """한 번에 실행되는 단위: 배치(여러 단계) 또는 delay/poll 단계 하나"""
+
+    def __init__(self, batched):
+        self.batched = batched
+        self.steps = []
+        self.prefetch = []   # 다음 배치의 field 쓰기를 위해 끝에 덧붙이는 읽기 주소
+
+    def __repr__(self):
+        kind = "batch" if self.batched else "single"
+        return f"Block({kind}, {[step.label for step in self.steps]}, prefetch={self.prefetch})"
+
+
+def compile_steps(steps, register_map, known=()):
+    """대상 해석 후 배치 경계 결정
+
+    known: 실행 시작 시 섀도 값이 있는 주소들 (field 쓰기에 읽기가 필요 없음)
+    """
+    blocks = []
+    known = set(known)
+    current = None
+    read_in_batch = set()   # 현재 배치에서 값이 읽기 결과에 의존하는 주소
+
+    def close():
+        nonlocal current
+        if current is not None and (current.steps or current.prefetch):
+            blocks.append(current)
+        current = None
+        read_in_batch.clear()
+
+    for step in steps:
+        if step.op == "until":
+            try:
+                step.condition = PollCondition(step.target, register_map)
+            except PollConditionError as e:
+                raise SequenceError(f"{step.line}번 단계: {e}") from None
+        elif step.target is not None:
+            try:
+                step.addr, field = register_map.resolve(step.target)
+            except RegisterMapError as e:
+                raise SequenceError(f"{step.line}번 단계: {e}") from None
+            step.field = field
+            if step.op == "write" and field is not None:
+                step.op = "field"
+            if step.op == "field" and field is None:
+                raise SequenceError(f"{step.line}번 단계: field 에는 '레지스터.필드' 대상이 필요합니다")
+
+        if step.op == "delay" and step.value <= HARDWARE_DELAY_MAX_MS:
+            if current is None:
+                current = Block(True)
+            current.steps.append(step)
+            continue
+
+        if step.op not in BATCHED_TYPES:
+            close()
+            single = Block(False)
+            single.steps.append(step)
+            blocks.append(single)
+            if step.op == "poll":
+                known.add(step.addr)
+            elif step.op == "until":
+                known.update(step.condition.addresses)
+            continue
+
+        if step.op == "field":
+            if step.addr in read_in_batch:
+                close()
+            elif step.addr not in known:
+                # 섀도 값을 모름: 현재 배치 끝에 읽기를 붙여 값을 받은 뒤 새 배치 시작
+                if current is None:
+                    current = Block(True)
+                current.prefetch.append(step.addr)
+                close()
+                known.add(step.addr)
+
+        if current is None:
+            current = Block(True)
+        current.steps.append(step)
+
+        if step.op in ("write", "field"):
+            known.add(step.addr)
+            read_in_batch.discard(step.addr)
+        else:
+            known.add(step.addr)
+            read_in_batch.add(step.addr)
+    close()
+    return blocks
+
+
+# ========== 실행 ==========
+
+class StepResult:
+    """단계 실행 결과"""
+
+    def __init__(self, step, block_index):
+        self.step = step
+        self.block = block_index
+        self.ok = True
+        self.value = None          # read/expect/poll 에서 읽은 값 (필드 대상이면 필드 값)
+        self.duration_s = 0.0      # 배치 단계는 배치 시간을 단계 수로 나눈 값
+        self.message = ""
+
+    def as_dict(self):
+        return {
+            "line": self.step.line, "op": self.step.op, "target": self.step.target,
+            "addr": self.step.addr, "ok": self.ok, "value": self.value,
+            "block": self.block, "duration_ms": round(self.duration_s * 1000, 3), "message": self.message,
+        }
+
+
+class SequenceResult:
+    """시퀀스 전체 결과"""
+
+    def __init__(self):
+        self.steps = []
+        self.blocks = 0
+        self.batches = 0        # 배치 전송 횟수
+        self.frames = 0         # 전송한 레지스터 프레임 수
+        self.total_s = 0.0
+        self.aborted = False
+
+    @property
+    def ok(self):
+        return not self.aborted and all(result.ok for result in self.steps)
+
+    @property
+    def failures(self):
+        return [result for result in self.steps if not result.ok]
+
+    def as_dict(self):
+        return {
+            "ok": self.ok, "aborted": self.aborted, "blocks": self.blocks, "batches": self.batches,
+            "frames": self.frames, "total_ms": round(self.total_s * 1000, 3),
+            "steps": [result.as_dict() for result in self.steps],
+        }
+
+
+class SequenceEngine:
+    """컴파일된 시퀀스를 포트 위에서 실행
+
+    shadow: {주소: 값} 마지막으로 쓰거나 읽은 값 (field 쓰기의 기준값, 실행 후 갱신됨)
+    """
+
+    def __init__(self, port, protocol, register_map, shadow=None, stop_on_fail=True,
+                 response_wait=0.0, sleep=time.sleep, clock=time.perf_counter):
+        self.port = port
+        self.protocol = protocol
+        self.register_map = register_map
+        self.shadow = dict(shadow or {})
+        self.stop_on_fail = stop_on_fail
+        self.response_wait = response_wait
+        self.sleep = sleep
+        self.clock = clock
+
+    def compile(self, steps):
+        blocks = compile_steps(steps, self.register_map, self.shadow)
+        if self.stop_on_fail:
+            blocks = self._split_after_expect(blocks)
+        return blocks
+
+    @staticmethod
+    def _split_after_expect(blocks):
+        """expect 실패 시 뒤 단계가 이미 전송되지 않도록 expect 뒤에서 배치를 나눔"""
+        result = []
+        for block in blocks:
+            if not block.batched:
+                result.append(block)
+                continue
+            part = Block(True)
+            for step in block.steps:
+                part.steps.append(step)
+                if step.op == "expect":
+                    result.append(part)
+                    part = Block(True)
+            part.prefetch = block.prefetch
+            if part.steps or part.prefetch:
+                result.append(part)
+        return result
+
+    def run(self, steps, progress=None):
+        """시퀀스 실행 → SequenceResult
+
+        progress(완료 단계 수, 전체 단계 수) 콜백은 블록마다 호출됩니다.
+        통신 오류(TransportError)는 해당 블록의 단계를 실패로 기록하고 중단합니다.
+        """
+        blocks = self.compile(steps)
+        result = SequenceResult()
+        result.blocks = len(blocks)
+        started = self.clock()
+        done = 0
+        for index, block in enumerate(blocks):
+            block_started = self.clock()
+            try:
+                if block.batched:
+                    block_results = self._run_batch(block, index)
+                    result.batches += 1
+                    result.frames += sum(step.op != "delay" for step in block.steps) + len(block.prefetch)
+                else:
+                    block_results = [self._run_single(block.steps[0], index, result)]
+            except TransportError as e:
+                block_results = [StepResult(step, index) for step in block.steps]
+                for step_result in block_results:
+                    step_result.ok = False
+                    step_result.message = f"통신 오류: {e}"
+                transport_log.error("❌ 시퀀스 블록 %d 통신 오류: %s", index, e)
+                result.aborted = True
+            elapsed = self.clock() - block_started
+            for step_result in block_results:
+                if not step_result.duration_s:
+                    step_result.duration_s = elapsed / len(block_results)
+            result.steps.extend(block_results)
+            done += len(block.steps)
+            if progress is not None:
+                progress(done, len(steps))
+            if result.aborted or (self.stop_on_fail and any(not r.ok for r in block_results)):
+                result.aborted = True
+                break
+        result.total_s = self.clock() - started
+        transport_log.info("🧾 시퀀스 완료: %d단계, 블록 %d개 (배치 %d), %.1fms, %s",
+                           len(result.steps), result.blocks, result.batches, result.total_s * 1000,
+                           "성공" if result.ok else f"실패 {len(result.failures)}")
+        return result
+
+    def _run_batch(self, block, index):
+        ops, shadow = [], dict(self.shadow)
+        for step in block.steps:
+            if step.op == "write":
+                shadow[step.addr] = step.value & 0xFFFFFFFF
+                ops.append(("W", step.addr, shadow[step.addr]))
+            elif step.op == "field":
+                shadow[step.addr] = step.field.insert(shadow[step.addr], step.value)
+                ops.append(("W", step.addr, shadow[step.addr]))
+            elif step.op == "delay":
+                ops.append(("D", step.value / 1000.0))
+            else:
+                ops.append(("R", step.addr))
+        ops.extend(("R", addr) for addr in block.prefetch)
+
+        values = transfer_batch(self.port, self.protocol, ops, self.response_wait)
+
+        results = []
+        for step, op, value in zip(block.steps, ops, values):
+            step_result = StepResult(step, index)
+            if op[0] == "D":
+                step_result.duration_s = op[1]
+            elif op[0] == "W":
+                self.shadow[step.addr] = op[2]
+            else:
+                self.shadow[step.addr] = value
+                self._check(step, step_result, value)
+            results.append(step_result)
+        for addr, value in zip(block.prefetch, values[len(block.steps):]):
+            self.shadow[addr] = value
+        return results
+
+    def _check(self, step, step_result, register_value):
+        value = step.field.extract(register_value) if step.field is not None else register_value
+        step_result.value = value
+        if step.op in ("expect", "poll"):
+            mask = step.mask if step.mask is not None else 0xFFFFFFFF
+            step_result.ok = (value & mask) == (step.value & mask)
+            if not step_result.ok:
+                step_result.message = f"기대 0x{step.value & mask:X}, 읽음 0x{value & mask:X} (mask 0x{mask:X})"
+        return step_result.ok
+
+    def _run_single(self, step, index, result):
+        step_result = StepResult(step, index)
+        if step.op == "delay":
+            self.sleep(step.value / 1000.0)
+            return step_result
+        if step.op == "until":
+            return self._run_until(step, step_result, result)
+        # poll: 값이 맞거나 시간이 다 될 때까지 고정 간격으로 읽기
+        timeout = (step.timeout_ms if step.timeout_ms is not None else DEFAULT_POLL_TIMEOUT_MS) / 1000.0
+        interval = (step.interval_ms if step.interval_ms is not None else DEFAULT_POLL_INTERVAL_MS) / 1000.0
+        deadline = self.clock() + timeout
+        attempts = 0
+        while True:
+            value = transfer_batch(self.port, self.protocol, [("R", step.addr)], self.response_wait)[0]
+            attempts += 1
+            result.frames += 1
+            self.shadow[step.addr] = value
+            if self._check(step, step_result, value) or self.clock() >= deadline:
+                break
+            self.sleep(interval)
+        if not step_result.ok:
+            step_result.message = f"시간 초과 ({attempts}회 읽기): " + step_result.message
+        else:
+            step_result.message = f"{attempts}회 읽기"
+        return step_result
+
+    def _run_until(self, step, step_result, result):
+        """until: 조건식에 쓰인 레지스터를 배치로 읽으며 적응형 백오프로 대기"""
+        def read(addresses):
+            values = transfer_batch(self.port, self.protocol, [("R", addr) for addr in addresses],
+                                    self.response_wait)
+            result.frames += len(addresses)
+            self.shadow.update(zip(addresses, values))
+            return dict(zip(addresses, values))
+
+        timeout_ms = step.timeout_ms if step.timeout_ms is not None else DEFAULT_POLL_TIMEOUT_MS
+        min_ms = step.interval_ms if step.interval_ms is not None else DEFAULT_UNTIL_MIN_INTERVAL_MS
+        max_ms = step.max_interval_ms if step.max_interval_ms is not None else max(min_ms, DEFAULT_UNTIL_MAX_INTERVAL_MS)
+        poll = PollUntil(step.condition, read, timeout_ms / 1000.0, min_ms / 1000.0, max(min_ms, max_ms) / 1000.0,
+                         clock=self.clock).run(self.sleep)
+        step_result.ok = poll.ok
+        step_result.message = f"{poll.attempts}회 읽기, {poll.elapsed_s * 1000:.3f}ms"
+        if not poll.ok:
+            step_result.message = "시간 초과 (" + step_result.message + ")"
+        return step_result
+
+
+def format_report(result):
+    """사람이 읽는 단계별 시간 보고서 (GUI 로그/명령줄 출력용)"""
+    lines = []
+    for step_result in result.steps:
+        step = step_result.step
+        status = "✅" if step_result.ok else "❌"
+        value = f" = 0x{step_result.value:X}" if step_result.value is not None else ""
+        message = f"  ({step_result.message})" if step_result.message else ""
+        lines.append(f"{status} [{step_result.block:>3}] {step.label}{value}"
+                     f"  {step_result.duration_s * 1000:.3f}ms{message}")
+    lines.append(f"🧾 {len(result.steps)}단계, 블록 {result.blocks}개 (배치 {result.batches}), "
+                 f"프레임 {result.frames}개, 총 {result.total_s * 1000:.3f}ms → {'성공' if result.ok else '실패'}")
+    return lines
+
+
+# ========== 명령줄 ==========
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="레지스터 시퀀스 실행")
+    parser.add_argument("sequence", help="시퀀스 파일 (.csv / .json / .yaml)")
+    parser.add_argument("--map", required=True, help="레지스터 맵 (.json 또는 Excel)")
+    parser.add_argument("--protocol", default="SPI", choices=("SPI", "I2C", "UART"))
+    parser.add_argument("--url", default="sim", help="'sim' 또는 ftdi:// URL (기본 sim)")
+    parser.add_argument("--frequency", type=int, default=None, help="버스 주파수 / 보드레이트")
+    parser.add_argument("--keep-going", action="store_true", help="expect/poll 실패 후에도 계속 실행")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력")
+    args = parser.parse_args(argv)
+
+    from register_ports import open_port
+    register_map = RegisterMap.from_file(args.map)
+    steps = load_sequence(args.sequence)
+    port, closer = open_port(args.protocol, args.url, register_map, args.frequency)
+    try:
+        # 섀도 값 없이 시작: field 쓰기 전에 실제 디바이스 값을 한 번 읽음
+        engine = SequenceEngine(port, args.protocol, register_map,
+                                stop_on_fail=not args.keep_going,
+                                response_wait=0.1 if args.protocol == "UART" else 0.0)
+        result = engine.run(steps)
+    finally:
+        if closer is not None:
+            closer.close()
+    if args.json:
+        print(json.dumps(result.as_dict(), ensure_ascii=False, indent=2))
+    else:
+        print("\n".join(format_report(result)))
+    return 0 if result.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
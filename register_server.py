@@ -0,0 +1,554 @@
+#!/usr/bin/env python3
+"""
+네트워크 레지스터 서버 (FT2232H 하나를 여러 클라이언트가 공유, Qt 의존성 없음)
+
+FTDI 핸들은 한 프로세스만 열 수 있으므로, 서버가 장치를 소유하고 TCP 또는 Unix 소켓으로
+레지스터 읽기/쓰기/배치/구독을 제공합니다.
+    - 버스 작업 스레드 하나가 요청 큐를 비우며, 그동안 쌓인 여러 클라이언트의 요청을
+      transfer_batch() 한 번으로 합쳐 전송합니다 (pyftdi SPI 에서는 USB 쓰기/읽기 한 번).
+      합친 전송이 실패하면 읽기만 있는 요청은 하나씩 다시 보내고, 쓰기/지연이 든 요청은 (이미 버스에
+      나갔을 수 있으므로) 다시 보내지 않고 오류를 돌려줍니다. 전송당 프레임은 max_batch_frames 를 넘지 않습니다.
+    - 읽기/쓰기 결과 값이 바뀐 레지스터는 구독한 클라이언트에게 변경 알림을 보냅니다.
+
+바이너리 프로토콜 (리틀 엔디언):
+    헤더    : 길이 u32 (헤더 뒤 바이트 수) | 종류 u8 | 요청 ID u32
+    BATCH   (0x01) : 개수 u16, (연산 u8 0=읽기 1=쓰기 2=지연, 주소 u8, 값 u32) x 개수
+                     (지연은 값이 마이크로초, 서버의 transfer_batch 안에서 대기 → MPSSE 빈 클럭)
+    SUBSCRIBE (0x02) / UNSUBSCRIBE (0x03) : 개수 u16, 주소 u8 x 개수 (개수 0 = 모든 주소)
+    RESULT  (0x81) : 개수 u16, 값 u32 x 개수 (쓰기 자리는 0)
+    ERROR   (0x82) : UTF-8 메시지
+    NOTIFY  (0x90) : 요청 ID 0, 개수 u16, (주소 u8, 값 u32) x 개수
+
+클라이언트 RegisterClient 는 transfer_ops() 를 제공하므로 register_transfer.transfer_batch() 의 포트로
+바로 쓸 수 있습니다 (RegisterDevice, 시퀀스, register_cli 의 --url tcp://... / unix://...).
+
+사용법:
+    python register_server.py --map Sample_tree.json --url sim --listen tcp://127.0.0.1:5555
+    python register_server.py --url ftdi://ftdi:2232h/1 --listen unix:///tmp/register.sock
+"""
+
+import itertools
+import os
+import queue
+import socket
+import socketserver
+import struct
+import sys
+import threading
+
+from register_logging import get_logger
+from register_transfer import transfer_batch, TransportError
+
+transport_log = get_logger("transport")
+
+HEADER = struct.Struct("<IBI")
+COUNT = struct.Struct("<H")
+OP = struct.Struct("<BBI")
+VALUE = struct.Struct("<I")
+NOTIFY_ITEM = struct.Struct("<BI")
+
+MSG_BATCH = 0x01
+MSG_SUBSCRIBE = 0x02
+MSG_UNSUBSCRIBE = 0x03
+MSG_RESULT = 0x81
+MSG_ERROR = 0x82
+MSG_NOTIFY = 0x90
+
+OP_READ = 0
+OP_WRITE = 1
+OP_DELAY = 2
+
+MAX_MESSAGE_BYTES = 1 << 20
+DEFAULT_MAX_BATCH_FRAMES = 256
+
+
+# ========== 메시지 인코딩 ==========
+
+def encode_message(kind, request_id, payload=b""):
+    return HEADER.pack(len(payload), kind, request_id) + payload
+
+
+def encode_ops(ops):
+    """("W", 주소, 값) / ("R", 주소) / ("D", 초) 목록 → BATCH 페이로드"""
+    parts = [COUNT.pack(len(ops))]
+    for op in ops:
+        if op[0] == "W":
+            parts.append(OP.pack(OP_WRITE, op[1], op[2] & 0xFFFFFFFF))
+        elif op[0] == "D":
+            parts.append(OP.pack(OP_DELAY, 0, min(round(op[1] * 1e6), 0xFFFFFFFF)))
+        else:
+            parts.append(OP.pack(OP_READ, op[1], 0))
+    return b"".join(parts)
+
+
+def decode_ops(payload):
+    (count,) = COUNT.unpack_from(payload)
+    if len(payload) != COUNT.size + count * OP.size:
+        raise ValueError("BATCH 페이로드 길이 오류")
+    ops = []
+    for index in range(count):
+        kind, addr, value = OP.unpack_from(payload, COUNT.size + index * OP.size)
+        if kind == OP_WRITE:
+            ops.append(("W", addr, value))
+        elif kind == OP_DELAY:
+            ops.append(("D", value / 1e6))
+        else:
+            ops.append(("R", addr))
+    return ops
+
+
+def encode_values(values):
+    return COUNT.pack(len(values)) + b"".join(VALUE.pack(value or 0) for value in values)
+
+
+def decode_values(payload):
+    (count,) = COUNT.unpack_from(payload)
+    return [VALUE.unpack_from(payload, COUNT.size + i * VALUE.size)[0] for i in range(count)]
+
+
+def encode_addresses(addresses):
+    addresses = list(addresses or [])
+    return COUNT.pack(len(addresses)) + bytes(addresses)
+
+
+def decode_addresses(payload):
+    (count,) = COUNT.unpack_from(payload)
+    return list(payload[COUNT.size:COUNT.size + count])
+
+
+def encode_notify(changes):
+    return COUNT.pack(len(changes)) + b"".join(NOTIFY_ITEM.pack(addr, value) for addr, value in changes)
+
+
+def decode_notify(payload):
+    (count,) = COUNT.unpack_from(payload)
+    return [NOTIFY_ITEM.unpack_from(payload, COUNT.size + i * NOTIFY_ITEM.size) for i in range(count)]
+
+
+def _recv_exact(sock, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("연결이 닫힘")
+        data += chunk
+    return bytes(data)
+
+
+def read_message(sock):
+    """소켓에서 메시지 하나 읽기 → (종류, 요청 ID, 페이로드)"""
+    length, kind, request_id = HEADER.unpack(_recv_exact(sock, HEADER.size))
+    if length > MAX_MESSAGE_BYTES:
+        raise ValueError(f"메시지가 너무 큼: {length}바이트")
+    return kind, request_id, _recv_exact(sock, length) if length else b""
+
+
+def parse_listen_address(text):
+    """'tcp://host:port' / 'unix:///path' → (socket family, 주소)"""
+    if text.startswith("unix://"):
+        return socket.AF_UNIX, text[len("unix://"):]
+    if text.startswith("tcp://"):
+        text = text[len("tcp://"):]
+    host, _, port = text.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+# ========== 서버 ==========
+
+class _Request:
+    def __init__(self, ops, reply):
+        self.ops = ops
+        self.reply = reply    # reply(values, error) - 버스 스레드에서 호출
+
+
+class ServerStats:
+    def __init__(self):
+        self.clients = 0
+        self.requests = 0
+        self.batches = 0       # 버스 전송 횟수
+        self.frames = 0
+        self.notifications = 0
+        self.max_merged = 0    # 한 번의 전송에 합쳐진 최대 요청 수
+        self.split = 0         # 실패해서 요청별로 나눠 처리한 병합 전송
+
+    def as_dict(self):
+        return dict(self.__dict__)
+
+
+class _ClientHandler(socketserver.BaseRequestHandler):
+    """클라이언트 연결 하나 (요청은 기다리지 않고 큐에 넣어 같은 연결에서 여러 요청을 겹칠 수 있음)"""
+
+    def setup(self):
+        self.send_lock = threading.Lock()
+        self.subscriptions = set()
+        self.subscribe_all = False
+        self.server.register_server._add_client(self)
+
+    def send(self, kind, request_id, payload=b""):
+        message = encode_message(kind, request_id, payload)
+        with self.send_lock:
+            try:
+                self.request.sendall(message)
+            except OSError:
+                pass  # 끊어진 연결은 handle() 루프가 정리
+
+    def wants(self, addr):
+        return self.subscribe_all or addr in self.subscriptions
+
+    def handle(self):
+        register_server = self.server.register_server
+        while True:
+            try:
+                kind, request_id, payload = read_message(self.request)
+            except (ConnectionError, OSError):
+                return
+            except ValueError as e:
+                self.send(MSG_ERROR, 0, str(e).encode())
+                return
+            try:
+                if kind == MSG_BATCH:
+                    ops = decode_ops(payload)
+                    register_server.submit(ops, lambda values, error, rid=request_id: self._reply(rid, values, error))
+                elif kind == MSG_SUBSCRIBE:
+                    addresses = decode_addresses(payload)
+                    if addresses:
+                        self.subscriptions.update(addresses)
+                    else:
+                        self.subscribe_all = True
+                    self.send(MSG_RESULT, request_id, encode_values([]))
+                elif kind == MSG_UNSUBSCRIBE:
+                    addresses = decode_addresses(payload)
+                    if addresses:
+                        self.subscriptions.difference_update(addresses)
+                    else:
+                        self.subscriptions.clear()
+                        self.subscribe_all = False
+                    self.send(MSG_RESULT, request_id, encode_values([]))
+                else:
+                    self.send(MSG_ERROR, request_id, f"알 수 없는 메시지 종류: 0x{kind:02X}".encode())
+            except (ValueError, struct.error) as e:
+                self.send(MSG_ERROR, request_id, f"잘못된 요청: {e}".encode())
+
+    def _reply(self, request_id, values, error):
+        if error is not None:
+            self.send(MSG_ERROR, request_id, str(error).encode())
+        else:
+            self.send(MSG_RESULT, request_id, encode_values(values))
+
+    def finish(self):
+        self.server.register_server._remove_client(self)
+
+
+class _TcpServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+class RegisterServer:
+    """포트를 소유하고 여러 클라이언트 요청을 배치로 합쳐 전송하는 서버"""
+
+    def __init__(self, port, protocol="SPI", response_wait=0.0, max_batch_frames=DEFAULT_MAX_BATCH_FRAMES):
+        self.port = port
+        self.protocol = protocol
+        self.response_wait = response_wait
+        self.max_batch_frames = max_batch_frames
+        self.shadow = {}
+        self.stats = ServerStats()
+        self._queue = queue.Queue()
+        self._held = None       # 한도를 넘어 다음 전송으로 미룬 요청
+        self._clients = set()
+        self._clients_lock = threading.Lock()
+        self._servers = []
+        self._running = True
+        self._bus_thread = threading.Thread(target=self._bus_loop, name="register-bus", daemon=True)
+        self._bus_thread.start()
+
+    # ----- 소켓 -----
+
+    def listen(self, address):
+        """'tcp://host:port' 또는 'unix:///path' 에서 대기 시작 (백그라운드 스레드), 실제 주소 문자열 반환"""
+        family, target = parse_listen_address(address)
+        if family == socket.AF_UNIX:
+            if os.path.exists(target):
+                os.unlink(target)
+            server = _UnixServer(target, _ClientHandler)
+            actual = f"unix://{target}"
+        else:
+            server = _TcpServer(target, _ClientHandler)
+            host, port = server.server_address[:2]
+            actual = f"tcp://{host}:{port}"
+        server.register_server = self
+        threading.Thread(target=server.serve_forever, name=f"register-server {actual}", daemon=True).start()
+        self._servers.append(server)
+        transport_log.info("🌐 레지스터 서버 대기: %s (%s)", actual, self.protocol)
+        return actual
+
+    def shutdown(self):
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+            if isinstance(server.server_address, str) and os.path.exists(server.server_address):
+                os.unlink(server.server_address)
+        self._servers = []
+        self._running = False
+        self._queue.put(None)
+        self._bus_thread.join(timeout=2.0)
+
+    def _add_client(self, handler):
+        with self._clients_lock:
+            self._clients.add(handler)
+            self.stats.clients += 1
+
+    def _remove_client(self, handler):
+        with self._clients_lock:
+            self._clients.discard(handler)
+
+    # ----- 버스 -----
+
+    def submit(self, ops, reply):
+        """연산 목록을 버스 큐에 추가 (reply(values, error) 는 버스 스레드에서 호출)"""
+        self._queue.put(_Request(ops, reply))
+
+    def _bus_loop(self):
+        while self._running:
+            request, self._held = self._held, None
+            if request is None:
+                request = self._queue.get()
+            if request is None:
+                break
+            # 이전 전송 동안 쌓인 요청을 한 번의 전송으로 합침 (한도를 넘기는 요청은 다음 전송으로,
+            # 한도보다 큰 요청 하나는 단독으로 전송)
+            merged, frames = [request], len(request.ops)
+            while frames < self.max_batch_frames:
+                try:
+                    request = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._running = False
+                    break
+                if frames + len(request.ops) > self.max_batch_frames:
+                    self._held = request
+                    break
+                merged.append(request)
+                frames += len(request.ops)
+            self._execute(merged)
+        if self._held is not None:
+            self._execute([self._held])
+            self._held = None
+
+    def _execute(self, requests):
+        """병합된 요청을 한 번에 전송
+
+        실패하면 쓰기나 지연이 든 요청은 이미 버스에 나갔을 수 있으므로 (MPSSE 는 읽기가 실패하기 전에
+        모든 쓰기를 내보냄) 다시 보내지 않고 오류를 돌려주고, 읽기만 있는 요청만 하나씩 다시 보냅니다.
+        """
+        ops = [op for request in requests for op in request.ops]
+        self.stats.requests += len(requests)
+        self.stats.frames += len(ops)
+        self.stats.max_merged = max(self.stats.max_merged, len(requests))
+        values, error = self._transfer(ops)
+        if error is None:
+            offset = 0
+            for request in requests:
+                count = len(request.ops)
+                request.reply(values[offset:offset + count], None)
+                offset += count
+            self._notify(ops, values)
+            return
+        if len(requests) == 1:
+            transport_log.error("❌ 서버 버스 전송 오류: %s", error)
+            requests[0].reply(None, error)
+            return
+
+        # 읽기만 있는 요청은 다른 클라이언트의 오류로 실패하지 않도록 하나씩 다시 전송
+        transport_log.warning("⚠️ 병합 전송 오류 (%d개 요청): %s → 읽기 요청만 재전송", len(requests), error)
+        self.stats.split += 1
+        for request in requests:
+            if any(op[0] != "R" for op in request.ops):
+                request.reply(None, error)
+                continue
+            values, retry_error = self._transfer(request.ops)
+            if retry_error is not None:
+                transport_log.error("❌ 서버 버스 전송 오류: %s", retry_error)
+            request.reply(values, retry_error)
+            if values is not None:
+                self._notify(request.ops, values)
+
+    def _transfer(self, ops):
+        """(값 목록, None) 또는 (None, 오류)"""
+        self.stats.batches += 1
+        try:
+            return (transfer_batch(self.port, self.protocol, ops, self.response_wait) if ops else []), None
+        except (TransportError, OSError, ValueError) as e:
+            return None, e
+
+    def _notify(self, ops, values):
+        changes = {}
+        for op, value in zip(ops, values):
+            if op[0] == "D":
+                continue
+            new = op[2] if op[0] == "W" else value
+            if self.shadow.get(op[1]) != new:
+                changes[op[1]] = new
+            self.shadow[op[1]] = new
+        if not changes:
+            return
+        with self._clients_lock:
+            clients = list(self._clients)
+        for client in clients:
+            items = [(addr, value) for addr, value in changes.items() if client.wants(addr)]
+            if items:
+                client.send(MSG_NOTIFY, 0, encode_notify(items))
+                self.stats.notifications += 1
+
+
+# ========== 클라이언트 ==========
+
+class RegisterClient:
+    """레지스터 서버 클라이언트 (스레드 안전, 여러 스레드의 요청이 한 연결에서 겹칠 수 있음)"""
+
+    def __init__(self, address, timeout=5.0):
+        family, target = parse_listen_address(address)
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.connect(target)
+        if family == socket.AF_INET:
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.timeout = timeout
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._callbacks = []
+        self._closed = False
+        self._reader = threading.Thread(target=self._read_loop, name="register-client", daemon=True)
+        self._reader.start()
+
+    def _read_loop(self):
+        while True:
+            try:
+                kind, request_id, payload = read_message(self.sock)
+            except (ConnectionError, OSError, ValueError):
+                break
+            if kind == MSG_NOTIFY:
+                changes = decode_notify(payload)
+                for callback in list(self._callbacks):
+                    callback(changes)
+                continue
+            with self._lock:
+                slot = self._pending.pop(request_id, None)
+            if slot is not None:
+                slot[1] = (kind, payload)
+                slot[0].set()
+        # 연결 종료: 대기 중인 요청 깨우기
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for slot in pending.values():
+            slot[1] = (MSG_ERROR, "서버 연결이 끊어짐".encode())
+            slot[0].set()
+
+    def _request(self, kind, payload):
+        request_id = next(self._ids)
+        slot = [threading.Event(), None]
+        with self._lock:
+            self._pending[request_id] = slot
+        with self._send_lock:
+            self.sock.sendall(encode_message(kind, request_id, payload))
+        if not slot[0].wait(self.timeout):
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise TransportError(f"서버 응답 시간 초과 ({self.timeout:.1f}s)")
+        reply_kind, reply = slot[1]
+        if reply_kind == MSG_ERROR:
+            raise TransportError(f"서버 오류: {reply.decode(errors='replace')}")
+        return decode_values(reply)
+
+    # ----- 레지스터 연산 -----
+
+    def transfer_ops(self, ops):
+        """("W", 주소, 값) / ("R", 주소) / ("D", 초) 목록 → 읽기 값 목록 (register_transfer.transfer_batch 호환)"""
+        values = self._request(MSG_BATCH, encode_ops(ops))
+        return [value if op[0] == "R" else None for op, value in zip(ops, values)]
+
+    def read_many(self, addresses):
+        return self.transfer_ops([("R", addr) for addr in addresses])
+
+    def read(self, addr):
+        return self.read_many([addr])[0]
+
+    def write_many(self, values):
+        self.transfer_ops([("W", addr, value) for addr, value in dict(values).items()])
+
+    def write(self, addr, value):
+        self.write_many({addr: value})
+
+    def subscribe(self, callback, addresses=None):
+        """변경 알림 구독: callback([(주소, 값), ...]) 은 수신 스레드에서 호출됨"""
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+        self._request(MSG_SUBSCRIBE, encode_addresses(addresses))
+
+    def unsubscribe(self, addresses=None):
+        self._request(MSG_UNSUBSCRIBE, encode_addresses(addresses))
+        if not addresses:
+            self._callbacks.clear()
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def main(argv=None):
+    import argparse
+    import time
+    from register_ports import open_port
+    from register_logging import configure_logging
+    from register_map import RegisterMap
+
+    parser = argparse.ArgumentParser(description="네트워크 레지스터 서버")
+    parser.add_argument("--map", default=None, help="레지스터 맵 (시뮬레이터 기본값용, 선택)")
+    parser.add_argument("--protocol", default="SPI", type=str.upper, choices=("SPI", "I2C", "UART"))
+    parser.add_argument("--url", default="sim", help="'sim' 또는 ftdi:// URL (기본 sim)")
+    parser.add_argument("--frequency", type=int, default=None)
+    parser.add_argument("--listen", default="tcp://127.0.0.1:5555", help="tcp://host:port 또는 unix:///path")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH_FRAMES, help="전송당 최대 프레임 수")
+    args = parser.parse_args(argv)
+
+    configure_logging("INFO")
+    register_map = RegisterMap.from_file(args.map) if args.map else RegisterMap({})
+    port, closer = open_port(args.protocol, args.url, register_map, args.frequency)
+    server = RegisterServer(port, args.protocol, 0.1 if args.protocol == "UART" and args.url != "sim" else 0.0,
+                            args.max_batch)
+    server.listen(args.listen)
+    try:
+        while True:
+            time.sleep(10)
+            transport_log.info("📊 %s", server.stats.as_dict())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        if closer is not None:
+            closer.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+시간 측정 히스토그램 (Qt 의존성 없음)
+
+HDR 히스토그램과 같은 로그-선형 버킷을 사용합니다. 값(마이크로초 정수)을 2의 거듭제곱 구간으로 나누고
+각 구간을 다시 sub_bucket 개로 균등 분할하므로, 메모리는 값 범위의 로그에 비례하고
+백분위 오차는 약 1/sub_bucket(기본 32 → 약 3%) 이내입니다.
+
+    histogram = LatencyHistogram()
+    histogram.record(0.0123)          # 초 단위로 기록
+    histogram.percentile(99)          # 초
+    histogram.as_dict()               # {"count", "min_ms", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"}
+"""
+
+import threading
+
+DEFAULT_SUB_BUCKET_BITS = 5
+SUMMARY_PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """로그-선형 버킷 시간 히스토그램 (여러 스레드에서 record 가능)"""
+
+    def __init__(self, sub_bucket_bits=DEFAULT_SUB_BUCKET_BITS, unit_s=1e-6):
+        self.sub_buckets = 1 << sub_bucket_bits
+        self._half = self.sub_buckets >> 1
+        self._bits = sub_bucket_bits
+        self.unit_s = unit_s
+        self._counts = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_s = 0.0
+        self.min_s = None
+        self.max_s = None
+
+    # ----- 버킷 계산 -----
+
+    def _index(self, units):
+        if units < self.sub_buckets:
+            return units
+        exponent = units.bit_length() - self._bits
+        return self.sub_buckets + (exponent - 1) * self._half + (units >> exponent) - self._half
+
+    def _bounds(self, index):
+        """버킷 index 의 (최소, 최대) 단위 값"""
+        if index < self.sub_buckets:
+            return index, index
+        offset = index - self.sub_buckets
+        exponent = offset // self._half + 1
+        mantissa = offset % self._half + self._half
+        return mantissa << exponent, ((mantissa + 1) << exponent) - 1
+
+    # ----- 기록 -----
+
+    def record(self, seconds, count=1):
+        """seconds 값을 count 번 기록 (배치를 프레임 수만큼 나눈 값 등)"""
+        units = max(0, int(seconds / self.unit_s + 0.5))
+        index = self._index(units)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + count
+            self.count += count
+            self.total_s += seconds * count
+            if self.min_s is None or seconds < self.min_s:
+                self.min_s = seconds
+            if self.max_s is None or seconds > self.max_s:
+                self.max_s = seconds
+
+    def merge(self, other):
+        with self._lock:
+            for index, count in other._counts.items():
+                self._counts[index] = self._counts.get(index, 0) + count
+            self.count += other.count
+            self.total_s += other.total_s
+            if other.min_s is not None and (self.min_s is None or other.min_s < self.min_s):
+                self.min_s = other.min_s
+            if other.max_s is not None and (self.max_s is None or other.max_s > self.max_s):
+                self.max_s = other.max_s
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+            self.count = 0
+            self.total_s = 0.0
+            self.min_s = self.max_s = None
+
+    # ----- 조회 -----
+
+    @property
+    def mean_s(self):
+        return self.total_s / self.count if self.count else 0.0
+
+    def percentile(self, percent):
+        """백분위 값(초): 해당 버킷의 최댓값 (실제 최댓값을 넘지 않음)"""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, int(self.count * percent / 100.0 + 0.999999))
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= rank:
+                    return min(self._bounds(index)[1] * self.unit_s, self.max_s)
+            return self.max_s
+
+    def buckets(self):
+        """[(하한 초, 상한 초, 개수)] (값이 있는 버킷만, 오름차순)"""
+        with self._lock:
+            items = sorted(self._counts.items())
+        return [(low * self.unit_s, high * self.unit_s, count)
+                for low, high, count in ((*self._bounds(index), count) for index, count in items)]
+
+    def as_dict(self):
+        summary = {"count": self.count,
+                   "min_ms": round((self.min_s or 0.0) * 1000, 3),
+                   "mean_ms": round(self.mean_s * 1000, 3)}
+        for percent in SUMMARY_PERCENTILES:
+            summary[f"p{percent}_ms"] = round(self.percentile(percent) * 1000, 3)
+        summary["max_ms"] = round((self.max_s or 0.0) * 1000, 3)
+        return summary
+
+    def __repr__(self):
+        return f"LatencyHistogram(count={self.count}, p50={self.percentile(50) * 1000:.3f}ms)"
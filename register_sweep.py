@@ -0,0 +1,260 @@
+"""
+필드 스윕 엔진 (특성 측정용, Qt 의존성 없음)
+
+하나 이상의 필드(DAC 코드, 바이어스 트림 등)를 범위만큼 바꾸면서 매 지점마다 상태 레지스터를 읽습니다.
+각 지점은 "바뀐 레지스터 쓰기 + 읽기" 한 배치(register_device.Transaction)로 전송되고,
+결과는 미리 할당한 NumPy 배열에 저장되어 CSV / Parquet 로 내보낼 수 있습니다.
+
+    with RegisterDevice.open("Sample_tree.json") as dev:
+        sweep = FieldSweep(dev, [SweepAxis.parse("TX_SEN13_0=0:0x3FFF:0x100"), SweepAxis.parse("EN_TX=0,1")],
+                           readback=["RO_DATA_5", "EN"])
+        result = sweep.run()
+        result.to_csv("sweep.csv")
+        print(result.points_per_second)
+
+축 지정 형식 ("대상=범위"):
+    "EN.EN_TX=0:1"          시작:끝 (끝 포함, 간격 1)
+    "TX_SEN13_0=0:255:16"   시작:끝:간격
+    "EN_TX=1,0,1"           값 목록
+nested=True(기본)이면 첫 축이 가장 바깥 루프이고, False 이면 모든 축을 같은 길이로 함께 진행합니다.
+"""
+
+import importlib.util
+import itertools
+import os
+import time
+
+import numpy as np
+
+from register_logging import get_logger
+from register_map import parse_value
+
+transport_log = get_logger("transport")
+
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+PARQUET_ENGINES = ("pyarrow", "fastparquet")
+
+
+class SweepError(ValueError):
+    """스윕 정의 오류"""
+
+
+def is_parquet_path(path):
+    return path.lower().endswith(PARQUET_SUFFIXES)
+
+
+def parquet_engine():
+    """설치된 pandas Parquet 엔진 이름 (없으면 None, 임포트하지 않고 확인)"""
+    if importlib.util.find_spec("pandas") is None:
+        return None
+    return next((name for name in PARQUET_ENGINES if importlib.util.find_spec(name) is not None), None)
+
+
+def check_output(path):
+    """스윕 전에 결과 파일 형식 확인 (Parquet 엔진이 없으면 측정 전에 SweepError)"""
+    if path and is_parquet_path(path) and parquet_engine() is None:
+        raise SweepError("Parquet 저장에는 pandas 와 pyarrow 또는 fastparquet 가 필요합니다 "
+                         "(CSV 는 추가 패키지 불필요: --out 결과.csv)")
+
+
+class SweepAxis:
+    """스윕할 대상 하나와 값 목록"""
+
+    def __init__(self, target, values):
+        self.target = target
+        self.values = [parse_value(value) for value in values]
+        if not self.values:
+            raise SweepError(f"스윕 값이 없음: {target}")
+
+    @classmethod
+    def range(cls, target, start, stop, step=1):
+        """start 부터 stop 까지 (stop 포함)"""
+        start, stop, step = parse_value(start), parse_value(stop), parse_value(step)
+        if step == 0:
+            raise SweepError(f"스윕 간격이 0: {target}")
+        if (stop - start) * step < 0:
+            raise SweepError(f"스윕 방향과 간격 부호가 다름: {target}")
+        return cls(target, range(start, stop + (1 if step > 0 else -1), step))
+
+    @classmethod
+    def parse(cls, text):
+        """'대상=시작:끝[:간격]' 또는 '대상=값,값,...'"""
+        target, sep, spec = text.rpartition("=")
+        if not sep or not target.strip():
+            raise SweepError(f"축 형식은 '대상=시작:끝[:간격]' 또는 '대상=값,값': {text}")
+        try:
+            if ":" in spec:
+                return cls.range(target.strip(), *spec.split(":"))
+            return cls(target.strip(), spec.split(","))
+        except (TypeError, ValueError) as e:
+            if isinstance(e, SweepError):
+                raise
+            raise SweepError(f"축 값 오류 ({text}): {e}") from None
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return f"SweepAxis({self.target}, {len(self.values)}점)"
+
+
+class SweepResult:
+    """스윕 결과: data[지점, 열] (열 = 축 값들 + 읽은 값들), timestamps[지점] (시작 기준 초)"""
+
+    def __init__(self, axis_names, readback_names, points):
+        self.axis_names = list(axis_names)
+        self.readback_names = list(readback_names)
+        self.data = np.zeros((points, len(self.axis_names) + len(self.readback_names)), dtype=np.uint32)
+        self.timestamps = np.zeros(points, dtype=np.float64)
+        self.completed = 0
+        self.batches = 0
+        self.elapsed_s = 0.0
+
+    @property
+    def columns(self):
+        return self.axis_names + self.readback_names
+
+    @property
+    def points_per_second(self):
+        return self.completed / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def column(self, name):
+        """열 이름으로 완료된 지점의 값 (뷰, 복사 없음)"""
+        return self.data[:self.completed, self.columns.index(name)]
+
+    def to_dataframe(self):
+        import pandas
+        frame = pandas.DataFrame(self.data[:self.completed], columns=self.columns)
+        frame.insert(0, "time_s", self.timestamps[:self.completed])
+        return frame
+
+    def to_csv(self, path):
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(",".join(["time_s"] + self.columns) + "\n")
+            for timestamp, row in zip(self.timestamps[:self.completed], self.data[:self.completed]):
+                f.write(f"{timestamp:.6f}," + ",".join(str(int(value)) for value in row) + "\n")
+
+    def to_parquet(self, path):
+        """Parquet 저장 (pandas + pyarrow 또는 fastparquet 필요)"""
+        try:
+            self.to_dataframe().to_parquet(path, index=False)
+        except ImportError:
+            raise SweepError("Parquet 저장에는 pandas 와 pyarrow 또는 fastparquet 가 필요합니다") from None
+
+    def save(self, path):
+        """확장자(.parquet / 그 외 CSV)에 따라 저장, 실제로 저장한 경로 반환
+
+        Parquet 엔진이 없으면 측정 결과를 버리지 않도록 같은 이름의 .csv 로 대신 저장합니다.
+        """
+        if is_parquet_path(path):
+            try:
+                self.to_parquet(path)
+                return path
+            except SweepError as e:
+                path = os.path.splitext(path)[0] + ".csv"
+                transport_log.warning("⚠️ %s → CSV 로 저장: %s", e, path)
+        self.to_csv(path)
+        return path
+
+    def as_dict(self):
+        return {
+            "points": self.completed, "columns": len(self.columns), "batches": self.batches,
+            "elapsed_ms": round(self.elapsed_s * 1000, 3), "points_per_s": round(self.points_per_second, 1),
+        }
+
+
+class FieldSweep:
+    """필드 스윕 실행기 (device: register_device.RegisterDevice)
+
+    축 레지스터의 시작 값은 스윕 전에 배치 읽기 1회로 가져오고, 이후 필드 값은 로컬에서 합성하므로
+    지점마다 읽기-수정-쓰기 왕복이 없습니다. 지점마다 값이 바뀐 레지스터만 씁니다.
+    settle_s 를 주면 지점마다 쓰기와 읽기 사이에 배치 안 대기(tx.delay)를 넣습니다 (MPSSE 에서는 빈 클럭).
+    points_per_batch > 1 이면 여러 지점을 한 배치로 묶어 보냅니다.
+    """
+
+    def __init__(self, device, axes, readback, nested=True, settle_s=0.0, points_per_batch=1):
+        if not axes:
+            raise SweepError("스윕 축이 없습니다")
+        self.device = device
+        self.axes = [axis if isinstance(axis, SweepAxis) else SweepAxis.parse(axis) for axis in axes]
+        self.readback = list(readback)
+        self.nested = nested
+        self.settle_s = settle_s
+        self.points_per_batch = max(1, int(points_per_batch))
+
+        register_map = device.register_map
+        self._axis_refs = [register_map.resolve(axis.target) for axis in self.axes]
+        for target in self.readback:
+            register_map.resolve(target)    # 이름 오류는 실행 전에
+        for axis, (addr, field) in zip(self.axes, self._axis_refs):
+            limit = (1 << field.width) - 1 if field else 0xFFFFFFFF
+            if any(value < 0 or value > limit for value in axis.values):
+                raise SweepError(f"{axis.target} 값이 범위(0~{limit})를 벗어남")
+        if not nested and len({len(axis) for axis in self.axes}) > 1:
+            raise SweepError("nested=False 이면 모든 축의 값 개수가 같아야 합니다")
+
+    @property
+    def points(self):
+        if self.nested:
+            count = 1
+            for axis in self.axes:
+                count *= len(axis)
+            return count
+        return len(self.axes[0])
+
+    def iter_points(self):
+        values = [axis.values for axis in self.axes]
+        return itertools.product(*values) if self.nested else zip(*values)
+
+    def _register_values(self, base, point):
+        registers = dict(base)
+        for (addr, field), value in zip(self._axis_refs, point):
+            registers[addr] = field.insert(registers[addr], value) if field else value
+        return registers
+
+    def run(self, progress=None):
+        """스윕 실행 → SweepResult (progress(완료 지점, 전체 지점) 는 배치마다 호출)"""
+        device = self.device
+        total = self.points
+        result = SweepResult([axis.target for axis in self.axes], self.readback, total)
+        batches_before = device.batches
+        started = time.perf_counter()
+
+        # 축 레지스터 시작 값 (필드 합성 기준), 첫 지점은 모든 축 레지스터를 씀
+        axis_addresses = list(dict.fromkeys(addr for addr, _ in self._axis_refs))
+        base = device.read_addresses(axis_addresses)
+        written = {}
+
+        index = 0
+        points = self.iter_points()
+        while index < total:
+            chunk = list(itertools.islice(points, self.points_per_batch))
+            reads = []
+            tx = device.transaction()
+            for point in chunk:
+                registers = self._register_values(base, point)
+                for addr in axis_addresses:
+                    if written.get(addr) != registers[addr]:
+                        tx.write(addr, registers[addr])
+                        written[addr] = registers[addr]
+                if self.settle_s:
+                    tx.delay(self.settle_s)     # 쓰기 → 안정화 대기 → 읽기 (같은 배치 안에서)
+                reads.append([tx.read(target) for target in self.readback])
+            tx.commit()
+            now = time.perf_counter() - started
+            for point, pending in zip(chunk, reads):
+                row = result.data[index]
+                row[:len(point)] = point
+                row[len(point):] = [value.value for value in pending]
+                result.timestamps[index] = now
+                index += 1
+            result.completed = index
+            if progress:
+                progress(index, total)
+
+        result.batches = device.batches - batches_before
+        result.elapsed_s = time.perf_counter() - started
+        transport_log.info("📈 스윕 완료: %d지점 x %d열, 배치 %d회, %.1f지점/s",
+                           result.completed, len(result.columns), result.batches, result.points_per_second)
+        return result
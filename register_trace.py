@@ -0,0 +1,214 @@
+"""
+구간(span) 추적과 Chrome trace-event JSON 내보내기 (Qt 의존성 없음)
+
+GUI 가 멈췄을 때 build_tree, update_tree_display_values, 블로킹 spi.exchange, 로그 출력 중 어디서
+시간이 쓰였는지 보기 위해 파서 / 트리 / 값 모델 / 전송 구간을 스레드별 타임라인으로 기록합니다.
+저장한 JSON 은 Perfetto (https://ui.perfetto.dev) 나 chrome://tracing 에서 열 수 있습니다.
+
+    with span("build_tree", "tree", {"registers": 128}):
+        ...
+
+    @traced("parser")
+    def load_excel(...):
+        ...
+
+    recorder = TraceRecorder().start()          # 이후 구간과 전송이 기록됨
+    ...
+    recorder.stop().save("trace.json")
+
+전송은 register_transfer 의 단계 관찰자로 기록하므로 전송 함수에는 추적 코드가 없습니다.
+전송 구간 아래에 단계(encode / submit / usb / decode)를 자식 구간으로 붙이며, 배치가 여러 번 나뉘어
+전송된 경우 단계별 합을 순서대로 이어 붙인 근사입니다.
+기록 중이 아니면 span() 은 공유 빈 컨텍스트를 돌려주고 traced() 는 함수를 바로 호출하므로
+전역 변수 검사 한 번 외의 비용은 없습니다.
+"""
+
+import functools
+import json
+import threading
+import time
+
+from register_transfer import add_phase_observer, remove_phase_observer, PHASES
+
+DEFAULT_MAX_EVENTS = 1_000_000
+
+_recorder = None
+
+
+def is_tracing():
+    return _recorder is not None
+
+
+class _NoSpan:
+    """기록 중이 아닐 때 span() 이 돌려주는 빈 컨텍스트"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Span:
+    __slots__ = ("recorder", "name", "category", "args", "started")
+
+    def __init__(self, recorder, name, category, args):
+        self.recorder = recorder
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        ended = time.perf_counter()
+        if exc_type is not None:
+            self.args = dict(self.args or {}, error=exc_type.__name__)
+        self.recorder.add(self.name, self.category, self.started, ended - self.started, self.args)
+        return False
+
+
+def span(name, category, args=None):
+    """with 블록을 구간으로 기록 (기록 중이 아니면 빈 컨텍스트)"""
+    recorder = _recorder
+    if recorder is None:
+        return _NO_SPAN
+    return _Span(recorder, name, category, args)
+
+
+def instant(name, category, args=None):
+    """시점 이벤트 기록 (로드 완료, 연결 끊김 등)"""
+    recorder = _recorder
+    if recorder is not None:
+        recorder.add(name, category, time.perf_counter(), None, args)
+
+
+def traced(category, name=None):
+    """함수 호출 전체를 구간으로 기록하는 데코레이터 (이름 기본값: 함수 __qualname__)"""
+    def decorator(function):
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            recorder = _recorder
+            if recorder is None:
+                return function(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                recorder.add(label, category, started, time.perf_counter() - started, None)
+        return wrapper
+    return decorator
+
+
+class TraceRecorder:
+    """구간 이벤트 수집기 (한 번에 하나만 기록 중일 수 있음)"""
+
+    def __init__(self, max_events=DEFAULT_MAX_EVENTS):
+        self.max_events = max_events
+        self.events = []             # (이름, 분류, 시작 초, 길이 초 또는 None, 스레드 ID, 인자)
+        self.dropped = 0
+        self.threads = {}            # 네이티브 스레드 ID -> 이름
+        self.started = None
+        self.stopped = None
+        self._lock = threading.Lock()
+
+    # ----- 기록 -----
+
+    def start(self):
+        global _recorder
+        if _recorder is not None and _recorder is not self:
+            raise RuntimeError("이미 다른 추적이 기록 중입니다.")
+        self.started = time.perf_counter()
+        self.stopped = None
+        _recorder = self
+        add_phase_observer(self._on_transfer)
+        return self
+
+    def stop(self):
+        global _recorder
+        remove_phase_observer(self._on_transfer)
+        if _recorder is self:
+            _recorder = None
+        self.stopped = time.perf_counter()
+        return self
+
+    @property
+    def recording(self):
+        return _recorder is self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def add(self, name, category, started, duration, args):
+        thread = threading.get_native_id()
+        with self._lock:
+            if len(self.events) >= self.max_events:
+                self.dropped += 1
+                return
+            self.events.append((name, category, started, duration, thread, args))
+            if thread not in self.threads:
+                self.threads[thread] = threading.current_thread().name
+
+    def _on_transfer(self, protocol, kind, ops, phases, duration, source):
+        """단계 관찰자: 방금 끝난 전송을 구간으로, 단계를 자식 구간으로 기록"""
+        ended = time.perf_counter()
+        started = ended - duration
+        frames = sum(op[0] != "D" for op in ops)
+        args = {"protocol": protocol, "frames": frames}
+        if source:
+            args["source"] = source
+        if kind == "transaction":
+            args["addr"] = f"0x{ops[0][1]:02X}"
+        self.add(f"{protocol} {kind}", "transport", started, duration, args)
+        offset = started
+        for phase in PHASES:
+            seconds = phases.get(phase, 0.0)
+            if seconds:
+                self.add(phase, "transport", offset, seconds, None)
+                offset += seconds
+
+    # ----- 내보내기 -----
+
+    def to_dict(self):
+        """Chrome trace-event 형식 {"traceEvents": [...]} (시각은 기록 시작 기준 us)"""
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self.threads)
+        origin = self.started if self.started is not None else 0.0
+        trace = [{"name": "process_name", "ph": "M", "pid": 1, "tid": 0,
+                  "args": {"name": "Register Controller"}}]
+        for thread, name in threads.items():
+            trace.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": thread, "args": {"name": name}})
+        for name, category, started, duration, thread, args in events:
+            event = {"name": name, "cat": category, "pid": 1, "tid": thread,
+                     "ts": round((started - origin) * 1e6, 3)}
+            if duration is None:
+                event["ph"] = "i"
+                event["s"] = "t"
+            else:
+                event["ph"] = "X"
+                event["dur"] = round(duration * 1e6, 3)
+            if args:
+                event["args"] = args
+            trace.append(event)
+        metadata = {"events": len(events), "dropped": self.dropped}
+        if self.stopped is not None:
+            metadata["window_s"] = round(self.stopped - origin, 6)
+        return {"traceEvents": trace, "displayTimeUnit": "ms", "otherData": metadata}
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, default=str)
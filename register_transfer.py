@@ -0,0 +1,415 @@
+"""
+레지스터 단위 송수신과 쓰기 후 검증 (Qt 의존성 없음)
+
+pyftdi SpiPort / I2cPort, pyserial 포트 또는 sim_device 의 시뮬레이션 포트 위에서
+register_protocol 의 프레임으로 레지스터를 읽고 씁니다.
+짧은 응답이나 응답 없음은 0 으로 바꾸지 않고 TransportError 로 알립니다.
+
+transfer_batch() 는 쓰기/읽기 프레임 목록을 한 번에 전송합니다. pyftdi SpiPort 에서는
+mpsse_batch.SpiFrameBatch 로 USB 쓰기/읽기 한 번에 묶고, register_server.RegisterClient 는
+요청 하나로 서버에 보내며, 그 밖의 포트는 프레임 단위로 보냅니다.
+목록에 ("D", 초) 를 넣으면 그 자리에서 기다립니다. pyftdi SpiPort 에서는 MPSSE 빈 클럭으로
+배치 안에서 대기하므로 USB 전송이 나뉘지 않고, 그 밖의 포트는 호스트 time.sleep 으로 기다립니다
+(UART 의 response_wait 처럼 응답 도착을 기다리는 대기는 호스트 쪽에 남습니다).
+
+write_and_verify() 는 배치 단위로 동작합니다: 모든 값을 transfer_batch 한 번으로 쓰고, 한 번으로 다시 읽어
+비교한 뒤, 불일치하거나 통신 오류가 난 주소만 다시 씁니다 (max_rounds 회까지).
+배치가 통신 오류로 끝난 라운드만 프레임 단위로 다시 보냅니다.
+
+전송 관찰자: add_transfer_observer(observer) 로 등록하면 전송마다
+observer(protocol, ops, values, started, duration, source, error) 가 호출됩니다 (트랜잭션 저널 등).
+전송이 실패해도 버스에 나간 연산이 있으면 호출되며, 이때 error 는 예외, ops 는 실제로 보낸 연산
+(MPSSE 배치는 USB 쓰기가 끝났으면 전체, 프레임 단위 전송은 실패한 프레임까지), values 는 받은 값 (모르면 None) 입니다.
+성공한 전송은 error 가 None 입니다.
+source 는 transfer_source("sequence") 블록으로 스레드별로 지정하는 출처 이름입니다.
+
+단계 관찰자: add_phase_observer(observer) 로 등록하면 전송마다 단계별 시간(PHASES)을 재서
+observer(protocol, kind, ops, phases, duration, source) 를 호출합니다 (register_latency.LatencyRecorder).
+kind 는 "transaction" (write_frame / read_frame) 또는 "batch" (transfer_batch), phases 는 {단계: 초} 입니다.
+단계 관찰자는 성공한 전송에만 호출됩니다.
+    encode : 레지스터 값 → 프레임 바이트 (배치는 MPSSE 명령 묶음 준비 포함)
+    submit : 명령 전송 (MPSSE 배치의 USB 쓰기, UART 쓰기)
+    usb    : 응답 수신까지 (pyftdi exchange() 처럼 쓰기와 응답 대기가 한 호출이면 함께, 배치 안의 지연 포함)
+    decode : 응답 → 값
+관찰자가 없으면 전송마다 리스트 검사 한 번 외의 비용은 없습니다.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from register_logging import get_logger
+from register_protocol import (
+    spi_write_frame, spi_read_frame, decode_spi_read,
+    i2c_write_frame, decode_i2c_read, DATA_BYTES,
+    uart_write_command, uart_read_command, parse_uart_response,
+    VALUE_MASK,
+)
+
+transport_log = get_logger("transport")
+
+PROTOCOLS = ("SPI", "I2C", "UART")
+
+
+class TransportError(IOError):
+    """응답이 없거나 프레임이 짧음"""
+
+
+class TransportTimeout(TransportError):
+    """정해진 시간 안에 전송이 끝나지 않음"""
+
+
+# ========== 전송 관찰자 ==========
+
+_observers = []
+_context = threading.local()
+
+
+def add_transfer_observer(observer):
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def remove_transfer_observer(observer):
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def current_source():
+    """현재 스레드의 전송 출처 이름 (지정하지 않았으면 빈 문자열)"""
+    return getattr(_context, "source", "")
+
+
+@contextmanager
+def transfer_source(name):
+    """블록 안의 전송에 출처 이름을 붙임 (중첩 가능, 스레드별)"""
+    previous = current_source()
+    _context.source = name
+    try:
+        yield
+    finally:
+        _context.source = previous
+
+
+# ========== 단계별 시간 측정 ==========
+
+PHASES = ("encode", "submit", "usb", "decode")
+_phase_observers = []
+
+
+def add_phase_observer(observer):
+    if observer not in _phase_observers:
+        _phase_observers.append(observer)
+
+
+def remove_phase_observer(observer):
+    if observer in _phase_observers:
+        _phase_observers.remove(observer)
+
+
+class PhaseTimer:
+    """전송 한 번의 단계별 시간 (mark 는 직전 mark 이후 경과 시간을 그 단계에 더함)"""
+
+    __slots__ = ("phases", "_last")
+
+    def __init__(self):
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self._last = time.perf_counter()
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases[phase] += now - self._last
+        self._last = now
+
+
+class _BatchProgress:
+    """전송 중 버스에 나간 연산 수와 받은 값 (실패한 전송을 관찰자에 알릴 때 사용)"""
+
+    __slots__ = ("sent", "values")
+
+    def __init__(self):
+        self.sent = 0
+        self.values = []
+
+
+def _notify(protocol, ops, values, started, kind, timer, error=None):
+    duration = time.perf_counter() - started
+    source = current_source()
+    for observer in tuple(_observers):
+        observer(protocol, ops, values, started, duration, source, error)
+    if timer is not None and error is None:
+        for observer in tuple(_phase_observers):
+            observer(protocol, kind, ops, timer.phases, duration, source)
+
+
+# ========== 프레임 전송 ==========
+
+def write_frame(port, protocol, addr, value):
+    """레지스터 쓰기 프레임 전송, 보낸 프레임(바이트 리스트 또는 UART 명령 문자열) 반환"""
+    if not (_observers or _phase_observers):
+        return _write_frame(port, protocol, addr, value)
+    started = time.perf_counter()
+    timer = PhaseTimer() if _phase_observers else None
+    try:
+        frame = _write_frame(port, protocol, addr, value, timer)
+    except Exception as e:
+        _notify(protocol, [("W", addr, value)], [None], started, "transaction", timer, e)
+        raise
+    _notify(protocol, [("W", addr, value)], [None], started, "transaction", timer)
+    return frame
+
+
+def read_frame(port, protocol, addr, response_wait=0.0):
+    """레지스터 읽기, 32비트 값 반환 (응답이 짧거나 없으면 TransportError)
+
+    response_wait: UART 응답이 아직 도착하지 않았을 때 기다릴 시간 (초)
+    """
+    if not (_observers or _phase_observers):
+        return _read_frame(port, protocol, addr, response_wait)
+    started = time.perf_counter()
+    timer = PhaseTimer() if _phase_observers else None
+    try:
+        value = _read_frame(port, protocol, addr, response_wait, timer)
+    except Exception as e:
+        _notify(protocol, [("R", addr)], [None], started, "transaction", timer, e)
+        raise
+    _notify(protocol, [("R", addr)], [value], started, "transaction", timer)
+    return value
+
+
+def _write_frame(port, protocol, addr, value, timer=None):
+    if protocol == "SPI":
+        frame = spi_write_frame(addr, value)
+        if timer is not None:
+            timer.mark("encode")
+        port.exchange(frame)
+        if timer is not None:
+            timer.mark("usb")
+        return frame
+    if protocol == "I2C":
+        frame = i2c_write_frame(addr, value)
+        if timer is not None:
+            timer.mark("encode")
+        port.write(frame)
+        if timer is not None:
+            timer.mark("usb")
+        return frame
+    if protocol == "UART":
+        command = uart_write_command(addr, value)
+        if timer is not None:
+            timer.mark("encode")
+        port.write(command.encode())
+        if timer is not None:
+            timer.mark("submit")
+        return command
+    raise ValueError(f"지원하지 않는 프로토콜: {protocol}")
+
+
+def _read_frame(port, protocol, addr, response_wait, timer=None):
+    if protocol == "SPI":
+        frame = spi_read_frame(addr)
+        if timer is not None:
+            timer.mark("encode")
+        # 데이터는 명령 바이트 뒤 4바이트 구간에 클럭되어 나오므로 전이중(duplex) 교환
+        response = port.exchange(frame, duplex=True)
+        if timer is not None:
+            timer.mark("usb")
+        value = decode_spi_read(response)
+    elif protocol == "I2C":
+        port.write([addr])
+        response = port.read(DATA_BYTES)
+        if timer is not None:
+            timer.mark("usb")
+        value = decode_i2c_read(response)
+    elif protocol == "UART":
+        command = uart_read_command(addr).encode()
+        if timer is not None:
+            timer.mark("encode")
+        port.write(command)
+        if timer is not None:
+            timer.mark("submit")
+        if response_wait and not getattr(port, 'in_waiting', 0):
+            time.sleep(response_wait)
+        response = port.read(20)  # 최대 20바이트 읽기
+        if timer is not None:
+            timer.mark("usb")
+        value = parse_uart_response(response)
+    else:
+        raise ValueError(f"지원하지 않는 프로토콜: {protocol}")
+    if timer is not None:
+        timer.mark("decode")
+
+    if value is None:
+        raise TransportError(f"{protocol} 읽기 응답 오류: Addr=0x{addr:02X}, 수신 {len(response or b'')}바이트")
+    return value
+
+
+def is_mpsse_spi_port(port):
+    """프레임을 MPSSE 명령 하나로 묶을 수 있는 pyftdi SpiPort 인지"""
+    return hasattr(port, "_cs_prolog") and hasattr(port, "_controller")
+
+
+def transfer_batch(port, protocol, ops, response_wait=0.0):
+    """("W", 주소, 값) / ("R", 주소) / ("D", 초) 목록을 순서대로 전송, 읽기 값 목록 반환 (쓰기/지연 자리는 None)
+
+    읽기 응답이 짧으면 TransportError (배치의 나머지 결과는 버려짐)
+    """
+    if not (_observers or _phase_observers):
+        return _transfer_batch(port, protocol, ops, response_wait)
+    started = time.perf_counter()
+    timer = PhaseTimer() if _phase_observers else None
+    progress = _BatchProgress()
+    try:
+        values = _transfer_batch(port, protocol, ops, response_wait, timer, progress)
+    except Exception as e:
+        if progress.sent:
+            # 이미 버스에 나간 쓰기/읽기도 기록되도록 보낸 연산까지 알림
+            received = progress.values[:progress.sent]
+            _notify(protocol, ops[:progress.sent], received + [None] * (progress.sent - len(received)),
+                    started, "batch", timer, e)
+        raise
+    _notify(protocol, ops, values, started, "batch", timer)
+    return values
+
+
+def _transfer_batch(port, protocol, ops, response_wait, timer=None, progress=None):
+    progress = progress or _BatchProgress()
+    if hasattr(port, "transfer_ops"):
+        # 네트워크 레지스터 서버 클라이언트: 서버가 배치로 전송
+        progress.sent = len(ops)
+        values = port.transfer_ops(ops)
+        if timer is not None:
+            timer.mark("usb")
+        return values
+    if protocol == "SPI" and is_mpsse_spi_port(port):
+        from mpsse_batch import SpiFrameBatch  # pyftdi 가 필요할 때만 임포트
+        batch = SpiFrameBatch(port)
+        for op in ops:
+            if op[0] == "D":
+                batch.delay(op[1])
+            else:
+                batch.add(spi_write_frame(op[1], op[2]) if op[0] == "W" else spi_read_frame(op[1]))
+        if timer is not None:
+            timer.mark("encode")
+        batch.submit()
+        progress.sent = len(ops)       # USB 쓰기가 끝났으면 모든 프레임이 클럭되어 나감
+        if timer is not None:
+            timer.mark("submit")
+        collected = []
+        while batch.pending:
+            collected.extend(batch.collect())
+        if timer is not None:
+            timer.mark("usb")
+        responses = iter(collected)
+        results = progress.values
+        for op in ops:
+            if op[0] == "D":
+                results.append(None)
+                continue
+            response = next(responses)
+            if op[0] == "W":
+                results.append(None)
+                continue
+            value = decode_spi_read(response)
+            if value is None:
+                raise TransportError(f"SPI 배치 읽기 응답 오류: Addr=0x{op[1]:02X}, 수신 {len(response)}바이트")
+            results.append(value)
+        if timer is not None:
+            timer.mark("decode")
+        return results
+
+    results = progress.values
+    for index, op in enumerate(ops):
+        progress.sent = index + 1
+        if op[0] == "W":
+            _write_frame(port, protocol, op[1], op[2], timer)
+            results.append(None)
+        elif op[0] == "D":
+            time.sleep(op[1])
+            if timer is not None:
+                timer.mark("usb")
+            results.append(None)
+        else:
+            results.append(_read_frame(port, protocol, op[1], response_wait, timer))
+    return results
+
+
+class VerifyResult:
+    """write_and_verify() 결과"""
+
+    def __init__(self):
+        self.rounds = 0          # 쓰기/검증 반복 횟수
+        self.writes = 0          # 전송한 쓰기 프레임 수 (재전송 포함)
+        self.reads = 0           # 전송한 읽기 프레임 수
+        self.errors = 0          # 통신 오류(TransportError) 횟수
+        self.verified = {}       # 주소 -> 검증된 값
+        self.failed = {}         # 주소 -> 마지막으로 읽은 값 (통신 오류면 None)
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    @property
+    def frames(self):
+        return self.writes + self.reads
+
+
+def write_and_verify(port, values, protocol="SPI", max_rounds=3, response_wait=0.0, mask=VALUE_MASK):
+    """{주소: 값} 을 배치로 쓰고 다시 읽어 검증, 실패한 주소만 재전송
+
+    라운드마다 쓰기와 검증 읽기를 각각 transfer_batch 한 번으로 보냅니다 (MPSSE 에서는 USB 왕복 한 번씩).
+    배치가 TransportError 로 끝나면 그 라운드만 프레임 단위로 다시 보내 오류가 난 주소를 가려냅니다.
+    mask 는 비교할 비트 (디바이스 데이터 폭이 32비트보다 좁을 때 사용)
+    """
+    result = VerifyResult()
+    pending = dict(values)
+    while pending and result.rounds < max_rounds:
+        result.rounds += 1
+        addresses = list(pending)
+
+        # 1) 쓰기 배치
+        try:
+            transfer_batch(port, protocol, [("W", addr, pending[addr]) for addr in addresses], response_wait)
+            result.writes += len(addresses)
+        except TransportError as e:
+            result.errors += 1
+            transport_log.debug("⚠️ 쓰기 배치 오류 (라운드 %d): %s → 프레임 단위 전송", result.rounds, e)
+            for addr in addresses:
+                try:
+                    write_frame(port, protocol, addr, pending[addr])
+                except TransportError as e:
+                    result.errors += 1
+                    transport_log.debug("⚠️ 쓰기 오류 (라운드 %d): %s", result.rounds, e)
+                result.writes += 1
+
+        # 2) 검증 배치 (쓰기가 실패했어도 다시 읽어 실제 상태로 판단)
+        try:
+            read_backs = transfer_batch(port, protocol, [("R", addr) for addr in addresses], response_wait)
+            result.reads += len(addresses)
+        except TransportError as e:
+            result.errors += 1
+            transport_log.debug("⚠️ 검증 배치 오류 (라운드 %d): %s → 프레임 단위 읽기", result.rounds, e)
+            read_backs = []
+            for addr in addresses:
+                try:
+                    read_backs.append(read_frame(port, protocol, addr, response_wait))
+                except TransportError as e:
+                    result.errors += 1
+                    read_backs.append(None)
+                    transport_log.debug("⚠️ 검증 읽기 오류 (라운드 %d): %s", result.rounds, e)
+                result.reads += 1
+
+        failed = {}
+        for addr, read_back in zip(addresses, read_backs):
+            value = pending[addr]
+            if read_back is not None and (read_back & mask) == (value & mask):
+                result.verified[addr] = value
+            else:
+                failed[addr] = read_back
+
+        if failed:
+            transport_log.info("🔁 검증 실패 %d개 (라운드 %d/%d) → 실패한 프레임만 재전송",
+                               len(failed), result.rounds, max_rounds)
+        result.failed = failed
+        pending = {addr: values[addr] for addr in failed}
+    return result
@@ -0,0 +1,257 @@
+"""
+USB 전송 효율 측정 (Qt 의존성 없음)
+
+처리량 문제는 대개 패킷 효율 문제입니다: 5바이트 프레임마다 USB 왕복을 하면 대부분의 바이트와 시간이
+MPSSE 명령 헤더, 상태 바이트, 왕복 대기에 쓰입니다. UsbEfficiencyMeter 는 같은 구간에서
+    payload : 레지스터 프레임 바이트 (프레임마다 주소 1 + 데이터 4 를 내보내고, 읽기는 데이터 4 를 받음)
+    USB     : 실제로 USB 로 오간 바이트와 bulk 전송 횟수 (MPSSE 명령, CS/GPIO, 상태 바이트 포함)
+를 세어 전송당 payload / USB 바이트, 패킷 채움, 바이트 효율(payload / USB 바이트),
+MPSSE 명령 오버헤드, USB 유휴 시간을 계산합니다. 배치가 FT2232H 버퍼를 채우는지는 전송당 값과 최대 쓰기 크기로 봅니다.
+패킷 채움은 bulk 전송마다 바이트 수 / (그 전송이 차지한 512B 패킷 수 * 512) 를 구해 평균한 값이라 513B 전송은
+50% 로 셉니다 (시뮬레이션 포트는 전송별 크기가 없어 왕복당 평균 바이트로 근사). 바이트 효율은 프레임 형식의 오버헤드를 보여 주며, 배치는 쓰기 프레임의 전이중 응답도 받으므로 전송 횟수가 크게
+줄어도 바이트 효율은 단일 전송보다 낮게 나올 수 있습니다.
+
+USB 쪽은 포트 종류에 따라 다르게 셉니다.
+    pyftdi SpiPort / I2cPort / FTDI UART : Ftdi._write / Ftdi._read (bulk OUT / IN 한 번씩) 를 인스턴스에서 감쌈.
+                                           실제 장치와 ftdi_virtual 가상 FT2232H 모두 같은 경로입니다.
+    sim_device 시뮬레이션 포트           : 포트의 TransportStats 증가분 (전송 = 왕복, 명령 오버헤드는
+                                           UsbLatencyModel.command_overhead 로 계산)
+    그 밖 (서버 클라이언트 등)           : payload 만 셈
+payload 는 register_transfer 의 전송 관찰자로 셉니다. SpiFrameBatch 를 직접 쓰는 벤치마크처럼 전송 함수를 거치지 않으면
+record_payload() 로 직접 더합니다.
+
+    meter = UsbEfficiencyMeter().attach(port)
+    ...                                       # 평소처럼 전송
+    meter.status_text()                       # "USB 213 B/전송 (패킷 42%) · 효율 18% · 유휴 48%"
+    meter.detach().summary()
+"""
+
+import threading
+import time
+
+from register_protocol import DATA_BYTES
+from register_transfer import add_transfer_observer, remove_transfer_observer
+
+FRAME_BYTES = 1 + DATA_BYTES          # 프레임당 내보내는 주소 + 데이터
+MAX_PACKET_SIZE = 512                 # FT2232H High-Speed bulk 패킷
+FT2232H_BUFFER_BYTES = 4096           # 채널당 TX/RX 버퍼
+STATUS_BYTES = 2                      # bulk IN 패킷마다 붙는 모뎀 상태 바이트
+
+
+def packet_fill(size):
+    """bulk 전송 하나의 패킷 채움 (바이트 / 차지한 512B 패킷 용량, 0바이트 전송은 빈 패킷 하나)"""
+    packets = max(1, -(-size // MAX_PACKET_SIZE))
+    return size / (packets * MAX_PACKET_SIZE)
+
+
+def usb_device_of(port):
+    """포트 밑의 pyftdi Ftdi 객체 (없으면 None)"""
+    controller = getattr(port, "_controller", None)
+    ftdi = getattr(controller, "_ftdi", None) or getattr(port, "udev", None)
+    if ftdi is not None and hasattr(ftdi, "_write") and hasattr(ftdi, "_read"):
+        return ftdi
+    return None
+
+
+class UsbEfficiencyMeter:
+    """payload 바이트 대 USB 전송 비교"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ftdi = None
+        self._sim_port = None
+        self._sim_start = None
+        self.reset()
+
+    # ----- 측정 -----
+
+    def attach(self, port=None):
+        """전송 관찰 시작, port 를 주면 USB 전송도 셈"""
+        add_transfer_observer(self._on_transfer)
+        if port is not None:
+            ftdi = usb_device_of(port)
+            if ftdi is not None:
+                self._wrap(ftdi)
+            elif hasattr(getattr(port, "stats", None), "usb_transfers"):
+                self._sim_port = port
+                self._sim_start = port.stats.as_dict()
+        return self
+
+    def detach(self):
+        remove_transfer_observer(self._on_transfer)
+        if self._ftdi is not None:
+            # 인스턴스 속성을 지우면 클래스 메서드가 다시 보임
+            for name in ("_write", "_read"):
+                self._ftdi.__dict__.pop(name, None)
+            self._ftdi = None
+        if self._sim_port is not None:
+            self._sim_final = self._sim_counts()
+            self._sim_port = None
+        self.stopped = time.perf_counter()
+        return self
+
+    def __enter__(self):
+        # with UsbEfficiencyMeter().attach(port) as meter: 처럼 attach 뒤에 사용
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.detach()
+        return False
+
+    def reset(self):
+        with self._lock:
+            self.frames = 0
+            self.payload_out = 0
+            self.payload_in = 0
+            self.usb_writes = 0
+            self.usb_reads = 0
+            self.empty_reads = 0         # 상태 바이트만 온 bulk IN (응답 대기 폴링)
+            self.usb_bytes_out = 0
+            self.usb_bytes_in = 0
+            self.max_write = 0
+            self.fill_sum = 0.0          # 전송별 packet_fill() 합
+            self.usb_busy_s = 0.0        # bulk 전송 호출 안에서 보낸 시간
+            self.started = time.perf_counter()
+            self.stopped = None
+            self._sim_final = None
+            if self._sim_port is not None:
+                self._sim_start = self._sim_port.stats.as_dict()
+
+    def _wrap(self, ftdi):
+        write, read = ftdi._write, ftdi._read
+        lock = self._lock
+
+        def counted_write(data):
+            started = time.perf_counter()
+            try:
+                return write(data)
+            finally:
+                elapsed = time.perf_counter() - started
+                with lock:
+                    self.usb_writes += 1
+                    self.usb_bytes_out += len(data)
+                    self.max_write = max(self.max_write, len(data))
+                    self.fill_sum += packet_fill(len(data))
+                    self.usb_busy_s += elapsed
+
+        def counted_read():
+            started = time.perf_counter()
+            data = read()
+            elapsed = time.perf_counter() - started
+            with lock:
+                self.usb_reads += 1
+                self.usb_bytes_in += len(data)
+                self.empty_reads += len(data) <= STATUS_BYTES
+                self.fill_sum += packet_fill(len(data))
+                self.usb_busy_s += elapsed
+            return data
+
+        ftdi._write = counted_write
+        ftdi._read = counted_read
+        self._ftdi = ftdi
+
+    def record_payload(self, frames, bytes_out, bytes_in=0):
+        """전송 함수를 거치지 않은 프레임의 payload 추가"""
+        with self._lock:
+            self.frames += frames
+            self.payload_out += bytes_out
+            self.payload_in += bytes_in
+
+    def _on_transfer(self, protocol, ops, values, started, duration, source, error=None):
+        frames = reads = 0
+        for op in ops:
+            if op[0] == "W":
+                frames += 1
+            elif op[0] == "R":
+                frames += 1
+                reads += 1
+        self.record_payload(frames, frames * FRAME_BYTES, reads * DATA_BYTES)
+
+    def _sim_counts(self):
+        """시뮬레이션 포트 통계 증가분 → (전송, OUT 바이트, IN 바이트, 모델 시간)"""
+        now = self._sim_port.stats.as_dict()
+        transfers = now["usb_transfers"] - self._sim_start["usb_transfers"]
+        overhead = getattr(getattr(self._sim_port, "usb", None), "command_overhead", 0)
+        return (transfers,
+                now["bytes_out"] - self._sim_start["bytes_out"] + overhead * transfers,
+                now["bytes_in"] - self._sim_start["bytes_in"],
+                now["elapsed_s"] - self._sim_start["elapsed_s"])
+
+    # ----- 조회 -----
+
+    def summary(self):
+        with self._lock:
+            frames, payload_out, payload_in = self.frames, self.payload_out, self.payload_in
+            writes, usb_reads, empty = self.usb_writes, self.usb_reads, self.empty_reads
+            out_bytes, in_bytes, busy_s = self.usb_bytes_out, self.usb_bytes_in, self.usb_busy_s
+            max_write, fill_sum = self.max_write, self.fill_sum
+        sim = self._sim_final or (self._sim_counts() if self._sim_port is not None else None)
+        if sim is not None:
+            # 시뮬레이션 포트는 왕복 단위로만 세므로 쓰기 = 왕복, 읽기는 구분하지 않음
+            writes, out_bytes, in_bytes, busy_s = sim
+        transfers = writes + usb_reads
+        usb_bytes = out_bytes + in_bytes
+        payload = payload_out + payload_in
+        window_s = (self.stopped or time.perf_counter()) - self.started
+        bytes_per_transfer = usb_bytes / transfers if transfers else None
+        if sim is not None and transfers:
+            fill_sum = packet_fill(round(bytes_per_transfer)) * transfers
+        return {
+            "source": "simulated" if sim is not None else ("ftdi" if transfers else None),
+            "frames": frames,
+            "payload_bytes": payload,
+            "usb_transfers": transfers,
+            "usb_writes": writes,
+            "usb_reads": usb_reads,
+            "empty_reads": empty,
+            "usb_bytes_out": out_bytes,
+            "usb_bytes_in": in_bytes,
+            "efficiency": payload / usb_bytes if usb_bytes else None,
+            "payload_per_transfer": payload / transfers if transfers else None,
+            "bytes_per_transfer": bytes_per_transfer,
+            "packet_fill": fill_sum / transfers if transfers else None,
+            "frames_per_transfer": frames / transfers if transfers else None,
+            "command_overhead_bytes": max(0, out_bytes - payload_out) if transfers else None,
+            "command_overhead_per_frame": max(0, out_bytes - payload_out) / frames if transfers and frames else None,
+            "max_write_bytes": max_write if sim is None else None,
+            "buffer_fill": max_write / FT2232H_BUFFER_BYTES if max_write and sim is None else None,
+            "usb_busy_s": busy_s,
+            # 시뮬레이션 포트의 시간은 모델 시간이라 호스트 시간 구간과 비교하지 않음
+            "idle_ratio": max(0.0, 1.0 - busy_s / window_s) if window_s > 0 and transfers and sim is None else None,
+            "window_s": window_s,
+        }
+
+    def status_text(self):
+        """상태 표시줄용 한 줄 요약"""
+        s = self.summary()
+        if not s["usb_transfers"]:
+            return f"USB 전송 없음 (프레임 {s['frames']:,})" if s["frames"] else "USB 전송 없음"
+        idle = f" · 유휴 {s['idle_ratio'] * 100:.0f}%" if s["idle_ratio"] is not None else ""
+        return (f"USB {s['payload_per_transfer']:.0f} B/전송 (패킷 {s['packet_fill'] * 100:.0f}%) · "
+                f"효율 {s['efficiency'] * 100:.0f}%{idle}")
+
+    def report_lines(self):
+        """벤치마크 보고서용 여러 줄 요약"""
+        s = self.summary()
+        if not s["usb_transfers"]:
+            return [f"payload {s['payload_bytes']:,} B (프레임 {s['frames']:,}), USB 전송 정보 없음"]
+        idle = f", USB 유휴 {s['idle_ratio'] * 100:.1f}%" if s["idle_ratio"] is not None else ""
+        if s["source"] == "simulated":
+            counts = f"USB 왕복 {s['usb_transfers']:,}회 (시뮬레이션 모델)"
+        else:
+            counts = (f"USB 전송 {s['usb_transfers']:,}회 (쓰기 {s['usb_writes']:,}, 읽기 {s['usb_reads']:,}, "
+                      f"빈 읽기 {s['empty_reads']:,})")
+        lines = [
+            f"{counts}, 전송당 payload {s['payload_per_transfer']:.1f} B / "
+            f"USB {s['bytes_per_transfer']:.1f} B (패킷 채움 {s['packet_fill'] * 100:.0f}%), "
+            f"{s['frames_per_transfer']:.2f} 프레임",
+            f"payload {s['payload_bytes']:,} B / USB {s['usb_bytes_out'] + s['usb_bytes_in']:,} B "
+            f"(OUT {s['usb_bytes_out']:,}, IN {s['usb_bytes_in']:,}) → 바이트 효율 {s['efficiency'] * 100:.1f}%",
+            f"MPSSE 명령 오버헤드 {s['command_overhead_bytes']:,} B (프레임당 "
+            f"{(s['command_overhead_per_frame'] or 0):.1f} B){idle}",
+        ]
+        if s["max_write_bytes"]:
+            lines.append(f"최대 쓰기 {s['max_write_bytes']:,} B (FT2232H 버퍼 {FT2232H_BUFFER_BYTES} B 의 "
+                         f"{s['buffer_fill'] * 100:.0f}%, {MAX_PACKET_SIZE} B 패킷 "
+                         f"{-(-s['max_write_bytes'] // MAX_PACKET_SIZE)}개)")
+        return lines
@@ -0,0 +1,102 @@
+"""
+현재 레지스터 값 모델 (단일 진실 공급원)
+
+비트 위젯, HEX SpinBox, DEC 표시, 트리 표시, register_data_store 는 위젯 상태를
+서로 읽어 값을 다시 계산하지 않고, 이 모델의 정수 값만 구독합니다.
+같은 이벤트 루프 틱 안에서 값이 여러 번 바뀌어도 valueChanged 는 틱이 끝날 때
+0ms 단일 타이머로 한 번만 발생하므로, 시그널 연쇄나 blockSignals() 가 필요 없습니다.
+"""
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from register_trace import span
+
+UINT32_MASK = 0xFFFFFFFF
+
+
+def field_mask(upper_bit, lower_bit):
+    """비트 범위 [upper_bit:lower_bit] 의 (정렬되지 않은) 마스크"""
+    return (1 << (upper_bit - lower_bit + 1)) - 1
+
+
+class RegisterValueModel(QObject):
+    """현재 선택된 레지스터의 32비트 unsigned 값을 보관하는 모델"""
+
+    # 이벤트 루프 틱당 최대 한 번, 마지막으로 알린 값과 다를 때만 발생
+    valueChanged = Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._value = 0
+        self._published = None   # 마지막으로 뷰에 알린 값
+        self._resync = False     # 값이 같아도 다음 flush 에서 알림
+        self._publishing = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    # ========== 값 읽기 ==========
+
+    def value(self):
+        """현재 32비트 unsigned 값"""
+        return self._value
+
+    def field(self, upper_bit, lower_bit):
+        """비트 범위 [upper_bit:lower_bit] 의 필드 값"""
+        return (self._value >> lower_bit) & field_mask(upper_bit, lower_bit)
+
+    def hasPendingValue(self):
+        """아직 뷰에 알리지 않은 값 변경이 있으면 True"""
+        return self._value != self._published
+
+    def isPublishing(self):
+        """valueChanged 로 뷰를 동기화하는 중이면 True (뷰의 되먹임 시그널 무시용)"""
+        return self._publishing
+
+    # ========== 값 변경 ==========
+
+    def setValue(self, value):
+        """전체 32비트 값 설정"""
+        value = int(value) & UINT32_MASK
+        if value != self._value:
+            self._value = value
+            self._schedule()
+
+    def setBit(self, bit, on):
+        """단일 비트 설정/해제"""
+        if on:
+            self.setValue(self._value | (1 << bit))
+        else:
+            self.setValue(self._value & ~(1 << bit))
+
+    def setField(self, upper_bit, lower_bit, field_value):
+        """비트 범위 [upper_bit:lower_bit] 에만 값을 삽입 (범위를 넘는 상위 비트는 버림)"""
+        mask = field_mask(upper_bit, lower_bit)
+        cleared = self._value & ~(mask << lower_bit)
+        self.setValue(cleared | ((int(field_value) & mask) << lower_bit))
+
+    def invalidate(self):
+        """값이 같아도 다음 틱에 뷰 전체를 다시 동기화 (레지스터/필드 선택 변경 시)"""
+        self._resync = True
+        self._schedule()
+
+    # ========== 알림 ==========
+
+    def _schedule(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """대기 중인 변경을 즉시 알림 (레지스터 전환 직전 등)"""
+        self._timer.stop()
+        if self._value == self._published and not self._resync:
+            return
+        self._published = self._value
+        self._resync = False
+        self._publishing = True
+        try:
+            with span("valueChanged", "value_model"):
+                self.valueChanged.emit(self._value)
+        finally:
+            self._publishing = False
@@ -0,0 +1,428 @@
+"""
+레지스터 정확도 디바이스 시뮬레이터 (하드웨어 없이 Linux CI 에서도 실행)
+
+SimulatedRegisterDevice 는 register_protocol 의 실제 프레임(RW 비트, 7비트 주소, 32비트 데이터)을
+바이트 단위로 해석하는 128 x 32비트 레지스터 슬레이브입니다. Excel 레지스터 맵의 default_value 로
+전원 인가(리셋) 상태를 만듭니다.
+
+포트 어댑터는 실제 라이브러리와 같은 메서드를 제공하므로 GUI/스크립트 코드를 바꾸지 않고 연결할 수 있습니다.
+    SimulatedSpiPort    : pyftdi SpiPort (exchange / read / write / flush / set_frequency / set_mode)
+    SimulatedI2cPort    : pyftdi I2cPort (write / read / exchange / read_from / write_to)
+    SimulatedSerialPort : pyserial Serial (write / read / readline / in_waiting / close)
+
+전송 시간은 BusTimingModel(버스 비트 시간 + 바이트 간격 + 프레임 오버헤드)과
+UsbLatencyModel(USB 왕복 지연 + 전송 대역폭)의 합으로 SimClock 에 누적됩니다.
+realtime=False 이면 실제로 대기하지 않고 가상 시간만 증가하므로, 배치/파이프라이닝 같은
+처리량 기능을 하드웨어 없이 빠르게 비교할 수 있습니다.
+"""
+
+import time
+
+from register_logging import get_logger
+from register_protocol import (
+    READ_FLAG, ADDRESS_MASK, DATA_BYTES, VALUE_MASK, I2C_DEFAULT_ADDRESS,
+    value_to_bytes, bytes_to_value,
+)
+
+transport_log = get_logger("transport")
+
+REGISTER_COUNT = 128
+
+# pyftdi MPSSE 명령 오버헤드 근사값 (CS prolog/epilog + 쓰기/읽기 명령 헤더, 바이트)
+MPSSE_COMMAND_OVERHEAD = 9
+
+
+def register_defaults(data):
+    """레지스터 맵 {"Sheet1": [...]} 에서 {주소(int): default_value(int)} 추출"""
+    defaults = {}
+    for registers in (data or {}).values():
+        for register in registers:
+            try:
+                addr = int(str(register.get('address', '')), 16)
+                value = register.get('default_value', 0)
+                defaults[addr] = int(value, 0) if isinstance(value, str) else int(value or 0)
+            except (TypeError, ValueError):
+                transport_log.warning("⚠️ 시뮬레이터 기본값 무시: %s", register.get('address'))
+    return defaults
+
+
+# ========== 시간 모델 ==========
+
+class SimClock:
+    """시뮬레이션 시간 (realtime=True 이면 실제로 대기)"""
+
+    def __init__(self, realtime=False):
+        self.realtime = realtime
+        self.elapsed = 0.0
+
+    def advance(self, seconds):
+        if seconds <= 0:
+            return
+        self.elapsed += seconds
+        if self.realtime:
+            time.sleep(seconds)
+
+    def now(self):
+        return self.elapsed
+
+
+class BusTimingModel:
+    """직렬 버스 전송 시간: 바이트당 비트 시간 + 바이트 간격 + 프레임(CS/START-STOP) 오버헤드"""
+
+    def __init__(self, frequency=1_000_000, bits_per_byte=8, byte_gap_s=0.0, frame_overhead_s=0.0):
+        self.frequency = float(frequency)
+        self.bits_per_byte = bits_per_byte
+        self.byte_gap_s = byte_gap_s
+        self.frame_overhead_s = frame_overhead_s
+
+    @classmethod
+    def for_spi(cls, frequency=1_000_000, byte_gap_s=0.0, cs_setup_s=1e-6):
+        return cls(frequency, 8, byte_gap_s, cs_setup_s)
+
+    @classmethod
+    def for_i2c(cls, frequency=100_000, byte_gap_s=0.0):
+        # 바이트당 8비트 + ACK, START/STOP 과 슬레이브 주소 바이트(9비트) 를 프레임 오버헤드로 계산
+        return cls(frequency, 9, byte_gap_s, 11.0 / frequency)
+
+    @classmethod
+    def for_uart(cls, baudrate=115200, bits_per_byte=10):
+        # 8N1 = START + 8 데이터 + STOP
+        return cls(baudrate, bits_per_byte)
+
+    def transfer_time(self, nbytes, frames=1):
+        if nbytes <= 0 and frames <= 0:
+            return 0.0
+        return (nbytes * self.bits_per_byte / self.frequency
+                + nbytes * self.byte_gap_s
+                + frames * self.frame_overhead_s)
+
+
+class UsbLatencyModel:
+    """USB 전송 시간: 왕복(명령 전송 → 응답 수신) 지연 + 대역폭에 따른 전송 시간"""
+
+    def __init__(self, round_trip_s=0.001, bytes_per_second=8_000_000, command_overhead=MPSSE_COMMAND_OVERHEAD):
+        self.round_trip_s = round_trip_s
+        self.bytes_per_second = float(bytes_per_second)
+        self.command_overhead = command_overhead
+
+    @classmethod
+    def none(cls):
+        """지연 없음 (순수 프레임 로직 테스트용)"""
+        return cls(0.0, float("inf"), 0)
+
+    def transfer_time(self, nbytes_out, nbytes_in=0):
+        return self.round_trip_s + (nbytes_out + self.command_overhead + nbytes_in) / self.bytes_per_second
+
+
+class TransportStats:
+    """포트별 전송 통계"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.usb_transfers = 0   # USB 왕복 횟수 (exchange/read/write 호출 수)
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.bus_bytes = 0       # 버스에서 클럭된 바이트 수
+        self.elapsed = 0.0       # 누적 시뮬레이션 시간 (초)
+
+    def as_dict(self):
+        return {
+            "usb_transfers": self.usb_transfers,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "bus_bytes": self.bus_bytes,
+            "elapsed_s": self.elapsed,
+        }
+
+
+# ========== 디바이스 ==========
+
+class SimulatedRegisterDevice:
+    """실제 프레임을 바이트 단위로 해석하는 레지스터 슬레이브"""
+
+    def __init__(self, register_count=REGISTER_COUNT, defaults=None):
+        self.register_count = register_count
+        self.defaults = dict(defaults or {})
+        self.registers = [0] * register_count
+        self.frames = 0          # 완료된 프레임 수
+        self.dropped_frames = 0  # 데이터가 모자라 버려진 쓰기 프레임 수
+        self._spi_command = None
+        self._spi_rx = []
+        self._spi_position = 0
+        self._i2c_pointer = 0
+        self.reset()
+
+    @classmethod
+    def from_register_map(cls, data, register_count=REGISTER_COUNT):
+        """Excel 레지스터 맵의 default_value 로 전원 인가 상태를 만든 디바이스"""
+        return cls(register_count, register_defaults(data))
+
+    def reset(self):
+        """전원 인가 상태로 복귀 (맵에 없는 레지스터는 0)"""
+        self.registers = [0] * self.register_count
+        for addr, value in self.defaults.items():
+            if 0 <= addr < self.register_count:
+                self.registers[addr] = value & VALUE_MASK
+        self._spi_command = None
+        self._i2c_pointer = 0
+
+    def read_register(self, addr):
+        return self.registers[addr % self.register_count]
+
+    def write_register(self, addr, value):
+        self.registers[addr % self.register_count] = int(value) & VALUE_MASK
+        transport_log.debug("🎭 시뮬레이터 쓰기: Addr=0x%02X, Value=0x%08X", addr, value & VALUE_MASK)
+
+    # ----- SPI 슬레이브 (CS 구간 단위) -----
+
+    def spi_select(self):
+        """CS assert: 새 프레임 시작"""
+        self._spi_command = None
+        self._spi_rx = []
+        self._spi_position = 0
+
+    def spi_clock_byte(self, mosi):
+        """MOSI 1바이트를 받고 같은 클럭 구간의 MISO 바이트 반환"""
+        position = self._spi_position
+        self._spi_position += 1
+        if position == 0:
+            # 명령 바이트 구간에는 아직 주소를 모르므로 0 출력
+            self._spi_command = mosi & 0xFF
+            return 0x00
+        if self._spi_command & READ_FLAG:
+            if position <= DATA_BYTES:
+                return value_to_bytes(self.read_register(self._spi_command & ADDRESS_MASK))[position - 1]
+            return 0x00
+        if position <= DATA_BYTES:
+            self._spi_rx.append(mosi & 0xFF)
+        return 0x00
+
+    def spi_deselect(self):
+        """CS deassert: 쓰기 프레임이면 데이터가 4바이트 모두 왔을 때만 반영"""
+        command = self._spi_command
+        self._spi_command = None
+        if command is None:
+            return
+        if command & READ_FLAG:
+            self.frames += 1
+        elif len(self._spi_rx) == DATA_BYTES:
+            self.write_register(command & ADDRESS_MASK, bytes_to_value(self._spi_rx))
+            self.frames += 1
+        else:
+            self.dropped_frames += 1
+            transport_log.debug("⚠️ 시뮬레이터: 불완전한 SPI 쓰기 프레임 버림 (%d바이트)", len(self._spi_rx))
+
+    # ----- I2C 슬레이브 -----
+
+    def i2c_write(self, data):
+        """[주소] 는 읽기 포인터 설정, [주소, 4바이트] 는 레지스터 쓰기"""
+        data = list(data)
+        if not data:
+            return
+        self._i2c_pointer = data[0] & ADDRESS_MASK
+        payload = data[1:]
+        if len(payload) >= DATA_BYTES:
+            self.write_register(self._i2c_pointer, bytes_to_value(payload))
+            self.frames += 1
+        elif payload:
+            self.dropped_frames += 1
+
+    def i2c_read(self, readlen):
+        """포인터 레지스터의 값을 big-endian 으로 반환 (4바이트 초과분은 0xFF)"""
+        value = value_to_bytes(self.read_register(self._i2c_pointer))
+        self.frames += 1
+        return bytes((value + [0xFF] * max(0, readlen - DATA_BYTES))[:readlen])
+
+    # ----- UART 텍스트 명령 -----
+
+    def uart_command(self, line):
+        """한 줄 명령을 처리하고 응답 바이트 반환 (쓰기는 응답 없음)"""
+        parts = line.strip().split(',')
+        try:
+            if parts[0].upper() == 'W' and len(parts) == 3:
+                self.write_register(int(parts[1], 16) & ADDRESS_MASK, int(parts[2], 16))
+                self.frames += 1
+                return b""
+            if parts[0].upper() == 'R' and len(parts) == 2:
+                self.frames += 1
+                return f"{self.read_register(int(parts[1], 16) & ADDRESS_MASK):08X}\n".encode()
+        except ValueError:
+            pass
+        self.dropped_frames += 1
+        return b""
+
+
+# ========== 포트 어댑터 ==========
+
+class _SimulatedPort:
+    """시간 모델과 통계를 공유하는 포트 기반 클래스"""
+
+    def __init__(self, device, bus, usb=None, clock=None):
+        self.device = device
+        self.bus = bus
+        self.usb = usb if usb is not None else UsbLatencyModel()
+        self.clock = clock if clock is not None else SimClock()
+        self.stats = TransportStats()
+
+    def _account(self, bytes_out, bytes_in, bus_bytes, frames=1):
+        seconds = self.usb.transfer_time(bytes_out, bytes_in) + self.bus.transfer_time(bus_bytes, frames)
+        self.stats.usb_transfers += 1
+        self.stats.bytes_out += bytes_out
+        self.stats.bytes_in += bytes_in
+        self.stats.bus_bytes += bus_bytes
+        self.stats.elapsed += seconds
+        self.clock.advance(seconds)
+
+
+class SimulatedSpiPort(_SimulatedPort):
+    """pyftdi SpiPort 호환 시뮬레이션 포트"""
+
+    def __init__(self, device, frequency=1_000_000, mode=0, cs=0, bus=None, usb=None, clock=None):
+        super().__init__(device, bus if bus is not None else BusTimingModel.for_spi(frequency), usb, clock)
+        self._frequency = float(frequency)
+        self._mode = mode
+        self._cs = cs
+        self._selected = False
+
+    def exchange(self, out=b'', readlen=0, start=True, stop=True, duplex=False, droptail=0):
+        """pyftdi 와 같은 의미: duplex 이면 out 을 보내며 같은 길이(또는 readlen)를 받고,
+        아니면 out 을 보낸 뒤 readlen 바이트를 추가로 클럭해 받음"""
+        out = list(out)
+        if duplex:
+            if readlen > len(out):
+                out.extend([0x00] * (readlen - len(out)))
+            elif readlen == 0:
+                readlen = len(out)
+        if start or not self._selected:
+            self.device.spi_select()
+            self._selected = True
+        received = [self.device.spi_clock_byte(b) for b in out]
+        if duplex:
+            data = bytes(received[:readlen])
+            bus_bytes = len(out)
+        else:
+            data = bytes(self.device.spi_clock_byte(0x00) for _ in range(readlen))
+            bus_bytes = len(out) + readlen
+        if stop:
+            self.device.spi_deselect()
+            self._selected = False
+        self._account(len(out), len(data), bus_bytes, 1 if start else 0)
+        return data
+
+    def read(self, readlen=0, start=True, stop=True, droptail=0):
+        return self.exchange(b'', readlen, start, stop, False, droptail)
+
+    def write(self, out, start=True, stop=True, droptail=0):
+        self.exchange(out, 0, start, stop, False, droptail)
+
+    def flush(self):
+        pass
+
+    def set_frequency(self, frequency):
+        self._frequency = float(frequency)
+        self.bus.frequency = self._frequency
+
+    def set_mode(self, mode, cs_hold=None):
+        if not 0 <= mode <= 3:
+            raise ValueError(f"Invalid SPI mode: {mode}")
+        self._mode = mode
+
+    @property
+    def frequency(self):
+        return self._frequency
+
+    @property
+    def cs(self):
+        return self._cs
+
+    @property
+    def mode(self):
+        return self._mode
+
+
+class SimulatedI2cPort(_SimulatedPort):
+    """pyftdi I2cPort 호환 시뮬레이션 포트"""
+
+    def __init__(self, device, address=I2C_DEFAULT_ADDRESS, frequency=100_000, bus=None, usb=None, clock=None):
+        super().__init__(device, bus if bus is not None else BusTimingModel.for_i2c(frequency), usb, clock)
+        self.address = address
+
+    def write(self, out, relax=True, start=True):
+        out = list(out)
+        self.device.i2c_write(out)
+        self._account(len(out), 0, len(out))
+
+    def read(self, readlen=0, relax=True, start=True):
+        data = self.device.i2c_read(readlen)
+        self._account(0, len(data), len(data))
+        return data
+
+    def exchange(self, out=b'', readlen=0, relax=True, start=True):
+        """쓰기 후 반복 START 로 읽기 (USB 왕복 한 번)"""
+        out = list(out)
+        self.device.i2c_write(out)
+        data = self.device.i2c_read(readlen)
+        self._account(len(out), len(data), len(out) + len(data), 2)
+        return data
+
+    def read_from(self, regaddr, readlen=0, relax=True, start=True):
+        return self.exchange([regaddr], readlen, relax, start)
+
+    def write_to(self, regaddr, out, relax=True, start=True):
+        self.write([regaddr] + list(out), relax, start)
+
+    def flush(self):
+        pass
+
+    @property
+    def frequency(self):
+        return self.bus.frequency
+
+
+class SimulatedSerialPort(_SimulatedPort):
+    """pyserial Serial 호환 시뮬레이션 포트 (UART 텍스트 명령)"""
+
+    def __init__(self, device, baudrate=115200, timeout=None, bus=None, usb=None, clock=None):
+        super().__init__(device, bus if bus is not None else BusTimingModel.for_uart(baudrate), usb, clock)
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.is_open = True
+        self._line = bytearray()
+        self._rx = bytearray()
+
+    def write(self, data):
+        data = bytes(data)
+        for byte in data:
+            if byte == 0x0A:  # '\n'
+                self._rx.extend(self.device.uart_command(self._line.decode(errors="ignore")))
+                self._line.clear()
+            else:
+                self._line.append(byte)
+        self._account(len(data), 0, len(data), 0)
+        return len(data)
+
+    def read(self, size=1):
+        data = bytes(self._rx[:size])
+        del self._rx[:size]
+        if data:
+            self._account(0, len(data), len(data), 0)
+        return data
+
+    def readline(self):
+        end = self._rx.find(b"\n")
+        return self.read(len(self._rx) if end < 0 else end + 1)
+
+    @property
+    def in_waiting(self):
+        return len(self._rx)
+
+    def reset_input_buffer(self):
+        self._rx.clear()
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.is_open = False
@@ -0,0 +1,135 @@
+"""
+시뮬레이션 전송 경로 고장 주입 (재시도/검증 성능 시험용)
+
+FaultInjectingPort 는 sim_device 의 시뮬레이션 포트(SPI / I2C / UART)를 감싸서
+노이즈가 많은 케이블과 불안정한 USB 를 흉내 냅니다.
+    - 비트 반전   : 송신(MOSI/SDA/TX)과 수신 바이트마다 bit_flip_rate 확률로 1비트 반전
+    - 응답 잘림   : 전송마다 truncate_rate 확률로 응답 일부만 반환
+    - 타임아웃    : 전송마다 timeout_rate 확률로 프레임을 디바이스에 전달하지 않고
+                    timeout_s 만큼 시간을 보낸 뒤 TransportTimeout 발생
+    - 지연 지터   : 전송마다 0 ~ jitter_s 의 추가 지연
+난수는 seed 로 고정되므로 같은 프로파일은 항상 같은 결과를 냅니다.
+"""
+
+import random
+
+from register_transfer import TransportTimeout
+
+# 이름 -> (bit_flip_rate, truncate_rate, timeout_rate, jitter_s)
+PROFILES = {
+    "clean": (0.0, 0.0, 0.0, 0.0),
+    "noisy_cable": (1e-3, 0.0, 0.0, 0.0002),
+    "long_cable": (5e-3, 0.005, 0.0, 0.0005),
+    "flaky_usb": (0.0, 0.01, 0.005, 0.002),
+    "worst": (1e-2, 0.02, 0.01, 0.005),
+}
+
+
+class FaultProfile:
+    """고장 발생 확률과 지연 설정"""
+
+    def __init__(self, name="custom", bit_flip_rate=0.0, truncate_rate=0.0, timeout_rate=0.0,
+                 jitter_s=0.0, timeout_s=0.05):
+        self.name = name
+        self.bit_flip_rate = bit_flip_rate
+        self.truncate_rate = truncate_rate
+        self.timeout_rate = timeout_rate
+        self.jitter_s = jitter_s
+        self.timeout_s = timeout_s
+
+    @classmethod
+    def named(cls, name, **overrides):
+        """PROFILES 의 이름으로 프로파일 생성"""
+        if name not in PROFILES:
+            raise ValueError(f"알 수 없는 고장 프로파일: {name} (사용 가능: {', '.join(PROFILES)})")
+        bit_flip_rate, truncate_rate, timeout_rate, jitter_s = PROFILES[name]
+        options = dict(bit_flip_rate=bit_flip_rate, truncate_rate=truncate_rate,
+                       timeout_rate=timeout_rate, jitter_s=jitter_s)
+        options.update(overrides)
+        return cls(name, **options)
+
+    def __repr__(self):
+        return (f"FaultProfile({self.name}: flip={self.bit_flip_rate}, trunc={self.truncate_rate}, "
+                f"timeout={self.timeout_rate}, jitter={self.jitter_s * 1000:.1f}ms)")
+
+
+class FaultStats:
+    """주입된 고장 횟수"""
+
+    def __init__(self):
+        self.bit_flips = 0
+        self.truncations = 0
+        self.timeouts = 0
+        self.jitter_s = 0.0
+
+    def as_dict(self):
+        return {"bit_flips": self.bit_flips, "truncations": self.truncations,
+                "timeouts": self.timeouts, "jitter_s": self.jitter_s}
+
+
+class FaultInjectingPort:
+    """시뮬레이션 포트를 감싸 고장을 주입하는 포트 (감싼 포트와 같은 메서드 제공)"""
+
+    def __init__(self, port, profile=None, seed=0):
+        self.port = port
+        self.profile = profile if profile is not None else FaultProfile()
+        self.random = random.Random(seed)
+        self.faults = FaultStats()
+
+    def __getattr__(self, name):
+        # frequency, mode, stats, in_waiting, close ... 는 감싼 포트에 위임
+        return getattr(self.port, name)
+
+    # ----- 고장 주입 -----
+
+    def _before_transfer(self):
+        profile = self.profile
+        if profile.jitter_s:
+            jitter = self.random.uniform(0.0, profile.jitter_s)
+            self.faults.jitter_s += jitter
+            self._advance(jitter)
+        if profile.timeout_rate and self.random.random() < profile.timeout_rate:
+            self.faults.timeouts += 1
+            self._advance(profile.timeout_s)
+            raise TransportTimeout(f"시뮬레이션 타임아웃 ({profile.timeout_s * 1000:.0f}ms)")
+
+    def _advance(self, seconds):
+        self.port.clock.advance(seconds)
+        self.port.stats.elapsed += seconds
+
+    def _flip(self, data):
+        if not self.profile.bit_flip_rate or not data:
+            return data
+        data = bytearray(data)
+        for i in range(len(data)):
+            if self.random.random() < self.profile.bit_flip_rate:
+                data[i] ^= 1 << self.random.randrange(8)
+                self.faults.bit_flips += 1
+        return bytes(data)
+
+    def _damage_response(self, data):
+        data = self._flip(data)
+        if data and self.profile.truncate_rate and self.random.random() < self.profile.truncate_rate:
+            self.faults.truncations += 1
+            data = data[:self.random.randrange(len(data))]
+        return data
+
+    # ----- SPI (pyftdi SpiPort) -----
+
+    def exchange(self, out=b'', readlen=0, *args, **kwargs):
+        self._before_transfer()
+        return self._damage_response(self.port.exchange(self._flip(bytes(out)), readlen, *args, **kwargs))
+
+    # ----- I2C (pyftdi I2cPort) / UART (pyserial) -----
+
+    def write(self, out, *args, **kwargs):
+        self._before_transfer()
+        return self.port.write(self._flip(bytes(out)), *args, **kwargs)
+
+    def read(self, readlen=1, *args, **kwargs):
+        self._before_transfer()
+        return self._damage_response(self.port.read(readlen, *args, **kwargs))
+
+    def readline(self):
+        self._before_transfer()
+        return self._damage_response(self.port.readline())
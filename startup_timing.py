@@ -0,0 +1,77 @@
+"""
+앱 시작 시간 측정
+
+import, UI 구성, 레지스터 맵 로드, 첫 화면 그리기 단계를 측정해 한 줄로 보고합니다.
+환경 변수 REGISTER_STARTUP_REPORT=파일경로 를 지정하면 같은 결과를 JSON 으로 기록하므로
+시작 시간 회귀를 추적할 수 있습니다 (Test_Script/startup_benchmark.py 참고).
+"""
+
+import json
+import os
+import time
+
+from register_logging import get_logger
+
+ui_log = get_logger("ui")
+
+# 보고 순서
+PHASES = ("import", "ui_build", "map_load", "first_paint")
+
+PHASE_LABELS = {
+    "import": "import",
+    "ui_build": "UI 구성",
+    "map_load": "맵 로드",
+    "first_paint": "첫 화면",
+}
+
+
+class StartupTimer:
+    """단계별 소요 시간(ms)과 시작 시점 기준 완료 시각(ms)을 기록"""
+
+    def __init__(self, t0=None):
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.durations = {}   # 단계 -> 소요 시간 (ms)
+        self.finished_at = {}  # 단계 -> t0 기준 완료 시각 (ms)
+        self._started = {}
+        self.reported = False
+
+    def begin(self, phase):
+        self._started[phase] = time.perf_counter()
+
+    def end(self, phase):
+        """begin() 이후 경과 시간을 기록 (이미 기록된 단계는 무시)"""
+        if phase in self.durations or phase not in self._started:
+            return
+        self.record(phase, self._started.pop(phase), time.perf_counter())
+
+    def record(self, phase, start, end):
+        self.durations[phase] = (end - start) * 1000.0
+        self.finished_at[phase] = (end - self.t0) * 1000.0
+
+    def is_complete(self):
+        return all(phase in self.durations for phase in PHASES)
+
+    def as_dict(self):
+        return {
+            "durations_ms": {p: round(self.durations[p], 2) for p in PHASES if p in self.durations},
+            "finished_at_ms": {p: round(self.finished_at[p], 2) for p in PHASES if p in self.finished_at},
+            "ready_ms": round(max(self.finished_at.values()), 2) if self.finished_at else 0.0,
+        }
+
+    def report(self):
+        """로그 한 줄 출력 + REGISTER_STARTUP_REPORT 경로에 JSON 기록 (한 번만)"""
+        if self.reported:
+            return
+        self.reported = True
+        result = self.as_dict()
+        parts = [f"{PHASE_LABELS[p]} {self.durations[p]:.0f}ms" for p in PHASES if p in self.durations]
+        ui_log.info("⏱️ 시작 시간: %s (사용 가능까지 %.0fms)", ", ".join(parts), result["ready_ms"])
+
+        report_path = os.environ.get("REGISTER_STARTUP_REPORT")
+        if report_path:
+            try:
+                with open(report_path, "w", encoding="utf-8") as f:
+                    json.dump(result, f, indent=2)
+            except OSError as e:
+                ui_log.warning("⚠️ 시작 시간 보고서 저장 실패 (%s): %s", report_path, e)
+        return result